@@ -1,10 +1,9 @@
 """A Pandas connector for SDMX-REST services."""
 
 # ruff: noqa: E402
-import contextlib
-import pathlib
 import tempfile
-from typing import Any, Iterable, Literal, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Iterable, Literal, Optional, Union
 
 from pysdmx.__extras_check import __check_data_extra
 
@@ -22,6 +21,8 @@ from pysdmx.model import Dataflow
 from pysdmx.toolkit.pd import to_pandas_schema
 from pysdmx.util import experimental
 
+_SPOOL_MAX_SIZE = 64 * 1_048_576
+
 
 @experimental
 class PandasConnector(BasicConnector):
@@ -186,83 +187,79 @@ class PandasConnector(BasicConnector):
             The requested data, if any. Data are returned as Pandas data frame.
         """
         q = prepare_basic_data_query(dataflow, filters)
-        temp_path: Optional[pathlib.Path] = None
-        try:
-            # Write response in chunks to temporary file
-            temp_path = self.__write_temp_csv(q)
 
-            # Infer read parameters (exclude SDMX columns, add data types etc.)
-            params: dict[str, Any] = {}
-            csv_cols = ["STRUCTURE", "STRUCTURE_ID", "ACTION", "DATAFLOW"]
-            params["usecols"] = lambda c: c not in csv_cols
+        # Infer read parameters (exclude SDMX columns, add data types etc.)
+        params: dict[str, Any] = {}
+        csv_cols = ["STRUCTURE", "STRUCTURE_ID", "ACTION", "DATAFLOW"]
+        params["usecols"] = lambda c: c not in csv_cols
 
-            # Fetch the flow if necessary
-            flow = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Fetch the flow, if necessary, while the data are downloaded
+            pending_flow: Optional[Future[Dataflow]] = None
             if (
                 apply_schema
                 or infer_series_keys
                 or infer_index
                 or labels != "id"
             ):
-                flow = self.dataflow(dataflow)
-
-            # Apply schema
-            if apply_schema:
-                schema = to_pandas_schema(flow.components)  # type: ignore[union-attr,arg-type]
-                params["dtype"] = schema
-
-            # Read CSV
-            df = pd.read_csv(temp_path, **params)
+                pending_flow = executor.submit(self.dataflow, dataflow)
+
+            with self.__download_csv(q) as buffer:
+                flow = pending_flow.result() if pending_flow else None
+
+                # Apply schema
+                if apply_schema:
+                    schema = to_pandas_schema(flow.components)  # type: ignore[union-attr,arg-type]
+                    params["dtype"] = schema
+
+                # Read CSV
+                df = pd.read_csv(buffer, **params)
+
+        # Infer series keys
+        if (infer_series_keys or infer_index) and "TIME_PERIOD" in df.columns:
+            dim_cols = [
+                d.id
+                for d in flow.components.dimensions  # type: ignore[union-attr]
+                if d.id != "TIME_PERIOD"
+            ]
+            df["SERIES_KEY"] = self.__get_series_keys(df, dim_cols)
+
+        # Select requested columns
+        if columns:
+            cols = self.__get_columns(columns, infer_index, infer_series_keys)
+            df = df[cols]
+
+        # Add index
+        if infer_index and "TIME_PERIOD" in df.columns:
+            idxs = ["SERIES_KEY", "TIME_PERIOD"]
+            idxs = [i for i in idxs if i and (not columns or i in columns)]
+            if idxs:
+                df.set_index(idxs, inplace=True)
+
+        # Display appropriate labels
+        if labels != "id":
+            df = self.__map_category_fields(df, flow, labels)  # type: ignore[arg-type]
+
+        # Return requested data as a DataFrame
+        return df
 
-            # Infer series keys
-            if (
-                infer_series_keys or infer_index
-            ) and "TIME_PERIOD" in df.columns:
-                dim_cols = [
-                    d.id
-                    for d in flow.components.dimensions  # type: ignore[union-attr]
-                    if d.id != "TIME_PERIOD"
-                ]
-                df["SERIES_KEY"] = df[dim_cols].map(str).agg(".".join, axis=1)
-
-            # Select requested columns
-            if columns:
-                cols = self.__get_columns(
-                    columns, infer_index, infer_series_keys
-                )
-                df = df[cols]
-
-            # Add index
-            if infer_index and "TIME_PERIOD" in df.columns:
-                idxs = ["SERIES_KEY", "TIME_PERIOD"]
-                idxs = [i for i in idxs if i and (not columns or i in columns)]
-                if idxs:
-                    df.set_index(idxs, inplace=True)
-
-            # Display appropriate labels
-            if labels != "id":
-                df = self.__map_category_fields(df, flow, labels)  # type: ignore[arg-type]
-
-            # Return requested data as a DataFrame
-            return df
-        finally:
-            self.__cleanup_temp_file(temp_path)
-
-    def __write_temp_csv(self, query: Any) -> pathlib.Path:
-        temp_path: Optional[pathlib.Path] = None
+    def __download_csv(self, query: Any) -> IO[bytes]:
+        # Responses are kept in memory and only spill to disk when they
+        # exceed the spooling threshold.
+        buffer: Optional[IO[bytes]] = None
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="wb", suffix=".csv", delete=False
-            ) as f:
-                temp_path = pathlib.Path(f.name)
-                for chunk in self.__client.stream_data(
-                    query, chunk_size=1_048_576
-                ):
-                    f.write(chunk)
-                f.flush()
-                return temp_path
+            buffer = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+                max_size=_SPOOL_MAX_SIZE, mode="w+b", suffix=".csv"
+            )
+            for chunk in self.__client.stream_data(
+                query, chunk_size=1_048_576
+            ):
+                buffer.write(chunk)
+            buffer.seek(0)
+            return buffer
         except BaseException as error:
-            self.__cleanup_temp_file(temp_path)
+            if buffer is not None:
+                buffer.close()
 
             # Preserve control-flow exceptions after cleanup.
             if isinstance(
@@ -278,18 +275,21 @@ class PandasConnector(BasicConnector):
             raise errors.InternalError(
                 "Unexpected I/O issue",
                 (
-                    "An internal I/O error occurred while creating a "
-                    "temporary file to process SDMX-CSV data."
+                    "An internal I/O error occurred while buffering "
+                    "the SDMX-CSV data."
                 ),
                 {
                     "original_exception": str(error),
                 },
             ) from error
 
-    def __cleanup_temp_file(self, temp_path: Optional[pathlib.Path]) -> None:
-        if temp_path is not None:
-            with contextlib.suppress(OSError):
-                temp_path.unlink(missing_ok=True)
+    def __get_series_keys(
+        self, df: pd.DataFrame, dim_cols: list[str]
+    ) -> pd.Series:
+        if not dim_cols:
+            return pd.Series("", index=df.index, dtype="object")
+        keys = df[dim_cols].astype(str)
+        return keys.iloc[:, 0].str.cat(keys.iloc[:, 1:], sep=".")
 
     def __map_category_fields(
         self, df: pd.DataFrame, flow: Dataflow, labels: Literal["name", "both"]
@@ -0,0 +1,184 @@
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from msgspec import Struct
+
+from pysdmx.api.dc.query._model import Filter, Operator
+from pysdmx.api.dc.query._parsing_model import _Field, _Filter, _Number
+from pysdmx.api.dc.query._parsing_util import _map_string, _to_response
+
+# The expressions below mirror the parsy combinators used by the
+# SQL and Python parsers, so that both produce the same filters.
+_PAD = re.compile(r"\s*")
+_FIELD = re.compile(r"[A-Za-z0-9_@$\-]+")
+_FLOAT = re.compile(r"\d*\.\d*")
+_INT = re.compile(r"\d+")
+_STRING = re.compile(r"'[^']*'")
+_COMMA = re.compile(r"\s*,\s*")
+
+
+class _Dialect(Struct, frozen=True):
+    core_op: Pattern[str]
+    core_ops: Dict[str, Operator]
+    in_op: Pattern[str]
+    in_ops: Dict[str, Operator]
+    range_op: Optional[Pattern[str]]
+    range_ops: Dict[str, Operator]
+    lparen: Pattern[str]
+    rparen: Pattern[str]
+    sep: Pattern[str]
+
+
+_SQL = _Dialect(
+    core_op=re.compile(r"(?i:NOT LIKE|LIKE)|<>|<=|>=|=|<|>"),
+    core_ops={
+        o.value: o
+        for o in (
+            Operator.EQUALS,
+            Operator.NOT_EQUALS,
+            Operator.LESS_THAN,
+            Operator.GREATER_THAN,
+            Operator.LESS_THAN_OR_EQUAL,
+            Operator.GREATER_THAN_OR_EQUAL,
+            Operator.LIKE,
+            Operator.NOT_LIKE,
+        )
+    },
+    in_op=re.compile(r"(?i:NOT)?\s*(?i:IN){1}"),
+    in_ops={"IN": Operator.IN, "NOT IN": Operator.NOT_IN},
+    range_op=re.compile(r"(?i:NOT)?\s*(?i:BETWEEN){1}"),
+    range_ops={
+        "BETWEEN": Operator.BETWEEN,
+        "NOT BETWEEN": Operator.NOT_BETWEEN,
+    },
+    lparen=re.compile(r"\("),
+    rparen=re.compile(r"\)"),
+    sep=re.compile(r"\s*(?i:AND)\s*"),
+)
+
+_PYTHON = _Dialect(
+    core_op=re.compile(r"==|!=|<=|>=|<|>"),
+    core_ops={
+        "==": Operator.EQUALS,
+        "!=": Operator.NOT_EQUALS,
+        "<": Operator.LESS_THAN,
+        ">": Operator.GREATER_THAN,
+        "<=": Operator.LESS_THAN_OR_EQUAL,
+        ">=": Operator.GREATER_THAN_OR_EQUAL,
+    },
+    in_op=re.compile(r"(not)?\s*(in){1}"),
+    in_ops={"IN": Operator.IN, "NOT IN": Operator.NOT_IN},
+    range_op=None,
+    range_ops={},
+    lparen=re.compile(r"[\[\(]{1}"),
+    rparen=re.compile(r"[\]\)]{1}"),
+    sep=re.compile(r"\s*and\s*"),
+)
+
+
+def __pad(query: str, pos: int) -> int:
+    return _PAD.match(query, pos).end()  # type: ignore[union-attr]
+
+
+def __value(query: str, pos: int) -> Optional[Tuple[Any, int]]:
+    m = _FLOAT.match(query, pos)
+    if m:
+        return _Number(float(m.group())), m.end()
+    m = _INT.match(query, pos)
+    if m:
+        return _Number(int(m.group())), m.end()
+    m = _STRING.match(query, pos)
+    if m:
+        return _map_string(m.group()), m.end()
+    return None
+
+
+def __values(
+    query: str, pos: int, sep: Pattern[str], max_count: int
+) -> Optional[Tuple[List[Any], int]]:
+    out = []
+    v = __value(query, pos)
+    while v is not None:
+        out.append(v[0])
+        pos = v[1]
+        if len(out) == max_count:
+            break
+        m = sep.match(query, pos)
+        if not m:
+            break
+        v = __value(query, m.end())
+    return (out, pos) if out else None
+
+
+def __operand(
+    query: str, pos: int, d: _Dialect, op: Operator
+) -> Optional[Tuple[Any, int]]:
+    if op in (Operator.IN, Operator.NOT_IN):
+        m = d.lparen.match(query, pos)
+        if not m:
+            return None
+        vals = __values(query, m.end(), _COMMA, -1)
+        if vals is None:
+            return None
+        m = d.rparen.match(query, vals[1])
+        return (vals[0], m.end()) if m else None
+    elif op in (Operator.BETWEEN, Operator.NOT_BETWEEN):
+        vals = __values(query, pos, d.sep, 2)
+        return vals if vals and len(vals[0]) == 2 else None
+    else:
+        return __value(query, pos)
+
+
+def __single(
+    query: str, pos: int, d: _Dialect
+) -> Optional[Tuple[_Filter, int]]:
+    m = _FIELD.match(query, __pad(query, pos))
+    if not m:
+        return None
+    field = _Field(m.group())
+    pos = __pad(query, m.end())
+    for op_re, ops in (
+        (d.core_op, d.core_ops),
+        (d.in_op, d.in_ops),
+        (d.range_op, d.range_ops),
+    ):
+        m = op_re.match(query, pos) if op_re else None
+        if not m:
+            continue
+        op = ops[m.group().upper()]
+        operand = __operand(query, __pad(query, m.end()), d, op)
+        if operand is not None:
+            flt = _Filter(field=field, operator=op, value=operand[0])
+            return flt, __pad(query, operand[1])
+    return None
+
+
+def __parse(query: str, d: _Dialect) -> Optional[Filter]:
+    filters = []
+    pos = 0
+    while True:
+        res = __single(query, pos, d)
+        if res is None:
+            return None
+        filters.append(res[0])
+        pos = res[1]
+        if pos == len(query):
+            return _to_response(filters)
+        m = d.sep.match(query, pos)
+        if not m:
+            return None
+        pos = m.end()
+
+
+def fast_parse(query: str) -> Optional[Filter]:
+    """Parse the query using precompiled regular expressions.
+
+    This covers the grammar supported by the Python and SQL parsers.
+    None is returned if the query could not be parsed, in which case
+    the parsy-based parsers must be used, to report the error.
+
+    Exceptions raised while parsing (for example, in case of invalid
+    datetime values) are propagated, and must be handled in the same
+    way as a failed parse.
+    """
+    return __parse(query, _PYTHON) or __parse(query, _SQL)
@@ -52,7 +52,7 @@ def __map_filter(f: _Filter) -> Filter:
         )
 
 
-def __map_string(input: str) -> Union[_DateTime, _String]:
+def _map_string(input: str) -> Union[_DateTime, _String]:
     __check_dc_extra()
     import dateutil.parser
 
@@ -90,6 +90,6 @@ _float_val = (
     .map(float)
     .map(_Number)
 )
-_string_val = regex(r"'[^']*'").map(__map_string)
+_string_val = regex(r"'[^']*'").map(_map_string)
 _value = _float_val | _int_val | _string_val
 _in_vals = _value.sep_by(_pad + string(",") + _pad, min=1)
@@ -1,30 +1,53 @@
 """Utility functions for pysdmx query API."""
 
+from functools import lru_cache
+
 from parsy import ParseError  # type: ignore[import-untyped]
 
+from pysdmx.api.dc.query._fast_parser import fast_parse
 from pysdmx.api.dc.query._model import Filter
 from pysdmx.api.dc.query._py_parser import py_parser
 from pysdmx.api.dc.query._sql_parser import sql_parser
 from pysdmx.errors import Invalid
 
+QUERY_CACHE_SIZE = 4096
 
-def parse_query(query: str) -> Filter:
-    """Parse a query string into a sequence of filters."""
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def __parse(query: str) -> Filter:
+    try:
+        flt = fast_parse(query)
+    except Exception:
+        flt = None
+    if flt is not None:
+        return flt
+    # The parsy-based parsers are the reference implementation, and
+    # they are used to report any error.
     try:
         return py_parser.parse(query)
     except ParseError:
-        try:
-            return sql_parser.parse(query)
-        except ParseError as pe:
-            raise Invalid(
-                "Unparseable query",
-                (
-                    "The query could not be parsed. "
-                    "It must be a SQL WHERE clause or "
-                    "a Python boolean expression. "
-                    f"The query was: {query}"
-                ),
-            ) from pe
+        return sql_parser.parse(query)
+
+
+def parse_query(query: str) -> Filter:
+    """Parse a query string into a sequence of filters.
+
+    The most recently parsed queries are cached, so parsing the same
+    query again is cheap. As a consequence, the same filter object may
+    be returned for equivalent queries, and it must not be modified.
+    """
+    try:
+        return __parse(query.strip())
+    except ParseError as pe:
+        raise Invalid(
+            "Unparseable query",
+            (
+                "The query could not be parsed. "
+                "It must be a SQL WHERE clause or "
+                "a Python boolean expression. "
+                f"The query was: {query}"
+            ),
+        ) from pe
 
 
 __all__ = ["parse_query"]
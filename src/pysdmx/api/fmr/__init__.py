@@ -26,6 +26,7 @@ from pysdmx.api.qb import (
     StructureType,
 )
 from pysdmx.errors import NotFound, NotImplemented
+from pysdmx.io._intern import InternPool, interning
 from pysdmx.io.format import RefMetaFormat, SchemaFormat, StructureFormat
 from pysdmx.io.json.fusion.reader import deserializers as fusion_readers
 from pysdmx.io.json.sdmxjson2.reader import deserializers as sdmx_readers
@@ -98,9 +99,23 @@ class __BaseRegistryClient:
             self.deser = fusion_readers
         else:
             self.deser = sdmx_readers
+        self._pool = InternPool()
+
+    def clear_cache(self) -> None:
+        """Forget the final artefacts shared across responses.
+
+        Final codelists, valuelists and concepts (i.e. with a version
+        like 1.0.0) cannot change anymore, and are therefore converted
+        to model objects once and then shared by all the artefacts
+        returned by the client (e.g. by all the schemas using CL_FREQ).
+        This releases them, e.g. after the cached schemas have been
+        discarded.
+        """
+        self._pool.clear()
 
     def _out(self, response: bytes, typ: Deserializer, *params: Any) -> Any:
-        return decode(response, type=typ).to_model(*params)
+        with interning(self._pool):
+            return decode(response, type=typ).to_model(*params)
 
     def _df_details(
         self, details: DataflowDetails
@@ -1,12 +1,15 @@
 """Upload metadata to an FMR instance."""
 
+import gzip
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Optional, Sequence, Union
+from types import TracebackType
+from typing import Any, Iterator, List, Optional, Sequence, Type, Union
 
 import httpx
 import msgspec
 
-from pysdmx.errors import Unauthorized
+from pysdmx.errors import Invalid, PysdmxError, Unauthorized
 from pysdmx.io.json.sdmxjson2.writer import serializers
 from pysdmx.model import MetadataReport
 from pysdmx.model.__base import MaintainableArtefact
@@ -42,6 +45,27 @@ class StructureAction(Enum):
     Replace = "Replace"
 
 
+class BatchResult(msgspec.Struct, frozen=True, omit_defaults=True):
+    """The outcome of the upload of a batch of artefacts or reports.
+
+    Attributes:
+        index: The position of the batch (starting at 0).
+        size: The number of artefacts or reports in the batch.
+        status: The HTTP status code returned by the service, if any.
+        error: The error raised while uploading the batch, if any.
+    """
+
+    index: int
+    size: int
+    status: Optional[int] = None
+    error: Optional[PysdmxError] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the batch was uploaded successfully."""
+        return self.error is None
+
+
 class RegistryMaintenanceClient:
     """EXPERIMENTAL: A client to update metadata in the FMR.
 
@@ -56,6 +80,10 @@ class RegistryMaintenanceClient:
     The client does not obtain or refresh OIDC/OAuth2 tokens itself. It is the
     responsibility of the caller to acquire a valid access token from their
     authentication provider and pass it to this client.
+
+    Connections to the service are pooled, and reused across uploads. The
+    client can be used as a context manager, or closed via ``close``, to
+    release them.
     """
 
     def __init__(
@@ -66,6 +94,7 @@ class RegistryMaintenanceClient:
         access_token: Optional[str] = None,
         pem: Optional[str] = None,
         timeout: float = 60.0,
+        compress: bool = False,
     ):
         """Instantiate a new client to update metadata in the target endpoint.
 
@@ -83,6 +112,9 @@ class RegistryMaintenanceClient:
                 this authority using this parameter.
             timeout: The maximum number of seconds to wait before considering
                 that a request timed out. Defaults to 60 seconds.
+            compress: Whether the uploaded messages are compressed with gzip
+                (with a ``Content-Encoding: gzip`` header). The targeted
+                service must support compressed requests. Defaults to False.
 
         Raises:
             Unauthorized: If neither ``access_token`` nor both ``user`` and
@@ -93,6 +125,9 @@ class RegistryMaintenanceClient:
         self._password = password
         self._access_token = access_token
         self._timeout = timeout
+        self._compress = compress
+        self._client: Optional[httpx.Client] = None
+        self._pool_size = 0
 
         if self._access_token is None and not (self._user and self._password):
             raise Unauthorized(
@@ -127,41 +162,140 @@ class RegistryMaintenanceClient:
 
         return httpx.BasicAuth(self._user, self._password)  # type: ignore[arg-type]
 
+    def __enter__(self) -> "RegistryMaintenanceClient":
+        """Return the client, to be used as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections to the service."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __get_client(self, concurrency: int) -> httpx.Client:
+        """Get the pooled client, with enough connections for the uploads.
+
+        The client is created again if its pool is too small for the
+        requested concurrency.
+        """
+        if self._client is not None and concurrency > self._pool_size:
+            self.close()
+        if self._client is None:
+            self._pool_size = max(concurrency, 10)
+            self._client = httpx.Client(
+                verify=self._ssl_context,
+                auth=self.__build_auth(),
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._pool_size,
+                    max_keepalive_connections=max(concurrency, 5),
+                ),
+            )
+        return self._client
+
     def __post(
         self,
+        client: httpx.Client,
         message: Union[MetadataMessage, StructureMessage],
         action: StructureAction,
         endpoint: str,
-    ) -> None:
-        with httpx.Client(verify=self._ssl_context) as client:
+    ) -> int:
+        headers = {
+            "Content-Type": "application/text",
+            "Action": action.value,
+        }
+        if isinstance(message, MetadataMessage):
+            serializer = serializers.metadata_message
+        else:
+            serializer = serializers.structure_message
+        body = self._encoder.encode(serializer.from_model(message))
+        if self._compress:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        r = client.post(endpoint, headers=headers, content=body)
+        r.raise_for_status()
+        return r.status_code
+
+    def __upload(
+        self,
+        client: httpx.Client,
+        index: int,
+        message: Union[MetadataMessage, StructureMessage],
+        size: int,
+        action: StructureAction,
+        endpoint: str,
+    ) -> BatchResult:
+        try:
+            status = self.__post(client, message, action, endpoint)
+            return BatchResult(index, size, status)
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            code = (
+                e.response.status_code
+                if isinstance(e, httpx.HTTPStatusError)
+                else None
+            )
             try:
-                auth = self.__build_auth()
-                headers = {
-                    "Content-Type": "application/text",
-                    "Action": action.value,
-                }
-                if isinstance(message, MetadataMessage):
-                    serializer = serializers.metadata_message
-                else:
-                    serializer = serializers.structure_message
-                bodyjs = self._encoder.encode(serializer.from_model(message))
-                r = client.post(
-                    endpoint,
-                    headers=headers,
-                    content=bodyjs,
-                    timeout=self._timeout,
-                    auth=auth,
-                )
-                r.raise_for_status()
-            except (httpx.RequestError, httpx.HTTPStatusError) as e:
                 map_httpx_errors(e)
+            except PysdmxError as error:
+                return BatchResult(index, size, code, error)
+
+    def __upload_all(
+        self,
+        messages: Iterator[Union[MetadataMessage, StructureMessage]],
+        sizes: Sequence[int],
+        action: StructureAction,
+        endpoint: str,
+        concurrency: int,
+        raise_errors: bool,
+    ) -> Sequence[BatchResult]:
+        if concurrency < 1:
+            raise Invalid(
+                "Invalid concurrency",
+                "At least one batch must be uploaded at a time.",
+                {"concurrency": concurrency},
+            )
+        client = self.__get_client(concurrency)
+        args = (
+            (client, i, m, sizes[i], action, endpoint)
+            for i, m in enumerate(messages)
+        )
+        results: List[BatchResult] = []
+        if concurrency == 1:
+            for a in args:
+                results.append(self.__upload(*a))
+                if raise_errors and results[-1].error is not None:
+                    raise results[-1].error
+            return results
+        with ThreadPoolExecutor(concurrency) as pool:
+            futures: List[Future[BatchResult]] = [
+                pool.submit(self.__upload, *a) for a in args
+            ]
+            for f in futures:
+                results.append(f.result())
+                if raise_errors and results[-1].error is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    raise results[-1].error
+        return results
 
     def put_structures(
         self,
         artefacts: Sequence[MaintainableArtefact],
         header: Optional[Header] = None,
         action: StructureAction = StructureAction.Replace,
-    ) -> None:
+        batch_size: Optional[int] = None,
+        concurrency: int = 1,
+        raise_errors: bool = True,
+    ) -> Sequence[BatchResult]:
         """EXPERIMENTAL: Upload SDMX structures to the FMR.
 
         This method is experimental and its interface or behavior may change
@@ -173,19 +307,51 @@ class RegistryMaintenanceClient:
                 supplied, pysdmx will generate one for you.
             action: How to apply the changes in case of already existing
                 structures.
+            batch_size: The maximum number of artefacts per uploaded
+                message. If not supplied, all artefacts are uploaded in
+                one message. Batches are encoded only when they are about
+                to be uploaded.
+            concurrency: The maximum number of batches uploaded at the
+                same time. Defaults to 1, i.e. one batch after the other.
+            raise_errors: Whether the error of the first failed batch is
+                raised (the batches not yet sent are then not uploaded). If
+                False, all batches are uploaded, and the errors are
+                available in the returned results.
+
+        Returns:
+            The outcome of the upload of each batch, in the order of the
+            batches.
+
+        Raises:
+            Invalid: If the batch size or the concurrency is lower than 1,
+                or if the service rejected a batch (and ``raise_errors`` is
+                True). Other pysdmx errors may be raised as well, depending
+                on the type of issue (e.g. ``Unavailable``).
         """
-        if not header:
-            header = Header()
-        message = StructureMessage(header=header, structures=artefacts)
         endpoint = f"{self._api_endpoint}/ws/secure/sdmxapi/rest"
-        return self.__post(message, action, endpoint)
+        batches = self.__split(artefacts, batch_size)
+        messages = (
+            StructureMessage(header=header or Header(), structures=b)
+            for b in batches
+        )
+        return self.__upload_all(
+            messages,
+            [len(b) for b in batches],
+            action,
+            endpoint,
+            concurrency,
+            raise_errors,
+        )
 
     def put_metadata_reports(
         self,
         reports: Sequence[MetadataReport],
         header: Optional[Header] = None,
         action: StructureAction = StructureAction.Replace,
-    ) -> None:
+        batch_size: Optional[int] = None,
+        concurrency: int = 1,
+        raise_errors: bool = True,
+    ) -> Sequence[BatchResult]:
         """EXPERIMENTAL: Upload SDMX metadata reports to the FMR.
 
         This method is experimental and its interface or behavior may change
@@ -197,12 +363,56 @@ class RegistryMaintenanceClient:
                 supplied, pysdmx will generate one for you.
             action: How to apply the changes in case of already existing
                 structures.
+            batch_size: The maximum number of reports per uploaded message.
+                If not supplied, all reports are uploaded in one message.
+                Batches are encoded only when they are about to be
+                uploaded.
+            concurrency: The maximum number of batches uploaded at the
+                same time. Defaults to 1, i.e. one batch after the other.
+            raise_errors: Whether the error of the first failed batch is
+                raised (the batches not yet sent are then not uploaded). If
+                False, all batches are uploaded, and the errors are
+                available in the returned results.
+
+        Returns:
+            The outcome of the upload of each batch, in the order of the
+            batches.
+
+        Raises:
+            Invalid: If the batch size or the concurrency is lower than 1,
+                or if the service rejected a batch (and ``raise_errors`` is
+                True). Other pysdmx errors may be raised as well, depending
+                on the type of issue (e.g. ``Unavailable``).
         """
-        if not header:
-            header = Header()
-        message = MetadataMessage(header=header, reports=reports)
         endpoint = f"{self._api_endpoint}/ws/secure/sdmx/v2/metadata"
-        return self.__post(message, action, endpoint)
+        batches = self.__split(reports, batch_size)
+        messages = (
+            MetadataMessage(header=header or Header(), reports=b)
+            for b in batches
+        )
+        return self.__upload_all(
+            messages,
+            [len(b) for b in batches],
+            action,
+            endpoint,
+            concurrency,
+            raise_errors,
+        )
+
+    def __split(
+        self, items: Sequence[Any], batch_size: Optional[int]
+    ) -> List[Sequence[Any]]:
+        if batch_size is None:
+            return [items]
+        if batch_size < 1:
+            raise Invalid(
+                "Invalid batch size",
+                "Batches must contain at least one artefact or report.",
+                {"batch_size": batch_size},
+            )
+        return [
+            items[i : i + batch_size] for i in range(0, len(items), batch_size)
+        ]
 
     def __sanitize_endpoint(self, endpoint: str) -> str:
         if endpoint.endswith("/"):
@@ -1,6 +1,7 @@
 """IO module for SDMX data."""
 
 from pysdmx.io.reader import get_datasets, read_sdmx
+from pysdmx.io.schema_registry import SchemaRegistry
 from pysdmx.io.writer import write_sdmx
 
-__all__ = ["read_sdmx", "get_datasets", "write_sdmx"]
+__all__ = ["read_sdmx", "get_datasets", "write_sdmx", "SchemaRegistry"]
@@ -0,0 +1,126 @@
+"""Sharing of the artefacts decoded out of several messages.
+
+Final artefacts cannot change anymore, so the model instance created
+for, say, a final codelist referenced by hundreds of data structures can
+be created once and shared by all of them. The pool of shared artefacts
+is bound to the current context while messages are converted to model
+objects, and nothing is shared when no pool is bound.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar, cast
+
+from pysdmx.errors import Invalid
+from pysdmx.util import is_final, parse_urn
+
+T = TypeVar("T")
+
+
+class InternPool:
+    """A pool of immutable model artefacts, indexed by URN.
+
+    Artefacts created out of their URN (see ``get``) and artefacts only
+    shared when equal (see ``share``) are kept apart, so that e.g. a
+    partial codelist is never returned instead of the complete one.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate an empty pool."""
+        self.__artefacts: Dict[str, Any] = {}
+        self.__shared: Dict[str, Any] = {}
+
+    def get(self, urn: str, factory: Callable[[], T]) -> T:
+        """Get the artefact with the supplied URN, creating it if needed.
+
+        If two threads create the same artefact at the same time, the
+        first one added to the pool is returned to both.
+        """
+        try:
+            return cast(T, self.__artefacts[urn])
+        except KeyError:
+            return cast(T, self.__artefacts.setdefault(urn, factory()))
+
+    def share(self, urn: str, artefact: T) -> T:
+        """Get the pooled artefact with the supplied URN, if equal.
+
+        The supplied artefact is added to the pool if there is no
+        artefact with this URN yet, and returned as is if the pooled
+        one is different.
+        """
+        pooled = self.__shared.setdefault(urn, artefact)
+        return cast(T, pooled) if pooled == artefact else artefact
+
+    def clear(self) -> None:
+        """Remove all artefacts from the pool."""
+        self.__artefacts.clear()
+        self.__shared.clear()
+
+    def __len__(self) -> int:
+        """Return the number of artefacts in the pool."""
+        return len(self.__artefacts) + len(self.__shared)
+
+
+_POOL: ContextVar[Optional[InternPool]] = ContextVar(
+    "pysdmx_intern_pool", default=None
+)
+
+
+@contextmanager
+def interning(pool: InternPool) -> Iterator[InternPool]:
+    """Share the final artefacts of the pool within the context."""
+    token = _POOL.set(pool)
+    try:
+        yield pool
+    finally:
+        _POOL.reset(token)
+
+
+def intern(urn: str, factory: Callable[[], T]) -> T:
+    """Get the shared instance of a final artefact, creating it if needed.
+
+    This is meant for artefacts that are fully identified by their URN,
+    i.e. complete (non-partial) maintainable artefacts.
+
+    Args:
+        urn: The URN (or short URN) of the artefact.
+        factory: The function creating the artefact.
+
+    Returns:
+        The shared instance if a pool is bound to the context and the
+        version in the URN is final, a new instance otherwise.
+    """
+    pool = _POOL.get()
+    if pool is None or not __final(urn):
+        return factory()
+    return pool.get(urn, factory)
+
+
+def share(urn: str, artefact: T) -> T:
+    """Get the shared instance of a final artefact, if equal.
+
+    This is meant for artefacts whose content also depends on other
+    artefacts of the message (e.g. a concept and its enumeration) or on
+    the query (e.g. partial codelists), and which are therefore only
+    shared when they are equal.
+
+    Args:
+        urn: The URN (or short URN) of the artefact.
+        artefact: The artefact.
+
+    Returns:
+        The shared instance if a pool is bound to the context, the
+        version in the URN is final and the shared instance is equal
+        to the artefact, the artefact otherwise.
+    """
+    pool = _POOL.get()
+    if pool is None or not __final(urn):
+        return artefact
+    return pool.share(urn, artefact)
+
+
+def __final(urn: str) -> bool:
+    try:
+        return is_final(parse_urn(urn).version)
+    except Invalid:
+        return False
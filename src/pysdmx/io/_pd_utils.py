@@ -1,12 +1,19 @@
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from pysdmx.errors import Invalid
 from pysdmx.io.pd import PandasDataset
 from pysdmx.model import DataType
 from pysdmx.model.dataflow import Schema
 
+# Element-wise str, as a NumPy ufunc on object arrays
+_to_str = np.frompyfunc(str, 1, 1)
+
 NUMERIC_TYPES = {
     DataType.BIG_INTEGER,
     DataType.COUNT,
@@ -40,24 +47,6 @@ def validate_schema_exists(dataset: PandasDataset) -> Schema:
     return dataset.structure
 
 
-def _is_null_value(value: Any) -> bool:
-    """Check if a value is null.
-
-    Empty strings are NOT considered null values.
-
-    Args:
-        value: The value to check.
-
-    Returns:
-        True if the value is null, False otherwise.
-    """
-    if isinstance(value, str):
-        # Empty strings are not considered null
-        return False
-
-    return pd.isna(value) or value is None
-
-
 def _get_null_representation(dtype: Optional[DataType] = None) -> str:
     """Get the appropriate null value representation based on data type.
 
@@ -75,26 +64,6 @@ def _get_null_representation(dtype: Optional[DataType] = None) -> str:
     return "#N/A"
 
 
-def _get_value_to_write(
-    value: Any,
-    required: bool = True,
-    dtype: Optional[DataType] = None,
-) -> Optional[str]:
-    """Get the value to write to the output, handling null representations.
-
-    Args:
-        value: The value to process.
-        required: Whether the component is required.
-        dtype: The data type of the component.
-
-    Returns:
-        The string value to write, or None if the value should be skipped.
-    """
-    if _is_null_value(value) or value == "":
-        return _get_null_representation(dtype) if required else None
-    return str(value)
-
-
 def transform_dataframe_for_writing(
     df: pd.DataFrame,
     schema: Schema,
@@ -106,6 +75,9 @@ def transform_dataframe_for_writing(
     - Empty strings for required components -> "NaN" or "#N/A"
     - Empty strings for optional components -> None (to be skipped)
 
+    The transformation is applied column by column, using the null and
+    empty string masks of each column.
+
     Args:
         df: The DataFrame to transform.
         schema: The Schema containing component definitions.
@@ -113,16 +85,54 @@ def transform_dataframe_for_writing(
     Returns:
         A new DataFrame with transformed values.
     """
-    df = df.copy()
+    # The columns are replaced, not modified, so a shallow copy is enough
+    df = df.copy(deep=False)
     for component in schema.components:
         if component.id in df.columns:
+            df[component.id] = __values_to_write(
+                df[component.id], component.required, component.dtype
+            )
+    return df
 
-            def transform_value(
-                v: Any,
-                req: bool = component.required,
-                dt: Optional[DataType] = component.dtype,
-            ) -> Optional[str]:
-                return _get_value_to_write(v, req, dt)
 
-            df[component.id] = df[component.id].apply(transform_value)
-    return df
+def __values_to_write(
+    column: pd.Series, required: bool, dtype: Optional[DataType]
+) -> Union[npt.NDArray[Any], pd.arrays.ArrowExtensionArray]:
+    """Get the values of a column to write to the output.
+
+    Null values and empty strings are replaced with the null
+    representation of the component. String columns are processed with
+    PyArrow compute, the other ones as arrays of Python objects.
+
+    Args:
+        column: The column to process.
+        required: Whether the component is required.
+        dtype: The data type of the component.
+
+    Returns:
+        The string values to write, None (or null) for values to be
+        skipped.
+    """
+    null = _get_null_representation(dtype) if required else None
+    if __is_string_dtype(column.dtype):
+        array = column.array.__arrow_array__()
+        missing = pc.fill_null(
+            pc.equal(array, pa.scalar("", array.type)), True
+        )
+        return pd.arrays.ArrowExtensionArray(
+            pc.if_else(missing, pa.scalar(null, array.type), array)
+        )
+    values = column.to_numpy(
+        dtype=object,
+        na_value=None,  # type: ignore[call-overload]
+    )
+    missing = pd.isna(values) | (values == "")
+    return np.where(missing, null, _to_str(values))  # type: ignore[arg-type]
+
+
+def __is_string_dtype(dtype: Any) -> bool:
+    """Check whether a column is a PyArrow-backed string column."""
+    return isinstance(dtype, pd.ArrowDtype) and (
+        pa.types.is_string(dtype.pyarrow_dtype)
+        or pa.types.is_large_string(dtype.pyarrow_dtype)
+    )
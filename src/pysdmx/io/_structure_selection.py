@@ -0,0 +1,166 @@
+"""Selection of the artefacts to be read from structure messages."""
+
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from msgspec import Struct
+
+from pysdmx.errors import Invalid
+from pysdmx.util import parse_short_urn, parse_urn
+
+# Any URN or short URN found in an artefact, with the agency, ID and
+# version of the maintainable artefact it points to (items are ignored).
+_URN = re.compile(
+    r"\b[A-Z][A-Za-z]*="
+    r"([^:\s\"'<>=]+):([^(\s\"'<>]+)\(([^)\s\"'<>]+)\)"
+)
+
+# A reference to a maintainable artefact: agency, ID and (optional) version
+Dependency = Tuple[str, str, Optional[str]]
+
+
+class Candidate(Struct, frozen=True):
+    """An artefact of a structure message, which may be selected.
+
+    Attributes:
+        sdmx_type: The SDMX class of the artefact (e.g. Codelist).
+        agency: The maintenance agency of the artefact.
+        id: The ID of the artefact.
+        version: The version of the artefact.
+        content: The raw content of the artefact in the message.
+    """
+
+    sdmx_type: str
+    agency: str
+    id: str
+    version: str
+    content: Any = None
+
+
+class StructureSelector(Struct, frozen=True):
+    """The artefacts to be read from a structure message.
+
+    Attributes:
+        types: The SDMX classes (e.g. Codelist) of the artefacts to be
+            read, in lower case.
+        references: The (SDMX class, agency, ID, version) of the
+            artefacts to be read, the SDMX class being in lower case,
+            or empty if unknown.
+    """
+
+    types: Set[str]
+    references: Set[Tuple[str, str, str, str]]
+
+    @classmethod
+    def from_query(cls, only: Sequence[str]) -> "StructureSelector":
+        """Create a selector out of a list of SDMX classes and URNs.
+
+        Args:
+            only: The SDMX classes (e.g. Codelist or DataStructure),
+                URNs and short URNs (e.g. Codelist=BIS:CL_FREQ(1.0)) of
+                the artefacts to be read. Item URNs select the item
+                scheme the item belongs to.
+
+        Returns:
+            The selector matching the supplied input.
+
+        Raises:
+            Invalid: If a URN cannot be parsed.
+        """
+        types = set()
+        references = set()
+        for entry in only:
+            if "=" not in entry:
+                types.add(entry.strip().lower())
+                continue
+            # Item URNs select the item scheme the item belongs to
+            head, sep, _ = entry.partition(").")
+            try:
+                ref: Any = (
+                    parse_urn(entry)
+                    if entry.startswith("urn:")
+                    else parse_short_urn(f"{head})" if sep else entry)
+                )
+            except Invalid as ex:
+                raise Invalid(
+                    "Invalid selection",
+                    f"{entry} is neither an SDMX class nor a valid URN.",
+                ) from ex
+            # The class of the item scheme is not known for item URNs
+            sdmx_type = "" if sep or hasattr(ref, "item_id") else ref.sdmx_type
+            references.add(
+                (sdmx_type.lower(), ref.agency, ref.id, ref.version)
+            )
+        return StructureSelector(types, references)
+
+    def matches(self, candidate: Candidate) -> bool:
+        """Whether the artefact has been explicitly requested."""
+        sdmx_type = candidate.sdmx_type.lower()
+        key = (candidate.agency, candidate.id, candidate.version)
+        return (
+            sdmx_type in self.types
+            or (sdmx_type, *key) in self.references
+            or ("", *key) in self.references
+        )
+
+    def select(
+        self,
+        candidates: Sequence[Candidate],
+        dependencies: Callable[[Any], Iterable[Dependency]],
+    ) -> List[bool]:
+        """Flag the artefacts to be read.
+
+        These are the requested artefacts, as well as, recursively,
+        the artefacts they reference (e.g. the codelists and concept
+        schemes used by a data structure), so that the requested
+        artefacts can be fully read.
+
+        Args:
+            candidates: The artefacts in the message.
+            dependencies: A function returning the artefacts referenced
+                in the raw content of an artefact. It is only called for
+                the artefacts to be read.
+
+        Returns:
+            For each candidate, whether it must be read.
+        """
+        index: Dict[Tuple[str, str], List[int]] = {}
+        for i, c in enumerate(candidates):
+            index.setdefault((c.agency, c.id), []).append(i)
+        selected = [self.matches(c) for c in candidates]
+        pending = [i for i, s in enumerate(selected) if s]
+        while pending:
+            current = candidates[pending.pop()]
+            for agency, id_, version in dependencies(current.content):
+                for i in index.get((agency, id_), ()):
+                    if not selected[i] and self.__same_version(
+                        version, candidates[i].version
+                    ):
+                        selected[i] = True
+                        pending.append(i)
+        return selected
+
+    @staticmethod
+    def __same_version(expected: Optional[str], actual: str) -> bool:
+        # Missing and wildcarded versions match any version
+        return (
+            expected is None
+            or expected == actual
+            or "+" in expected
+            or "*" in expected
+        )
+
+
+def find_urn_dependencies(text: str) -> Iterable[Dependency]:
+    """Return the maintainable artefacts referenced (by URN) in the text."""
+    return ((m[0], m[1], m[2]) for m in _URN.findall(text))
@@ -0,0 +1,159 @@
+"""Binary columnar cache for PandasDatasets.
+
+Datasets are written as Arrow IPC files (which can be memory-mapped) or
+Parquet files, so that they can be read again without parsing an SDMX
+message or casting the columns a second time. The dataset metadata (e.g.
+the structure, the action and the dataset-level attributes), and
+optionally the Schema of the dataset, are kept in the file metadata.
+"""
+
+from pathlib import Path
+from typing import Any, Literal, Type, Union
+
+from pysdmx.__extras_check import __check_data_extra
+
+__check_data_extra()
+
+# E402 is needed here to ensure a clear message is used on missing import
+import msgspec  # noqa: E402
+import pandas as pd  # noqa: E402
+import pyarrow as pa  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from pysdmx.errors import Invalid  # noqa: E402
+from pysdmx.io.pd import PandasDataset  # noqa: E402
+from pysdmx.model import Component, Components, encoders  # noqa: E402
+from pysdmx.model.dataset import Dataset  # noqa: E402
+
+METADATA_KEY = b"pysdmx.dataset"
+
+_IPC_MAGIC = b"ARROW1"
+_PARQUET_MAGIC = b"PAR1"
+
+
+def write(
+    dataset: PandasDataset,
+    output_path: Union[str, Path],
+    file_format: Literal["ipc", "parquet"] = "ipc",
+    include_schema: bool = True,
+) -> None:
+    """Write a dataset to an Arrow IPC or Parquet file.
+
+    The columns are written with their (PyArrow-backed) dtypes, and the
+    dataset metadata are kept in the file metadata, so that reading the
+    file gives back the same dataset.
+
+    Args:
+        dataset: The dataset to be written.
+        output_path: The path of the file to be written.
+        file_format: Either "ipc" (Arrow IPC file format, which can be
+            memory-mapped when reading) or "parquet".
+        include_schema: Whether the Schema of the dataset (if any) is
+            kept in the file metadata. If False, only the short URN
+            of the structure is kept.
+
+    Raises:
+        Invalid: If the file format is not supported.
+    """
+    if file_format not in ("ipc", "parquet"):
+        raise Invalid(
+            "Unsupported format",
+            f"{file_format} is not a supported cache format.",
+            {"supported": ["ipc", "parquet"]},
+        )
+    meta = Dataset(
+        **{f: getattr(dataset, f) for f in Dataset.__struct_fields__}
+    )
+    if not include_schema:
+        meta.structure = dataset.short_urn
+    table = pa.Table.from_pandas(dataset.data)
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            METADATA_KEY: msgspec.json.encode(meta, enc_hook=encoders),
+        }
+    )
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if file_format == "parquet":
+        pq.write_table(table, output_path)
+    else:
+        sink = pa.OSFile(str(output_path), "wb")
+        with sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read(input_path: Union[str, Path]) -> PandasDataset:
+    """Read a dataset from an Arrow IPC or Parquet file.
+
+    The file format is detected out of the content of the file. Arrow
+    IPC files are memory-mapped, and the columns of the returned dataset
+    point directly to the mapped memory (i.e. they are not copied).
+    Parquet files need to be decoded, and are therefore always copied
+    into memory.
+
+    As the columns already have the dtypes of the written dataset, they
+    are not cast again.
+
+    The facets of the components are decoded to their declared types.
+    Facets kept as strings by some readers (e.g. a maximum length read
+    from SDMX-ML) are therefore read back as numbers, so that the Schema
+    may then differ from the written one.
+
+    Args:
+        input_path: The path of the file to be read.
+
+    Returns:
+        The dataset, with its structure (the Schema if it was
+        included when writing the file, the short URN otherwise),
+        action and dataset-level attributes.
+
+    Raises:
+        Invalid: If the file is neither an Arrow IPC nor a Parquet
+            file, or if it was not written by pysdmx.
+    """
+    input_path = Path(input_path)
+    with open(input_path, "rb") as f:
+        magic = f.read(len(_IPC_MAGIC))
+    if magic == _IPC_MAGIC:
+        with pa.memory_map(str(input_path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    elif magic.startswith(_PARQUET_MAGIC):
+        table = pq.read_table(input_path, memory_map=True)
+    else:
+        raise Invalid(
+            "Unsupported format",
+            f"{input_path} is neither an Arrow IPC nor a Parquet file.",
+        )
+
+    metadata = table.schema.metadata or {}
+    if METADATA_KEY not in metadata:
+        raise Invalid(
+            "Invalid cache file",
+            f"{input_path} does not contain pysdmx dataset metadata.",
+        )
+    meta = msgspec.json.decode(
+        metadata[METADATA_KEY], type=Dataset, dec_hook=__decoders
+    )
+    # The dtypes were applied before writing the file, so the columns
+    # are assigned after construction, to avoid casting them again.
+    dataset = PandasDataset(
+        **{f: getattr(meta, f) for f in Dataset.__struct_fields__},
+        data=pd.DataFrame(),
+    )
+    dataset.data = table.to_pandas(types_mapper=pd.ArrowDtype)
+    return dataset
+
+
+def __decoders(type: Type, obj: Any) -> Any:  # type: ignore[type-arg]
+    """Decode the components of the Schema.
+
+    Conversions are lenient, as some readers keep the facets of the
+    components as strings.
+    """
+    if type is Components:
+        return Components(
+            [msgspec.convert(item, Component, strict=False) for item in obj]
+        )
+    raise NotImplementedError(f"Objects of type {type} are not supported")
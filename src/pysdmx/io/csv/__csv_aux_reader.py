@@ -1,8 +1,11 @@
+from typing import Optional
+
 import pandas as pd
 
 from pysdmx.errors import Invalid
 from pysdmx.io.pd import PandasDataset
 from pysdmx.model.dataset import ActionType
+from pysdmx.toolkit.pd._filter_utils import Predicate
 
 ACTION_SDMX_CSV_MAPPER_READING = {
     "A": ActionType.Append,
@@ -15,6 +18,7 @@ ACTION_SDMX_CSV_MAPPER_READING = {
 def __generate_dataset_from_sdmx_csv(  # noqa: C901
     data: pd.DataFrame,
     references_21: bool = False,
+    predicate: Optional[Predicate] = None,
 ) -> PandasDataset:
     urn = ""
     df_csv = pd.DataFrame()
@@ -92,6 +96,9 @@ def __generate_dataset_from_sdmx_csv(  # noqa: C901
         df_csv = data.drop(["DATAFLOW"], axis=1)
 
         urn = f"Dataflow={structure_id}"
+    if predicate is not None:
+        # Datasets without matching rows are kept, but empty
+        df_csv = df_csv[predicate(df_csv)].reset_index(drop=True)
     return PandasDataset(
         structure=urn,
         data=df_csv,
@@ -1,17 +1,26 @@
-from copy import copy
 from typing import Dict, List, Literal, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from pysdmx.errors import Invalid
 from pysdmx.io._pd_utils import (
     transform_dataframe_for_writing,
     validate_schema_exists,
 )
-from pysdmx.io.pd import PandasDataset
+from pysdmx.io.pd import PandasDataset, stringify_dataset
 from pysdmx.model import Schema
 from pysdmx.model.dataflow import Component, Role
 from pysdmx.model.dataset import ActionType
+from pysdmx.model.metadata import MetadataReport
 from pysdmx.toolkit.pd._data_utils import format_labels, get_codes
+from pysdmx.toolkit.pd._metadata import (
+    ATTRIBUTE,
+    LANG,
+    REPORT,
+    VALUE,
+    reports_to_frame,
+)
 
 _NULL_STRINGS = frozenset(("", "nan", "None"))
 
@@ -221,9 +230,10 @@ def _write_csv_2_aux(
         # Validate that the dataset has a Schema defined
         schema = validate_schema_exists(dataset)
 
-        # Create a copy and apply null value transformation
-        df: pd.DataFrame = copy(dataset.data)
-        df = transform_dataframe_for_writing(df, schema)
+        # Apply the null value transformation to the string view
+        df = transform_dataframe_for_writing(
+            stringify_dataset(dataset), schema
+        )
 
         structure_ref, unique_id = dataset.short_urn.split("=", maxsplit=1)
 
@@ -259,3 +269,105 @@ def _write_csv_2_aux(
         )
         dataframes.append(df)
     return dataframes
+
+
+def __metadata_structure(report: MetadataReport) -> Tuple[str, str]:
+    """Get the STRUCTURE and STRUCTURE_ID columns of a metadata report."""
+    if report.metadataflow:
+        return "metadataflow", report.metadataflow.split("=", 1)[-1]
+    elif report.metadataProvisionAgreement:
+        return (
+            "metadataprovision",
+            report.metadataProvisionAgreement.split("=", 1)[-1],
+        )
+    raise Invalid(
+        "Missing structure",
+        (
+            "A metadataflow or a metadata provision agreement is needed "
+            "to write a metadata report to SDMX-CSV."
+        ),
+        {"metadata_report": report.short_urn},
+    )
+
+
+def _write_metadata_csv_aux(
+    reports: Sequence[MetadataReport],
+    references_21: bool = False,
+) -> pd.DataFrame:
+    """Write metadata reports to SDMX-CSV 2.x format.
+
+    Each report is written as one row, with the STRUCTURE, STRUCTURE_ID,
+    ACTION, METADATASET_ID and TARGET columns, followed by one column
+    per attribute, named after the path of the attribute (e.g.
+    CONTACT.EMAIL). Several values for the same attribute are written
+    as an array (e.g. [A;B]), and localised values are preceded by
+    their language (e.g. en:Text).
+
+    Args:
+        reports: The metadata reports to write.
+        references_21: Whether to use SDMX 2.1 references.
+
+    Returns:
+        The DataFrame ready for CSV output.
+
+    Raises:
+        Invalid: If a report has neither a metadataflow nor a metadata
+            provision agreement.
+    """
+    header: Dict[str, List[str]] = {
+        "STRUCTURE": [],
+        "STRUCTURE_ID": [],
+        "ACTION": [],
+        "METADATASET_ID": [],
+        "TARGET": [],
+    }
+    for report in reports:
+        structure_ref, unique_id = __metadata_structure(report)
+        action = report.action or ActionType.Information
+        if references_21 and action in [
+            ActionType.Information,
+            ActionType.Append,
+        ]:
+            action_value = "M"
+        else:
+            action_value = SDMX_CSV_ACTION_MAPPER[action]
+        header["STRUCTURE"].append(structure_ref)
+        header["STRUCTURE_ID"].append(unique_id)
+        header["ACTION"].append(action_value)
+        header["METADATASET_ID"].append(
+            report.short_urn.split("=", maxsplit=1)[1]
+        )
+        header["TARGET"].append(
+            f"[{';'.join(report.targets)}]"
+            if len(report.targets) > 1
+            else "".join(report.targets)
+        )
+    df = pd.DataFrame(header)
+
+    # The attribute columns are pivoted out of the flattened reports,
+    # and only the attributes with several values need to be grouped
+    flat = reports_to_frame(reports)
+    flat = flat[flat[VALUE].notna()]
+    text = flat[VALUE].astype(str)
+    lang = flat[LANG].astype(object)
+    text = text.where(lang.isna(), lang + ":" + text)
+    index = pd.MultiIndex.from_arrays([flat[REPORT], flat[ATTRIBUTE]])
+    several = index.duplicated(keep=False)
+    first = ~index.duplicated()
+    values = text.to_numpy(dtype=object)
+    if several.any():
+        groups, uniques = pd.factorize(index[several])
+        parts: List[List[str]] = [[] for _ in range(len(uniques))]
+        for group, value in zip(groups.tolist(), values[several].tolist()):
+            parts[group].append(value)
+        values[several & first] = [f"[{';'.join(p)}]" for p in parts]
+    urns = {r.short_urn: i for i, r in reversed(list(enumerate(reports)))}
+    rows = np.fromiter(urns.values(), dtype=np.intp)[
+        pd.Index(list(urns)).get_indexer(pd.Index(flat[REPORT]))
+    ]
+    columns, attributes = pd.factorize(flat[ATTRIBUTE])
+    table = np.full((len(df), len(attributes)), None, dtype=object)
+    table[rows[first], columns[first]] = values[first]
+    return pd.concat(
+        [df, pd.DataFrame(table, columns=list(attributes))], axis=1
+    )
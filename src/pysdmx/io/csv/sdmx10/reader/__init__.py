@@ -1,21 +1,27 @@
 """SDMX 1.0 CSV reader module."""
 
 from io import StringIO
-from typing import Sequence
+from typing import Optional, Sequence
 
 import pandas as pd
 
+from pysdmx.api.dc.query import Filter
 from pysdmx.errors import Invalid
 from pysdmx.io.csv.__csv_aux_reader import __generate_dataset_from_sdmx_csv
 from pysdmx.io.pd import PandasDataset
+from pysdmx.toolkit.pd import compile_filter
 from pysdmx.toolkit.pd._data_utils import drop_labels
 
 
-def read(input_str: str) -> Sequence[PandasDataset]:
+def read(
+    input_str: str, filters: Optional[Filter] = None
+) -> Sequence[PandasDataset]:
     """Reads csv data and returns a sequence of Datasets.
 
     Args:
         input_str: str.
+        filters: If set, only the observations matching the filters
+            are kept.
 
     Returns:
         A Sequence of Pandas Datasets.
@@ -42,6 +48,8 @@ def read(input_str: str) -> Sequence[PandasDataset]:
     # Convert all columns to strings
     df_csv = df_csv.astype(str).replace({"nan": "NaN", "<NA>": "NaN"})
     df_csv = drop_labels(df_csv)
+    # Filtering by dataset keeps the datasets without matching rows
+    predicate = None if filters is None else compile_filter(filters)
 
     # Determine the id column based on the SDMX-CSV version
     id_column = "DATAFLOW"
@@ -54,7 +62,9 @@ def read(input_str: str) -> Sequence[PandasDataset]:
     payload = []
     for df in list_df:
         # Generate a dataset from each subset of the DataFrame
-        dataset = __generate_dataset_from_sdmx_csv(data=df)
+        dataset = __generate_dataset_from_sdmx_csv(
+            data=df, predicate=predicate
+        )
 
         # Add the dataset to the payload dictionary
         payload.append(dataset)
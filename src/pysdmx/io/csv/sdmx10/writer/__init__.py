@@ -1,6 +1,5 @@
 """SDMX 1.0 CSV writer module."""
 
-from copy import copy
 from pathlib import Path
 from typing import Literal, Optional, Sequence, Union
 
@@ -11,7 +10,11 @@ from pysdmx.io._pd_utils import (
     validate_schema_exists,
 )
 from pysdmx.io.csv.__csv_aux_writer import __write_time_period
-from pysdmx.io.pd import PandasDataset, stringify_dataframe
+from pysdmx.io.pd import (
+    PandasDataset,
+    stringify_dataframe,
+    stringify_dataset,
+)
 from pysdmx.toolkit.pd._data_utils import format_labels
 
 
@@ -53,9 +56,10 @@ def write(
         # Validate that the dataset has a Schema defined
         schema = validate_schema_exists(dataset)
 
-        # Create a copy and apply null value transformation
-        df: pd.DataFrame = copy(dataset.data)
-        df = transform_dataframe_for_writing(df, schema)
+        # Apply the null value transformation to the string view
+        df = transform_dataframe_for_writing(
+            stringify_dataset(dataset), schema
+        )
 
         # Add additional attributes to the dataset
         for k, v in dataset.attributes.items():
@@ -0,0 +1,46 @@
+"""SDMX 2.0 CSV writer for reference metadata."""
+
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from pysdmx.io.csv.__csv_aux_writer import _write_metadata_csv_aux
+from pysdmx.io.pd import stringify_dataframe
+from pysdmx.model.metadata import MetadataReport
+
+
+def write(
+    reports: Sequence[MetadataReport],
+    output_path: Optional[Union[str, Path]] = None,
+) -> Optional[str]:
+    """Write reference metadata reports to SDMX-CSV 2.0 format.
+
+    Each report is written as one row, with one column per attribute,
+    named after the path of the attribute (e.g. CONTACT.EMAIL). Several
+    values for the same attribute are written as an array (e.g. [A;B]),
+    and localised values are preceded by their language (e.g. en:Text).
+
+    Args:
+        reports: The metadata reports to write. They must have a
+            metadataflow or a metadata provision agreement.
+        output_path: Path to write the reports to.
+          If None, the reports are returned as a string.
+
+    Returns:
+        SDMX CSV reference metadata as a string, if output_path is None.
+
+    Raises:
+        Invalid: If a report has neither a metadataflow nor a metadata
+            provision agreement.
+    """
+    all_data = stringify_dataframe(
+        _write_metadata_csv_aux(reports, references_21=False)
+    )
+
+    # If the output path is an empty string we use None
+    output_path = (
+        None
+        if isinstance(output_path, str) and output_path == ""
+        else output_path
+    )
+
+    return all_data.to_csv(output_path, index=False, header=True)
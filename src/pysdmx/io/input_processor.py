@@ -145,6 +145,13 @@ def __get_sdmx_json_flavour(input_str: str) -> Tuple[str, Format]:
         return input_str, Format.STRUCTURE_SDMX_JSON_2_0_0
     elif "2.1/sdmx-json-structure-schema.json" in flavour_check:
         return input_str, Format.STRUCTURE_SDMX_JSON_2_1_0
+    elif "2.0.0/sdmx-json-data-schema.json" in flavour_check:
+        return input_str, Format.DATA_SDMX_JSON_2_0_0
+    elif (
+        "2.1/sdmx-json-data-schema.json" in flavour_check
+        or "2.1.0/sdmx-json-data-schema.json" in flavour_check
+    ):
+        return input_str, Format.DATA_SDMX_JSON_2_1_0
     elif "sdmx-json" in flavour_check:
         raise NotImplemented(
             "Unsupported format", "This flavour of SDMX-JSON is not supported."
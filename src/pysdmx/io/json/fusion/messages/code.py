@@ -6,6 +6,7 @@ from typing import Optional, Sequence, Tuple
 
 from msgspec import Struct
 
+from pysdmx.io._intern import intern, share
 from pysdmx.io.json.fusion.messages.core import (
     FusionAnnotation,
     FusionLink,
@@ -79,6 +80,7 @@ class FusionCodelist(Struct, frozen=True, rename={"agency": "agencyId"}):
     descriptions: Sequence[FusionString] = ()
     version: str = "1.0"
     items: Sequence[FusionCode] = ()
+    isPartial: bool = False
 
     def to_model(self, extract_urns: bool = False) -> CL:
         """Converts a JsonCodelist to a standard codelist."""
@@ -95,6 +97,17 @@ class FusionCodelist(Struct, frozen=True, rename={"agency": "agencyId"}):
             sdmx_type=t,  # type: ignore[arg-type]
         )
 
+    def to_shared_model(self) -> CL:
+        """Converts a codelist, sharing final ones across messages.
+
+        Complete codelists are only converted once, while partial ones
+        (e.g. codelists restricted by a constraint) are shared when
+        equal.
+        """
+        if self.isPartial:
+            return share(self.urn, self.to_model())
+        return intern(self.urn, self.to_model)
+
 
 class FusionCodelistMessage(Struct, frozen=True):
     """Fusion-JSON payload for /codelist queries."""
@@ -256,7 +269,7 @@ class FusionHierarchyAssociation(
         codelists: Sequence[FusionCodelist],
     ) -> HA:
         """Converts a FusionHierarchyAssocation to a standard association."""
-        cls = [cl.to_model() for cl in codelists]
+        cls = [cl.to_shared_model() for cl in codelists]
         m = find_by_urn(hierarchies, self.hierarchyRef).to_model(cls)
         return HA(
             id=self.id,
@@ -4,6 +4,7 @@ from typing import Optional, Sequence
 
 import msgspec
 
+from pysdmx.io._intern import share
 from pysdmx.io.json.fusion.messages.code import FusionCodelist
 from pysdmx.io.json.fusion.messages.core import (
     FusionRepresentation,
@@ -42,7 +43,7 @@ class FusionConcept(msgspec.Struct, frozen=True):
             if self.representation and c
             else None
         )
-        return Concept(
+        concept = Concept(
             id=self.id,
             dtype=dt,
             facets=f,
@@ -52,6 +53,7 @@ class FusionConcept(msgspec.Struct, frozen=True):
             enum_ref=cl_ref,
             urn=self.urn,
         )
+        return share(self.urn, concept)
 
 
 class FusionConceptScheme(
@@ -127,10 +127,10 @@ class FusionRepresentation(msgspec.Struct, frozen=True):
         if self.representation:
             try:
                 a = find_by_urn(codelists, self.representation)
-                cl = a.to_model()
-                codes = [
-                    c.to_model() for c in a.items if not valid or c.id in valid
-                ]
+                cl = a.to_shared_model()
+                if not valid:
+                    return cl
+                codes = [c for c in cl.codes if c.id in valid]
                 return msgspec.structs.replace(cl, items=codes)
             except NotFound:
                 # This is OK. In case of schema queries, if a component
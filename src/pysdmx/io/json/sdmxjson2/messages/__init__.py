@@ -16,6 +16,7 @@ from pysdmx.io.json.sdmxjson2.messages.constraint import (
     JsonDataConstraintMessage,
 )
 from pysdmx.io.json.sdmxjson2.messages.consumer import JsonConsumerMessage
+from pysdmx.io.json.sdmxjson2.messages.data import JsonDataMessage
 from pysdmx.io.json.sdmxjson2.messages.dataflow import (
     JsonDataflowMessage,
     JsonDataflowsMessage,
@@ -58,6 +59,7 @@ __all__ = [
     "JsonDataConstraintMessage",
     "JsonDataflowMessage",
     "JsonDataflowsMessage",
+    "JsonDataMessage",
     "JsonDataStructuresMessage",
     "JsonMetadataProviderMessage",
     "JsonProviderMessage",
@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from datetime import timezone as tz
-from typing import Optional, Sequence, Tuple
+from typing import Optional, Sequence, Tuple, Union
 
 from msgspec import Struct
 
 from pysdmx import errors
+from pysdmx.io._intern import intern, share
 from pysdmx.io.json.sdmxjson2.messages.core import (
     ItemSchemeType,
     JsonAnnotation,
@@ -237,6 +238,19 @@ class JsonCodelists(Struct, frozen=True, omit_defaults=True):
     valueLists: Sequence[JsonValuelist] = ()
 
 
+def _to_shared_model(scheme: Union[JsonCodelist, JsonValuelist]) -> Codelist:
+    """Converts a codelist, sharing final ones across messages.
+
+    Complete codelists are only converted once, while partial ones (e.g.
+    codelists restricted by a constraint) are shared when equal.
+    """
+    kind = "Codelist" if isinstance(scheme, JsonCodelist) else "ValueList"
+    urn = f"{kind}={scheme.agency}:{scheme.id}({scheme.version})"
+    if scheme.isPartial:
+        return share(urn, scheme.to_model())
+    return intern(urn, scheme.to_model)
+
+
 class JsonCodelistMessage(Struct, frozen=True, omit_defaults=True):
     """SDMX-JSON payload for /codelist queries."""
 
@@ -392,7 +406,7 @@ class JsonHierarchy(ItemSchemeType, frozen=True, omit_defaults=True):
 
     def to_model(self, codelists: Sequence[JsonCodelist]) -> Hierarchy:
         """Converts a JsonHierarchy to a standard hierarchy."""
-        cls = [cl.to_model() for cl in codelists]
+        cls = [_to_shared_model(cl) for cl in codelists]
         return Hierarchy(
             id=self.id,
             name=self.name,
@@ -5,7 +5,11 @@ from typing import Optional, Sequence
 import msgspec
 
 from pysdmx import errors
-from pysdmx.io.json.sdmxjson2.messages.code import JsonCodelist
+from pysdmx.io._intern import share
+from pysdmx.io.json.sdmxjson2.messages.code import (
+    JsonCodelist,
+    _to_shared_model,
+)
 from pysdmx.io.json.sdmxjson2.messages.core import (
     ItemSchemeType,
     JsonAnnotation,
@@ -53,7 +57,7 @@ class JsonConcept(NameableType, frozen=True, omit_defaults=True):
             cl_ref = None
         urn_lnk = [lnk for lnk in self.links if lnk.rel == "self"]
         c_urn = urn_lnk[0].urn if len(urn_lnk) > 0 else None
-        return Concept(
+        concept = Concept(
             id=self.id,
             dtype=dt,
             facets=facets,
@@ -63,6 +67,7 @@ class JsonConcept(NameableType, frozen=True, omit_defaults=True):
             enum_ref=cl_ref,
             urn=c_urn,
         )
+        return share(c_urn, concept) if c_urn else concept
 
     @classmethod
     def from_model(self, concept: Concept) -> "JsonConcept":
@@ -103,7 +108,7 @@ class JsonConceptScheme(ItemSchemeType, frozen=True, omit_defaults=True):
 
     def to_model(self, codelists: Sequence[JsonCodelist]) -> ConceptScheme:
         """Converts a JsonConceptScheme to a standard concept scheme."""
-        cls = [cl.to_model() for cl in codelists]
+        cls = [_to_shared_model(cl) for cl in codelists]
         concepts = [c.to_model(cls) for c in self.concepts]
         return ConceptScheme(
             id=self.id,
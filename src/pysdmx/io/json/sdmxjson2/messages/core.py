@@ -224,7 +224,9 @@ class JsonRepresentation(msgspec.Struct, frozen=True, omit_defaults=True):
         if self.enumeration:
             try:
                 a = find_by_urn(codelists, self.enumeration)
-                codes = [c for c in a.codes if not valid or c.id in valid]
+                if not valid:
+                    return a
+                codes = [c for c in a.codes if c.id in valid]
                 return msgspec.structs.replace(a, items=codes)
             except NotFound:
                 # This is OK. In case of schema queries, if a component
@@ -306,14 +308,15 @@ class JsonHeader(msgspec.Struct, frozen=True, omit_defaults=True):
     def from_model(
         self,
         header: Header,
-        msg_type: Literal["structure", "metadata"] = "structure",
+        msg_type: Literal["structure", "metadata", "data"] = "structure",
         msg_version: Literal["2.0.0", "2.1"] = "2.0.0",
     ) -> "JsonHeader":
         """Create an SDMX-JSON header from a pysdmx Header."""
         if msg_version == "2.0.0":
+            folder = "data" if msg_type == "data" else "structure"
             schema = (
                 "https://raw.githubusercontent.com/sdmx-twg/sdmx-json/"
-                f"develop/structure-message/tools/schemas/{msg_version}/"
+                f"develop/{folder}-message/tools/schemas/{msg_version}/"
                 f"sdmx-json-{msg_type}-schema.json"
             )
         else:
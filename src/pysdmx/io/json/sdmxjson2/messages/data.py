@@ -0,0 +1,132 @@
+"""Collection of SDMX-JSON schemas for data messages.
+
+In SDMX-JSON data messages, the values of the components are listed
+once, in the structure of the message, and the series and observations
+only contain the position of their values in these lists.
+
+Only the fields needed to read and write the data are modelled. The
+other fields (e.g. the annotations) are ignored when decoding.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import msgspec
+
+from pysdmx.io.json.sdmxjson2.messages.core import JsonHeader, JsonLink
+
+
+class JsonComponentValue(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for a value of a component.
+
+    Coded values have an ID and a name, while uncoded values only
+    have a value.
+    """
+
+    id: Optional[str] = None
+    name: Optional[str] = None
+    value: Any = None
+
+
+class JsonRelationship(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for the relationship of an attribute."""
+
+    dataflow: Optional[Dict[str, Any]] = None
+    dimensions: Optional[Sequence[str]] = None
+    observation: Optional[Dict[str, Any]] = None
+    primaryMeasure: Optional[str] = None
+    measures: Optional[Sequence[str]] = None
+
+
+class JsonDataComponent(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for a dimension, measure or attribute."""
+
+    id: str
+    name: Optional[str] = None
+    keyPosition: Optional[int] = None
+    relationship: Optional[JsonRelationship] = None
+    values: Sequence[Optional[JsonComponentValue]] = ()
+
+
+class JsonDataDimensions(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for the dimensions, by presentation level."""
+
+    dataSet: Sequence[JsonDataComponent] = ()
+    series: Sequence[JsonDataComponent] = ()
+    observation: Sequence[JsonDataComponent] = ()
+
+
+class JsonDataMeasures(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for the measures."""
+
+    observation: Sequence[JsonDataComponent] = ()
+
+
+class JsonDataAttributes(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for the attributes, by presentation level."""
+
+    dataSet: Sequence[JsonDataComponent] = ()
+    dimensionGroup: Sequence[JsonDataComponent] = ()
+    series: Sequence[JsonDataComponent] = ()
+    observation: Sequence[JsonDataComponent] = ()
+
+
+class JsonDataStructure(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for the structure of one or more datasets."""
+
+    dimensions: JsonDataDimensions
+    links: Sequence[JsonLink] = ()
+    name: Optional[str] = None
+    measures: JsonDataMeasures = msgspec.field(
+        default_factory=JsonDataMeasures
+    )
+    attributes: JsonDataAttributes = msgspec.field(
+        default_factory=JsonDataAttributes
+    )
+    dataSets: Sequence[int] = ()
+
+
+class JsonSeries(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for a series.
+
+    The observations are keyed by the position of the values of the
+    observation-level dimensions, and contain the values of the
+    measures, followed by the positions of the values of the
+    observation-level attributes.
+    """
+
+    attributes: Sequence[Any] = ()
+    observations: Dict[str, Sequence[Any]] = msgspec.field(
+        default_factory=dict
+    )
+
+
+class JsonDataSet(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for a dataset.
+
+    The data are either organised in series, keyed by the position of
+    the values of the series-level dimensions, or as a flat list of
+    observations, keyed by the position of the values of all the
+    dimensions presented at observation level.
+    """
+
+    links: Sequence[JsonLink] = ()
+    structure: int = 0
+    action: str = "Information"
+    attributes: Sequence[Any] = ()
+    dimensionGroupAttributes: Optional[Dict[str, Sequence[Any]]] = None
+    series: Optional[Dict[str, JsonSeries]] = None
+    observations: Optional[Dict[str, Sequence[Any]]] = None
+
+
+class JsonData(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for the content of a data message."""
+
+    structures: Sequence[JsonDataStructure] = ()
+    dataSets: Sequence[JsonDataSet] = ()
+
+
+class JsonDataMessage(msgspec.Struct, frozen=True, omit_defaults=True):
+    """SDMX-JSON payload for a data message."""
+
+    meta: JsonHeader
+    data: JsonData = msgspec.field(default_factory=JsonData)
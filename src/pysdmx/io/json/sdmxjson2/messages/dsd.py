@@ -5,7 +5,11 @@ from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
 from msgspec import Struct
 
 from pysdmx import errors
-from pysdmx.io.json.sdmxjson2.messages.code import JsonCodelist, JsonValuelist
+from pysdmx.io.json.sdmxjson2.messages.code import (
+    JsonCodelist,
+    JsonValuelist,
+    _to_shared_model,
+)
 from pysdmx.io.json.sdmxjson2.messages.concept import (
     JsonConcept,
     JsonConceptScheme,
@@ -479,8 +483,8 @@ class JsonComponents(Struct, frozen=True, omit_defaults=True):
         constraints: Sequence[JsonDataConstraint],
     ) -> Tuple[Components, Sequence[Group]]:
         """Returns the components for this DSD."""
-        enums = [cl.to_model() for cl in cls]
-        enums.extend([vl.to_model() for vl in vls])
+        enums = [_to_shared_model(cl) for cl in cls]
+        enums.extend([_to_shared_model(vl) for vl in vls])
         comps = []
         if constraints:
             incl_cubes = []
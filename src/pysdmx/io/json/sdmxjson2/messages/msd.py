@@ -5,7 +5,11 @@ from typing import Literal, Optional, Sequence, Union
 from msgspec import Struct
 
 from pysdmx import errors
-from pysdmx.io.json.sdmxjson2.messages.code import JsonCodelist, JsonValuelist
+from pysdmx.io.json.sdmxjson2.messages.code import (
+    JsonCodelist,
+    JsonValuelist,
+    _to_shared_model,
+)
 from pysdmx.io.json.sdmxjson2.messages.concept import JsonConceptScheme
 from pysdmx.io.json.sdmxjson2.messages.core import (
     JsonAnnotation,
@@ -144,8 +148,8 @@ class JsonMetadataComponents(Struct, frozen=True, omit_defaults=True):
         vls: Sequence[JsonValuelist],
     ) -> Sequence[MetadataComponent]:
         """Returns the components for this DSD."""
-        enums = [cl.to_model() for cl in cls]
-        enums.extend([vl.to_model() for vl in vls])
+        enums = [_to_shared_model(cl) for cl in cls]
+        enums.extend([_to_shared_model(vl) for vl in vls])
         comps = (
             self.metadataAttributeList.to_model(cs, enums)
             if self.metadataAttributeList
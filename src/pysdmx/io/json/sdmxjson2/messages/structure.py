@@ -1,6 +1,15 @@
 """Collection of SDMX-JSON schemas for generic structure messages."""
 
-from typing import Literal, Sequence
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+)
 
 from msgspec import Struct
 
@@ -162,177 +171,140 @@ class JsonStructures(Struct, frozen=True, omit_defaults=True):
     @classmethod
     def from_model(cls, msg: StructureMessage) -> "JsonStructures":
         """Create an SDMX-JSON structures from a list of artefacts."""
+        return JsonStructures(
+            **{
+                field: tuple(artefacts)
+                for field, artefacts in cls.iter_from_model(msg)
+            }
+        )
+
+    @classmethod
+    def iter_from_model(
+        cls, msg: StructureMessage
+    ) -> Iterator[Tuple[str, Iterator[Any]]]:
+        """Lazily create the SDMX-JSON structures, collection by collection.
+
+        The collections are returned in the order they are serialized,
+        and empty collections are skipped. The artefacts of a collection
+        are only converted when iterated over, so that they can be
+        serialized one by one.
+
+        Args:
+            msg: The message holding the artefacts.
+
+        Returns:
+            The non-empty collections (e.g. codelists), with the
+            converted artefacts they contain.
+
+        Raises:
+            Invalid: If the message has no structures.
+        """
         if not msg.structures:
             raise errors.Invalid(
                 "Invalid input",
                 "SDMX-JSON structure messages must have structures.",
             )
-        codelists = tuple(
-            [JsonCodelist.from_model(c) for c in msg.get_codelists()]
-        )
-        valuelists = tuple(
-            [JsonValuelist.from_model(c) for c in msg.get_value_lists()]
-        )
-        agencies = tuple(
-            [JsonAgencyScheme.from_model(a) for a in msg.get_agency_schemes()]
-        )
-        dataflows = tuple(
-            [JsonDataflow.from_model(d) for d in msg.get_dataflows()]
-        )
-        agreements = tuple(
-            [
-                JsonProvisionAgreement.from_model(p)
-                for p in msg.get_provision_agreements()
-            ]
-        )
-        categorisations = tuple(
-            [
-                JsonCategorisation.from_model(c)
-                for c in msg.get_categorisations()
-            ]
-        )
-        hier_associations = tuple(
-            [
-                JsonHierarchyAssociation.from_model(ha)
-                for ha in msg.get_hierarchy_associations()
-            ]
-        )
-        category_schemes = tuple(
-            [
-                JsonCategoryScheme.from_model(cs)
-                for cs in msg.get_category_schemes()
-            ]
-        )
-        concept_schemes = tuple(
-            [
-                JsonConceptScheme.from_model(cs)
-                for cs in msg.get_concept_schemes()
-            ]
-        )
-        data_structures = tuple(
-            [
-                JsonDataStructure.from_model(ds)
-                for ds in msg.get_data_structure_definitions()
-            ]
-        )
-        data_providers = tuple(
-            [
-                JsonDataProviderScheme.from_model(dps)
-                for dps in msg.get_data_provider_schemes()
-            ]
-        )
-        representations_maps = tuple(
-            [
-                JsonRepresentationMap.from_model(rm)
-                for rm in msg.get_representation_maps()
-            ]
-        )
-        structure_maps = tuple(
-            [
-                JsonStructureMap.from_model(sm)
-                for sm in msg.get_structure_maps()
-            ]
-        )
-        custom_types = tuple(
-            [
-                JsonCustomTypeScheme.from_model(ct)
-                for ct in msg.get_custom_type_schemes()
-            ]
-        )
-        name_personalisations = tuple(
-            [
-                JsonNamePersonalisationScheme.from_model(np)
-                for np in msg.get_name_personalisation_schemes()
-            ]
-        )
-        user_operators = tuple(
-            [
-                JsonUserDefinedOperatorScheme.from_model(uo)
-                for uo in msg.get_user_defined_operator_schemes()
-            ]
-        )
-        rulesets = tuple(
-            [
-                JsonRulesetScheme.from_model(rs)
-                for rs in msg.get_ruleset_schemes()
-            ]
-        )
-        vtl_mappings = tuple(
-            [
-                JsonVtlMappingScheme.from_model(vm)
-                for vm in msg.get_vtl_mapping_schemes()
-            ]
-        )
-        transformations = tuple(
-            [
-                JsonTransformationScheme.from_model(ts)
-                for ts in msg.get_transformation_schemes()
-            ]
-        )
-        hierarchies = tuple(
-            [JsonHierarchy.from_model(h) for h in msg.get_hierarchies()]
-        )
-        constraints = tuple(
-            [
-                JsonDataConstraint.from_model(c)
-                for c in msg.get_data_constraints()
-            ]
-        )
-        mpas = tuple(
-            [
-                JsonMetadataProvisionAgreement.from_model(c)
-                for c in msg.get_metadata_provision_agreements()
-            ]
-        )
-        mprvs = tuple(
-            [
-                JsonMetadataProviderScheme.from_model(c)
-                for c in msg.get_metadata_provider_schemes()
-            ]
-        )
-        mdfs = tuple(
-            [JsonMetadataflow.from_model(c) for c in msg.get_metadataflows()]
-        )
-        msds = tuple(
-            [
-                JsonMetadataStructure.from_model(c)
-                for c in msg.get_metadata_structures()
-            ]
-        )
-        dcs = tuple(
-            [
-                JsonDataConsumerScheme.from_model(a)
-                for a in msg.get_data_consumer_schemes()
-            ]
-        )
-        return JsonStructures(
-            agencySchemes=agencies,
-            categorisations=categorisations,
-            categorySchemes=category_schemes,
-            codelists=codelists,
-            conceptSchemes=concept_schemes,
-            customTypeSchemes=custom_types,
-            dataConstraints=constraints,
-            dataflows=dataflows,
-            dataConsumerSchemes=dcs,
-            dataProviderSchemes=data_providers,
-            dataStructures=data_structures,
-            hierarchies=hierarchies,
-            hierarchyAssociations=hier_associations,
-            metadataflows=mdfs,
-            metadataProviderSchemes=mprvs,
-            metadataProvisionAgreements=mpas,
-            metadataStructures=msds,
-            namePersonalisationSchemes=name_personalisations,
-            provisionAgreements=agreements,
-            representationMaps=representations_maps,
-            rulesetSchemes=rulesets,
-            structureMaps=structure_maps,
-            transformationSchemes=transformations,
-            userDefinedOperatorSchemes=user_operators,
-            valueLists=valuelists,
-            vtlMappingSchemes=vtl_mappings,
-        )
+        content = []
+        for field in cls.__struct_fields__:
+            getter, json_type = _CONTENT[field]
+            artefacts = getter(msg)
+            if artefacts:
+                content.append((field, map(json_type.from_model, artefacts)))
+        return iter(content)
+
+
+# The message getter and SDMX-JSON type of each collection of structures
+_CONTENT: Dict[str, Tuple[Callable[[StructureMessage], List[Any]], Any]] = {
+    "agencySchemes": (
+        StructureMessage.get_agency_schemes,
+        JsonAgencyScheme,
+    ),
+    "categorisations": (
+        StructureMessage.get_categorisations,
+        JsonCategorisation,
+    ),
+    "categorySchemes": (
+        StructureMessage.get_category_schemes,
+        JsonCategoryScheme,
+    ),
+    "codelists": (StructureMessage.get_codelists, JsonCodelist),
+    "conceptSchemes": (
+        StructureMessage.get_concept_schemes,
+        JsonConceptScheme,
+    ),
+    "customTypeSchemes": (
+        StructureMessage.get_custom_type_schemes,
+        JsonCustomTypeScheme,
+    ),
+    "dataConstraints": (
+        StructureMessage.get_data_constraints,
+        JsonDataConstraint,
+    ),
+    "dataConsumerSchemes": (
+        StructureMessage.get_data_consumer_schemes,
+        JsonDataConsumerScheme,
+    ),
+    "dataflows": (StructureMessage.get_dataflows, JsonDataflow),
+    "dataProviderSchemes": (
+        StructureMessage.get_data_provider_schemes,
+        JsonDataProviderScheme,
+    ),
+    "dataStructures": (
+        StructureMessage.get_data_structure_definitions,
+        JsonDataStructure,
+    ),
+    "hierarchies": (StructureMessage.get_hierarchies, JsonHierarchy),
+    "hierarchyAssociations": (
+        StructureMessage.get_hierarchy_associations,
+        JsonHierarchyAssociation,
+    ),
+    "metadataflows": (
+        StructureMessage.get_metadataflows,
+        JsonMetadataflow,
+    ),
+    "metadataProviderSchemes": (
+        StructureMessage.get_metadata_provider_schemes,
+        JsonMetadataProviderScheme,
+    ),
+    "metadataProvisionAgreements": (
+        StructureMessage.get_metadata_provision_agreements,
+        JsonMetadataProvisionAgreement,
+    ),
+    "metadataStructures": (
+        StructureMessage.get_metadata_structures,
+        JsonMetadataStructure,
+    ),
+    "namePersonalisationSchemes": (
+        StructureMessage.get_name_personalisation_schemes,
+        JsonNamePersonalisationScheme,
+    ),
+    "provisionAgreements": (
+        StructureMessage.get_provision_agreements,
+        JsonProvisionAgreement,
+    ),
+    "representationMaps": (
+        StructureMessage.get_representation_maps,
+        JsonRepresentationMap,
+    ),
+    "rulesetSchemes": (
+        StructureMessage.get_ruleset_schemes,
+        JsonRulesetScheme,
+    ),
+    "structureMaps": (StructureMessage.get_structure_maps, JsonStructureMap),
+    "transformationSchemes": (
+        StructureMessage.get_transformation_schemes,
+        JsonTransformationScheme,
+    ),
+    "userDefinedOperatorSchemes": (
+        StructureMessage.get_user_defined_operator_schemes,
+        JsonUserDefinedOperatorScheme,
+    ),
+    "valueLists": (StructureMessage.get_value_lists, JsonValuelist),
+    "vtlMappingSchemes": (
+        StructureMessage.get_vtl_mapping_schemes,
+        JsonVtlMappingScheme,
+    ),
+}
 
 
 class JsonStructureMessage(Struct, frozen=True, omit_defaults=True):
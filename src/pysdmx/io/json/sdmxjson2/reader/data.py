@@ -0,0 +1,319 @@
+"""Reader interface for SDMX-JSON 2.0.0 and 2.1.0 Data messages."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import msgspec
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from pysdmx import errors
+from pysdmx.__extras_check import __check_json_extra
+from pysdmx.api.dc.query import Filter
+from pysdmx.io.json.sdmxjson2.messages.data import (
+    JsonComponentValue,
+    JsonDataComponent,
+    JsonDataMessage,
+    JsonDataSet,
+    JsonDataStructure,
+    JsonSeries,
+)
+from pysdmx.io.json.sdmxjson2.reader.doc_validation import validate_sdmx_json
+from pysdmx.io.pd import PandasDataset
+from pysdmx.model import decoders
+from pysdmx.model.dataset import ActionType
+from pysdmx.model.message import Message
+from pysdmx.toolkit.pd import filter_data
+from pysdmx.util import parse_urn
+
+# The links to the structure of the data, by order of preference
+_STRUCTURE_RELS = ("dataflow", "datastructure", "provisionagreement")
+_STRUCTURE_TYPES = ("Dataflow", "DataStructure", "ProvisionAgreement")
+# SDMX-JSON 2.1 merge is the equivalent of the SDMX-CSV 2.1 M action
+_ACTIONS = {"Merge": ActionType.Append}
+# Without measures in the structure, observations contain a single value
+_DEFAULT_MEASURE = JsonDataComponent("OBS_VALUE")
+
+# The positions of the values of a component, -1 standing for missing values
+Positions = npt.NDArray[np.int64]
+
+
+def read(
+    input_str: str, validate: bool = True, filters: Optional[Filter] = None
+) -> Message:
+    """Read SDMX-JSON 2.0.0 and 2.1.0 Data messages.
+
+    The positions of the component values found in the series and
+    observation keys, and in the observation arrays, are decoded into
+    categorical columns by indexing the values listed in the structure
+    of the message, rather than observation by observation.
+
+    Args:
+        input_str: SDMX-JSON data message to read.
+        validate: If True, the JSON data will be validated against the schemas.
+        filters: If set, only the observations matching the filters
+            are kept.
+
+    Returns:
+        A pysdmx Message, with the header and the datasets.
+
+    Raises:
+        Invalid: If the message cannot be read as an SDMX-JSON data
+            message, or if a dataset does not reference its structure.
+    """
+    if validate:
+        __check_json_extra()
+        validate_sdmx_json(input_str)
+
+    try:
+        msg = msgspec.json.Decoder(JsonDataMessage, dec_hook=decoders).decode(
+            input_str
+        )
+    except msgspec.DecodeError as de:
+        raise errors.Invalid(
+            "Invalid message",
+            (
+                "The supplied file could not be read as SDMX-JSON 2.0.0 "
+                "or 2.1.0 data message."
+            ),
+        ) from de
+
+    datasets = []
+    for dataset in msg.data.dataSets:
+        try:
+            structure = msg.data.structures[dataset.structure]
+        except IndexError:
+            raise errors.Invalid(
+                "Invalid message",
+                f"Dataset structure {dataset.structure} not found.",
+            ) from None
+        datasets.append(__to_dataset(dataset, structure, filters))
+    return Message(header=msg.meta.to_model(), data=datasets)
+
+
+def __to_dataset(
+    dataset: JsonDataSet,
+    structure: JsonDataStructure,
+    filters: Optional[Filter],
+) -> PandasDataset:
+    """Decode a dataset into a PandasDataset."""
+    columns: Dict[str, Any] = {}
+    positions: Dict[str, Positions] = {}
+    if dataset.series is not None:
+        __read_series(dataset.series, structure, columns, positions)
+    else:
+        observations = list((dataset.observations or {}).items())
+        __read_observations(observations, structure, columns, positions)
+    rows = len(next(iter(positions.values()))) if positions else 0
+
+    # Dimensions presented at dataset level are the same for all rows
+    for dim in structure.dimensions.dataSet:
+        __add_dimension(
+            dim, np.zeros(rows, dtype=np.int64), columns, positions
+        )
+    dims = sorted(
+        (
+            *structure.dimensions.dataSet,
+            *structure.dimensions.series,
+            *structure.dimensions.observation,
+        ),
+        key=lambda d: d.keyPosition or 0,
+    )
+    if structure.attributes.dimensionGroup:
+        __add_group_attributes(dataset, structure, dims, columns, positions)
+
+    order = [d.id for d in dims]
+    order.extend(c for c in columns if c not in order)
+    df = pd.DataFrame({c: columns[c] for c in order}, copy=False)
+
+    attributes = {}
+    for att, pos in zip(structure.attributes.dataSet, dataset.attributes):
+        value = __value_at(att, pos)
+        if value is not None:
+            attributes[att.id] = value
+
+    out = PandasDataset(
+        structure=__get_structure(dataset, structure),
+        attributes=attributes,
+        data=df,
+        action=_ACTIONS.get(dataset.action) or ActionType(dataset.action),
+    )
+    if filters is not None:
+        out.data = filter_data(out.data, filters).reset_index(drop=True)
+    return out
+
+
+def __read_series(
+    series: Dict[str, JsonSeries],
+    structure: JsonDataStructure,
+    columns: Dict[str, Any],
+    positions: Dict[str, Positions],
+) -> None:
+    """Decode the series of a dataset, then their observations."""
+    no_obs = ":".join(["-1"] * len(structure.dimensions.observation))
+    # Series without observations are kept, as a row without observation
+    observations = [
+        obs
+        for s in series.values()
+        for obs in (s.observations.items() or [(no_obs, ())])
+    ]
+    __read_observations(observations, structure, columns, positions)
+
+    counts = np.fromiter(
+        (len(s.observations) or 1 for s in series.values()),
+        dtype=np.int64,
+        count=len(series),
+    )
+    series_dims = structure.dimensions.series
+    codes = __key_positions(list(series), len(series_dims))
+    for i, dim in enumerate(series_dims):
+        __add_dimension(
+            dim, np.repeat(codes[:, i], counts), columns, positions
+        )
+
+    atts = structure.attributes.series
+    values = __value_matrix([s.attributes for s in series.values()], len(atts))
+    for att, raw in zip(atts, values):
+        columns[att.id] = __decode(att, np.repeat(raw, counts))
+
+
+def __read_observations(
+    observations: List[Tuple[str, Sequence[Any]]],
+    structure: JsonDataStructure,
+    columns: Dict[str, Any],
+    positions: Dict[str, Positions],
+) -> None:
+    """Decode the observation keys and arrays into columns."""
+    obs_dims = structure.dimensions.observation
+    codes = __key_positions([k for k, _ in observations], len(obs_dims))
+    for i, dim in enumerate(obs_dims):
+        __add_dimension(dim, codes[:, i], columns, positions)
+
+    measures = structure.measures.observation or (_DEFAULT_MEASURE,)
+    components = (*measures, *structure.attributes.observation)
+    values = __value_matrix([v for _, v in observations], len(components))
+    for comp, raw in zip(components, values):
+        columns[comp.id] = __decode(comp, raw)
+
+
+def __add_dimension(
+    dim: JsonDataComponent,
+    codes: Positions,
+    columns: Dict[str, Any],
+    positions: Dict[str, Positions],
+) -> None:
+    positions[dim.id] = codes
+    columns[dim.id] = __categorical(dim, codes)
+
+
+def __add_group_attributes(
+    dataset: JsonDataSet,
+    structure: JsonDataStructure,
+    dims: Sequence[JsonDataComponent],
+    columns: Dict[str, Any],
+    positions: Dict[str, Positions],
+) -> None:
+    """Attach the dimension group attributes to the matching rows.
+
+    The group keys contain the positions of the values of the dimensions
+    (by key position), wildcarded dimensions being left empty or set to
+    a tilde.
+    """
+    rows = len(next(iter(positions.values()))) if positions else 0
+    atts = structure.attributes.dimensionGroup
+    values = [np.full(rows, None, dtype=object) for _ in atts]
+    for key, group in (dataset.dimensionGroupAttributes or {}).items():
+        mask = np.ones(rows, dtype=bool)
+        for dim, part in zip(dims, key.split(":")):
+            if part not in ("", "~"):
+                mask &= positions[dim.id] == int(part)
+        for out, pos in zip(values, group):
+            if pos is not None:
+                out[mask] = pos
+    for att, raw in zip(atts, values):
+        columns[att.id] = __decode(att, raw)
+
+
+def __key_positions(keys: List[str], size: int) -> Positions:
+    """Split keys (e.g. 0:2:1) into a matrix of value positions."""
+    if not size or not keys:
+        return np.zeros((len(keys), size), dtype=np.int64)
+    try:
+        flat = np.array(":".join(keys).split(":"), dtype=np.int64)
+        return flat.reshape(len(keys), size)
+    except ValueError:
+        raise errors.Invalid(
+            "Invalid message",
+            f"Keys must contain the positions of {size} dimension values.",
+        ) from None
+
+
+def __value_matrix(arrays: List[Sequence[Any]], width: int) -> List[Any]:
+    """Transpose the (possibly shorter) arrays into columns."""
+    if not arrays:
+        return [np.empty(0, dtype=object) for _ in range(width)]
+    frame = pd.DataFrame(arrays, dtype=object).reindex(columns=range(width))
+    return [frame[i].to_numpy(dtype=object) for i in range(width)]
+
+
+def __label(value: Optional[JsonComponentValue]) -> Optional[str]:
+    """The ID of a coded value, the value of an uncoded one."""
+    if value is None:
+        return None
+    elif value.id is not None:
+        return value.id
+    return None if value.value is None else str(value.value)
+
+
+def __value_at(comp: JsonDataComponent, position: Any) -> Any:
+    """Return the value found at the position, for a single value."""
+    if not comp.values or position is None:
+        return position
+    return __label(comp.values[int(position)])
+
+
+def __decode(comp: JsonDataComponent, raw: npt.NDArray[Any]) -> Any:
+    """Decode the raw content of the arrays into a column.
+
+    The arrays contain the positions of the values of the components
+    with values (e.g. coded attributes), and the values themselves for
+    the other components (e.g. the measures).
+    """
+    if not comp.values:
+        return raw
+    codes = np.where(pd.isna(raw), -1, raw).astype(np.int64)
+    return __categorical(comp, codes)
+
+
+def __categorical(comp: JsonDataComponent, codes: Positions) -> Any:
+    """Index the values of the component, by position (-1 if missing)."""
+    labels = pd.Series([__label(v) for v in comp.values], dtype=object)
+    remap, categories = pd.factorize(labels)
+    if len(codes) and (codes.max() >= len(remap) or codes.min() < -1):
+        raise errors.Invalid(
+            "Invalid message",
+            f"Value position out of range for component {comp.id}.",
+        )
+    # Duplicated or missing values are remapped to the unique ones
+    remapped: Any = np.append(remap, -1)[codes]
+    return pd.Categorical.from_codes(remapped, categories=categories)
+
+
+def __get_structure(dataset: JsonDataSet, structure: JsonDataStructure) -> str:
+    """Return the short URN of the structure of the dataset."""
+    links = [lnk for lnk in dataset.links if lnk.rel in _STRUCTURE_RELS]
+    links.extend(
+        sorted(
+            (lnk for lnk in structure.links if lnk.rel in _STRUCTURE_RELS),
+            key=lambda lnk: _STRUCTURE_RELS.index(lnk.rel),
+        )
+    )
+    for lnk in links:
+        if lnk.urn:
+            ref = parse_urn(lnk.urn)
+            if ref.sdmx_type in _STRUCTURE_TYPES:
+                return f"{ref.sdmx_type}={ref.agency}:{ref.id}({ref.version})"
+    raise errors.Invalid(
+        "Invalid message",
+        "The structure of the dataset could not be found in its links.",
+    )
@@ -42,7 +42,10 @@ _SCHEMA_FILES: Mapping[str, Mapping[str, Path]] = {
 
 
 def _schema_for(instance: Mapping[str, Any]) -> dict[str, Any]:
-    schema_url = instance.get("meta", {}).get("schema", "")
+    # The schema may also be declared at the top of the message
+    schema_url = instance.get("meta", {}).get("schema") or instance.get(
+        "$schema", ""
+    )
     version = "2.1" if "2.1" in schema_url else "2.0"
     p = next(
         p for p in _SCHEMA_FILES[version].values() if p.name in schema_url
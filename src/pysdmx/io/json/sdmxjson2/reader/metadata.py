@@ -1,13 +1,28 @@
 """Reader interface for SDMX-JSON 2.0.0 and 2.1.0 Reference Metadata."""
 
+import re
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Tuple, Union
+
 import msgspec
 
 from pysdmx import errors
 from pysdmx.__extras_check import __check_json_extra
 from pysdmx.io.json.sdmxjson2.messages import JsonMetadataMessage
+from pysdmx.io.json.sdmxjson2.messages.report import JsonMetadataReport
 from pysdmx.io.json.sdmxjson2.reader.doc_validation import validate_sdmx_json
 from pysdmx.model import decoders
 from pysdmx.model.message import MetadataMessage
+from pysdmx.model.metadata import MetadataReport
+
+CHUNK_SIZE = 1 << 20
+_REPORTS_PATH = ("data", "metadataSets")
+_STRUCTURAL = re.compile(rb'["{}\[\],]')
+# A complete string, a bracket, or the start of a string not complete yet
+_NESTED = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"', re.DOTALL)
+_STRING_END = re.compile(rb'["\\]')
+_VALUE_START = re.compile(rb"[^\s,]")
+_SCALAR_END = re.compile(rb"[\s,\]]")
 
 
 def read(input_str: str, validate: bool = True) -> MetadataMessage:
@@ -37,3 +52,183 @@ def read(input_str: str, validate: bool = True) -> MetadataMessage:
                 "or 2.1.0 reference metadata message."
             ),
         ) from de
+
+
+def iter_read(
+    source: Union[str, bytes, Path, IO[bytes]],
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[MetadataReport]:
+    """Read the reports of SDMX-JSON 2.0.0 and 2.1.0 Metadata messages.
+
+    The message is read in chunks, and the metadata sets are decoded one
+    by one, so that the memory used is bounded by the largest report
+    rather than by the size of the message. The header of the message is
+    not read, and the message is not validated against the schemas.
+
+    Args:
+        source: SDMX-JSON reference metadata message to read (as a
+            string or bytes), path to the file containing it, or binary
+            file object.
+        chunk_size: The number of bytes read at a time.
+
+    Yields:
+        The reference metadata reports, in the order of the message.
+
+    Raises:
+        Invalid: If the message or one of its reports could not be read.
+    """
+    decoder = msgspec.json.Decoder(JsonMetadataReport, dec_hook=decoders)
+    scanner = _ArrayScanner(__chunks(source, chunk_size))
+    try:
+        for raw in scanner.items(_REPORTS_PATH):
+            yield decoder.decode(raw).to_model()
+    except (msgspec.DecodeError, _ScanError) as e:
+        raise errors.Invalid(
+            "Invalid message",
+            (
+                "The supplied file could not be read as SDMX-JSON 2.0.0 "
+                "or 2.1.0 reference metadata message."
+            ),
+            {"error": str(e)},
+        ) from e
+
+
+def __chunks(
+    source: Union[str, bytes, Path, IO[bytes]], chunk_size: int
+) -> Iterator[bytes]:
+    if isinstance(source, str):
+        yield source.encode("utf-8")
+    elif isinstance(source, bytes):
+        yield source
+    elif isinstance(source, Path):
+        with open(source, "rb") as f:
+            yield from iter(lambda: f.read(chunk_size), b"")
+    else:
+        yield from iter(lambda: source.read(chunk_size), b"")
+
+
+class _ScanError(Exception):
+    """The JSON document ended before the expected content."""
+
+
+class _ArrayScanner:
+    """Extracts the items of an array out of a JSON document in chunks.
+
+    The document is not decoded: only the characters delimiting strings,
+    objects and arrays are looked for, and the raw bytes of the items of
+    the requested array are returned one by one. Only the bytes from the
+    start of the item being extracted are kept in memory.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self.__chunks = chunks
+        self.__buf = b""
+        self.__pos = 0
+        self.__keep = 0
+
+    def __search(self, pattern: "re.Pattern[bytes]") -> "re.Match[bytes]":
+        """Find the next match, from the current position, reading chunks.
+
+        Bytes before the ``keep`` position are discarded when reading a new
+        chunk, and positions are shifted accordingly.
+        """
+        while True:
+            m = pattern.search(self.__buf, self.__pos)
+            if m is not None:
+                return m
+            chunk = next(self.__chunks, b"")
+            if not chunk:
+                raise _ScanError("Unexpected end of the JSON document")
+            keep = min(self.__keep, self.__pos)
+            self.__buf = self.__buf[keep:] + chunk
+            self.__pos -= keep
+            self.__keep -= keep
+
+    def __skip_string(self) -> None:
+        """Move after the end of the string starting at the position."""
+        while True:
+            m = self.__search(_STRING_END)
+            if m.group() == b"\\":
+                # Skip the escaped character
+                self.__pos = m.end() + 1
+            else:
+                self.__pos = m.end()
+                return
+
+    def items(self, path: Tuple[str, ...]) -> Iterator[bytes]:
+        """Returns the raw items of the array found at the supplied path.
+
+        Args:
+            path: The keys leading to the array from the root object.
+
+        Yields:
+            The raw JSON bytes of each item of the array.
+        """
+        keys: List[Optional[str]] = []
+        containers: List[bytes] = []
+        key: Optional[str] = None
+        expect_key = False
+        while True:
+            self.__keep = self.__pos
+            m = self.__search(_STRUCTURAL)
+            c = m.group()
+            self.__pos = m.end()
+            if c == b'"':
+                self.__keep = m.start()
+                self.__skip_string()
+                if expect_key:
+                    raw = self.__buf[self.__keep : self.__pos]
+                    key = msgspec.json.decode(raw, type=str)
+                    expect_key = False
+            elif c in b"{[":
+                containers.append(c)
+                keys.append(key)
+                if c == b"[" and tuple(keys[1:]) == path:
+                    yield from self.__array_items()
+                    return
+                key = None
+                expect_key = c == b"{"
+            elif c in b"}]":
+                containers.pop()
+                keys.pop()
+                if not containers:
+                    raise _ScanError(f"No array found at {'.'.join(path)}")
+                expect_key = False
+            else:
+                expect_key = containers[-1] == b"{"
+
+    def __array_items(self) -> Iterator[bytes]:
+        while True:
+            self.__keep = self.__pos
+            m = self.__search(_VALUE_START)
+            c = m.group()
+            self.__pos = self.__keep = m.start()
+            if c == b"]":
+                return
+            if c in b"{[":
+                self.__skip_nested()
+            elif c == b'"':
+                self.__pos += 1
+                self.__skip_string()
+            else:
+                self.__pos = self.__search(_SCALAR_END).start()
+            yield self.__buf[self.__keep : self.__pos]
+
+    def __skip_nested(self) -> None:
+        """Move after the end of the object or array at the position."""
+        depth = 0
+        while True:
+            m = self.__search(_NESTED)
+            c = m.group()
+            self.__pos = m.end()
+            if c == b'"':
+                # The end of the string is not in the buffer yet
+                self.__skip_string()
+            elif c[0:1] == b'"':
+                continue
+            elif c in b"{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
@@ -1,21 +1,108 @@
 """Reader interface for SDMX-JSON 2.0.0 and 2.1.0 Structure messages."""
 
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
 import msgspec
 
 from pysdmx import errors
 from pysdmx.__extras_check import __check_json_extra
+from pysdmx.io._structure_selection import (
+    Candidate,
+    Dependency,
+    StructureSelector,
+    find_urn_dependencies,
+)
 from pysdmx.io.json.sdmxjson2.messages import JsonStructureMessage
 from pysdmx.io.json.sdmxjson2.reader.doc_validation import validate_sdmx_json
 from pysdmx.model import decoders
 from pysdmx.model.message import StructureMessage
 
+# The SDMX class of the artefacts in each property of the message
+_TYPES = {
+    "agencySchemes": "AgencyScheme",
+    "categorisations": "Categorisation",
+    "categorySchemes": "CategoryScheme",
+    "codelists": "Codelist",
+    "conceptSchemes": "ConceptScheme",
+    "customTypeSchemes": "CustomTypeScheme",
+    "dataConstraints": "DataConstraint",
+    "dataConsumerSchemes": "DataConsumerScheme",
+    "dataflows": "Dataflow",
+    "dataProviderSchemes": "DataProviderScheme",
+    "dataStructures": "DataStructure",
+    "hierarchies": "Hierarchy",
+    "hierarchyAssociations": "HierarchyAssociation",
+    "metadataflows": "Metadataflow",
+    "metadataProviderSchemes": "MetadataProviderScheme",
+    "metadataProvisionAgreements": "MetadataProvisionAgreement",
+    "metadataStructures": "MetadataStructure",
+    "namePersonalisationSchemes": "NamePersonalisationScheme",
+    "provisionAgreements": "ProvisionAgreement",
+    "representationMaps": "RepresentationMap",
+    "rulesetSchemes": "RulesetScheme",
+    "structureMaps": "StructureMap",
+    "transformationSchemes": "TransformationScheme",
+    "userDefinedOperatorSchemes": "UserDefinedOperatorScheme",
+    "valueLists": "ValueList",
+    "vtlMappingSchemes": "VtlMappingScheme",
+}
+
+
+class _RawMessage(msgspec.Struct):
+    meta: msgspec.Raw
+    data: Dict[str, List[msgspec.Raw]] = {}
+
+
+class _RawArtefact(msgspec.Struct):
+    id: str
+    agencyID: str = ""
+    version: str = "1.0"
+
+
+def __find_dependencies(artefact: msgspec.Raw) -> Iterable[Dependency]:
+    return find_urn_dependencies(bytes(artefact).decode("utf-8"))
+
+
+def __select(input_str: str, only: Sequence[str]) -> bytes:
+    """Keep only the requested artefacts and their dependencies.
+
+    Artefacts are not decoded, except for their identification, so
+    that the artefacts which are not needed are never fully decoded.
+    """
+    selector = StructureSelector.from_query(only)
+    msg = msgspec.json.decode(input_str, type=_RawMessage)
+    identity = msgspec.json.Decoder(_RawArtefact)
+    props = []
+    candidates = []
+    for prop, artefacts in msg.data.items():
+        if prop in _TYPES:
+            for raw in artefacts:
+                a = identity.decode(raw)
+                props.append(prop)
+                candidates.append(
+                    Candidate(_TYPES[prop], a.agencyID, a.id, a.version, raw)
+                )
+    selected = selector.select(candidates, __find_dependencies)
+    data: Dict[str, List[msgspec.Raw]] = {}
+    for prop, candidate, keep in zip(props, candidates, selected):
+        if keep:
+            data.setdefault(prop, []).append(candidate.content)
+    return msgspec.json.encode({"meta": msg.meta, "data": data})
+
 
-def read(input_str: str, validate: bool = True) -> StructureMessage:
+def read(
+    input_str: str,
+    validate: bool = True,
+    only: Optional[Sequence[str]] = None,
+) -> StructureMessage:
     """Read SDMX-JSON 2.0.0 and 2.1.0 Structure messages.
 
     Args:
         input_str: SDMX-JSON structure message to read.
         validate: If True, the JSON data will be validated against the schemas.
+        only: The SDMX classes (e.g. Codelist) and URNs of the structures
+            to be read, if not all of them. The structures they reference
+            are read as well.
 
     Returns:
         A pysdmx StructureMessage
@@ -25,9 +112,12 @@ def read(input_str: str, validate: bool = True) -> StructureMessage:
         validate_sdmx_json(input_str)
 
     try:
+        content: Union[str, bytes] = (
+            input_str if only is None else __select(input_str, only)
+        )
         msg = msgspec.json.Decoder(
             JsonStructureMessage, dec_hook=decoders
-        ).decode(input_str)
+        ).decode(content)
         return msg.to_model()
     except msgspec.DecodeError as de:
         raise errors.Invalid(
@@ -0,0 +1,411 @@
+"""Writer helper for SDMX-JSON 2.0.0 and 2.1.0 Data messages.
+
+The columns of the datasets are factorised, so that the values of each
+component are listed once in the structure of the message, and the
+series and observation keys, as well as the observation arrays, are
+built out of the resulting positions, column by column.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import msgspec
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from pysdmx.errors import Invalid
+from pysdmx.io._pd_utils import validate_schema_exists
+from pysdmx.io.json.sdmxjson2.messages.core import JsonHeader, JsonLink
+from pysdmx.io.json.sdmxjson2.messages.data import (
+    JsonComponentValue,
+    JsonData,
+    JsonDataAttributes,
+    JsonDataComponent,
+    JsonDataDimensions,
+    JsonDataMeasures,
+    JsonDataMessage,
+    JsonDataSet,
+    JsonDataStructure,
+    JsonRelationship,
+    JsonSeries,
+)
+from pysdmx.io.pd import PandasDataset
+from pysdmx.io.xml.__write_data_aux import _single_non_empty_or_raise
+from pysdmx.model import Codelist, Component, Schema, encoders
+from pysdmx.model.message import Header
+
+ALL_DIM = "AllDimensions"
+
+_URN_PREFIXES = {
+    "datastructure": "datastructure.DataStructure",
+    "dataflow": "datastructure.Dataflow",
+    "provisionagreement": "registry.ProvisionAgreement",
+}
+
+# The positions of the values of a component, -1 standing for missing values
+Positions = npt.NDArray[np.int64]
+
+
+class _Factorised:
+    """A column of a dataset, as value positions and (unique) values."""
+
+    def __init__(self, component: Component, column: pd.Series) -> None:
+        if pd.api.types.is_string_dtype(column.dtype):
+            # Empty strings stand for missing values
+            column = column.mask(column.astype(str) == "")
+        codes, uniques = pd.factorize(column)
+        self.component = component
+        self.codes: Positions = codes.astype(np.int64, copy=False)
+        self.values: List[Any] = [
+            v.item() if isinstance(v, np.generic) else v for v in uniques
+        ]
+
+    def to_json(
+        self, key_position: Optional[int] = None, **kwargs: Any
+    ) -> JsonDataComponent:
+        """The SDMX-JSON component, with its values."""
+        comp = self.component
+        enum = comp.enumeration
+        names = (
+            {c.id: c.name for c in enum} if isinstance(enum, Codelist) else {}
+        )
+        values = [
+            (
+                JsonComponentValue(id=v, name=names[v] or v)
+                if v in names
+                else JsonComponentValue(value=v)
+            )
+            for v in self.values
+        ]
+        return JsonDataComponent(
+            comp.id,
+            comp.name or comp.id,
+            keyPosition=key_position,
+            values=values,
+            **kwargs,
+        )
+
+    def positions(self) -> npt.NDArray[Any]:
+        """The positions of the values, None for missing values."""
+        out = self.codes.astype(object)
+        out[self.codes < 0] = None
+        return out
+
+
+def write_data_msg(
+    datasets: Sequence[PandasDataset],
+    output_path: Optional[Union[str, Path]] = None,
+    prettyprint: bool = True,
+    header: Optional[Header] = None,
+    dimension_at_observation: Optional[Union[str, Dict[str, str]]] = None,
+    msg_version: Literal["2.0.0", "2.1"] = "2.0.0",
+) -> Optional[str]:
+    """Write datasets in SDMX-JSON.
+
+    Args:
+        datasets: The datasets to be serialized. Their structure must
+            be a Schema.
+        output_path: The path to save the JSON file. If None or empty, the
+            serialized content is returned as a string instead.
+        prettyprint: Whether to format the JSON output with indentation (True)
+            or output compact JSON without extra whitespace (False).
+        header: The header to be used in the SDMX-JSON message
+            (will be generated if no header is supplied).
+        dimension_at_observation: The dimension at observation, either
+            as a string applied to all datasets or a dict mapping short
+            URNs to dimension IDs. By default, or for AllDimensions,
+            the data are written as a flat list of observations.
+            Otherwise, they are organised in series.
+        msg_version: The desired version of SDMX-JSON. Defaults to 2.0.0.
+
+    Returns:
+        The JSON string if output_path is None or empty, None otherwise.
+
+    Raises:
+        Invalid: If a dataset structure is not a Schema or has no
+            dimensions, if the dimension at observation is not a
+            dimension of the dataset, if a dataset has several
+            observations with the same key, or if a series attribute
+            has conflicting values in a series.
+    """
+    if not header:
+        header = Header()
+    if not isinstance(dimension_at_observation, dict):
+        dimension_at_observation = dict.fromkeys(
+            (ds.short_urn for ds in datasets),
+            dimension_at_observation or ALL_DIM,
+        )
+
+    structures = []
+    json_datasets = []
+    for i, dataset in enumerate(datasets):
+        dim = dimension_at_observation.get(dataset.short_urn, ALL_DIM)
+        structure, json_dataset = __from_dataset(dataset, dim, i)
+        structures.append(structure)
+        json_datasets.append(json_dataset)
+
+    msg = JsonDataMessage(
+        JsonHeader.from_model(header, "data", msg_version),
+        JsonData(structures, json_datasets),
+    )
+    encoder = msgspec.json.Encoder(enc_hook=encoders)
+    serialized_data = encoder.encode(msg)
+    if prettyprint:
+        serialized_data = msgspec.json.format(serialized_data, indent=4)
+
+    # If output_path is provided, write to file
+    if output_path:
+        # Convert to Path object if string
+        if isinstance(output_path, str):
+            output_path = Path(output_path)
+
+        # Create parent directories if they don't exist
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to file
+        with open(output_path, "wb") as f:
+            f.write(serialized_data)
+        return None
+    else:
+        # Return as string
+        return serialized_data.decode("utf-8")
+
+
+def __from_dataset(
+    dataset: PandasDataset, dim_at_obs: str, index: int
+) -> Tuple[JsonDataStructure, JsonDataSet]:
+    """Convert a dataset to its SDMX-JSON structure and content."""
+    schema = validate_schema_exists(dataset)
+    components = schema.components
+    data = dataset.data
+    dim_ids = [d.id for d in components.dimensions]
+    dim_at_obs = __dimension_at_observation(dataset, dim_ids, dim_at_obs)
+    dims = [_Factorised(d, data[d.id]) for d in components.dimensions]
+    __check_unique_keys(dataset, dims)
+    measures = [m for m in components.measures if m.id in data.columns]
+
+    ds_atts, series_atts, obs_atts = [], [], []
+    for att in components.attributes:
+        if att.attachment_level == "D":
+            ds_atts.append(__dataset_attribute(dataset, att))
+        elif att.id in data.columns:
+            factorised = _Factorised(att, data[att.id])
+            if not factorised.values:
+                continue
+            att_dims = (att.attachment_level or "").split(",")
+            if (
+                dim_at_obs != ALL_DIM
+                and att.attachment_level != "O"
+                and dim_at_obs not in att_dims
+                and any(d in dim_ids for d in att_dims)
+            ):
+                series_atts.append(factorised)
+            else:
+                obs_atts.append(factorised)
+
+    # Observation arrays: the values of the measures, then the positions
+    # of the values of the observation-level attributes
+    columns = [__literal(data[m.id]) for m in measures]
+    columns.extend(a.positions() for a in obs_atts)
+
+    links = [__link(schema)]
+    if dim_at_obs == ALL_DIM:
+        json_dims = JsonDataDimensions(
+            observation=[d.to_json(i) for i, d in enumerate(dims)]
+        )
+        keys = __keys([d.codes for d in dims])
+        json_ds = JsonDataSet(
+            links,
+            index,
+            dataset.action.value,
+            observations=dict(zip(keys, __rows(columns))),
+        )
+    else:
+        obs_pos = dim_ids.index(dim_at_obs)
+        series_dims = [(i, d) for i, d in enumerate(dims) if i != obs_pos]
+        json_dims = JsonDataDimensions(
+            series=[d.to_json(i) for i, d in series_dims],
+            observation=[dims[obs_pos].to_json(obs_pos)],
+        )
+        series = __series(
+            [d.codes for _, d in series_dims],
+            dims[obs_pos].codes,
+            columns,
+            series_atts,
+        )
+        json_ds = JsonDataSet(
+            links, index, dataset.action.value, series=series
+        )
+
+    present = [a for a in ds_atts if a is not None]
+    if present:
+        json_ds = msgspec.structs.replace(
+            json_ds, attributes=[0] * len(present)
+        )
+    structure = JsonDataStructure(
+        json_dims,
+        links,
+        schema.name or schema.id,
+        JsonDataMeasures(
+            [JsonDataComponent(m.id, m.name or m.id) for m in measures]
+        ),
+        JsonDataAttributes(
+            dataSet=present,
+            series=[__attribute(a, dim_ids) for a in series_atts],
+            observation=[__attribute(a, dim_ids) for a in obs_atts],
+        ),
+        dataSets=[index],
+    )
+    return structure, json_ds
+
+
+def __dimension_at_observation(
+    dataset: PandasDataset, dim_ids: List[str], dim_at_obs: str
+) -> str:
+    """Check the dimension at observation, AllDimensions if no series."""
+    if not dim_ids:
+        raise Invalid(
+            "Missing dimensions",
+            f"Dataset {dataset.short_urn} has no dimensions, so its "
+            "observations cannot be identified.",
+        )
+    if dim_at_obs != ALL_DIM and dim_at_obs not in dim_ids:
+        raise Invalid(
+            f"Dimension at observation {dim_at_obs} not found in dataset "
+            f"{dataset.short_urn}."
+        )
+    # Without series dimensions, the series keys would be empty
+    return ALL_DIM if len(dim_ids) == 1 else dim_at_obs
+
+
+def __series(
+    series_codes: List[Positions],
+    obs_codes: Positions,
+    columns: List[npt.NDArray[Any]],
+    series_atts: List[_Factorised],
+) -> Dict[str, JsonSeries]:
+    """Group the observations by series."""
+    series_keys = np.array(__keys(series_codes), dtype=object)
+    series_index, unique_keys = pd.factorize(series_keys)
+    order = np.argsort(series_index, kind="stable")
+    starts = np.searchsorted(series_index[order], np.arange(len(unique_keys)))
+    ends = [*starts[1:].tolist(), len(order)]
+
+    obs_keys = __keys([obs_codes[order]])
+    rows = __rows([c[order] for c in columns])
+    att_positions = [
+        __series_attribute(a, series_index, len(unique_keys))
+        for a in series_atts
+    ]
+    out = {}
+    for i, (key, start, end) in enumerate(zip(unique_keys, starts, ends)):
+        out[key] = JsonSeries(
+            [a[i] for a in att_positions],
+            dict(zip(obs_keys[start:end], rows[start:end])),
+        )
+    return out
+
+
+def __series_attribute(
+    att: _Factorised, series_index: Positions, count: int
+) -> List[Optional[int]]:
+    """The position of the unique value of an attribute in each series.
+
+    The missing values are ignored, so that rows where the attribute
+    was left empty do not conflict with the other rows of the series.
+    """
+    pairs = pd.DataFrame({"series": series_index, "value": att.codes})
+    pairs = pairs[pairs["value"] >= 0].drop_duplicates()
+    conflicts = pairs["series"].duplicated(keep=False)
+    if conflicts.any():
+        first = pairs["series"][conflicts].min()
+        positions = pairs["value"][pairs["series"] == first]
+        _single_non_empty_or_raise(
+            [att.values[p] for p in positions], att.component.id, "series"
+        )
+    out: List[Optional[int]] = [None] * count
+    for series, value in zip(pairs["series"], pairs["value"]):
+        out[series] = int(value)
+    return out
+
+
+def __check_unique_keys(
+    dataset: PandasDataset, dims: List[_Factorised]
+) -> None:
+    """Check that there is at most one observation per key."""
+    keys = pd.DataFrame({i: d.codes for i, d in enumerate(dims)})
+    duplicated = keys.duplicated().to_numpy()
+    if duplicated.any():
+        row = int(np.argmax(duplicated))
+        key = ".".join(
+            "" if d.codes[row] < 0 else str(d.values[d.codes[row]])
+            for d in dims
+        )
+        raise Invalid(
+            "Duplicated observations",
+            f"Dataset {dataset.short_urn} has several observations "
+            f"with key {key}.",
+        )
+
+
+def __keys(codes: List[Positions]) -> List[str]:
+    """Join the value positions into keys (e.g. 0:2:1)."""
+    out = codes[0].astype(str)
+    for c in codes[1:]:
+        out = np.char.add(np.char.add(out, ":"), c.astype(str))
+    return out.tolist()
+
+
+def __rows(columns: List[npt.NDArray[Any]]) -> List[List[Any]]:
+    """Transpose the columns into observation arrays."""
+    return list(map(list, zip(*columns)))
+
+
+def __literal(column: pd.Series) -> npt.NDArray[Any]:
+    """The values of a measure, None for missing values."""
+    out = column.astype(object).to_numpy()
+    missing = pd.isna(out)
+    if pd.api.types.is_string_dtype(column.dtype):
+        missing |= column.eq("").fillna(False).to_numpy(dtype=bool)
+    out[missing] = None
+    return out
+
+
+def __dataset_attribute(
+    dataset: PandasDataset, att: Component
+) -> Optional[JsonDataComponent]:
+    """The dataset-level attribute, with its value (if any)."""
+    value = dataset.attributes.get(att.id)
+    if value is None and att.id in dataset.data.columns:
+        values = _Factorised(att, dataset.data[att.id]).values
+        value = values[0] if values else None
+    if value is None:
+        return None
+    factorised = _Factorised(att, pd.Series([value], dtype=object))
+    return factorised.to_json(relationship=JsonRelationship(dataflow={}))
+
+
+def __attribute(att: _Factorised, dim_ids: List[str]) -> JsonDataComponent:
+    """The attribute, with its relationship to the other components."""
+    level = att.component.attachment_level or "O"
+    ids = level.split(",")
+    if level == "O":
+        relationship = JsonRelationship(observation={})
+    elif any(i in dim_ids for i in ids):
+        relationship = JsonRelationship(
+            dimensions=[i for i in ids if i in dim_ids]
+        )
+    else:
+        # Attributes of measures vary with each observation
+        relationship = JsonRelationship(observation={}, measures=ids)
+    return att.to_json(relationship=relationship)
+
+
+def __link(schema: Schema) -> JsonLink:
+    """The link to the structure of the dataset."""
+    prefix = _URN_PREFIXES[schema.context]
+    return JsonLink(
+        urn=f"urn:sdmx:org.sdmx.infomodel.{prefix}={schema.agency}:{schema.id}({schema.version})",
+        rel=schema.context,
+    )
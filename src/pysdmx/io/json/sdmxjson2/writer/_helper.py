@@ -1,17 +1,17 @@
 """Writer interface for SDMX-JSON 2.0.0 Reference Metadata messages."""
 
 from pathlib import Path
-from typing import Literal, Optional, Sequence, Union
+from typing import Any, Iterator, Literal, Optional, Sequence, Union
 
 import msgspec
 
-from pysdmx.io.json.sdmxjson2.messages import (
-    JsonMetadataMessage,
-    JsonStructureMessage,
-)
+from pysdmx.io.json.sdmxjson2.messages import JsonMetadataMessage
+from pysdmx.io.json.sdmxjson2.messages.core import JsonHeader
+from pysdmx.io.json.sdmxjson2.messages.structure import JsonStructures
 from pysdmx.model import MetadataReport, encoders
 from pysdmx.model.__base import MaintainableArtefact
 from pysdmx.model.message import Header, MetadataMessage, StructureMessage
+from pysdmx.util._file_utils import open_replacing
 
 
 def write_metadata_msg(
@@ -75,6 +75,11 @@ def write_structure_msg(
 ) -> Optional[str]:
     """Write maintainable SDMX artefacts in SDMX-JSON 2.0.0.
 
+    The artefacts are converted and serialized one by one, and, when
+    an output path is supplied, written to the file as they are
+    serialized. The whole message is therefore never held in memory,
+    which matters for messages with many (or large) artefacts.
+
     Args:
         structures: The maintainable SDMX artefacts to be serialized.
         output_path: The path to save the JSON file. If None or empty, the
@@ -91,14 +96,7 @@ def write_structure_msg(
     if not header:
         header = Header()
     sm = StructureMessage(header, structures)
-    jsm = JsonStructureMessage.from_model(sm, msg_version)
-
-    encoder = msgspec.json.Encoder(enc_hook=encoders)
-    serialized_data = encoder.encode(jsm)
-
-    # Apply pretty-printing if requested
-    if prettyprint:
-        serialized_data = msgspec.json.format(serialized_data, indent=4)
+    parts = __iter_structure_msg(sm, header, msg_version, prettyprint)
 
     # If output_path is provided, write to file
     if output_path:
@@ -109,10 +107,50 @@ def write_structure_msg(
         # Create parent directories if they don't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file
-        with open(output_path, "wb") as f:
-            f.write(serialized_data)
+        # Write to file, without leaving a partially written message behind
+        with open_replacing(output_path, binary=True) as f:
+            f.writelines(parts)
         return None
     else:
         # Return as string
-        return serialized_data.decode("utf-8")
+        return b"".join(parts).decode("utf-8")
+
+
+def __iter_structure_msg(
+    message: StructureMessage,
+    header: Header,
+    msg_version: Literal["2.0.0", "2.1"],
+    prettyprint: bool,
+) -> Iterator[bytes]:
+    """Serialize the message, artefact by artefact.
+
+    The output is the same as when serializing the whole message at once,
+    including the indentation applied when pretty-printing.
+    """
+    meta = JsonHeader.from_model(header, msg_version=msg_version)
+    # Validates the message before anything is serialized
+    collections = JsonStructures.iter_from_model(message)
+    encoder = msgspec.json.Encoder(enc_hook=encoders)
+
+    def encode(obj: Any, depth: int) -> bytes:
+        out = encoder.encode(obj)
+        if prettyprint:
+            out = msgspec.json.format(out, indent=4)
+            out = out.replace(b"\n", b"\n" + b" " * (4 * depth))
+        return out
+
+    def indent(depth: int) -> bytes:
+        return b"\n" + b" " * (4 * depth) if prettyprint else b""
+
+    colon = b": " if prettyprint else b":"
+    yield b"{" + indent(1) + b'"meta"' + colon + encode(meta, 1)
+    yield b"," + indent(1) + b'"data"' + colon + b"{"
+    empty = True
+    for field, artefacts in collections:
+        yield (b"" if empty else b",") + indent(2)
+        yield b'"' + field.encode() + b'"' + colon + b"["
+        for i, artefact in enumerate(artefacts):
+            yield (b"," if i else b"") + indent(3) + encode(artefact, 3)
+        yield indent(2) + b"]"
+        empty = False
+    yield (b"}" if empty else indent(1) + b"}") + indent(0) + b"}"
@@ -0,0 +1,44 @@
+"""Writer interface for SDMX-JSON 2.0.0 Data messages."""
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+from pysdmx.io.json.sdmxjson2.writer._data import write_data_msg
+from pysdmx.io.pd import PandasDataset
+from pysdmx.model.message import Header
+
+
+def write(
+    datasets: Sequence[PandasDataset],
+    output_path: Optional[Union[str, Path]] = None,
+    prettyprint: bool = True,
+    header: Optional[Header] = None,
+    dimension_at_observation: Optional[Union[str, Dict[str, str]]] = None,
+) -> Optional[str]:
+    """Write datasets in SDMX-JSON 2.0.0.
+
+    Args:
+        datasets: The datasets to be serialized. Their structure must
+            be a Schema.
+        output_path: The path to save the JSON file. If None or empty, the
+            serialized content is returned as a string instead.
+        prettyprint: Whether to format the JSON output with indentation (True)
+            or output compact JSON without extra whitespace (False).
+        header: The header to be used in the SDMX-JSON message
+            (will be generated if no header is supplied).
+        dimension_at_observation: The dimension at observation, either
+            as a string applied to all datasets or a dict mapping short
+            URNs to dimension IDs. By default, the data are written as
+            a flat list of observations.
+
+    Returns:
+        The JSON string if output_path is None or empty, None otherwise.
+    """
+    return write_data_msg(
+        datasets,
+        output_path,
+        prettyprint,
+        header,
+        dimension_at_observation,
+        "2.0.0",
+    )
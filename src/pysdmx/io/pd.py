@@ -1,6 +1,6 @@
 """Pandas SDMX Dataset."""
 
-from typing import Any, Dict
+from typing import Any, Optional, Tuple
 
 from pysdmx.__extras_check import __check_data_extra
 from pysdmx.model.dataset import Dataset
@@ -10,18 +10,58 @@ __check_data_extra()
 # E402 is needed here to ensure a clear message is used on missing import
 import pandas as pd  # noqa: E402
 import pyarrow as pa  # noqa: E402
+import pyarrow.compute as pc  # noqa: E402
 
 from pysdmx.errors import Invalid  # noqa: E402
 from pysdmx.model import Schema  # noqa: E402
 from pysdmx.toolkit.pd import to_pyarrow_schema  # noqa: E402
 
+# Set (in the instance dict) when the dtypes are to be applied lazily
+_PENDING_DTYPES = "_pending_dtypes"
+# Set (in the instance dict) to the cached string view of the data
+_STRING_VIEW = "_string_view"
+
+
+def _stringify_column(column: pd.Series) -> pd.arrays.ArrowExtensionArray:
+    """Convert a column to PyArrow strings, nulls as empty strings.
+
+    PyArrow-backed columns are converted without copy, and string
+    columns without nulls are returned as they are. NaN values in float
+    columns are considered as nulls.
+
+    Args:
+        column: The column to convert.
+
+    Returns:
+        The values of the converted column.
+    """
+    if isinstance(column.dtype, pd.ArrowDtype):
+        array = column.array.__arrow_array__()
+    else:
+        if column.dtype == object:
+            mask = column.notna()
+            column = column.where(~mask, column[mask].astype(str))
+        array = pa.array(column, from_pandas=True)
+    if pa.types.is_dictionary(array.type):
+        array = pc.cast(array, array.type.value_type)
+    if pa.types.is_floating(array.type):
+        # NaN values are missing values, not "nan" strings
+        array = pc.if_else(
+            pc.is_nan(array), pa.scalar(None, array.type), array
+        )
+    if not pa.types.is_string(array.type):
+        array = pc.cast(array, pa.string())
+    if array.null_count:
+        array = pc.fill_null(array, "")
+    return pd.arrays.ArrowExtensionArray(array)
+
 
 def stringify_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Convert all DataFrame columns to strings with nulls as empty strings.
 
-    Casts all columns to ``string[pyarrow]`` so that null values become
-    ``pd.NA``, fills nulls with empty strings, and converts to plain
-    Python strings.
+    The columns are converted one by one with PyArrow compute, to
+    ``string[pyarrow]`` columns without null values. The original
+    DataFrame is not modified.
 
     Args:
         df: The DataFrame to convert.
@@ -31,59 +71,109 @@ def stringify_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     if len(df.columns) == 0:
         return df
-    str_dtype = pd.ArrowDtype(pa.string())
-    conversion = dict.fromkeys(df.columns, str_dtype)
-    return df.astype(conversion).fillna("").astype(str)
+    out = pd.DataFrame(
+        {i: _stringify_column(df.iloc[:, i]) for i in range(len(df.columns))},
+        index=df.index,
+    )
+    out.columns = df.columns
+    return out
 
 
-def _prepare_columns(
-    data: pd.DataFrame,
-    conversion: Dict[str, pd.ArrowDtype],
-    str_dtype: pd.ArrowDtype,
-) -> None:
-    """Prepare DataFrame columns for PyArrow type conversion.
+def _cast_column(
+    column: pd.Series, dtype: pd.ArrowDtype
+) -> pd.arrays.ArrowExtensionArray:
+    """Cast a column to the supplied PyArrow-backed dtype.
 
-    For non-string target dtypes, replaces empty strings with None
+    The column is converted to a PyArrow array (without copy for columns
+    that are already PyArrow-backed) and cast with PyArrow compute.
+
+    For non-string target dtypes, empty strings are replaced with nulls
     so that the conversion succeeds. For string target dtypes with
-    mixed-type object columns, converts values to Python str first
+    mixed-type object columns, values are converted to Python str first
     because PyArrow cannot infer the string type from a column
     containing both integers and strings.
 
+    Object, datetime and PyArrow string columns are cast with pandas
+    instead (unless the target is a string), as PyArrow renders datetimes
+    differently (e.g. with nanoseconds) and cannot parse ISO datetime
+    strings into dates, nor strings like "1.0" into integers.
+
     Args:
-        data: The DataFrame to modify in place.
-        conversion: Mapping of column names to target ArrowDtype.
-        str_dtype: The PyArrow string dtype for comparison.
+        column: The column to be cast.
+        dtype: The target ArrowDtype.
+
+    Returns:
+        The values of the cast column.
     """
-    for col, dtype in conversion.items():
-        if dtype != str_dtype:
-            data[col] = data[col].replace("", None)
-        elif data[col].dtype == object:
-            mask = data[col].notna()
-            data.loc[mask, col] = data.loc[mask, col].astype(str)
+    target = dtype.pyarrow_dtype
+    if isinstance(column.dtype, pd.ArrowDtype):
+        array = pa.array(column.array)
+        if pa.types.is_string(array.type) and not pa.types.is_string(target):
+            return column.replace("", None).astype(dtype).array
+    else:
+        if not pa.types.is_string(target):
+            column = column.replace("", None)
+        elif column.dtype == object:
+            mask = column.notna()
+            column = column.where(~mask, column[mask].astype(str))
+        if column.dtype == object or pd.api.types.is_datetime64_any_dtype(
+            column.dtype
+        ):
+            return column.astype(dtype).array
+        try:
+            array = pa.array(column, type=target, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Let PyArrow infer the type, then cast
+            array = pa.array(column, from_pandas=True)
+    if array.type != target:
+        array = pc.cast(array, target)
+    return pd.arrays.ArrowExtensionArray(array)
 
 
-class PandasDataset(Dataset, frozen=False, kw_only=True):
+class PandasDataset(Dataset, frozen=False, kw_only=True, dict=True):
     """A Dataset that is backed by a Pandas DataFrame.
 
     When a ``Schema`` is provided as the structure, the DataFrame
     columns are automatically cast to PyArrow-backed dtypes based
     on the component data types. When the structure is a URN string,
-    all columns are cast to ``string[pyarrow]``.
+    all columns are cast to ``string[pyarrow]``. Columns that already
+    have the expected dtype are left untouched.
 
     Args:
         data: Pandas Dataframe to contain SDMX data.
+        lazy: If True, the dtypes are not applied when the dataset is
+            created (or when its structure is reassigned), but when the
+            data are first accessed.
     """
 
     data: pd.DataFrame
+    lazy: bool = False
 
     def __post_init__(self) -> None:
         """Apply PyArrow dtypes after construction."""
-        self._apply_dtypes()
+        self._schedule_dtypes()
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Re-apply dtypes when structure is reassigned."""
         super().__setattr__(name, value)
+        if name == "data":
+            self.__dict__.pop(_STRING_VIEW, None)
         if name == "structure":
+            self._schedule_dtypes()
+
+    def __getattribute__(self, name: str) -> Any:
+        """Apply the deferred dtypes when the data are first accessed."""
+        if name == "data" and super().__getattribute__("__dict__").pop(
+            _PENDING_DTYPES, False
+        ):
+            self._apply_dtypes()
+        return super().__getattribute__(name)
+
+    def _schedule_dtypes(self) -> None:
+        """Apply the dtypes now, or on first access in lazy mode."""
+        if self.lazy:
+            self.__dict__[_PENDING_DTYPES] = True
+        else:
             self._apply_dtypes()
 
     def _apply_dtypes(self) -> None:
@@ -96,22 +186,77 @@ class PandasDataset(Dataset, frozen=False, kw_only=True):
             return
 
         str_dtype = pd.ArrowDtype(pa.string())
-
-        if isinstance(self.structure, Schema):
-            schema_dtypes = to_pyarrow_schema(self.structure.components)
-            conversion = {
-                col: schema_dtypes.get(col, str_dtype)
-                for col in self.data.columns
-            }
-            _prepare_columns(self.data, conversion, str_dtype)
+        schema_dtypes = (
+            to_pyarrow_schema(self.structure.components)
+            if isinstance(self.structure, Schema)
+            else {}
+        )
+        converted = {}
+        for col in self.data.columns:
+            column = self.data[col]
+            dtype = schema_dtypes.get(col, str_dtype)
+            if column.dtype == dtype:
+                continue
             try:
-                self.data = self.data.astype(conversion)
-            except (ValueError, TypeError, pa.ArrowInvalid) as e:
+                converted[col] = _cast_column(column, dtype)
+            except (
+                ValueError,
+                TypeError,
+                pa.ArrowInvalid,
+                pa.ArrowNotImplementedError,
+            ) as e:
                 raise Invalid(
                     "Type conversion failed",
                     f"Cannot convert DataFrame columns to PyArrow dtypes: {e}",
                 ) from e
-        else:
-            conversion = dict.fromkeys(self.data.columns, str_dtype)
-            _prepare_columns(self.data, conversion, str_dtype)
-            self.data = self.data.astype(conversion)
+        if converted:
+            # The columns of the original frame are not modified
+            data = self.data.copy(deep=False)
+            for col, values in converted.items():
+                data[col] = values
+            self.data = data
+
+
+def stringify_dataset(dataset: PandasDataset) -> pd.DataFrame:
+    """Get the data of a dataset as strings, with nulls as empty strings.
+
+    This is the view of the data used by the writers. It is computed
+    once and kept on the dataset, until its data (or any of the columns
+    of its data) are modified.
+
+    Args:
+        dataset: The dataset whose data are to be converted.
+
+    Returns:
+        The data, with all string columns and no null values. The
+        returned DataFrame must not be modified.
+    """
+    data = dataset.data
+    key = __view_key(data)
+    cached = dataset.__dict__.get(_STRING_VIEW)
+    if (
+        key is not None
+        and cached is not None
+        and len(cached[0]) == len(key)
+        and all(a is b for a, b in zip(cached[0], key))
+    ):
+        return cached[1]
+    view = stringify_dataframe(data)
+    if key is not None:
+        dataset.__dict__[_STRING_VIEW] = (key, view)
+    return view
+
+
+def __view_key(data: pd.DataFrame) -> Optional[Tuple[Any, ...]]:
+    """The objects a string view of the data depends on.
+
+    Those are the frame, its index, its column labels and the PyArrow
+    arrays of its columns, as they are all replaced (rather than
+    modified in place) whenever the data are modified. There is no
+    key if some columns are not PyArrow-backed.
+    """
+    columns = [data.iloc[:, i] for i in range(len(data.columns))]
+    if not all(isinstance(c.dtype, pd.ArrowDtype) for c in columns):
+        return None
+    arrays = (c.array.__arrow_array__() for c in columns)
+    return (data, data.index, data.columns, *arrays)
@@ -1,5 +1,6 @@
 """SDMX All formats reader module."""
 
+from concurrent.futures import Executor
 from io import BytesIO
 from pathlib import Path
 from typing import (
@@ -15,23 +16,26 @@ from typing import (
 if TYPE_CHECKING:  # pragma: no cover
     from pysdmx.io.pd import PandasDataset
 
+from pysdmx.api.dc.query import Filter
 from pysdmx.errors import Invalid
 from pysdmx.io.format import Format
 from pysdmx.io.input_processor import process_string_to_read
+from pysdmx.io.schema_registry import SchemaRegistry
 from pysdmx.model import Schema
 from pysdmx.model.__base import MaintainableArtefact
 from pysdmx.model.dataset import Dataset
-from pysdmx.model.message import Message
+from pysdmx.model.message import Message, StructureMessage
 from pysdmx.model.metadata import MetadataReport
 from pysdmx.model.submission import SubmissionResult
-from pysdmx.util import parse_short_urn
-from pysdmx.util._model_utils import schema_generator
 
 
 def read_sdmx(  # noqa: C901
     sdmx_document: Union[str, Path, BytesIO],
     validate: bool = True,
     pem: Optional[Union[str, Path]] = None,
+    filters: Optional[Filter] = None,
+    only: Optional[Sequence[str]] = None,
+    executor: Optional[Executor] = None,
 ) -> Message:
     """Reads any SDMX message and extracts its content.
 
@@ -53,6 +57,29 @@ def read_sdmx(  # noqa: C901
           a certificate created by an unknown certificate
           authority, you can pass a PEM file for this
           authority using this parameter.
+        filters: Only for data messages. If set, only the observations
+          matching the filters are read. This can be any of the filters
+          the `pysdmx.api.dc.query` module offers. The filters are
+          applied while the data are parsed, so that non-matching
+          observations are never materialised in the resulting
+          datasets. In SDMX-CSV messages, datasets without any
+          matching observation are not returned.
+        only: Only for structure messages. If set, only the artefacts
+          matching the supplied SDMX classes (e.g. ``Codelist`` or
+          ``DataStructure``), URNs or short URNs (e.g.
+          ``Codelist=BIS:CL_FREQ(1.0)``) are read, together with the
+          artefacts they reference (e.g. the codelists and concept
+          schemes used by a data structure). The other artefacts are
+          neither formatted nor, in SDMX-JSON messages, decoded.
+          Artefacts referencing the selected ones (e.g. categorisations)
+          are not read, unless they are selected too. If no artefact
+          matches, the message returned has no structures.
+        executor: Only for SDMX-ML structure messages. If set, the
+          independent families of artefacts (e.g. codelists, concept
+          schemes and hierarchies) are formatted concurrently, using
+          this thread or process pool, before the artefacts depending
+          on them (e.g. data structures and dataflows). The result is
+          the same as when formatting sequentially.
 
     Raises:
         Invalid: If the file is empty or the format is not supported.
@@ -72,7 +99,9 @@ def read_sdmx(  # noqa: C901
 
         header = read_header(input_str, validate=validate)
         # SDMX-ML 2.1 Structure
-        result_structures = read_structure(input_str, validate=validate)
+        result_structures = read_structure(
+            input_str, validate=validate, only=only, executor=executor
+        )
     elif read_format == Format.STRUCTURE_SDMX_ML_3_0:
         from pysdmx.io.xml.header import read as read_header
         from pysdmx.io.xml.sdmx30.reader.structure import (
@@ -81,7 +110,9 @@ def read_sdmx(  # noqa: C901
 
         header = read_header(input_str, validate=validate)
         # SDMX-ML 3.0 Structure
-        result_structures = read_structure(input_str, validate=validate)
+        result_structures = read_structure(
+            input_str, validate=validate, only=only, executor=executor
+        )
     elif read_format == Format.STRUCTURE_SDMX_ML_3_1:
         from pysdmx.io.xml.header import read as read_header
         from pysdmx.io.xml.sdmx31.reader.structure import (
@@ -90,7 +121,9 @@ def read_sdmx(  # noqa: C901
 
         header = read_header(input_str, validate=validate)
         # SDMX-ML 3.1 Structure
-        result_structures = read_structure(input_str, validate=validate)
+        result_structures = read_structure(
+            input_str, validate=validate, only=only, executor=executor
+        )
     elif read_format in (
         Format.STRUCTURE_SDMX_JSON_2_0_0,
         Format.STRUCTURE_SDMX_JSON_2_1_0,
@@ -99,7 +132,7 @@ def read_sdmx(  # noqa: C901
             read as read_struct,
         )
 
-        struct_msg = read_struct(input_str, validate=validate)
+        struct_msg = read_struct(input_str, validate=validate, only=only)
         header = struct_msg.header
         result_structures = struct_msg.structures or []
     elif read_format in (
@@ -113,6 +146,18 @@ def read_sdmx(  # noqa: C901
         ref_msg = read_refmeta(input_str, validate=validate)
         header = ref_msg.header
         reports = ref_msg.get_reports()
+    elif read_format in (
+        Format.DATA_SDMX_JSON_2_0_0,
+        Format.DATA_SDMX_JSON_2_1_0,
+    ):
+        from pysdmx.io.json.sdmxjson2.reader.data import read as read_json_data
+
+        # SDMX-JSON 2.0.0 / 2.1.0 Data
+        data_msg = read_json_data(
+            input_str, validate=validate, filters=filters
+        )
+        header = data_msg.header
+        result_data = data_msg.data or []
     elif read_format == Format.REFMETA_SDMX_ML_3_0:
         from pysdmx.io.xml.header import read as read_header
         from pysdmx.io.xml.sdmx30.reader.metadata import (
@@ -140,7 +185,9 @@ def read_sdmx(  # noqa: C901
 
         header = read_header(input_str, validate=validate)
         # SDMX-ML 2.1 Generic / Generic Time Series Data
-        result_data = read_generic(input_str, validate=validate)
+        result_data = read_generic(
+            input_str, validate=validate, filters=filters
+        )
     elif read_format in (
         Format.DATA_SDMX_ML_2_1_STR,
         Format.DATA_SDMX_ML_2_1_STRTS,
@@ -153,7 +200,9 @@ def read_sdmx(  # noqa: C901
         header = read_header(input_str, validate=validate)
 
         # SDMX-ML 2.1 Structure Specific Data
-        result_data = read_str_spe(input_str, validate=validate)
+        result_data = read_str_spe(
+            input_str, validate=validate, filters=filters
+        )
     elif read_format == Format.REGISTRY_SDMX_ML_2_1:
         from pysdmx.io.xml.sdmx21.reader.submission import read as read_sub
 
@@ -173,7 +222,9 @@ def read_sdmx(  # noqa: C901
         header = read_header(input_str, validate=validate)
 
         # SDMX-ML 3.0 Structure Specific Data
-        result_data = read_str_spe(input_str, validate=validate)
+        result_data = read_str_spe(
+            input_str, validate=validate, filters=filters
+        )
     elif read_format == Format.DATA_SDMX_ML_3_1:
         from pysdmx.io.xml.header import read as read_header
         from pysdmx.io.xml.sdmx31.reader.structure_specific import (
@@ -183,19 +234,35 @@ def read_sdmx(  # noqa: C901
         header = read_header(input_str, validate=validate)
 
         # SDMX-ML 3.1 Structure Specific Data
-        result_data = read_str_spe(input_str, validate=validate)
+        result_data = read_str_spe(
+            input_str, validate=validate, filters=filters
+        )
     elif read_format == Format.DATA_SDMX_CSV_1_0_0:
         from pysdmx.io.csv.sdmx10.reader import read as read_csv_v1
 
         # SDMX-CSV 1.0
-        result_data = read_csv_v1(input_str)
+        result_data = read_csv_v1(input_str, filters)
     else:
         # SDMX-CSV 2.1
         from pysdmx.io.csv.sdmx21.reader import read as read_csv_v2
 
-        result_data = read_csv_v2(input_str)
+        result_data = read_csv_v2(input_str, filters)
 
-    if not (result_data or result_structures or result_submission or reports):
+    # A selection of structures may legitimately match no artefact
+    selection = only is not None and read_format in (
+        Format.STRUCTURE_SDMX_ML_2_1,
+        Format.STRUCTURE_SDMX_ML_3_0,
+        Format.STRUCTURE_SDMX_ML_3_1,
+        Format.STRUCTURE_SDMX_JSON_2_0_0,
+        Format.STRUCTURE_SDMX_JSON_2_1_0,
+    )
+    if not (
+        result_data
+        or result_structures
+        or result_submission
+        or reports
+        or selection
+    ):
         raise Invalid("Empty SDMX Message")
 
     # Returning a Message class
@@ -209,6 +276,8 @@ def read_sdmx(  # noqa: C901
         Format.DATA_SDMX_ML_2_1_STRTS,
         Format.DATA_SDMX_ML_3_0,
         Format.DATA_SDMX_ML_3_1,
+        Format.DATA_SDMX_JSON_2_0_0,
+        Format.DATA_SDMX_JSON_2_1_0,
     ):
         # TODO: Add here the Schema download for Datasets, based on structure
         # TODO: Ensure we have changed the signature of the data readers
@@ -251,7 +320,9 @@ def __manage_dataset_level_attributes(dataset: Dataset) -> None:
 
 
 def __assign_structure_to_dataset(
-    datasets: Sequence[Dataset], structure_msg: Message
+    datasets: Sequence[Dataset],
+    structure_msg: StructureMessage,
+    registry: SchemaRegistry,
 ) -> None:
     for dataset in datasets:
         short_urn: str = (
@@ -259,8 +330,7 @@ def __assign_structure_to_dataset(
             if isinstance(dataset.structure, Schema)
             else dataset.structure
         )
-        dataset_ref = parse_short_urn(short_urn)
-        dataset.structure = schema_generator(structure_msg, dataset_ref)
+        dataset.structure = registry.get_schema(structure_msg, short_urn)
         __manage_dataset_level_attributes(dataset)
 
 
@@ -270,23 +340,29 @@ def get_datasets(  # pragma: no cover
     structure: None = None,
     validate: bool = True,
     pem: Optional[Union[str, Path]] = None,
+    filters: Optional[Filter] = None,
+    registry: Optional[SchemaRegistry] = None,
 ) -> "Sequence[PandasDataset]": ...
 
 
 @overload
 def get_datasets(  # pragma: no cover
     data: Union[str, Path, BytesIO],
-    structure: Union[str, Path, BytesIO] = ...,
+    structure: Union[str, Path, BytesIO, StructureMessage] = ...,
     validate: bool = True,
     pem: Optional[Union[str, Path]] = None,
+    filters: Optional[Filter] = None,
+    registry: Optional[SchemaRegistry] = None,
 ) -> "Sequence[PandasDataset]": ...
 
 
 def get_datasets(
     data: Union[str, Path, BytesIO],
-    structure: Optional[Union[str, Path, BytesIO]] = None,
+    structure: Optional[Union[str, Path, BytesIO, StructureMessage]] = None,
     validate: bool = True,
     pem: Optional[Union[str, Path]] = None,
+    filters: Optional[Filter] = None,
+    registry: Optional[SchemaRegistry] = None,
 ) -> "Sequence[PandasDataset]":
     """Reads a data message and a structure message and returns a dataset.
 
@@ -317,11 +393,21 @@ def get_datasets(
           Path to file
           (`pathlib.Path <https://docs.python.org/3/library/pathlib.html>`_),
           URL, or string for the structure message, if needed.
+          An already read structure message can also be supplied.
         validate: Validate the input file (only for SDMX-ML and SDMX-JSON).
         pem: When using a URL, in case the service exposed
             a certificate created by an unknown certificate
             authority, you can pass a PEM file for this
             authority using this parameter.
+        filters: If set, only the observations matching the filters
+            are read. This can be any of the filters the
+            `pysdmx.api.dc.query` module offers.
+        registry: The registry used to resolve the schemas of the
+            datasets. Holding a registry and passing it to subsequent
+            calls allows reusing the schemas generated for the same
+            structure message or (unmodified) structure file. If not
+            set, the schemas are only shared by the datasets of the
+            data message.
 
     Raises:
         Invalid:
@@ -331,16 +417,34 @@ def get_datasets(
             If the related data structure (or dataflow with its children)
             is not found.
     """
-    data_msg = read_sdmx(data, validate=validate, pem=pem)
+    data_msg = read_sdmx(data, validate=validate, pem=pem, filters=filters)
     if not data_msg.data:
         raise Invalid("No data found in the data message")
 
     if structure is None:
         return cast("Sequence[PandasDataset]", data_msg.data)
-    structure_msg = read_sdmx(structure, validate=validate, pem=pem)
+    # Only the structures of the datasets (and their children) are needed
+    refs = [
+        d.structure.short_urn
+        if isinstance(d.structure, Schema)
+        else d.structure
+        for d in data_msg.data
+    ]
+    if registry is not None:
+        structure_msg = registry.get_structures(
+            structure, validate=validate, pem=pem, only=refs
+        )
+    else:
+        # The schemas are only shared within this call
+        registry = SchemaRegistry()
+        structure_msg = (
+            structure
+            if isinstance(structure, StructureMessage)
+            else read_sdmx(structure, validate=validate, pem=pem, only=refs)
+        )
     if structure_msg.structures is None:
         raise Invalid("No structure found in the structure message")
 
-    __assign_structure_to_dataset(data_msg.data, structure_msg)
+    __assign_structure_to_dataset(data_msg.data, structure_msg, registry)
 
     return cast("Sequence[PandasDataset]", data_msg.data)
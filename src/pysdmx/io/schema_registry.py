@@ -0,0 +1,154 @@
+"""Memoised resolution of the schemas of datasets."""
+
+import os
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from pysdmx.model import Reference, Schema
+from pysdmx.model.message import StructureMessage
+from pysdmx.util import parse_short_urn
+from pysdmx.util._model_utils import schema_generator
+
+# A structure file, identified by its path, modification time and size,
+# as well as whether it was validated when read.
+_FileKey = Tuple[str, int, int, bool]
+
+
+class SchemaRegistry:
+    """Memoised resolution of the schemas of datasets.
+
+    Generating the schema of a dataset requires resolving its structure
+    (data structure, dataflow or provision agreement) in a structure
+    message, and collecting the artefacts used by the data structure.
+    The registry performs this once per structure and per structure
+    message, so that the datasets of a data message (e.g. the many
+    slices of a dataflow in a CSV file) share the same schema.
+
+    The registry can be held for the life of a process, and be passed
+    to ``get_datasets``, to reuse the schemas across calls. Schemas are
+    reused when the same structure message (i.e. the same object) or
+    the same, unmodified, structure file is supplied. The least recently
+    used structure messages are evicted once ``max_messages`` is
+    reached.
+    """
+
+    def __init__(self, max_messages: int = 16) -> None:
+        """Instantiate a new schema registry.
+
+        Args:
+            max_messages: The maximum number of structure messages
+                (and structure files) for which schemas are kept.
+        """
+        self.max_messages = max_messages
+        self.__schemas: OrderedDict[
+            int, Tuple[StructureMessage, Dict[str, Schema]]
+        ] = OrderedDict()
+        self.__files: OrderedDict[_FileKey, StructureMessage] = OrderedDict()
+        self.__lock = Lock()
+
+    def get_schema(
+        self,
+        message: StructureMessage,
+        dataset_ref: Union[str, Reference],
+    ) -> Schema:
+        """Return the schema of a dataset, generating it if needed.
+
+        Args:
+            message: The structure message in which the structure of the
+                dataset is resolved.
+            dataset_ref: The short URN (or reference) of the structure
+                of the dataset.
+
+        Returns:
+            The schema of the dataset.
+
+        Raises:
+            Invalid: If the structure of the dataset cannot be resolved
+                in the structure message.
+        """
+        if isinstance(dataset_ref, str):
+            dataset_ref = parse_short_urn(dataset_ref)
+        key = str(dataset_ref)
+        with self.__lock:
+            entry = self.__schemas.get(id(message))
+            if entry is None or entry[0] is not message:
+                entry = (message, {})
+                self.__schemas[id(message)] = entry
+            self.__schemas.move_to_end(id(message))
+            self.__evict(self.__schemas)
+            schema = entry[1].get(key)
+        if schema is None:
+            schema = schema_generator(message, dataset_ref)
+            entry[1][key] = schema
+        return schema
+
+    def get_structures(
+        self,
+        structure: Union[str, Path, BytesIO, StructureMessage],
+        validate: bool = True,
+        pem: Optional[Union[str, Path]] = None,
+        only: Optional[Sequence[str]] = None,
+    ) -> StructureMessage:
+        """Return the structure message to be used to resolve schemas.
+
+        Structure messages are returned unchanged. Local structure files
+        are read in full once, and the resulting message is kept as long
+        as the file is not modified, so that the schemas resolved in it
+        can be reused. Other inputs (e.g. URLs) are read on every call,
+        with only the artefacts matching ``only`` (and their children).
+
+        Args:
+            structure: The structure message, or the path to file, URL
+                or string to be read.
+            validate: Validate the input (only for SDMX-ML and SDMX-JSON).
+            pem: The PEM file to be used when reading from a URL.
+            only: The artefacts to be read when the input is not cached.
+
+        Returns:
+            The structure message.
+        """
+        if isinstance(structure, StructureMessage):
+            return structure
+        from pysdmx.io.reader import read_sdmx
+
+        key = self.__get_file_key(structure, validate)
+        if key is None:
+            return read_sdmx(structure, validate=validate, pem=pem, only=only)
+        with self.__lock:
+            message = self.__files.get(key)
+            if message is not None:
+                self.__files.move_to_end(key)
+                return message
+        message = read_sdmx(structure, validate=validate, pem=pem)
+        with self.__lock:
+            self.__files[key] = message
+            self.__evict(self.__files)
+        return message
+
+    def clear(self) -> None:
+        """Remove all cached structure messages and schemas."""
+        with self.__lock:
+            self.__schemas.clear()
+            self.__files.clear()
+
+    def __evict(self, cache: "OrderedDict[Any, Any]") -> None:
+        while len(cache) > self.max_messages:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def __get_file_key(
+        structure: Union[str, Path, BytesIO], validate: bool
+    ) -> Optional[_FileKey]:
+        if isinstance(structure, BytesIO) or (
+            isinstance(structure, str) and not os.path.isfile(structure)
+        ):
+            return None
+        try:
+            path = Path(structure).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+        return str(path), stat.st_mtime_ns, stat.st_size, validate
@@ -38,8 +38,12 @@ WRITERS = {
     Format.REFMETA_SDMX_JSON_2_1_0: (
         "pysdmx.io.json.sdmxjson2.writer.v2_1.metadata"
     ),
+    Format.DATA_SDMX_JSON_2_0_0: "pysdmx.io.json.sdmxjson2.writer.v2_0.data",
+    Format.DATA_SDMX_JSON_2_1_0: "pysdmx.io.json.sdmxjson2.writer.v2_1.data",
     Format.REFMETA_SDMX_ML_3_0: "pysdmx.io.xml.sdmx30.writer.metadata",
     Format.REFMETA_SDMX_ML_3_1: "pysdmx.io.xml.sdmx31.writer.metadata",
+    Format.REFMETA_SDMX_CSV_2_0_0: "pysdmx.io.csv.sdmx20.writer.metadata",
+    Format.REFMETA_SDMX_CSV_2_1_0: "pysdmx.io.csv.sdmx21.writer.metadata",
 }
 
 STRUCTURE_WRITERS = (
@@ -51,6 +55,8 @@ STRUCTURE_WRITERS = (
 )
 
 REFMETA_WRITERS = (
+    Format.REFMETA_SDMX_CSV_2_0_0,
+    Format.REFMETA_SDMX_CSV_2_1_0,
     Format.REFMETA_SDMX_JSON_2_0_0,
     Format.REFMETA_SDMX_JSON_2_1_0,
     Format.REFMETA_SDMX_ML_3_0,
@@ -78,8 +84,9 @@ def write_sdmx(
         for more information.
 
     .. important::
-        To write SDMX-ML Generic or Series messages, the PandasDataset
-        requires to have its structure defined as a
+        To write SDMX-ML Generic or Series messages, as well as SDMX-JSON
+        data messages, the PandasDataset requires to have its structure
+        defined as a
         :class:`Schema <pysdmx.model.dataflow.Schema>`.
 
     Args:
@@ -92,11 +99,11 @@ def write_sdmx(
 
     Keyword Args:
         prettyprint: Whether to pretty-print the output (default: True)
-          (only for SDMX-ML).
+          (only for SDMX-ML and SDMX-JSON).
         header: Custom :class:`Header <pysdmx.model.message.Header>` to
-          include in the SDMX Message (only for SDMX-ML)
+          include in the SDMX Message (only for SDMX-ML and SDMX-JSON)
         dimension_at_observation: Mapping for dimension at observation
-          (only for SDMX-ML Data formats). Can be either:
+          (only for SDMX-ML and SDMX-JSON Data formats). Can be either:
 
           - A **string** with the dimension ID to apply to all datasets
             (e.g., ``"TIME_PERIOD"``).
@@ -178,7 +185,7 @@ def write_sdmx(
                     "dimension_at_observation"
                 )
             }
-            if is_xml and not is_structure and not is_ref_meta
+            if (is_xml or is_json) and not is_structure and not is_ref_meta
             else {}
         ),
         **(
@@ -188,7 +195,7 @@ def write_sdmx(
                 "time_format": kwargs.get("time_format"),
                 "partial_keys": kwargs.get("partial_keys"),
             }
-            if not is_xml
+            if not is_xml and not is_json and not is_ref_meta
             else {}
         ),
     }
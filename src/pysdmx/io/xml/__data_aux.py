@@ -20,6 +20,7 @@ from pysdmx.io.xml.__tokens import (
     VERSION,
 )
 from pysdmx.io.xml.utils import add_list
+from pysdmx.toolkit.pd._filter_utils import Predicate
 from pysdmx.util import parse_urn
 
 READING_CHUNKSIZE = 50000
@@ -29,19 +30,71 @@ def __process_df(
     test_list: List[Dict[str, Any]],
     df: Optional[pd.DataFrame],
     is_end: bool = False,
+    predicate: Optional[Predicate] = None,
 ) -> Any:
     if not is_end and len(test_list) <= READING_CHUNKSIZE:
         return test_list, df
-    if df is not None:
-        df = pd.concat([df, pd.DataFrame(test_list)], ignore_index=True)
-    else:
-        df = pd.DataFrame(test_list)
+    chunk = pd.DataFrame(test_list)
+    if predicate is not None:
+        # Rows not matching the filters are dropped chunk by chunk
+        chunk = chunk[predicate(chunk)].reset_index(drop=True)
+    df = chunk if df is None else pd.concat([df, chunk], ignore_index=True)
 
     del test_list[:]
 
     return test_list, df
 
 
+def __merge_groups(df: pd.DataFrame, groups: pd.DataFrame) -> pd.DataFrame:
+    """Add the attributes of the groups to the matching rows of the data.
+
+    A group (i.e. a row of ``groups``) applies to the rows of the data
+    with the same values for the columns that the group shares with the
+    data (i.e. its dimensions), and its other values (i.e. its
+    attributes) are added to those rows.
+
+    The groups are bucketed by the set of columns they match on, so that
+    there is one merge per bucket (e.g. per group type) rather than per
+    group. When several groups provide a value for the same attribute of
+    a row, the value of the first group is kept.
+
+    Args:
+        df: The data (e.g. the series and their observations).
+        groups: The groups, missing values standing for the columns
+            not set by a group.
+
+    Returns:
+        The data, with the attributes of the groups.
+    """
+    shared = groups.columns.isin(df.columns)
+    key_cols = list(groups.columns[shared])
+    att_cols = list(groups.columns[~shared])
+    if groups.empty or not key_cols or not att_cols:
+        return df
+
+    attributes = None
+    buckets = groups[key_cols].notna().groupby(key_cols, sort=False).indices
+    for mask, positions in buckets.items():
+        flags = mask if isinstance(mask, tuple) else (mask,)
+        keys = [k for k, m in zip(key_cols, flags) if m]
+        if not keys:
+            continue
+        # The first non-missing value of each attribute, per group key
+        values = (
+            groups.iloc[positions].groupby(keys, sort=False)[att_cols].first()
+        )
+        merged = df[keys].merge(
+            values, left_on=keys, right_index=True, how="left"
+        )[att_cols]
+        merged.index = df.index
+        attributes = (
+            merged if attributes is None else attributes.combine_first(merged)
+        )
+    if attributes is None:
+        return df
+    return pd.concat([df, attributes[att_cols]], axis=1)
+
+
 def __get_ids_from_structure(element: Dict[str, Any]) -> Any:
     """Gets the agency_id, id and version of the structure.
 
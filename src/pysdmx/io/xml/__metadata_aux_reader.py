@@ -1,9 +1,22 @@
 """Shared reader for SDMX-ML reference metadata (GenericMetadata)."""
 
-from typing import Any, Dict, List, Sequence
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Sequence, Union
 
+import xmltodict
+from lxml import etree
+
+from pysdmx.__extras_check import __check_xml_extra
 from pysdmx.errors import Invalid
-from pysdmx.io.xml.__parse_xml import parse_xml
+from pysdmx.io.xml.__parse_xml import (
+    SCHEMA_ROOT_30,
+    SCHEMA_ROOT_31,
+    XML_OPTIONS_21,
+    XML_OPTIONS_30,
+    XML_OPTIONS_31,
+    parse_xml,
+)
 from pysdmx.io.xml.__structure_aux_reader import _extract_text
 from pysdmx.io.xml.__tokens import (
     ACTION,
@@ -134,3 +147,68 @@ def read_metadata(
             __format_report(metadata_set) for metadata_set in add_list(sets)
         ]
     return reports
+
+
+def __xml_options(root: Any) -> Dict[str, Any]:
+    """Returns the xmltodict options matching the root of the message."""
+    qname = etree.QName(root)
+    if qname.localname != GENERIC_METADATA:
+        raise Invalid("This SDMX document is not SDMX-ML GenericMetadata.")
+    namespace = qname.namespace or ""
+    if SCHEMA_ROOT_31 in namespace:
+        return XML_OPTIONS_31
+    elif SCHEMA_ROOT_30 in namespace:
+        return XML_OPTIONS_30
+    return XML_OPTIONS_21
+
+
+def iter_metadata(
+    source: Union[str, Path, IO[bytes]],
+) -> Iterator[MetadataReport]:
+    """Reads the reports of an SDMX-ML GenericMetadata message one by one.
+
+    The message is parsed incrementally, and each ``<mes:MetadataSet>`` is
+    discarded once the corresponding report has been returned, so that the
+    memory used does not depend on the number of reports. The message is
+    not validated against the XSD.
+
+    Args:
+        source: The SDMX-ML GenericMetadata message (as a string), the
+            path to the file containing the message, or a binary file
+            object to read the message from.
+
+    Yields:
+        The reference metadata reports, in the order of the message.
+
+    Raises:
+        Invalid: If the document is not an SDMX-ML GenericMetadata message.
+    """
+    __check_xml_extra()
+    if isinstance(source, str):
+        source = BytesIO(source.encode("utf-8"))
+    elif isinstance(source, Path):
+        source = str(source)
+    context = etree.iterparse(source, events=("start", "end"), huge_tree=True)
+    options: Dict[str, Any] = XML_OPTIONS_21
+    root = None
+    try:
+        for event, elem in context:
+            if root is None:
+                root = elem
+                options = __xml_options(root)
+            elif event == "end" and elem.getparent() is root:
+                if etree.QName(elem).localname == METADATA_SET:
+                    metadata_set = xmltodict.parse(
+                        etree.tostring(elem), **options
+                    )
+                    yield __format_report(metadata_set[METADATA_SET])
+                # Free the children of the root already processed
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del root[0]
+    except etree.XMLSyntaxError as e:
+        raise Invalid(
+            "Invalid XML",
+            "The supplied message could not be parsed as SDMX-ML.",
+            {"error": str(e)},
+        ) from e
@@ -1,12 +1,14 @@
 """SDMX XML StructureSpecificData reader aux module."""
 
 import itertools
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from pysdmx.api.dc.query import Filter
 from pysdmx.io.pd import PandasDataset
 from pysdmx.io.xml.__data_aux import (
+    __merge_groups,
     __process_df,
 )
 from pysdmx.io.xml.__tokens import (
@@ -17,12 +19,16 @@ from pysdmx.io.xml.__tokens import (
 )
 from pysdmx.io.xml.utils import add_list
 from pysdmx.model.dataset import ActionType
+from pysdmx.toolkit.pd import compile_filter, filter_data
 
 
-def _reading_str_series(dataset: Dict[str, Any]) -> pd.DataFrame:
+def _reading_str_series(
+    dataset: Dict[str, Any], filters: Optional[Filter] = None
+) -> pd.DataFrame:
     # Structure Specific Series
     test_list = []
     df = None
+    predicate = None if filters is None else compile_filter(filters)
     dataset[SERIES] = add_list(dataset[SERIES])
     for data in dataset[SERIES]:
         keys = dict(itertools.islice(data.items(), len(data)))
@@ -32,29 +38,23 @@ def _reading_str_series(dataset: Dict[str, Any]) -> pd.DataFrame:
             test_list.extend([{**keys, **j} for j in data[OBS]])
         else:
             test_list.append(keys)
-        test_list, df = __process_df(test_list, df)
+        test_list, df = __process_df(test_list, df, predicate=predicate)
 
-    test_list, df = __process_df(test_list, df, is_end=True)
+    test_list, df = __process_df(
+        test_list, df, is_end=True, predicate=predicate
+    )
 
     return df
 
 
-def _reading_group_data(dataset: Dict[str, Any]) -> List[pd.DataFrame]:
-    # Structure Specific Group Data
-    group_dfs = []
+def _reading_group_data(dataset: Dict[str, Any]) -> pd.DataFrame:
+    # Structure Specific Group Data, one row per group
     dataset[GROUP] = add_list(dataset[GROUP])
-    for data in dataset[GROUP]:
-        group_dict = dict(data.items())
-        group_df = pd.DataFrame([group_dict])
-
-        # Remove :type columns
-        cols_to_delete = [x for x in group_df.columns if ":type" in x]
-        for x in cols_to_delete:
-            del group_df[x]
+    group_df = pd.DataFrame(dataset[GROUP])
 
-        group_dfs.append(group_df)
-
-    return group_dfs
+    # Remove :type columns
+    cols_to_delete = [x for x in group_df.columns if ":type" in x]
+    return group_df.drop(columns=cols_to_delete)
 
 
 def _get_at_att_str(dataset: Dict[str, Any]) -> Dict[str, Any]:
@@ -63,7 +63,9 @@ def _get_at_att_str(dataset: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _parse_structure_specific_data(
-    dataset: Dict[str, Any], structure_info: Dict[str, Any]
+    dataset: Dict[str, Any],
+    structure_info: Dict[str, Any],
+    filters: Optional[Filter] = None,
 ) -> PandasDataset:
     attached_attributes = _get_at_att_str(dataset)
 
@@ -72,40 +74,20 @@ def _parse_structure_specific_data(
     # Parsing data
     if SERIES in dataset:
         # Structure Specific Series
-        df = _reading_str_series(dataset)
-        if GROUP in dataset:
-            group_dfs = _reading_group_data(dataset)
-            original_columns = df.columns.tolist()
-            for group_df in group_dfs:
-                # Find non-NaN columns in this group
-                non_nan_cols = [
-                    col
-                    for col in group_df.columns
-                    if not group_df[col].isna().all()
-                ]
-
-                # Merge keys are intersection of original and non-NaN cols
-                merge_cols = list(
-                    set(original_columns).intersection(set(non_nan_cols))
-                )
-
-                group_df = group_df.drop_duplicates(merge_cols, keep="first")
-                df = pd.merge(
-                    df,
-                    group_df,
-                    on=merge_cols,
-                    how="left",
-                    suffixes=("", "_drop"),
-                )
-                for col in list(df.columns):
-                    if col.endswith("_drop"):
-                        original = col[:-5]
-                        df[original] = df[original].fillna(df[col])
-                        df.drop(col, axis=1, inplace=True)
+        if GROUP not in dataset:
+            df = _reading_str_series(dataset, filters)
+        else:
+            # Group attributes are only known once merged into the series
+            df = _reading_str_series(dataset)
+            df = __merge_groups(df, _reading_group_data(dataset))
+            if filters is not None:
+                df = filter_data(df, filters).reset_index(drop=True)
     elif OBS in dataset:
         dataset[OBS] = add_list(dataset[OBS])
         # Structure Specific All dimensions
         df = pd.DataFrame(dataset[OBS]).fillna("")
+        if filters is not None:
+            df = filter_data(df, filters).reset_index(drop=True)
 
     urn = f"{structure_info['structure_type']}={structure_info['unique_id']}"
     action = dataset.get("action", "Information")
@@ -1,11 +1,13 @@
 """Parsers for reading metadata."""
 
 from collections import defaultdict
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -18,6 +20,12 @@ from typing import (
 from msgspec import Struct
 from msgspec.structs import asdict, replace
 
+from pysdmx.io._structure_selection import (
+    Candidate,
+    Dependency,
+    StructureSelector,
+    find_urn_dependencies,
+)
 from pysdmx.io.xml.__tokens import (
     AGENCIES,
     AGENCY,
@@ -394,6 +402,25 @@ ORG_SCHEME_ITEMS = {
 
 COMP_TYPES = [DIM, ATT, MEASURE, MSR, GROUP_DIM]
 
+# Collections which may be formatted concurrently, phase by phase, once
+# the agencies are known. Each phase only depends on the previous ones
+# (e.g. concepts use the codelists of their core representation). VTL
+# schemes reference each other, and are therefore formatted afterwards.
+_CONCURRENT_PHASES = (
+    (
+        DATA_PROVIDER_SCHEMES,
+        METADATA_PROVIDER_SCHEMES,
+        DATA_CONSUMER_SCHEMES,
+        CLS,
+        VALUE_LISTS,
+        HIERARCHIES,
+        HIERARCHICAL_CODELISTS,
+        HIERARCHY_ASSOCIATIONS,
+        CATEGORY_SCHEMES,
+    ),
+    (CON_SCHEMES, CONCEPTS),
+)
+
 ROLE_MAPPING = {
     DIM: Role.DIMENSION,
     ATT: Role.ATTRIBUTE,
@@ -2335,138 +2362,185 @@ class StructureParser(Struct):
 
         return schemas
 
-    def format_structures(
-        self, json_meta: Dict[str, Any]
-    ) -> Sequence[Union[ItemScheme, DataStructureDefinition, Dataflow]]:
-        """Formats the structures in JSON format.
-
-        Args:
-            json_meta: The structures in JSON format.
+    @staticmethod
+    def __find_dependencies(element: Any) -> Iterator[Dependency]:
+        """Yields the maintainable artefacts referenced by the element.
 
-        Returns:
-            A list with the formatted structures.
+        References are either Ref elements (SDMX-ML 2.1) or URNs.
         """
+        stack = [element]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get(REF)
+                if isinstance(ref, dict) and ID in ref:
+                    if PAR_ID in ref:
+                        yield (
+                            ref.get(AGENCY_ID, ""),
+                            ref[PAR_ID],
+                            ref.get(PAR_VER),
+                        )
+                    else:
+                        yield ref.get(AGENCY_ID, ""), ref[ID], ref.get(VERSION)
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+            elif isinstance(current, str) and "urn:" in current:
+                yield from find_urn_dependencies(current)
 
-        def process_structure(
-            key: str,
-            formatter: Callable[[Dict[str, Any]], Dict[Any, Any]],
-            attr: Optional[str] = None,
-        ) -> Dict[Any, Any]:
-            """Helper function to process and store formatted structures."""
-            if key in json_meta:
-                formatted = formatter(json_meta[key])
-                setattr(self, attr, formatted) if attr else None
-                return formatted
-            return {}
-
-        structures = {
+    @staticmethod
+    def __list_candidates(
+        json_meta: Dict[str, Any],
+    ) -> Tuple[List[Tuple[str, str]], List[Candidate]]:
+        """Lists the structures, with their collection and element tag."""
+        slots = []
+        candidates = []
+        for collection, content in json_meta.items():
+            if not isinstance(content, dict):
+                continue
+            for tag, elements in content.items():
+                if not isinstance(elements, (dict, list)):
+                    continue
+                for element in add_list(elements):
+                    if isinstance(element, dict) and ID in element:
+                        slots.append((collection, tag))
+                        candidates.append(
+                            Candidate(
+                                tag,
+                                element.get(AGENCY_ID, ""),
+                                element[ID],
+                                element.get(VERSION, "1.0"),
+                                element,
+                            )
+                        )
+        return slots, candidates
+
+    def __select_structures(
+        self, json_meta: Dict[str, Any], only: Sequence[str]
+    ) -> Dict[str, Any]:
+        """Keeps only the requested structures and their dependencies."""
+        selector = StructureSelector.from_query(only)
+        slots, candidates = self.__list_candidates(json_meta)
+        selected = selector.select(candidates, self.__find_dependencies)
+        kept: Dict[str, Dict[str, List[Any]]] = {}
+        for (collection, tag), candidate, keep in zip(
+            slots, candidates, selected
+        ):
+            elements = kept.setdefault(collection, {}).setdefault(tag, [])
+            if keep:
+                elements.append(candidate.content)
+        out = dict(json_meta)
+        for collection, tags in kept.items():
+            content = {
+                k: v for k, v in json_meta[collection].items() if k not in tags
+            }
+            content.update((k, v) for k, v in tags.items() if v)
+            if any(tags.values()):
+                out[collection] = content
+            else:
+                del out[collection]
+        return out
+
+    def __formatters(
+        self,
+    ) -> Dict[
+        str, Tuple[Callable[[Dict[str, Any]], Dict[Any, Any]], Optional[str]]
+    ]:
+        """Returns, per collection, its formatter and parser attribute.
+
+        The collections are listed in the order they are formatted.
+        """
+        return {
             # SDMX-ML 2.1: a single wrapper holding every organisation
             # scheme type, so it is not stored into the AgencyScheme-typed
             # attribute to avoid mixing types.
-            ORGS: process_structure(ORGS, self.__format_orgs),
-            AGENCIES: process_structure(
-                AGENCIES, self.__format_orgs, "agencies"
-            ),
-            DATA_PROVIDER_SCHEMES: process_structure(
-                DATA_PROVIDER_SCHEMES,
+            ORGS: (self.__format_orgs, None),
+            AGENCIES: (self.__format_orgs, "agencies"),
+            DATA_PROVIDER_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data, DATA_PROVIDER_SCHEME, DATA_PROV
                 ),
                 "data_provider_schemes",
             ),
-            METADATA_PROVIDER_SCHEMES: process_structure(
-                METADATA_PROVIDER_SCHEMES,
+            METADATA_PROVIDER_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data, METADATA_PROVIDER_SCHEME, METADATA_PROVIDER
                 ),
                 "metadata_provider_schemes",
             ),
-            DATA_CONSUMER_SCHEMES: process_structure(
-                DATA_CONSUMER_SCHEMES,
+            DATA_CONSUMER_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data, DATA_CONSUMER_SCHEME, DATA_CONSUMER
                 ),
                 "data_consumer_schemes",
             ),
-            CLS: process_structure(
-                CLS,
+            CLS: (
                 lambda data: self.__format_scheme(data, CL, CODE),
                 "codelists",
             ),
-            VALUE_LISTS: process_structure(
-                VALUE_LISTS,
+            VALUE_LISTS: (
                 lambda data: self.__format_scheme(
                     data, VALUE_LIST, VALUE_ITEM
                 ),
                 "valuelists",
             ),
-            HIERARCHIES: process_structure(
-                HIERARCHIES,
+            HIERARCHIES: (
                 self.__format_hierarchy,
+                None,
             ),
-            HIERARCHICAL_CODELISTS: process_structure(
-                HIERARCHICAL_CODELISTS,
+            HIERARCHICAL_CODELISTS: (
                 self.__format_hierarchical_codelist,
+                None,
             ),
-            HIERARCHY_ASSOCIATIONS: process_structure(
-                HIERARCHY_ASSOCIATIONS,
+            HIERARCHY_ASSOCIATIONS: (
                 self.__format_hierarchy_association,
+                None,
             ),
-            CON_SCHEMES: process_structure(
-                CON_SCHEMES,
+            CON_SCHEMES: (
                 lambda data: self.__format_scheme(data, CS, CON),
                 "concepts",
             ),
-            CONCEPTS: process_structure(
-                CONCEPTS,
+            CONCEPTS: (
                 lambda data: self.__format_scheme(data, CS, CON),
                 "concepts",
             ),
-            DSDS: process_structure(
-                DSDS,
+            DSDS: (
                 lambda data: self.__format_schema(data, DSDS, DSD),
                 "datastructures",
             ),
-            DFWS: process_structure(
-                DFWS,
+            DFWS: (
                 lambda data: self.__format_schema(data, DFWS, DFW),
                 "dataflows",
             ),
-            PROV_AGREEMENTS: process_structure(
-                PROV_AGREEMENTS,
+            PROV_AGREEMENTS: (
                 lambda data: self.__format_schema(
                     data, PROV_AGREEMENTS, PROV_AGREEMENT
                 ),
+                None,
             ),
-            MSDS: process_structure(
-                MSDS,
+            MSDS: (
                 self.__format_metadatastructure,
                 "metadatastructures",
             ),
-            METADATAFLOWS: process_structure(
-                METADATAFLOWS,
+            METADATAFLOWS: (
                 lambda data: self.__format_schema(
                     data, METADATAFLOWS, METADATAFLOW
                 ),
                 "metadataflows",
             ),
-            CATEGORY_SCHEMES: process_structure(
-                CATEGORY_SCHEMES,
+            CATEGORY_SCHEMES: (
                 self.__format_category_scheme,
                 "category_schemes",
             ),
-            CATEGORISATIONS: process_structure(
-                CATEGORISATIONS,
+            CATEGORISATIONS: (
                 self.__format_categorisation,
                 "categorisations",
             ),
-            MPAS: process_structure(
-                MPAS,
+            MPAS: (
                 lambda data: self.__format_schema(data, MPAS, MPA),
                 "metadata_provision_agreements",
             ),
-            VTLMAPPINGS: process_structure(
-                VTLMAPPINGS,
+            VTLMAPPINGS: (
                 lambda data: self.__format_scheme(
                     data,
                     VTL_MAPPING_SCHEME,
@@ -2474,8 +2548,7 @@ class StructureParser(Struct):
                 ),
                 "vtl_mappings",
             ),
-            VTLMAPPING_SCHEMES: process_structure(
-                VTLMAPPING_SCHEMES,
+            VTLMAPPING_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data,
                     VTL_MAPPING_SCHEME,
@@ -2483,56 +2556,47 @@ class StructureParser(Struct):
                 ),
                 "vtl_mappings",
             ),
-            RULESETS: process_structure(
-                RULESETS,
+            RULESETS: (
                 lambda data: self.__format_scheme(data, RULE_SCHEME, RULE),
                 "rulesets",
             ),
-            RULE_SCHEMES: process_structure(
-                RULE_SCHEMES,
+            RULE_SCHEMES: (
                 lambda data: self.__format_scheme(data, RULE_SCHEME, RULE),
                 "rulesets",
             ),
-            UDOS: process_structure(
-                UDOS,
+            UDOS: (
                 lambda data: self.__format_scheme(data, UDO_SCHEME, UDO),
                 "udos",
             ),
-            UDO_SCHEMES: process_structure(
-                UDO_SCHEMES,
+            UDO_SCHEMES: (
                 lambda data: self.__format_scheme(data, UDO_SCHEME, UDO),
                 "udos",
             ),
-            NAME_PERS: process_structure(
-                NAME_PERS,
+            NAME_PERS: (
                 lambda data: self.__format_scheme(
                     data, NAME_PER_SCHEME, NAME_PER
                 ),
                 "name_personalisations",
             ),
-            NAME_PER_SCHEMES: process_structure(
-                NAME_PER_SCHEMES,
+            NAME_PER_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data, NAME_PER_SCHEME, NAME_PER
                 ),
                 "name_personalisations",
             ),
-            CUSTOM_TYPES: process_structure(
-                CUSTOM_TYPES,
+            CUSTOM_TYPES: (
                 lambda data: self.__format_scheme(
                     data, CUSTOM_TYPE_SCHEME, CUSTOM_TYPE
                 ),
                 "custom_types",
             ),
-            CUSTOM_TYPE_SCHEMES: process_structure(
-                CUSTOM_TYPE_SCHEMES,
+            CUSTOM_TYPE_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data, CUSTOM_TYPE_SCHEME, CUSTOM_TYPE
                 ),
                 "custom_types",
             ),
-            TRANSFORMATIONS: process_structure(
-                TRANSFORMATIONS,
+            TRANSFORMATIONS: (
                 lambda data: self.__format_scheme(
                     data,
                     TRANS_SCHEME,
@@ -2540,48 +2604,41 @@ class StructureParser(Struct):
                 ),
                 "transformations",
             ),
-            STRUCTURE_MAPS: process_structure(
-                STRUCTURE_MAPS,
+            STRUCTURE_MAPS: (
                 lambda data: self.__format_schema(
                     data, STRUCTURE_MAP, STRUCTURE_MAP
                 ),
                 "structure_maps",
             ),
-            COMPONENT_MAPS: process_structure(
-                COMPONENT_MAPS,
+            COMPONENT_MAPS: (
                 lambda data: self.__format_schema(
                     data, COMPONENT_MAP, COMPONENT_MAP
                 ),
                 "component_maps",
             ),
-            FIXED_VALUE_MAPS: process_structure(
-                FIXED_VALUE_MAPS,
+            FIXED_VALUE_MAPS: (
                 lambda data: self.__format_schema(
                     data, FIXED_VALUE_MAP, FIXED_VALUE_MAP
                 ),
                 "fixed_value_maps",
             ),
-            REPRESENTATION_MAPS: process_structure(
-                REPRESENTATION_MAPS,
+            REPRESENTATION_MAPS: (
                 lambda data: self.__format_schema(
                     data, REPRESENTATION_MAP, REPRESENTATION_MAP
                 ),
                 "representation_maps",
             ),
-            CONSTRAINTS: process_structure(
-                CONSTRAINTS,
+            CONSTRAINTS: (
                 lambda data: self.__format_schema(data, CONSTRAINTS, CON_CONS),
                 "constraints",
             ),
-            DATA_CONSTRAINTS: process_structure(
-                DATA_CONSTRAINTS,
+            DATA_CONSTRAINTS: (
                 lambda data: self.__format_schema(
                     data, DATA_CONSTRAINTS, DATA_CONS
                 ),
                 "constraints",
             ),
-            TRANS_SCHEMES: process_structure(
-                TRANS_SCHEMES,
+            TRANS_SCHEMES: (
                 lambda data: self.__format_scheme(
                     data,
                     TRANS_SCHEME,
@@ -2590,6 +2647,92 @@ class StructureParser(Struct):
                 "transformations",
             ),
         }
+
+    def format_collection(self, key: str, data: Any) -> Dict[Any, Any]:
+        """Formats a collection of structures (e.g. Codelists).
+
+        Args:
+            key: The collection of structures.
+            data: The collection in JSON format.
+
+        Returns:
+            The formatted structures, by short URN.
+        """
+        return self.__formatters()[key][0](data)
+
+    def __store(self, key: str, formatted: Dict[Any, Any]) -> None:
+        """Keeps the formatted structures needed by other collections."""
+        attr = self.__formatters()[key][1]
+        if attr:
+            setattr(self, attr, formatted)
+
+    def __process_collection(
+        self,
+        json_meta: Dict[str, Any],
+        key: str,
+        formatted: Dict[str, Dict[Any, Any]],
+    ) -> None:
+        """Formats and stores a collection of structures, if present."""
+        formatted[key] = {}
+        if key in json_meta:
+            formatted[key] = self.format_collection(key, json_meta[key])
+            self.__store(key, formatted[key])
+
+    def __format_collections(
+        self, json_meta: Dict[str, Any], executor: Optional[Executor]
+    ) -> Dict[str, Dict[Any, Any]]:
+        """Formats every collection, concurrently if possible."""
+        formatters = self.__formatters()
+        formatted: Dict[str, Dict[Any, Any]] = {}
+        if executor is not None:
+            for key in (ORGS, AGENCIES):
+                self.__process_collection(json_meta, key, formatted)
+            for phase in _CONCURRENT_PHASES:
+                futures = {
+                    key: executor.submit(
+                        self.format_collection, key, json_meta[key]
+                    )
+                    for key in phase
+                    if key in json_meta
+                }
+                # Results are stored in the sequential order
+                for key in formatters:
+                    if key in futures:
+                        formatted[key] = futures[key].result()
+                        self.__store(key, formatted[key])
+        for key in formatters:
+            if key not in formatted:
+                self.__process_collection(json_meta, key, formatted)
+        return {key: formatted[key] for key in formatters}
+
+    def format_structures(
+        self,
+        json_meta: Dict[str, Any],
+        only: Optional[Sequence[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Sequence[Union[ItemScheme, DataStructureDefinition, Dataflow]]:
+        """Formats the structures in JSON format.
+
+        Args:
+            json_meta: The structures in JSON format.
+            only: The SDMX classes (e.g. Codelist) and URNs of the
+                structures to be formatted. The structures they reference
+                are formatted as well. If None, all structures are
+                formatted.
+            executor: If set, the independent collections (e.g.
+                codelists, concept schemes, hierarchies) are formatted
+                concurrently, using this thread or process pool. The
+                structures depending on other collections (e.g. data
+                structures and dataflows) are formatted afterwards. The
+                result is the same as when formatting sequentially.
+
+        Returns:
+            A list with the formatted structures.
+        """
+        if only is not None:
+            json_meta = self.__select_structures(json_meta, only)
+
+        structures = self.__format_collections(json_meta, executor)
         self.__enrich_category_schemes(structures.get(CATEGORY_SCHEMES, {}))
         # Enrich provider schemes with the dataflows derived from the
         # parsed provision agreements (SDMX-JSON parity). Data provider
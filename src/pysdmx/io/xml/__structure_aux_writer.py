@@ -1,7 +1,17 @@
 """Module for writing metadata to XML files."""
 
 from collections import OrderedDict
-from typing import Any, Dict, Optional, Sequence, Union
+from itertools import chain
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from msgspec.structs import replace
 
@@ -205,6 +215,7 @@ from pysdmx.util import (
     parse_short_urn,
     parse_urn,
 )
+from pysdmx.util._file_utils import open_replacing
 
 ANNOTATION_WRITER = OrderedDict(
     {
@@ -1993,33 +2004,38 @@ def __write_categorisation(
     return outfile
 
 
-def __write_scheme(  # noqa: C901
+def __iter_scheme(  # noqa: C901
     item_scheme: Any, indent: str, scheme: str, references_30: bool = False
-) -> str:
-    """Writes the scheme to the XML file."""
+) -> Iterator[str]:
+    """Writes the scheme to the XML file, item by item."""
     if getattr(item_scheme, "sdmx_type", None) == "valuelist":
         scheme = VALUE_LIST
 
     if isinstance(item_scheme, (RepresentationMap, MultiRepresentationMap)):
-        return __write_representation_map(item_scheme, indent, references_30)
+        yield __write_representation_map(item_scheme, indent, references_30)
+        return
     if scheme == STRUCTURE_MAP:
-        return __write_structure_map(item_scheme, indent, references_30)
+        yield __write_structure_map(item_scheme, indent, references_30)
+        return
     if isinstance(item_scheme, DataConstraint):
-        return __write_data_constraint(item_scheme, indent, references_30)
+        yield __write_data_constraint(item_scheme, indent, references_30)
+        return
     if isinstance(item_scheme, Hierarchy):
-        return (
+        yield (
             __write_hierarchy(item_scheme, indent, references_30)
             if references_30
             else __write_hierarchical_codelist(item_scheme, indent)
         )
+        return
     if isinstance(item_scheme, HierarchyAssociation):
-        return __write_hierarchy_association(
-            item_scheme, indent, references_30
-        )
+        yield __write_hierarchy_association(item_scheme, indent, references_30)
+        return
     if scheme == CATEGORY_SCHEME:
-        return __write_category_scheme(item_scheme, indent, references_30)
+        yield __write_category_scheme(item_scheme, indent, references_30)
+        return
     if isinstance(item_scheme, Categorisation):
-        return __write_categorisation(item_scheme, indent, references_30)
+        yield __write_categorisation(item_scheme, indent, references_30)
+        return
 
     # The MetadataStructure and MetadataProvisionAgreement constructs do not
     # exist (MPA) or have an incompatible grammar (MSD) in SDMX-ML 2.1.
@@ -2119,12 +2135,13 @@ def __write_scheme(  # noqa: C901
             if scheme == AGENCY_SCHEME
             else ""
         )
+        # Items are emitted one by one, as schemes may be large
+        yield outfile
+        outfile = ""
         for item in item_scheme.items:
             if scheme == AGENCY_SCHEME:
                 item = __localize_agency_item(item, owner, references_30)
-            outfile += __write_item(
-                item, add_indent(indent), scheme, references_30
-            )
+            yield __write_item(item, add_indent(indent), scheme, references_30)
     if scheme in [
         RULE_SCHEME,
         UDO_SCHEME,
@@ -2140,7 +2157,7 @@ def __write_scheme(  # noqa: C901
         )
     outfile += f"{indent}</{label}>"
 
-    return outfile
+    yield outfile
 
 
 def __check_sdmx_type(
@@ -2157,12 +2174,12 @@ def __check_sdmx_type(
         return msg_content[key]
 
 
-def __write_metadata_element(
+def __iter_metadata_element(
     package: Dict[str, Any],
     key: str,
     prettyprint: object,
     references_30: bool = False,
-) -> str:
+) -> Iterator[str]:
     """Writes the metadata element to the XML file.
 
     Args:
@@ -2171,10 +2188,9 @@ def __write_metadata_element(
         prettyprint: Prettyprint or not
         references_30: Whether to use SDMX 3.0 references
 
-    Returns:
-        A string with the metadata element
+    Yields:
+        The parts of the metadata element
     """
-    outfile = ""
     nl = "\n" if prettyprint else ""
     child2 = "\t\t" if prettyprint else ""
 
@@ -2184,20 +2200,18 @@ def __write_metadata_element(
 
     if key in package:
         scheme = __check_sdmx_type(package, key, msg_content)
-        outfile += f"{base_indent}<{ABBR_STR}:{scheme}>"
+        yield f"{base_indent}<{ABBR_STR}:{scheme}>"
         for element in package[key].values():
             item = (
                 DSD
                 if issubclass(element.__class__, DataStructureDefinition)
                 else element.__class__.__name__
             )
-            outfile += __write_scheme(
+            yield from __iter_scheme(
                 element, add_indent(base_indent), item, references_30
             )
 
-        outfile += f"{base_indent}</{ABBR_STR}:{scheme}>"
-
-    return outfile
+        yield f"{base_indent}</{ABBR_STR}:{scheme}>"
 
 
 def __get_outfile(obj_: Dict[str, Any], key: str = "") -> str:
@@ -2265,35 +2279,59 @@ def group_structures(
     return content
 
 
-def __write_structures(
+def iter_structures(
     content: Dict[str, Any], prettyprint: bool, references_30: bool = False
-) -> str:
-    """Writes the structures to the XML file.
+) -> Iterator[str]:
+    """Writes the structures to the XML file, part by part.
+
+    Large item schemes are written item by item, so that the parts can
+    be written to a file as they are generated, without building the
+    whole message in memory.
 
     Args:
         content: The Message Content to be written
         prettyprint: Prettyprint or not
         references_30: Whether to use SDMX 3.0 references
 
-    Returns:
-        A string with the structures
+    Yields:
+        The parts of the structures, each one being complete XML tags
     """
     nl = "\n" if prettyprint else ""
     child1 = "\t" if prettyprint else ""
 
-    outfile = f"{nl}{child1}<{ABBR_MSG}:Structures>"
-    msg_content = MSG_CONTENT_PKG_30 if references_30 else MSG_CONTENT_PKG_21
-    for key in msg_content:
-        outfile += __write_metadata_element(
-            content, key, prettyprint, references_30
-        )
+    parts = chain(
+        [f"{nl}{child1}<{ABBR_MSG}:Structures>"],
+        chain.from_iterable(
+            __iter_metadata_element(content, key, prettyprint, references_30)
+            for key in (
+                MSG_CONTENT_PKG_30 if references_30 else MSG_CONTENT_PKG_21
+            )
+        ),
+        [f"{nl}{child1}</{ABBR_MSG}:Structures>"],
+    )
+    # Replace &amp; with & in the outfile
+    for part in parts:
+        yield part.replace("& ", "&amp; ")
 
-    outfile += f"{nl}{child1}</{ABBR_MSG}:Structures>"
 
-    # Replace &amp; with & in the outfile
-    outfile = outfile.replace("& ", "&amp; ")
+def write_message(
+    parts: Iterable[str], output_path: Optional[Union[str, Path]]
+) -> Optional[str]:
+    """Writes the parts of a message to a file, or returns the message.
 
-    return outfile
+    Args:
+        parts: The parts of the message, in order
+        output_path: The path to save the file, if any
+
+    Returns:
+        The XML string if output_path is empty, None otherwise
+    """
+    if output_path is None or output_path == "":
+        return "".join(parts)
+    # Do not leave a partially written message behind
+    with open_replacing(output_path, encoding="UTF-8", errors="replace") as f:
+        f.writelines(parts)
+    return None
 
 
 def _write_vtl(  # noqa: C901
@@ -58,6 +58,9 @@ MESSAGE_TYPE_MAPPING = {
     Format.REFMETA_SDMX_ML_3_1: "GenericMetadata",
 }
 
+# Double quotes which are not part of a word are escaped in XML content
+_UNQUOTED_QUOTE = re.compile(r'(?<!\w)"(?!\w)')
+
 ABBR_MSG = "mes"
 ABBR_GEN = "gen"
 ABBR_COM = "com"
@@ -567,7 +570,8 @@ def __to_lower_camel_case(snake_str: str) -> str:
 
 def __escape_xml(value: str) -> str:
     final_value = escape(value)
-    final_value = re.sub(r'(?<!\w)"(?!\w)', "&quot;", final_value)
+    if '"' in final_value:
+        final_value = _UNQUOTED_QUOTE.sub("&quot;", final_value)
     return final_value
 
 
@@ -1,8 +1,12 @@
-from typing import Any, Dict, Iterable, Optional, Sequence, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
 
 from pysdmx.errors import Invalid
 from pysdmx.io._pd_utils import validate_schema_exists
-from pysdmx.io.pd import PandasDataset, stringify_dataframe
+from pysdmx.io.pd import PandasDataset
 from pysdmx.io.xml.__write_aux import ALL_DIM
 from pysdmx.model import Role, Schema
 
@@ -91,15 +95,6 @@ def writing_validation(dataset: PandasDataset) -> None:
         raise Invalid("The dataset structure must have at least one measure.")
 
 
-def stringify_dataset(dataset: PandasDataset) -> None:
-    """Convert all dataset DataFrame columns to strings, nulls as empty.
-
-    Args:
-        dataset: The dataset whose DataFrame will be converted in place.
-    """
-    dataset.data = stringify_dataframe(dataset.data)
-
-
 _XML_SKIP_VALUES = frozenset(("", None))
 
 
@@ -150,3 +145,60 @@ def _single_non_empty_or_raise(
             f"{sorted(distinct)!r} across rows of the same {context}."
         )
     return next(iter(distinct), "")
+
+
+def _group_series(
+    data: pd.DataFrame,
+    series_codes: List[str],
+    series_att_codes: List[str],
+) -> Tuple[pd.DataFrame, npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Group the rows of the (stringified) data by series.
+
+    The series are identified by the values of the dimensions only, so
+    that rows where a series-attached attribute was left empty do not
+    split a series. The series are sorted by key, and the rows of each
+    series keep their original order.
+
+    Args:
+        data: The data, with all string columns and no null values.
+        series_codes: The ids of the series dimensions.
+        series_att_codes: The ids of the series-attached attributes.
+
+    Returns:
+        The series (one row per series, with the values of the series
+        dimensions and attributes), the positions of the rows of the
+        data sorted by series, and the boundaries of each series in
+        those positions (i.e. series ``i`` spans the positions
+        ``bounds[i]`` to ``bounds[i + 1]``).
+
+    Raises:
+        Invalid: If a series-attached attribute has more than one
+            distinct non-empty value in a series.
+    """
+    codes = (
+        data.groupby(by=series_codes, dropna=False, sort=True)
+        .ngroup()
+        .to_numpy()
+    )
+    count = int(codes.max()) + 1 if len(codes) else 0
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(count + 1))
+    series = data.iloc[order[bounds[:-1]]][series_codes].reset_index(drop=True)
+    for att in series_att_codes:
+        series[att] = __series_attribute(data[att], codes, count, att)
+    return series, order, bounds
+
+
+def __series_attribute(
+    column: pd.Series, codes: npt.NDArray[Any], count: int, att: str
+) -> npt.NDArray[Any]:
+    """The unique non-empty value of an attribute in each series."""
+    values = pd.DataFrame({"series": codes, "value": column.to_numpy()})
+    values = values[values["value"] != ""].drop_duplicates()
+    conflicts = values["series"].duplicated(keep=False)
+    if conflicts.any():
+        first = values["series"][conflicts].min()
+        _single_non_empty_or_raise(column[codes == first], att, "series")
+    out = np.full(count, "", dtype=object)
+    out[values["series"].to_numpy()] = values["value"].to_numpy()
+    return out
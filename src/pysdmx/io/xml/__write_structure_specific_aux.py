@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 import pandas as pd
 
 from pysdmx.errors import Invalid
-from pysdmx.io.pd import PandasDataset
+from pysdmx.io.pd import PandasDataset, stringify_dataset
 from pysdmx.io.xml.__write_aux import (
     ABBR_MSG,
     ALL_DIM,
@@ -14,9 +14,9 @@ from pysdmx.io.xml.__write_aux import (
     get_structure,
 )
 from pysdmx.io.xml.__write_data_aux import (
+    _group_series,
     _should_skip_xml_value,
     _single_non_empty_or_raise,
-    stringify_dataset,
     writing_validation,
 )
 from pysdmx.io.xml.config import CHUNKSIZE
@@ -24,12 +24,14 @@ from pysdmx.toolkit.pd._data_utils import get_codes
 from pysdmx.util import parse_short_urn
 
 
-def __validate_all_dimensions_data(dataset: PandasDataset) -> None:
+def __validate_all_dimensions_data(
+    dataset: PandasDataset, data: pd.DataFrame
+) -> None:
     dim_cols = [d.id for d in dataset.structure.components.dimensions]
     for col in dim_cols:
-        if col not in dataset.data.columns:
+        if col not in data.columns:
             continue
-        empty_rows = dataset.data[col] == ""
+        empty_rows = data[col] == ""
         if empty_rows.any():
             raise Invalid(
                 f"AllDimensions requires all dimensions to have values. "
@@ -82,7 +84,6 @@ def __write_data_structure_specific(
     outfile = ""
 
     for i, (short_urn, dataset) in enumerate(datasets.items()):
-        stringify_dataset(dataset)
         outfile += __write_data_single_dataset(
             dataset=dataset,
             prettyprint=prettyprint,
@@ -117,8 +118,8 @@ def __write_data_single_dataset(
     structure_urn = get_structure(dataset)
     id_structure = parse_short_urn(structure_urn).id
     sdmx_type = parse_short_urn(structure_urn).id
-    # Remove null values from DataFrame
-    stringify_dataset(dataset)
+    # Strings, with null values as empty strings
+    df = stringify_dataset(dataset)
 
     nl = "\n" if prettyprint else ""
     child1 = "\t" if prettyprint else ""
@@ -139,14 +140,14 @@ def __write_data_single_dataset(
     )
     data = ""
     if dim == ALL_DIM:
-        __validate_all_dimensions_data(dataset)
-        data += __memory_optimization_writing(dataset.data, prettyprint)
+        __validate_all_dimensions_data(dataset, df)
+        data += __memory_optimization_writing(df, prettyprint)
     else:
         writing_validation(dataset)
         series_codes, obs_codes, group_codes = get_codes(
             dimension_code=dim,
             structure=dataset.structure,  # type: ignore[arg-type]
-            data=dataset.data,
+            data=df,
         )
         att_codes = [att.id for att in dataset.structure.components.attributes]
         series_att_codes = [x for x in series_codes if x in att_codes]
@@ -155,12 +156,12 @@ def __write_data_single_dataset(
         obs_codes = [x for x in obs_codes if x not in obs_att_codes]
         if group_codes:
             data += __group_processing(
-                data=dataset.data,
+                data=df,
                 group_codes=group_codes,
                 prettyprint=prettyprint,
             )
         data += __series_processing(
-            data=dataset.data,
+            data=df,
             series_codes=series_codes,
             series_att_codes=series_att_codes,
             obs_codes=obs_codes,
@@ -292,16 +293,15 @@ def __series_processing(
     (series-attribute-only rows) are excluded from the obs list.
     """
     obs_dim = obs_codes[0]
+    series, order, bounds = _group_series(data, series_codes, series_att_codes)
+    rows = data.iloc[order]
+    has_obs = (rows[obs_dim] != "").to_numpy(dtype=bool)
+    obs = rows[obs_codes + obs_att_codes].to_dict(orient="records")
     out_list: List[str] = []
-    for keys, group_data in data.groupby(by=series_codes, dropna=False):
-        record: Dict[str, Any] = dict(zip(series_codes, keys))
-        for att in series_att_codes:
-            record[att] = _single_non_empty_or_raise(
-                group_data[att], att, "series"
-            )
-        obs_rows = group_data[~group_data[obs_dim].map(_should_skip_xml_value)]
-        record["Obs"] = obs_rows[obs_codes + obs_att_codes].to_dict(
-            orient="records"
-        )
+    for i, record in enumerate(series.to_dict(orient="records")):
+        start, end = bounds[i], bounds[i + 1]
+        record["Obs"] = [
+            o for o, keep in zip(obs[start:end], has_obs[start:end]) if keep
+        ]
         out_list.append(__format_ser_str(record, prettyprint))
     return "".join(out_list)
@@ -1,12 +1,14 @@
 """SDMX 2.1 XML Generic Data reader module."""
 
-from typing import Any, Dict, Sequence
+from typing import Any, Dict, Optional, Sequence
 
 import pandas as pd
 
+from pysdmx.api.dc.query import Filter
 from pysdmx.errors import Invalid
 from pysdmx.io.pd import PandasDataset
 from pysdmx.io.xml.__data_aux import (
+    __merge_groups,
     __process_df,
     get_data_objects,
 )
@@ -30,6 +32,7 @@ from pysdmx.io.xml.__tokens import (
 )
 from pysdmx.io.xml.utils import add_list
 from pysdmx.model.dataset import ActionType
+from pysdmx.toolkit.pd import filter_data
 
 
 def __get_element_to_list(data: Dict[str, Any], mode: Any) -> Dict[str, Any]:
@@ -58,7 +61,7 @@ def __reading_generic_groups(dataset: Dict[str, Any]) -> pd.DataFrame:
         test_list.append(keys)
         test_list, df = __process_df(test_list, df)
     test_list, df = __process_df(test_list, df, is_end=True)
-    return df.fillna("")
+    return df
 
 
 def __reading_generic_series(dataset: Dict[str, Any]) -> pd.DataFrame:
@@ -139,7 +142,9 @@ def __get_at_att_gen(dataset: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def __parse_generic_data(
-    dataset: Dict[str, Any], structure_info: Dict[str, Any]
+    dataset: Dict[str, Any],
+    structure_info: Dict[str, Any],
+    filters: Optional[Filter] = None,
 ) -> PandasDataset:
     attached_attributes = __get_at_att_gen(dataset)
 
@@ -148,11 +153,7 @@ def __parse_generic_data(
         # Generic Series
         df = __reading_generic_series(dataset)
         if GROUP in dataset:
-            df_group = __reading_generic_groups(dataset)
-            common_columns = list(
-                set(df.columns).intersection(set(df_group.columns))
-            )
-            df = pd.merge(df, df_group, on=common_columns, how="left")
+            df = __merge_groups(df, __reading_generic_groups(dataset))
         dim_at_obs = structure_info["dimensionAtObservation"]
         # In case there are observations defined, we need to replace the
         # OBS_DIM column with the dimension at observation
@@ -163,6 +164,9 @@ def __parse_generic_data(
         # Generic All Dimensions
         df = __reading_generic_all(dataset)
 
+    if filters is not None:
+        df = filter_data(df, filters).reset_index(drop=True)
+
     action = dataset.get("action", "Information")
     action = ActionType(action)
 
@@ -173,12 +177,16 @@ def __parse_generic_data(
     )
 
 
-def read(input_str: str, validate: bool = True) -> Sequence[PandasDataset]:
+def read(
+    input_str: str, validate: bool = True, filters: Optional[Filter] = None
+) -> Sequence[PandasDataset]:
     """Reads an SDMX-ML 2.1 Generic data and returns a Sequence of Datasets.
 
     Args:
         input_str: SDMX-ML data to read.
         validate: If True, the XML data will be validated against the XSD.
+        filters: If set, only the observations matching the filters
+            are kept.
     """
     dict_info = parse_xml(input_str, validate=validate)
     msg_key = next((k for k in (GENERIC, GENERIC_TS) if k in dict_info), None)
@@ -188,6 +196,6 @@ def read(input_str: str, validate: bool = True) -> Sequence[PandasDataset]:
 
     datasets = []
     for dataset in dataset_info:
-        ds = __parse_generic_data(dataset, str_info[dataset[STR_REF]])
+        ds = __parse_generic_data(dataset, str_info[dataset[STR_REF]], filters)
         datasets.append(ds)
     return datasets
@@ -1,6 +1,7 @@
 """Parsers for reading metadata."""
 
-from typing import Sequence, Union
+from concurrent.futures import Executor
+from typing import Optional, Sequence, Union
 
 from pysdmx.errors import Invalid
 from pysdmx.io.xml.__parse_xml import parse_xml
@@ -21,12 +22,20 @@ from pysdmx.model.dataflow import (
 def read(
     input_str: str,
     validate: bool = True,
+    only: Optional[Sequence[str]] = None,
+    executor: Optional[Executor] = None,
 ) -> Sequence[Union[ItemScheme, DataStructureDefinition, Dataflow]]:
     """Reads an SDMX-ML 2.1 Structure data and returns the structures.
 
     Args:
         input_str: SDMX-ML structure message to read.
         validate: If True, the XML data will be validated against the XSD.
+        only: The SDMX classes (e.g. Codelist) and URNs of the structures
+            to be read, if not all of them. The structures they reference
+            are read as well.
+        executor: If set, the independent families of structures (e.g.
+            codelists and concept schemes) are formatted concurrently,
+            using this thread or process pool.
 
     Returns:
         dict: Dictionary with the parsed structures.
@@ -35,5 +44,5 @@ def read(
     if STRUCTURE not in dict_info:
         raise Invalid("This SDMX document is not SDMX-ML 2.1 Structure.")
     return StructureParser().format_structures(
-        dict_info[STRUCTURE][STRUCTURES]
+        dict_info[STRUCTURE][STRUCTURES], only, executor
     )
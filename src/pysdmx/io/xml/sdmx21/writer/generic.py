@@ -4,10 +4,13 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from pysdmx.io.format import Format
-from pysdmx.io.pd import PandasDataset
+from pysdmx.io.pd import PandasDataset, stringify_dataset
 from pysdmx.io.xml.__write_aux import (
     ABBR_GEN,
     ABBR_MSG,
@@ -19,11 +22,10 @@ from pysdmx.io.xml.__write_aux import (
     get_structure,
 )
 from pysdmx.io.xml.__write_data_aux import (
+    _group_series,
     _should_skip_xml_value,
-    _single_non_empty_or_raise,
     check_content_dataset,
     check_dimension_at_observation,
-    stringify_dataset,
     writing_validation,
 )
 from pysdmx.io.xml.config import CHUNKSIZE
@@ -31,6 +33,11 @@ from pysdmx.model.message import Header
 from pysdmx.toolkit.pd._data_utils import get_codes
 from pysdmx.util import parse_short_urn
 
+# Replaced as in xml.sax.saxutils.escape (ampersands first)
+_XML_ENTITIES = (("&", "&amp;"), (">", "&gt;"), ("<", "&lt;"))
+# Characters that repr escapes in strings
+_REPR_ESCAPED = r"[\p{Cc}\p{Cf}\p{Co}\p{Cs}\p{Zl}\p{Zp}\\]|[^\P{Zs} ]"
+
 
 def __value(id: str, value: str) -> str:
     """Write a value tag."""
@@ -125,7 +132,6 @@ def __write_data_generic(
 
     for short_urn, dataset in datasets.items():
         writing_validation(dataset)
-        stringify_dataset(dataset)
         outfile += __write_data_single_dataset(
             dataset=dataset,
             prettyprint=prettyprint,
@@ -153,7 +159,8 @@ def __write_data_single_dataset(
     outfile = ""
     structure_urn = get_structure(dataset)
     id_structure = parse_short_urn(structure_urn).id
-    stringify_dataset(dataset)
+    # Strings, with null values as empty strings
+    df = stringify_dataset(dataset)
 
     nl = "\n" if prettyprint else ""
     child1 = "\t" if prettyprint else ""
@@ -181,7 +188,7 @@ def __write_data_single_dataset(
     if dim == ALL_DIM:
         obs_structure = __generate_obs_structure(dataset)
         data += __memory_optimization_writing(
-            data=dataset.data,
+            data=df,
             obs_structure=obs_structure,
             prettyprint=prettyprint,
         )
@@ -189,7 +196,7 @@ def __write_data_single_dataset(
         series_codes, obs_codes, group_codes = get_codes(
             dimension_code=dim,
             structure=dataset.structure,  # type: ignore[arg-type]
-            data=dataset.data,
+            data=df,
         )
         att_codes = [att.id for att in dataset.structure.components.attributes]
         series_att_codes = [x for x in series_codes if x in att_codes]
@@ -200,13 +207,13 @@ def __write_data_single_dataset(
 
         if group_codes:
             data += __group_processing(
-                data=dataset.data,
+                data=df,
                 group_codes=group_codes,
                 prettyprint=prettyprint,
             )
 
         data += __series_processing(
-            data=dataset.data,
+            data=df,
             series_codes=series_codes,
             series_att_codes=series_att_codes,
             obs_codes=obs_codes,
@@ -227,48 +234,23 @@ def __obs_processing(
     obs_structure: Tuple[List[str], str, List[str]],
     prettyprint: bool = True,
 ) -> str:
-    def __format_obs_str(element: Dict[str, Any]) -> str:
-        child2 = "\t\t" if prettyprint else ""
-        child3 = "\t\t\t" if prettyprint else ""
-        child4 = "\t\t\t\t" if prettyprint else ""
-        nl = "\n" if prettyprint else ""
-
-        out = f"{child2}<{ABBR_GEN}:Obs>{nl}"
-        # Obs Key writing
-        out += f"{child3}<{ABBR_GEN}:ObsKey>{nl}"
-        for k, v in element.items():
-            if k in obs_structure[0] and not _should_skip_xml_value(v):
-                out += f"{child4}{__value(k, v)}{nl}"
-        out += f"{child3}</{ABBR_GEN}:ObsKey>{nl}"
-
-        # Obs Value writing (already transformed)
-        obs_value_id = obs_structure[1]
-        obs_value = element[obs_value_id]
-        if not _should_skip_xml_value(obs_value):
-            out += (
-                f"{child3}<{ABBR_GEN}:ObsValue value={str(obs_value)!r}/>{nl}"
-            )
-
-        if len(obs_structure[2]) > 0:
-            # Obs Attributes writing
-            obs_att_content = ""
-            for k, v in element.items():
-                if k in obs_structure[2] and not _should_skip_xml_value(v):
-                    obs_att_content += f"{child4}{__value(k, v)}{nl}"
-            if obs_att_content:
-                out += f"{child3}<{ABBR_GEN}:Attributes>{nl}"
-                out += obs_att_content
-                out += f"{child3}</{ABBR_GEN}:Attributes>{nl}"
-
-        out += f"{child2}</{ABBR_GEN}:Obs>{nl}"
-
-        return out
-
-    parser = lambda x: __format_obs_str(x)  # noqa: E731
-
-    iterator = map(parser, data.to_dict(orient="records"))
+    child2 = "\t\t" if prettyprint else ""
+    child3 = "\t\t\t" if prettyprint else ""
+    child4 = "\t\t\t\t" if prettyprint else ""
+    nl = "\n" if prettyprint else ""
 
-    return "".join(iterator)
+    # The columns keep the order of the data
+    key_codes = [k for k in data.columns if k in obs_structure[0]]
+    att_codes = [k for k in data.columns if k in obs_structure[2]]
+    obs = __join(
+        f"{child2}<{ABBR_GEN}:Obs>{nl}{child3}<{ABBR_GEN}:ObsKey>{nl}",
+        __value_tags(data, key_codes, child4, nl),
+        f"{child3}</{ABBR_GEN}:ObsKey>{nl}",
+        __tags(data[obs_structure[1]], f"{child3}<{ABBR_GEN}:ObsValue", nl),
+        __attributes(data, att_codes, child3, child4, nl),
+        f"{child2}</{ABBR_GEN}:Obs>{nl}",
+    )
+    return "".join(obs.to_numpy(zero_copy_only=False))
 
 
 def __group_processing(
@@ -346,118 +328,130 @@ def __series_processing(
     non-empty value found across the group's rows; conflicting
     non-empty values raise ``Invalid``.
     """
-    out_list: List[str] = []
-    for keys, group_data in data.groupby(by=series_codes, dropna=False):
-        record: Dict[str, Any] = dict(zip(series_codes, keys))
-        for att in series_att_codes:
-            record[att] = _single_non_empty_or_raise(
-                group_data[att], att, "series"
-            )
-        record["Obs"] = group_data[obs_codes + obs_att_codes].to_dict(
-            orient="records"
-        )
-        out_list.append(
-            __format_ser_str(
-                data_info=record,
-                series_codes=series_codes,
-                series_att_codes=series_att_codes,
-                obs_codes=obs_codes,
-                obs_att_codes=obs_att_codes,
-                prettyprint=prettyprint,
-            )
-        )
-    return "".join(out_list)
-
-
-def __format_ser_str(
-    data_info: Dict[Any, Any],
-    series_codes: List[str],
-    series_att_codes: List[str],
-    obs_codes: List[str],
-    obs_att_codes: List[str],
-    prettyprint: bool,
-) -> str:
     child2 = "\t\t" if prettyprint else ""
     child3 = "\t\t\t" if prettyprint else ""
     child4 = "\t\t\t\t" if prettyprint else ""
     child5 = "\t\t\t\t\t" if prettyprint else ""
     nl = "\n" if prettyprint else ""
 
-    out_element = f"{child2}<{ABBR_GEN}:Series>{nl}"
-
-    # Series Key writing
-    out_element += f"{child3}<{ABBR_GEN}:SeriesKey>{nl}"
-    for k, v in data_info.items():
-        if k in series_codes:
-            out_element += f"{child4}{__value(k, v)}{nl}"
-    out_element += f"{child3}</{ABBR_GEN}:SeriesKey>{nl}"
-
-    # Series Attributes writing (values already transformed)
-    if len(series_att_codes) > 0:
-        att_content = ""
-        for k, v in data_info.items():
-            if k in series_att_codes and not _should_skip_xml_value(v):
-                att_content += f"{child4}{__value(k, v)}{nl}"
-        if att_content:
-            out_element += f"{child3}<{ABBR_GEN}:Attributes>{nl}"
-            out_element += att_content
-            out_element += f"{child3}</{ABBR_GEN}:Attributes>{nl}"
-
-    # Obs writing
-    for obs in data_info["Obs"]:
-        # Skip observations with sentinel dimension values
-        obs_dim_val = obs[obs_codes[0]]
-        if _should_skip_xml_value(obs_dim_val):
-            continue
-        out_element += f"{child3}<{ABBR_GEN}:Obs>{nl}"
-
-        # Obs Dimension writing
-        out_element += (
-            f"{child4}<{ABBR_GEN}:ObsDimension "
-            f"value={str(obs_dim_val)!r}/>{nl}"
-        )
-        # Obs Value writing (already transformed)
-        obs_value_id = obs_codes[1]
-        obs_val = obs[obs_value_id]
-        if not _should_skip_xml_value(obs_val):
-            out_element += (
-                f"{child4}<{ABBR_GEN}:ObsValue value={str(obs_val)!r}/>{nl}"
-            )
+    series, order, bounds = _group_series(data, series_codes, series_att_codes)
+    headers = __join(
+        f"{child2}<{ABBR_GEN}:Series>{nl}{child3}<{ABBR_GEN}:SeriesKey>{nl}",
+        __value_tags(series, series_codes, child4, nl, skip_empty=False),
+        f"{child3}</{ABBR_GEN}:SeriesKey>{nl}",
+        __attributes(series, series_att_codes, child3, child4, nl),
+    ).to_numpy(zero_copy_only=False)
+
+    # Observations with an empty observation dimension are skipped
+    obs_dim, obs_value = obs_codes[0], obs_codes[1]
+    obs = __join(
+        f"{child3}<{ABBR_GEN}:Obs>{nl}",
+        __tags(data[obs_dim], f"{child4}<{ABBR_GEN}:ObsDimension", nl),
+        __tags(data[obs_value], f"{child4}<{ABBR_GEN}:ObsValue", nl),
+        __attributes(data, obs_att_codes, child4, child5, nl),
+        f"{child3}</{ABBR_GEN}:Obs>{nl}",
+    )
+    obs = pc.if_else(__is_empty(data[obs_dim]), "", obs)
+    sorted_obs = obs.to_numpy(zero_copy_only=False)[order]
 
-        # Obs Attributes writing
-        out_element += __format_obs_attributes(
-            obs, obs_att_codes, child4, child5, nl
-        )
-        out_element += f"{child3}</{ABBR_GEN}:Obs>{nl}"
+    out_list: List[str] = []
+    for i, header in enumerate(headers):
+        out_list.append(header)
+        out_list.extend(sorted_obs[bounds[i] : bounds[i + 1]])
+        out_list.append(f"{child2}</{ABBR_GEN}:Series>{nl}")
+    return "".join(out_list)
 
-    out_element += f"{child2}</{ABBR_GEN}:Series>{nl}"
 
-    return out_element
+def __join(*parts: Union[str, pa.StringArray]) -> pa.StringArray:
+    """Concatenate strings and arrays of strings, element-wise."""
+    return pc.binary_join_element_wise(  # type: ignore[call-overload]
+        *parts, ""
+    )
 
 
-def __format_obs_attributes(
-    obs: Dict[str, Any],
-    obs_att_codes: List[str],
-    child4: str,
-    child5: str,
-    nl: str,
-) -> str:
-    if len(obs_att_codes) == 0:
-        return ""
+def __is_empty(column: pd.Series) -> pa.BooleanArray:
+    """Check which (stringified) values are empty."""
+    return pc.equal(pa.array(column.array), pa.scalar(""))
 
-    obs_att_content = ""
-    for k, v in obs.items():
-        if k in obs_att_codes and not _should_skip_xml_value(v):
-            obs_att_content += f"{child5}{__value(k, v)}{nl}"
 
-    if not obs_att_content:
-        return ""
+def __xml_values(column: pd.Series, escape: bool) -> pa.StringArray:
+    """The values of a (stringified) column, as written in a value tag.
 
-    return (
-        f"{child4}<{ABBR_GEN}:Attributes>{nl}"
-        f"{obs_att_content}"
-        f"{child4}</{ABBR_GEN}:Attributes>{nl}"
+    Vectorised equivalent of ``repr(v)[1:-1]`` (or of
+    ``repr(__escape_xml(v))[1:-1]`` if ``escape`` is True), i.e. the
+    value as written between the quotes of the XML attribute. Values
+    that repr escapes (e.g. backslashes or non-printable characters),
+    and values that __escape_xml needs to inspect (those with double
+    quotes), are formatted one by one.
+    """
+    array = pa.array(column.array, type=pa.string())
+    if escape:
+        for char, entity in _XML_ENTITIES:
+            array = pc.replace_substring(array, char, entity)
+        special = pc.match_substring(array, '"')
+    else:
+        special = pc.and_(
+            pc.match_substring(array, '"'), pc.match_substring(array, "'")
+        )
+    special = pc.or_(special, pc.match_substring_regex(array, _REPR_ESCAPED))
+    if pc.any(special).as_py():
+        positions = np.flatnonzero(special.to_numpy(zero_copy_only=False))
+        values = column.iloc[positions].tolist()
+        if escape:
+            values = [__escape_xml(v) for v in values]
+        array = pc.replace_with_mask(
+            array, special, pa.array([repr(v)[1:-1] for v in values])
+        )
+    return array
+
+
+def __tags(
+    column: pd.Series, prefix: str, nl: str, escape: bool = False
+) -> pa.StringArray:
+    """Format a value tag per (non-empty) value of a column."""
+    tags = __join(
+        f"{prefix} value='", __xml_values(column, escape), f"'/>{nl}"
+    )
+    return pc.if_else(__is_empty(column), "", tags)
+
+
+def __value_tags(
+    data: pd.DataFrame,
+    codes: List[str],
+    indent: str,
+    nl: str,
+    skip_empty: bool = True,
+) -> pa.StringArray:
+    """Format the <gen:Value> tags of the columns, for each row."""
+    if not codes:
+        return pa.array([""] * len(data), pa.string())
+    tags = []
+    for k in codes:
+        prefix = f"{indent}<{ABBR_GEN}:Value id={k!r}"
+        if skip_empty:
+            tags.append(__tags(data[k], prefix, nl, escape=True))
+        else:
+            tags.append(
+                __join(
+                    f"{prefix} value='",
+                    __xml_values(data[k], escape=True),
+                    f"'/>{nl}",
+                )
+            )
+    return __join(*tags)
+
+
+def __attributes(
+    data: pd.DataFrame, codes: List[str], indent: str, child: str, nl: str
+) -> pa.StringArray:
+    """Format the <gen:Attributes> block of each row, if any."""
+    content = __value_tags(data, codes, child, nl)
+    block = __join(
+        f"{indent}<{ABBR_GEN}:Attributes>{nl}",
+        content,
+        f"{indent}</{ABBR_GEN}:Attributes>{nl}",
     )
+    return pc.if_else(pc.equal(content, pa.scalar("")), "", block)
 
 
 def write(
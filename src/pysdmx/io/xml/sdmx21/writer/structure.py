@@ -1,13 +1,15 @@
 """Module for writing metadata to XML files."""
 
+from itertools import chain
 from pathlib import Path
 from typing import Optional, Sequence, Union
 
 from pysdmx.io.format import Format
 from pysdmx.io.xml.__structure_aux_writer import (
     STR_DICT_TYPE_LIST_21,
-    __write_structures,
     group_structures,
+    iter_structures,
+    write_message,
 )
 from pysdmx.io.xml.__write_aux import (
     __write_header,
@@ -42,21 +44,18 @@ def write(
 
     content = group_structures(elements, STR_DICT_TYPE_LIST_21)
 
-    # Generating the initial tag with namespaces
-    outfile = create_namespaces(type_, prettyprint=prettyprint)
-    # Generating the header
-    outfile += __write_header(header, prettyprint, data_message=False)
-    # Writing the content
-    outfile += __write_structures(content, prettyprint)
-
-    outfile += get_end_message(type_, prettyprint)
+    # Generating the initial tag with namespaces and the header,
+    # followed by the content, written part by part
+    parts = chain(
+        [
+            create_namespaces(type_, prettyprint=prettyprint),
+            __write_header(header, prettyprint, data_message=False),
+        ],
+        iter_structures(content, prettyprint),
+        [get_end_message(type_, prettyprint)],
+    )
 
     output_path = (
         str(output_path) if isinstance(output_path, Path) else output_path
     )
-
-    if output_path is None or output_path == "":
-        return outfile
-    with open(output_path, "w", encoding="UTF-8", errors="replace") as f:
-        f.write(outfile)
-    return None
+    return write_message(parts, output_path)
@@ -1,8 +1,9 @@
 """Reader for SDMX-ML 3.0 reference metadata (GenericMetadata)."""
 
-from typing import Sequence
+from pathlib import Path
+from typing import IO, Iterator, Sequence, Union
 
-from pysdmx.io.xml.__metadata_aux_reader import read_metadata
+from pysdmx.io.xml.__metadata_aux_reader import iter_metadata, read_metadata
 from pysdmx.model.metadata import MetadataReport
 
 
@@ -20,3 +21,22 @@ def read(
         The sequence of reference metadata reports.
     """
     return read_metadata(input_str, validate)
+
+
+def iter_read(
+    source: Union[str, Path, IO[bytes]],
+) -> Iterator[MetadataReport]:
+    """Reads the reports of an SDMX-ML 3.0 GenericMetadata message one by one.
+
+    The message is parsed incrementally, so that the memory used is bounded
+    by the largest report rather than by the size of the message. The
+    message is not validated against the XSD.
+
+    Args:
+        source: SDMX-ML GenericMetadata message to read (as a string),
+            path to the file containing it, or binary file object.
+
+    Returns:
+        An iterator over the reference metadata reports.
+    """
+    return iter_metadata(source)
@@ -1,7 +1,8 @@
 """SDMX XML 3.0 StructureSpecificData reader module."""
 
-from typing import Sequence
+from typing import Optional, Sequence
 
+from pysdmx.api.dc.query import Filter
 from pysdmx.errors import Invalid
 from pysdmx.io.pd import PandasDataset
 from pysdmx.io.xml.__data_aux import (
@@ -17,12 +18,17 @@ from pysdmx.io.xml.__tokens import (
 )
 
 
-def read(input_str: str, validate: bool = True) -> Sequence[PandasDataset]:
+def read(
+    input_str: str, validate: bool = True, filters: Optional[Filter] = None
+) -> Sequence[PandasDataset]:
     """Reads an SDMX-ML 3.0 and returns a Sequence of Datasets.
 
     Args:
         input_str: SDMX-ML data to read.
         validate: If True, the XML data will be validated against the XSD.
+        filters: If set, only the observations matching the filters
+            are kept. Non-matching observations are dropped while the
+            message is parsed.
     """
     dict_info = parse_xml(input_str, validate=validate)
     if STR_SPE not in dict_info:
@@ -33,7 +39,7 @@ def read(input_str: str, validate: bool = True) -> Sequence[PandasDataset]:
     datasets = []
     for dataset in dataset_info:
         ds = _parse_structure_specific_data(
-            dataset, str_info[dataset[STR_REF]]
+            dataset, str_info[dataset[STR_REF]], filters
         )
         datasets.append(ds)
     return datasets
@@ -1,7 +1,21 @@
 import re
+import unicodedata
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from enum import Enum
-from typing import Any, Literal, Optional, Sequence, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from msgspec import Struct
 
@@ -446,12 +460,210 @@ class MaintainableArtefact(
         return f"{self.__class__.__name__}={agency}:{self.id}({self.version})"
 
 
-class ItemScheme(MaintainableArtefact, frozen=True, omit_defaults=True):
+_SEARCH_FIELDS = ("name", "description")
+_WORD = re.compile(r"\w+")
+
+
+def _normalise(text: str) -> str:
+    """Fold the case and strip the accents of a text, for searching."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        c for c in decomposed if not unicodedata.combining(c)
+    ).casefold()
+
+
+@lru_cache(maxsize=256)
+def _compile_query(
+    query: str, use_regex: bool
+) -> Tuple[Optional[Pattern[str]], str, Tuple[str, ...]]:
+    """Compile a search query once.
+
+    Regular expressions are compiled as is. Other queries are normalised
+    and split into words, which are looked up in the search index.
+    """
+    if use_regex:
+        return re.compile(query), query, ()
+    folded = _normalise(query)
+    return None, folded, tuple(_WORD.findall(folded))
+
+
+class _SearchIndex:
+    """A full-text index of the names and descriptions of items.
+
+    The texts are normalised (i.e. case folded and without accents), and
+    split into words. Each word points to the items using it (inverted
+    index), and the words are sorted, so that the words starting with a
+    given prefix are found by bisection. The words are also joined into
+    a single string, to find the words containing a given substring
+    without looping over them in Python.
+
+    The items matching a query are the items having, for each word of
+    the query, a word containing it (or starting with it, for prefix
+    searches). The normalised texts of these candidates are then
+    checked for the whole query.
+    """
+
+    __slots__ = (
+        "items",
+        "texts",
+        "folded",
+        "words",
+        "postings",
+        "blob",
+        "starts",
+    )
+
+    def __init__(self, items: Sequence[Any]) -> None:
+        self.items = list(items)
+        self.texts: Dict[str, List[str]] = {}
+        self.folded: Dict[str, List[str]] = {}
+        postings: Dict[str, Set[int]] = {}
+        for field in _SEARCH_FIELDS:
+            texts = []
+            for item in self.items:
+                value = getattr(item, field, None)
+                texts.append("" if value is None else str(value))
+            folded = [_normalise(t) for t in texts]
+            for i, text in enumerate(folded):
+                for word in _WORD.findall(text):
+                    postings.setdefault(word, set()).add(i)
+            self.texts[field] = texts
+            self.folded[field] = folded
+        self.words = sorted(postings)
+        self.postings = [postings[w] for w in self.words]
+        self.starts: List[int] = []
+        offset = 0
+        for word in self.words:
+            self.starts.append(offset)
+            offset += len(word) + 1
+        self.blob = "\n".join(self.words)
+
+    def search(
+        self,
+        query: str,
+        use_regex: bool,
+        prefix: bool,
+        fields: Sequence[str],
+    ) -> List[Any]:
+        """Return the matching items, best matches first."""
+        pattern, folded, words = _compile_query(query, use_regex)
+        if pattern is not None:
+            ranks = self.__regex_ranks(pattern, fields)
+        else:
+            ranks = self.__text_ranks(folded, words, prefix, fields)
+        ranks.sort()
+        return [self.items[i] for _, _, i in ranks]
+
+    def __regex_ranks(
+        self, pattern: Pattern[str], fields: Sequence[str]
+    ) -> List[Tuple[int, int, int]]:
+        ranks = []
+        for i in range(len(self.items)):
+            best = None
+            for f, field in enumerate(fields):
+                text = self.texts[field][i]
+                match = pattern.search(text)
+                if match:
+                    rank = (self.__kind(text, match.start(), match.end()), f)
+                    best = rank if best is None else min(best, rank)
+            if best is not None:
+                ranks.append((*best, i))
+        return ranks
+
+    def __text_ranks(
+        self,
+        folded: str,
+        words: Tuple[str, ...],
+        prefix: bool,
+        fields: Sequence[str],
+    ) -> List[Tuple[int, int, int]]:
+        ranks = []
+        for i in self.__candidates(words, prefix):
+            best = None
+            for f, field in enumerate(fields):
+                text = self.folded[field][i]
+                start = text.find(folded)
+                while start >= 0:
+                    kind = self.__kind(text, start, start + len(folded))
+                    if not prefix or kind < 3:
+                        rank = (kind, f)
+                        best = rank if best is None else min(best, rank)
+                        break
+                    start = text.find(folded, start + 1)
+            if best is not None:
+                ranks.append((*best, i))
+        return ranks
+
+    def __candidates(
+        self, words: Tuple[str, ...], prefix: bool
+    ) -> Sequence[int]:
+        """The items having a word matching each word of the query.
+
+        Words matching a large part of the vocabulary (e.g. single
+        letters) do not narrow the search much, and are skipped, as
+        checking all items is then faster than merging their postings.
+        """
+        found: Optional[Set[int]] = None
+        for word in sorted(set(words), key=len, reverse=True):
+            ids = self.__prefixed(word) if prefix else self.__containing(word)
+            if len(ids) > len(self.words) // 8:
+                continue
+            matches: Set[int] = set()
+            for w in ids:
+                matches.update(self.postings[w])
+            found = matches if found is None else found & matches
+            if not found:
+                return []
+        return range(len(self.items)) if found is None else sorted(found)
+
+    def __prefixed(self, word: str) -> range:
+        """The indices of the words starting with the supplied one."""
+        start = bisect_left(self.words, word)
+        end = bisect_left(self.words, word + "\U0010ffff", start)
+        return range(start, end)
+
+    def __containing(self, word: str) -> Sequence[int]:
+        """The indices of the words containing the supplied one."""
+        out = []
+        pos = self.blob.find(word)
+        while pos >= 0:
+            w = bisect_right(self.starts, pos) - 1
+            out.append(w)
+            if w + 1 == len(self.starts):
+                break
+            pos = self.blob.find(word, self.starts[w + 1])
+        return out
+
+    @staticmethod
+    def __kind(text: str, start: int, end: int) -> int:
+        """Rank a match: whole text, start of the text, of a word, other."""
+        if start == 0:
+            return 0 if end == len(text) else 1
+        elif not text[start - 1].isalnum():
+            return 2
+        return 3
+
+
+def _search_fields(
+    fields: Literal["name", "description", "all"],
+) -> Sequence[str]:
+    return _SEARCH_FIELDS if fields == "all" else (fields,)
+
+
+class ItemScheme(
+    MaintainableArtefact, frozen=True, omit_defaults=True, dict=True
+):
     """ItemScheme class.
 
     The descriptive information for an arrangement or division of objects
     into groups based on characteristics, which the objects have in common.
 
+    Items are searched using a full-text index of the scheme, built the
+    first time it is needed. As item schemes are immutable, the items
+    must not be modified afterwards.
+
     Attributes:
         items: The list of items in the scheme.
         is_partial: Whether the scheme is partial.
@@ -465,44 +677,51 @@ class ItemScheme(MaintainableArtefact, frozen=True, omit_defaults=True):
         query: str,
         use_regex: bool = False,
         fields: Literal["name", "description", "all"] = "all",
+        prefix: bool = False,
     ) -> Sequence[Item]:
         """Search for items matching the query.
 
+        Plain text queries are case-insensitive and ignore accents (e.g.
+        "cote" matches "Côte d'Ivoire"). Regular expressions are applied
+        as is. Nested items (e.g. categories in a category scheme) are
+        searched as well.
+
+        The matching items are ranked by match quality: items whose text
+        is the query come first, followed by items whose text starts with
+        the query, items with a word starting with the query and other
+        items. Matches in names rank higher than matches in descriptions,
+        and items otherwise keep their order in the scheme.
+
         Args:
             query: The substring or regex pattern to search for.
             use_regex: Whether to treat the query as a regex (default: False).
             fields: The fields to search in (default: all textual fields).
+            prefix: Whether the query must match the start of a word, as
+                when suggesting items while the query is typed (default:
+                False). This is ignored for regular expressions.
 
         Returns:
-           Items that match the query.
+           Items that match the query, best matches first.
+
+        Raises:
+            Invalid: If the query is empty.
         """
         if not query:
             raise Invalid(
                 "Invalid search", "The query string cannot be empty."
             )
-
-        # Determine which fields to search in
-        search_fields = (
-            ["name", "description"] if fields == "all" else [fields]
+        return self.__search_index.search(
+            query, use_regex, prefix, _search_fields(fields)
         )
 
-        # Transform plain text queries into a regex
-        if not use_regex:
-            query = re.escape(query)
-
-        pattern = re.compile(query, re.IGNORECASE if not use_regex else 0)
-
-        all_items = getattr(self, "all_items", "")
-        items = all_items or self.items
-
-        return [
-            item  # type: ignore[misc]
-            for item in items
-            if any(
-                pattern.search(str(getattr(item, field, "")))
-                for field in search_fields
-            )
-        ]
+    @property
+    def __search_index(self) -> _SearchIndex:
+        index = self.__dict__.get("_search")
+        if index is None:
+            all_items = getattr(self, "all_items", None)
+            index = _SearchIndex(all_items or self.items)
+            self.__dict__["_search"] = index
+        return index
 
 
 class DataflowRef(
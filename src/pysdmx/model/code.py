@@ -17,10 +17,23 @@ representation of hierarchical relationships to hierarchies only.
 """
 
 from datetime import datetime
-from typing import Iterator, Literal, Optional, Sequence, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from msgspec import Struct
 
+from pysdmx.errors import Invalid
 from pysdmx.model.__base import (
     Agency,
     Annotation,
@@ -30,8 +43,12 @@ from pysdmx.model.__base import (
     ItemScheme,
     MaintainableArtefact,
     NameableArtefact,
+    _search_fields,
+    _SearchIndex,
 )
 
+T = TypeVar("T")
+
 
 class Code(Item, frozen=True, omit_defaults=True):
     """A code, such as a country code in the list of ISO 3166 codes.
@@ -217,8 +234,88 @@ class LevelType(NameableArtefact, frozen=True, omit_defaults=True):
     facets: Optional[Facets] = None
 
 
+class _HierarchyIndex:
+    """A flat view of the codes in a hierarchy.
+
+    Codes are identified by their path, i.e. their ID preceded by the
+    IDs of their parents, separated by dots (e.g. 1.11.111). The paths
+    are numbered in pre-order and in post-order, so that checking
+    whether a code is the ancestor of another one does not require
+    walking the hierarchy.
+    """
+
+    __slots__ = (
+        "codes",
+        "parents",
+        "pre",
+        "post",
+        "ends",
+        "order",
+        "paths",
+        "by_id",
+        "distinct",
+        "size",
+    )
+
+    def __init__(self, codes: Sequence[HierarchicalCode]) -> None:
+        self.codes: Dict[str, HierarchicalCode] = {}
+        self.parents: Dict[str, Optional[str]] = {}
+        self.pre: Dict[str, int] = {}
+        self.post: Dict[str, int] = {}
+        self.ends: Dict[str, int] = {}
+        self.order: List[str] = []
+        self.paths: Dict[str, List[str]] = {}
+        self.by_id: Dict[str, List[HierarchicalCode]] = {}
+        self.distinct: List[HierarchicalCode] = []
+        self.size = 0
+
+        # Iterative depth-first walk, to support deep hierarchies. A
+        # path on the stack marks the end of the descendants of a code.
+        stack: List[Union[str, Tuple[Optional[str], HierarchicalCode]]] = [
+            (None, c) for c in reversed(codes)
+        ]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                self.post[item] = len(self.post)
+                self.ends[item] = len(self.order)
+                continue
+            parent, code = item
+            self.size += 1
+            self.__add_distinct(code)
+            path = code.id if parent is None else f"{parent}.{code.id}"
+            if path in self.codes:
+                # Same ID under the same parent: the first code is the
+                # one indexed, but the codes below the others still count
+                self.__add_unindexed(code.codes)
+                continue
+            self.codes[path] = code
+            self.parents[path] = parent
+            self.pre[path] = len(self.order)
+            self.order.append(path)
+            self.paths.setdefault(code.id, []).append(path)
+            stack.append(path)
+            stack.extend((path, c) for c in reversed(code.codes))
+
+    def __add_unindexed(self, codes: Sequence[HierarchicalCode]) -> None:
+        stack = list(reversed(codes))
+        while stack:
+            code = stack.pop()
+            self.size += 1
+            self.__add_distinct(code)
+            stack.extend(reversed(code.codes))
+
+    def __add_distinct(self, code: HierarchicalCode) -> None:
+        # Hierarchical codes are not hashable, but only codes
+        # sharing the same ID need to be compared.
+        same_id = self.by_id.setdefault(code.id, [])
+        if code not in same_id:
+            same_id.append(code)
+            self.distinct.append(code)
+
+
 class Hierarchy(
-    MaintainableArtefact, frozen=True, omit_defaults=True, tag=True
+    MaintainableArtefact, frozen=True, omit_defaults=True, tag=True, dict=True
 ):
     """An immutable collection of codes, organized hierarchically.
 
@@ -230,6 +327,10 @@ class Hierarchy(
 
     A hierarchy is **iterable**, i.e. it can be used as is in a for loop.
 
+    Codes are retrieved using a flat index of the hierarchy, built the
+    first time it is needed. As hierarchies are immutable, the codes
+    must not be modified afterwards.
+
     Attributes:
         id: The identifier for the hierarchy (e.g. AREA).
         name: The hierarchy name (e.g. "Country groups and their composition").
@@ -270,53 +371,42 @@ class Hierarchy(
 
     def __len__(self) -> int:
         """Return the number of codes in the hierarchy."""
-        return self.__get_count(self.codes)
+        return self.__index.size
 
     def __getitem__(self, id_: str) -> Optional[HierarchicalCode]:
         """Return the code identified by the supplied ID."""
-        return self.__extract_code(self.codes, id_)
+        return self.__index.codes.get(id_)
 
     def __contains__(self, id_: str) -> bool:
         """Whether a code with the supplied ID is present in the hierarchy."""
         return bool(self.__getitem__(id_))
 
-    def __get_count(self, codes: Sequence[HierarchicalCode]) -> int:
-        """Return the number of codes at all levels."""
-        count = len(codes)
-        for code in codes:
-            if code.codes:
-                count += self.__get_count(code.codes)
-        return count
-
-    def __extract_code(
-        self, codes: Sequence[HierarchicalCode], id_: str
-    ) -> Optional[HierarchicalCode]:
-        if "." in id_:
-            ids = id_.split(".")
-            out = list(filter(lambda c: c.id == ids[0], codes))
-            if out:
-                pkey = ".".join(ids[1:])
-                return self.__extract_code(out[0].codes, pkey)
-        else:
-            out = list(filter(lambda c: c.id == id_, codes))
-            if out:
-                return out[0]
-        return None
+    @property
+    def __index(self) -> _HierarchyIndex:
+        index = self.__dict__.get("_index")
+        if index is None:
+            index = _HierarchyIndex(self.codes)
+            self.__dict__["_index"] = index
+        return index
 
-    def __by_id(
-        self,
-        id: str,
-        codes: Sequence[HierarchicalCode],
-        out: Optional[Sequence[HierarchicalCode]] = None,
-    ) -> Sequence[HierarchicalCode]:
-        if out is None:
-            out = []
-        for i in codes:
-            if i.id == id and i not in out:
-                out.append(i)  # type: ignore[attr-defined]
-            if i.codes:
-                self.__by_id(id, i.codes, out)
-        return out
+    def _cached(self, key: str, factory: Callable[[], T]) -> T:
+        """Get a value derived from the codes, computing it only once.
+
+        As hierarchies are immutable, values derived from the codes
+        (e.g. a table mapping the codes to their ancestors) can be kept
+        for the lifetime of the hierarchy.
+
+        Args:
+            key: The key identifying the value.
+            factory: The function computing the value.
+
+        Returns:
+            The value, computed the first time it is requested.
+        """
+        cache = self.__dict__.setdefault("_derived", {})
+        if key not in cache:
+            cache[key] = factory()
+        return cast(T, cache[key])
 
     def by_id(self, id: str) -> Sequence[HierarchicalCode]:
         """Get a code without knowing its parent IDs.
@@ -339,17 +429,7 @@ class Hierarchy(
             we could have different codes with the same ID in the
             returned set.
         """
-        return self.__by_id(id, self.codes)
-
-    def __get_codes(
-        self, codes: Sequence[HierarchicalCode]
-    ) -> Sequence[HierarchicalCode]:
-        out = []
-        for code in codes:
-            out.append(code)
-            if code.codes:
-                out.extend(self.__get_codes(code.codes))
-        return out
+        return list(self.__index.by_id.get(id, ()))
 
     def all_codes(self) -> Sequence[HierarchicalCode]:
         """Get all the codes in the hierarchy as a flat list.
@@ -361,14 +441,128 @@ class Hierarchy(
         Returns:
             A flat list of the codes present in the hierarchy.
         """
+        return list(self.__index.distinct)
+
+    def paths(self, id: str) -> Sequence[str]:
+        """Get the full IDs of the nodes of a code.
+
+        Args:
+            id: The ID of the code (e.g. 111).
+
+        Returns:
+            The full IDs (e.g. 1.11.111) of the nodes where the code is
+            attached, in the order of the hierarchy. If there is no
+            matching code, the list will be empty.
+        """
+        return list(self.__index.paths.get(id, ()))
+
+    def parent(self, id_: str) -> Optional[str]:
+        """Get the full ID of the parent of a code.
+
+        Args:
+            id_: The full ID of the code (e.g. 1.11.111).
+
+        Returns:
+            The full ID of the parent (e.g. 1.11), or None if the code
+            is at the top of the hierarchy or is not in the hierarchy.
+        """
+        return self.__index.parents.get(id_)
+
+    def ancestors(self, id_: str) -> Sequence[str]:
+        """Get the full IDs of the ancestors of a code.
+
+        Args:
+            id_: The full ID of the code (e.g. 1.11.111).
+
+        Returns:
+            The full IDs of the ancestors, starting with the parent
+            (e.g. [1.11, 1]). The list will be empty if the code is at
+            the top of the hierarchy or is not in the hierarchy.
+        """
+        parents = self.__index.parents
         out = []
-        # We need to do this below because a hierarchical code is not
-        # (yet?) hashable.
-        for c in self.__get_codes(self.codes):
-            if c not in out:
-                out.append(c)
+        parent = parents.get(id_)
+        while parent is not None:
+            out.append(parent)
+            parent = parents[parent]
         return out
 
+    def descendants(self, id_: str) -> Sequence[str]:
+        """Get the full IDs of the descendants of a code.
+
+        Args:
+            id_: The full ID of the code (e.g. 1.11).
+
+        Returns:
+            The full IDs of the descendants, at all levels, in the order
+            of the hierarchy (e.g. [1.11.111, 1.11.112]). The list will
+            be empty if the code has no children or is not in the
+            hierarchy.
+        """
+        index = self.__index
+        if id_ not in index.pre:
+            return []
+        return index.order[index.pre[id_] + 1 : index.ends[id_]]
+
+    def is_ancestor(self, ancestor: str, id_: str) -> bool:
+        """Whether a code is an ancestor of another code.
+
+        The check does not walk the hierarchy, and can therefore be
+        used for many pairs of codes (e.g. for roll-up membership).
+
+        Args:
+            ancestor: The full ID of the expected ancestor (e.g. 1).
+            id_: The full ID of the code (e.g. 1.11.111).
+
+        Returns:
+            True if the first code is an ancestor (at any level) of
+            the second code, False otherwise, including when one of
+            the codes is not in the hierarchy.
+        """
+        index = self.__index
+        if ancestor not in index.pre or id_ not in index.pre:
+            return False
+        return (
+            index.pre[ancestor] < index.pre[id_]
+            and index.post[id_] < index.post[ancestor]
+        )
+
+    def search(
+        self,
+        query: str,
+        use_regex: bool = False,
+        fields: Literal["name", "description", "all"] = "all",
+        prefix: bool = False,
+    ) -> Sequence[HierarchicalCode]:
+        """Search for codes matching the query, at any level.
+
+        The search works as for item schemes (see ``ItemScheme.search``),
+        with the distinct codes of the hierarchy. The index used for
+        searching is built the first time it is needed.
+
+        Args:
+            query: The substring or regex pattern to search for.
+            use_regex: Whether to treat the query as a regex (default: False).
+            fields: The fields to search in (default: all textual fields).
+            prefix: Whether the query must match the start of a word
+                (default: False). This is ignored for regular expressions.
+
+        Returns:
+           Codes that match the query, best matches first.
+
+        Raises:
+            Invalid: If the query is empty.
+        """
+        if not query:
+            raise Invalid(
+                "Invalid search", "The query string cannot be empty."
+            )
+        index = self.__dict__.get("_search")
+        if index is None:
+            index = _SearchIndex(self.__index.distinct)
+            self.__dict__["_search"] = index
+        return index.search(query, use_regex, prefix, _search_fields(fields))
+
 
 class HierarchyAssociation(
     MaintainableArtefact, frozen=True, omit_defaults=True
@@ -130,9 +130,15 @@ class Header(Struct, repr_omit_defaults=True, kw_only=True):
         return f"{', '.join(processed_output)}"
 
 
-class StructureMessage(Struct, repr_omit_defaults=True, frozen=True):
+class StructureMessage(
+    Struct, repr_omit_defaults=True, frozen=True, dict=True
+):
     """Message class holds the content of an SDMX Structure Message.
 
+    Artefacts are retrieved using indexes (by short URN and by type),
+    built the first time they are needed. As messages are immutable,
+    the sequence of structures must not be modified afterwards.
+
     Attributes:
         header: The header of the SDMX message.
         structures: Sequence of MaintainableArtefact objects.
@@ -200,8 +206,12 @@ class StructureMessage(Struct, repr_omit_defaults=True, frozen=True):
             raise NotFound(
                 f"No {type_.__name__} found in message.",
             )
-        structures = [e for e in self.structures if isinstance(e, type_)]
-        return structures
+        by_type = self.__dict__.setdefault("_by_type", {})
+        if type_ not in by_type:
+            by_type[type_] = [
+                e for e in self.structures if isinstance(e, type_)
+            ]
+        return list(by_type[type_])
 
     # Returns Codelist or ValueList only, but mypy complains.
     # As it is an internal method, it's acceptable.
@@ -226,9 +236,14 @@ class StructureMessage(Struct, repr_omit_defaults=True, frozen=True):
                 f"No {type_.__name__} found in message.",
                 "Could not find any Structures in this message.",
             )
-        for structure in self.structures:
-            if structure.short_urn == short_urn:
-                return structure
+        by_urn = self.__dict__.get("_by_urn")
+        if by_urn is None:
+            by_urn = {}
+            for structure in self.structures:
+                by_urn.setdefault(structure.short_urn, structure)
+            self.__dict__["_by_urn"] = by_urn
+        if short_urn in by_urn:
+            return by_urn[short_urn]
 
         raise NotFound(
             f"No {type_.__name__} with Short URN {short_urn} found in message",
@@ -6,10 +6,19 @@ import pandas as pd
 import pyarrow as pa
 
 from pysdmx.model import Component, DataType
+from pysdmx.toolkit.pd._aggregation import aggregate, check_aggregates
 from pysdmx.toolkit.pd._data_utils import drop_labels
+from pysdmx.toolkit.pd._filter_utils import compile_filter, filter_data
+from pysdmx.toolkit.pd._metadata import frame_to_reports, reports_to_frame
 
 __all__ = [
+    "aggregate",
+    "check_aggregates",
+    "compile_filter",
     "drop_labels",
+    "filter_data",
+    "frame_to_reports",
+    "reports_to_frame",
     "to_pandas_schema",
     "to_pandas_type",
     "to_pyarrow_schema",
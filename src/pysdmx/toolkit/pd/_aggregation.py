@@ -0,0 +1,224 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pysdmx.errors import Invalid
+from pysdmx.model import Hierarchy, Schema
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pysdmx.io.pd import PandasDataset
+
+_CHILD = "child"
+_PARENT = "parent"
+_EXPECTED = "EXPECTED"
+_DIFFERENCE = "DIFFERENCE"
+
+
+def aggregate(
+    dataset: "PandasDataset",
+    dimension: str,
+    hierarchy: Optional[Hierarchy] = None,
+    measure: Optional[str] = None,
+) -> pd.DataFrame:
+    """Compute the totals of the parent codes of a hierarchy.
+
+    The totals are computed out of the values reported for the codes at
+    the bottom of the hierarchy (i.e. the codes without children), for
+    each combination of the values of the other dimensions. A code
+    attached to several parents contributes to the totals of each of
+    them. Values reported for the parent codes are not used, and values
+    for codes outside of the hierarchy are ignored.
+
+    The computation is done with a single merge and group by, using a
+    table mapping the codes at the bottom of the hierarchy to their
+    ancestors, which is built once per hierarchy.
+
+    Args:
+        dataset: The dataset, with a Schema as structure.
+        dimension: The ID of the dimension the hierarchy applies to.
+        hierarchy: The hierarchy of codes. If not provided, the hierarchy
+            associated to the dimension in the Schema is used.
+        measure: The ID of the measure to aggregate. If not provided,
+            the first measure of the Schema is used.
+
+    Returns:
+        A data frame with the dimensions of the dataset and the measure,
+        with one row per parent code and combination of the values of
+        the other dimensions. Totals without any reported value are
+        missing.
+
+    Raises:
+        Invalid: If the dataset has no Schema, if the dimension, the
+            measure or the hierarchy cannot be found, or if the measure
+            has non-numeric values.
+    """
+    keys, measure, hierarchy = __check_args(
+        dataset, dimension, hierarchy, measure
+    )
+    mapping = __rollup(hierarchy)
+    data = dataset.data
+    codes = pd.Series(data[dimension].to_numpy(dtype=object), data.index)
+    leaves = codes.isin(mapping[_CHILD])
+    values = pd.DataFrame(
+        {
+            **{k: data.loc[leaves, k] for k in keys if k != dimension},
+            _CHILD: codes[leaves],
+            measure: __to_numeric(data.loc[leaves, measure], measure),
+        }
+    )
+    merged = values.merge(mapping, on=_CHILD).rename(
+        columns={_PARENT: dimension}
+    )
+    totals = merged.groupby(keys, sort=False, dropna=False, observed=True)[
+        measure
+    ].sum(min_count=1)
+    return totals.reset_index()
+
+
+def check_aggregates(
+    dataset: "PandasDataset",
+    dimension: str,
+    hierarchy: Optional[Hierarchy] = None,
+    measure: Optional[str] = None,
+    rel_tol: float = 1e-09,
+    abs_tol: float = 0.0,
+) -> pd.DataFrame:
+    """Check the values reported for the parent codes of a hierarchy.
+
+    The reported values are compared to the totals computed by
+    ``aggregate``, with the same semantics as ``math.isclose``, i.e. a
+    value is valid if the difference with the total is at most the
+    largest of ``rel_tol`` times the largest absolute value of the two,
+    and ``abs_tol``. Parent codes not reported in the dataset, and
+    reported parent codes without any reported child, are not checked.
+
+    Args:
+        dataset: The dataset, with a Schema as structure.
+        dimension: The ID of the dimension the hierarchy applies to.
+        hierarchy: The hierarchy of codes. If not provided, the hierarchy
+            associated to the dimension in the Schema is used.
+        measure: The ID of the measure to check. If not provided, the
+            first measure of the Schema is used.
+        rel_tol: The relative tolerance.
+        abs_tol: The absolute tolerance.
+
+    Returns:
+        A data frame with the invalid aggregates, i.e. the dimensions
+        of the dataset, the reported value (in the measure column), the
+        computed total (EXPECTED) and the difference between the two
+        (DIFFERENCE). The data frame is empty if all aggregates are
+        valid.
+
+    Raises:
+        Invalid: If the dataset has no Schema, if the dimension, the
+            measure or the hierarchy cannot be found, or if the measure
+            has non-numeric values.
+    """
+    keys, measure, hierarchy = __check_args(
+        dataset, dimension, hierarchy, measure
+    )
+    totals = aggregate(dataset, dimension, hierarchy, measure)
+    data = dataset.data
+    codes = pd.Series(data[dimension].to_numpy(dtype=object), data.index)
+    reported = pd.DataFrame(
+        {
+            **{k: data[k] for k in keys if k != dimension},
+            dimension: codes,
+            measure: __to_numeric(data[measure], measure),
+        }
+    )[keys + [measure]]
+    reported = reported[codes.isin(__rollup(hierarchy)[_PARENT])]
+    checked = reported.merge(
+        totals.rename(columns={measure: _EXPECTED}), on=keys
+    )
+    checked[_DIFFERENCE] = checked[measure] - checked[_EXPECTED]
+    diff = checked[_DIFFERENCE].abs().to_numpy(dtype=float, na_value=0.0)
+    largest = np.maximum(
+        checked[measure].abs().to_numpy(dtype=float, na_value=0.0),
+        checked[_EXPECTED].abs().to_numpy(dtype=float, na_value=0.0),
+    )
+    invalid = diff > np.maximum(rel_tol * largest, abs_tol)
+    return checked[invalid].reset_index(drop=True)
+
+
+def __check_args(
+    dataset: "PandasDataset",
+    dimension: str,
+    hierarchy: Optional[Hierarchy],
+    measure: Optional[str],
+) -> Tuple[List[str], str, Hierarchy]:
+    schema = dataset.structure
+    if not isinstance(schema, Schema):
+        raise Invalid(
+            "Missing Schema",
+            "A Schema is needed to aggregate the data of a dataset.",
+            {"structure": schema},
+        )
+    keys = [d.id for d in schema.components.dimensions if d.id in dataset.data]
+    if dimension not in keys:
+        raise Invalid(
+            "Unknown dimension",
+            f"{dimension} is not a dimension of the dataset.",
+            {"dimensions": keys},
+        )
+    if hierarchy is None:
+        local_codes = schema.components[dimension].local_codes
+        if not isinstance(local_codes, Hierarchy):
+            raise Invalid(
+                "Missing hierarchy",
+                f"No hierarchy is associated to {dimension}.",
+            )
+        hierarchy = local_codes
+    if measure is None:
+        measures = schema.components.measures
+        measure = measures[0].id if measures else None
+    if measure is None or measure not in dataset.data:
+        raise Invalid(
+            "Unknown measure",
+            f"{measure} is not a measure of the dataset.",
+        )
+    return keys, measure, hierarchy
+
+
+def __rollup(hierarchy: Hierarchy) -> pd.DataFrame:
+    """Map the codes at the bottom of a hierarchy to their ancestors.
+
+    The table is built once per hierarchy. A code reachable from an
+    ancestor through several paths is mapped once per path. A parent
+    code attached to several nodes gets the codes below all of them,
+    the codes found at the same relative path being mapped only once.
+    """
+    return hierarchy._cached("rollup", lambda: __build_rollup(hierarchy))
+
+
+def __build_rollup(hierarchy: Hierarchy) -> pd.DataFrame:
+    codes = hierarchy.all_codes()
+    parents = dict.fromkeys(c.id for c in codes if c.codes)
+    children: List[str] = []
+    ancestors: List[str] = []
+    for parent in parents:
+        below: Dict[str, str] = {}
+        for path in hierarchy.paths(parent):
+            for descendant in hierarchy.descendants(path):
+                below.setdefault(
+                    descendant[len(path) + 1 :], descendant.rsplit(".", 1)[-1]
+                )
+        for child in below.values():
+            if child not in parents:
+                children.append(child)
+                ancestors.append(parent)
+    return pd.DataFrame({_CHILD: children, _PARENT: ancestors}, dtype=object)
+
+
+def __to_numeric(values: pd.Series, measure: str) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    try:
+        return pd.to_numeric(values.mask(values == ""))
+    except (TypeError, ValueError) as e:
+        raise Invalid(
+            "Non-numeric values",
+            f"{measure} has values that are not numbers.",
+            {"error": str(e)},
+        ) from e
@@ -0,0 +1,262 @@
+import re
+from datetime import datetime
+from functools import reduce
+from typing import Any, Callable, Optional, Union
+
+import pandas as pd
+
+from pysdmx import errors
+from pysdmx.api.dc.query import (
+    BooleanFilter,
+    DateTimeFilter,
+    Filter,
+    LogicalOperator,
+    MultiFilter,
+    NotFilter,
+    NullFilter,
+    NumberFilter,
+    Operator,
+    TextFilter,
+)
+
+Predicate = Callable[[pd.DataFrame], pd.Series]
+
+
+def compile_filter(filters: Filter, case_sensitive: bool = False) -> Predicate:
+    """Compile a data query filter into a vectorised predicate.
+
+    The returned function takes a data frame and returns a boolean
+    series, aligned with the data frame index, flagging the rows
+    matching the filter.
+
+    Comparisons follow the SQL semantics used by
+    ``pysdmx.toolkit.sqlsrv``: a comparison involving a missing value
+    is unknown, and rows for which the filter is unknown are not
+    selected, even when the comparison is negated. Empty strings are
+    considered as missing values, as in SDMX-CSV and SDMX-ML messages,
+    and a column absent from the data frame is considered as containing
+    only missing values.
+
+    Args:
+        filters: The filter to compile. This can be any of the filters
+            the `pysdmx.api.dc.query` module offers, including
+            `MultiFilter` and `NotFilter`.
+        case_sensitive: Whether LIKE and NOT LIKE patterns must match
+            the case of the values. Defaults to False, like the
+            'insensitive' case mode of ``pysdmx.toolkit.sqlsrv``.
+
+    Returns:
+        A function returning the boolean mask of the matching rows.
+
+    Raises:
+        Invalid: If an operator cannot be used with the filter type.
+    """
+    compiled = __compile(filters, case_sensitive)
+
+    def predicate(df: pd.DataFrame) -> pd.Series:
+        return compiled(df).fillna(False).astype(bool)
+
+    return predicate
+
+
+def filter_data(
+    data: pd.DataFrame,
+    filters: Optional[Filter],
+    case_sensitive: bool = False,
+) -> pd.DataFrame:
+    """Return the rows of the data frame matching the supplied filter.
+
+    Args:
+        data: The data frame to be filtered.
+        filters: The filter to apply, if any. If None, the data frame
+            is returned unchanged.
+        case_sensitive: Whether LIKE and NOT LIKE patterns must match
+            the case of the values.
+
+    Returns:
+        The rows of the data frame for which the filter holds.
+    """
+    if filters is None or data.empty:
+        return data
+    return data[compile_filter(filters, case_sensitive)(data)]
+
+
+def __compile(flt: Filter, case_sensitive: bool) -> Predicate:
+    if isinstance(flt, MultiFilter):
+        return __compile_multi_filter(flt, case_sensitive)
+    elif isinstance(flt, NotFilter):
+        inner = __compile(flt.filter, case_sensitive)
+        return lambda df: ~inner(df)
+    elif isinstance(flt, NullFilter):
+        return __compile_null_filter(flt)
+    elif isinstance(flt, BooleanFilter):
+        return __compile_boolean_filter(flt)
+    elif isinstance(flt, NumberFilter):
+        return __compile_single_filter(flt, __as_number, case_sensitive)
+    elif isinstance(flt, DateTimeFilter):
+        utc = DateTimeFilter(flt.field, flt.operator, __to_utc(flt.value))
+        return __compile_single_filter(utc, __as_datetime, case_sensitive)
+    else:
+        return __compile_single_filter(flt, __as_text, case_sensitive)
+
+
+def __compile_multi_filter(
+    flt: MultiFilter, case_sensitive: bool
+) -> Predicate:
+    parts = [__compile(f, case_sensitive) for f in flt.filters]
+    if flt.operator == LogicalOperator.OR:
+
+        def combine(a: pd.Series, b: pd.Series) -> pd.Series:
+            return a | b
+
+    else:
+
+        def combine(a: pd.Series, b: pd.Series) -> pd.Series:
+            return a & b
+
+    def predicate(df: pd.DataFrame) -> pd.Series:
+        if not parts:
+            return pd.Series(True, index=df.index, dtype="boolean")
+        return reduce(combine, (p(df) for p in parts))
+
+    return predicate
+
+
+def __compile_null_filter(flt: NullFilter) -> Predicate:
+    def predicate(df: pd.DataFrame) -> pd.Series:
+        isna = __is_missing(__get_column(df, flt.field))
+        out = isna if flt.operator == Operator.NULL else ~isna
+        return out.astype("boolean")
+
+    return predicate
+
+
+def __compile_boolean_filter(flt: BooleanFilter) -> Predicate:
+    if flt.operator not in (Operator.EQUALS, Operator.NOT_EQUALS):
+        raise errors.Invalid(
+            "Invalid operator",
+            "Only equal and not equal can be used in boolean queries.",
+            {"operator_used": flt.operator},
+        )
+
+    def predicate(df: pd.DataFrame) -> pd.Series:
+        col = __as_boolean(__get_column(df, flt.field))
+        out = col == flt.value
+        if flt.operator == Operator.NOT_EQUALS:
+            out = col != flt.value
+        return __with_nulls(out, col)
+
+    return predicate
+
+
+def __compile_single_filter(  # noqa: C901
+    flt: Union[DateTimeFilter, NumberFilter, TextFilter],
+    convert: Callable[[pd.Series], pd.Series],
+    case_sensitive: bool,
+) -> Predicate:
+    # The complexity is merely due to the number of supported operators.
+    op = flt.operator
+    value: Any = flt.value
+    test: Callable[[pd.Series], pd.Series]
+    if op == Operator.GREATER_THAN:
+        test = lambda c: c > value  # noqa: E731
+    elif op == Operator.GREATER_THAN_OR_EQUAL:
+        test = lambda c: c >= value  # noqa: E731
+    elif op == Operator.LESS_THAN:
+        test = lambda c: c < value  # noqa: E731
+    elif op == Operator.LESS_THAN_OR_EQUAL:
+        test = lambda c: c <= value  # noqa: E731
+    elif op == Operator.NOT_EQUALS:
+        test = lambda c: c != value  # noqa: E731
+    elif op in (Operator.LIKE, Operator.NOT_LIKE):
+        rgx = __like_to_regex(str(value), case_sensitive)
+        test = lambda c: c.astype(str).str.fullmatch(rgx)  # noqa: E731
+    elif op in (Operator.IN, Operator.NOT_IN):
+        values = [value] if isinstance(value, str) else list(value)
+        test = lambda c: c.isin(values)  # noqa: E731
+    elif op in (Operator.BETWEEN, Operator.NOT_BETWEEN):
+        test = lambda c: c.between(value[0], value[1])  # noqa: E731
+    elif op in (Operator.NULL, Operator.NOT_NULL):
+        return __compile_null_filter(NullFilter(flt.field, op))
+    else:
+        test = lambda c: c == value  # noqa: E731
+    negate = op in (
+        Operator.NOT_LIKE,
+        Operator.NOT_IN,
+        Operator.NOT_BETWEEN,
+    )
+
+    def predicate(df: pd.DataFrame) -> pd.Series:
+        col = convert(__get_column(df, flt.field))
+        out = test(col)
+        if negate:
+            out = ~out.astype("boolean")
+        return __with_nulls(out, col)
+
+    return predicate
+
+
+def __like_to_regex(pattern: str, case_sensitive: bool) -> re.Pattern[str]:
+    out = []
+    for char in pattern:
+        if char in ("%", "*"):
+            out.append(".*")
+        elif char == "_":
+            out.append(".")
+        else:
+            out.append(re.escape(char))
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile("".join(out), flags | re.DOTALL)
+
+
+def __get_column(df: pd.DataFrame, field: str) -> pd.Series:
+    if field in df.columns:
+        return df[field]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def __is_missing(col: pd.Series) -> pd.Series:
+    isna = col.isna()
+    if col.dtype == object or pd.api.types.is_string_dtype(col):
+        isna |= (col.astype("string") == "").fillna(False).astype(bool)
+    return isna
+
+
+def __with_nulls(out: pd.Series, col: pd.Series) -> pd.Series:
+    return out.astype("boolean").mask(__is_missing(col).to_numpy())
+
+
+def __as_text(col: pd.Series) -> pd.Series:
+    if pd.api.types.is_string_dtype(col) and not isinstance(
+        col.dtype, pd.CategoricalDtype
+    ):
+        return col
+    return col.astype("string")
+
+
+def __as_number(col: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(
+        col
+    ):
+        return col
+    return pd.to_numeric(col.replace("", None), errors="coerce")
+
+
+def __as_datetime(col: pd.Series) -> pd.Series:
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = col.replace("", None)
+    return pd.to_datetime(col, errors="coerce", utc=True)
+
+
+def __to_utc(value: Any) -> Any:
+    if isinstance(value, datetime):
+        ts = pd.Timestamp(value)
+        return ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+    return [__to_utc(v) for v in value]
+
+
+def __as_boolean(col: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(col):
+        return col
+    mapping = {"true": True, "false": False, "1": True, "0": False}
+    return col.astype("string").str.lower().map(mapping).astype("boolean")
@@ -0,0 +1,236 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import msgspec
+import pandas as pd
+import pyarrow as pa
+
+from pysdmx.errors import Invalid
+from pysdmx.model.metadata import MetadataAttribute, MetadataReport
+
+REPORT = "REPORT"
+ATTRIBUTE = "ATTRIBUTE"
+POSITION = "POSITION"
+VALUE = "VALUE"
+LANG = "LANG"
+
+_STRING = pd.ArrowDtype(pa.string())
+_INTEGER = pd.ArrowDtype(pa.int32())
+_COLUMNS = (REPORT, ATTRIBUTE, POSITION, VALUE, LANG)
+
+# An attribute being rebuilt: its path, its (value, language) pairs and
+# its children
+_Node = Tuple[str, List[Tuple[Any, Optional[str]]], List[MetadataAttribute]]
+
+
+def reports_to_frame(reports: Iterable[MetadataReport]) -> pd.DataFrame:
+    """Flatten metadata reports into a long-format data frame.
+
+    The data frame has one row per value reported for an attribute, with
+    the following columns:
+
+    - REPORT: The short URN of the report.
+    - ATTRIBUTE: The path of the attribute in the report, i.e. the IDs
+      of the attribute and of its parents, separated by dots (e.g.
+      CONTACT.EMAIL).
+    - POSITION: The position of the attribute in the report, with the
+      attributes numbered depth first. Several values of the same
+      attribute share the same position.
+    - VALUE: The value. It is missing for attributes without value,
+      such as the attributes only containing other attributes.
+    - LANG: The language of the value, for localised values (i.e.
+      values mapping languages to texts), and missing otherwise.
+
+    The frame is built in one pass over the reports, with the string
+    columns backed by PyArrow, so that it can be filtered and grouped
+    without traversing the reports again.
+
+    Args:
+        reports: The metadata reports to flatten.
+
+    Returns:
+        The long-format data frame, with the rows in the order of the
+        reports and of their attributes.
+    """
+    urns: List[str] = []
+    paths: List[str] = []
+    positions: List[int] = []
+    values: List[Any] = []
+    langs: List[Optional[str]] = []
+    for report in reports:
+        urn = report.short_urn
+        position = 0
+        stack: List[Tuple[MetadataAttribute, str]] = [
+            (a, a.id) for a in reversed(report.attributes)
+        ]
+        while stack:
+            attr, path = stack.pop()
+            if isinstance(attr.value, (dict, list, tuple)):
+                entries = __entries(attr.value)
+            else:
+                entries = [(attr.value, None)]
+            for value, lang in entries:
+                urns.append(urn)
+                paths.append(path)
+                positions.append(position)
+                values.append(value)
+                langs.append(lang)
+            position += 1
+            if attr.attributes:
+                stack.extend(
+                    (a, f"{path}.{a.id}") for a in reversed(attr.attributes)
+                )
+    return pd.DataFrame(
+        {
+            REPORT: pd.Series(urns, dtype=_STRING),
+            ATTRIBUTE: pd.Series(paths, dtype=_STRING),
+            POSITION: pd.Series(positions, dtype=_INTEGER),
+            VALUE: pd.Series(values, dtype=object),
+            LANG: pd.Series(langs, dtype=_STRING),
+        }
+    )
+
+
+def frame_to_reports(
+    frame: pd.DataFrame,
+    reports: Optional[Sequence[MetadataReport]] = None,
+) -> List[MetadataReport]:
+    """Build metadata reports out of a long-format data frame.
+
+    This is the reverse of ``reports_to_frame``, and the frame is
+    expected to have the same columns. Its rows may have been filtered
+    (e.g. to drop some attributes) or modified (e.g. to replace some
+    values), as long as the attributes of a report keep their relative
+    order and the attributes containing other attributes are kept. The
+    annotations and formats of the attributes are not kept in the
+    frame, and are therefore lost.
+
+    Several values for an attribute are combined into a list, and
+    localised values into a dictionary mapping languages to texts, as
+    done by the SDMX readers.
+
+    Args:
+        frame: The long-format data frame.
+        reports: The reports from which the frame was built, if any.
+            The other properties of the reports (e.g. their name or
+            targets) are taken from them, and only their attributes
+            are replaced. Otherwise, the reports only have their ID,
+            agency and version, as found in the REPORT column.
+
+    Returns:
+        The metadata reports, in the order of the REPORT column.
+
+    Raises:
+        Invalid: If a column is missing, or if a report is not in the
+            supplied reports.
+    """
+    missing = [c for c in _COLUMNS if c not in frame.columns]
+    if missing:
+        raise Invalid(
+            "Missing columns",
+            "The data frame is not a flattened collection of reports.",
+            {"missing": missing},
+        )
+    by_urn = {r.short_urn: r for r in reports} if reports is not None else {}
+    rows: Dict[str, List[Tuple[int, str, Any, Optional[str]]]] = {}
+    for urn, position, path, value, lang in zip(
+        frame[REPORT].to_numpy(dtype=object).tolist(),
+        frame[POSITION].to_numpy(dtype=object).tolist(),
+        frame[ATTRIBUTE].to_numpy(dtype=object).tolist(),
+        frame[VALUE].to_numpy(dtype=object).tolist(),
+        frame[LANG].to_numpy(dtype=object, na_value="").tolist(),
+    ):
+        rows.setdefault(urn, []).append((position, path, value, lang or None))
+    out = []
+    for urn, entries in rows.items():
+        attributes = __build_attributes(entries)
+        if reports is None:
+            out.append(__report(urn, attributes))
+        elif urn in by_urn:
+            out.append(
+                msgspec.structs.replace(by_urn[urn], attributes=attributes)
+            )
+        else:
+            raise Invalid(
+                "Unknown report",
+                f"{urn} is not one of the supplied reports.",
+            )
+    return out
+
+
+def __entries(value: Any) -> List[Tuple[Any, Optional[str]]]:
+    """Split a list or localised value into (value, language) pairs."""
+    if isinstance(value, dict):
+        return [(v, k) for k, v in value.items()]
+    out: List[Tuple[Any, Optional[str]]] = []
+    for v in value:
+        if isinstance(v, dict):
+            out.extend((t, k) for k, t in v.items())
+        else:
+            out.append((v, None))
+    return out or [(None, None)]
+
+
+def __value(entries: List[Tuple[Any, Optional[str]]]) -> Any:
+    """Combine (value, language) pairs into the value of an attribute."""
+    if len(entries) == 1 and entries[0][1] is None:
+        return entries[0][0]
+    items: List[Any] = []
+    texts: Optional[Dict[str, Any]] = None
+    for value, lang in entries:
+        if lang is None:
+            texts = None
+            items.append(value)
+        else:
+            if texts is None or lang in texts:
+                texts = {}
+                items.append(texts)
+            texts[lang] = value
+    return items[0] if len(items) == 1 else items
+
+
+def __build_attributes(
+    rows: List[Tuple[int, str, Any, Optional[str]]],
+) -> Tuple[MetadataAttribute, ...]:
+    """Rebuild the attributes of a report out of its rows.
+
+    The rows are in depth-first order, so that the parent of an
+    attribute is the last open attribute with the parent path. An
+    attribute is built when it is closed, i.e. once all its children
+    have been built.
+    """
+    top: List[MetadataAttribute] = []
+    nodes: List[_Node] = []
+    previous = None
+    for position, path, value, lang in rows:
+        if position == previous and path == nodes[-1][0]:
+            nodes[-1][1].append((value, lang))
+            continue
+        previous = position
+        parent = path.rpartition(".")[0]
+        while nodes and nodes[-1][0] != parent:
+            __close(nodes, top)
+        nodes.append((path, [(value, lang)], []))
+    while nodes:
+        __close(nodes, top)
+    return tuple(top)
+
+
+def __close(nodes: List[_Node], top: List[MetadataAttribute]) -> None:
+    """Build the last open attribute and add it to its parent."""
+    path, entries, children = nodes.pop()
+    attr = MetadataAttribute(
+        path.rpartition(".")[2], __value(entries), tuple(children)
+    )
+    (nodes[-1][2] if nodes else top).append(attr)
+
+
+def __report(
+    urn: str, attributes: Tuple[MetadataAttribute, ...]
+) -> MetadataReport:
+    """Create a report out of its short URN."""
+    ref = urn.split("=", 1)[-1]
+    agency, rest = ref.split(":", 1)
+    id_, version = rest.rstrip(")").split("(", 1)
+    return MetadataReport(
+        id=id_, agency=agency, version=version, attributes=attributes
+    )
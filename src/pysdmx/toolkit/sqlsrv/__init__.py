@@ -2,7 +2,17 @@
 
 import re
 from collections.abc import Collection
-from typing import Any, Callable, Literal, Optional, Union, get_args
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+    get_args,
+)
 
 import msgspec
 
@@ -10,6 +20,7 @@ from pysdmx import errors
 from pysdmx.api.dc.query import (
     BooleanFilter,
     DateTimeFilter,
+    Filter,
     MultiFilter,
     NotFilter,
     NullFilter,
@@ -29,8 +40,16 @@ from pysdmx.model import (
     Role,
     Schema,
 )
+from pysdmx.model.dataset import ActionType
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
 
 __SQL_ESC = '"'
+# SQL Server accepts at most 2,100 parameters per statement, and at
+# most 1,000 rows per table value constructor.
+MAX_PARAMETERS = 2100
+MAX_ROWS = 1000
 CaseMode = Literal["insensitive", "sensitive", "default"]
 
 
@@ -140,6 +159,135 @@ def create_table(
     return cs
 
 
+def get_insert_statements(
+    structure: Union[DataflowInfo, DataStructureDefinition, Schema],
+    data: "pd.DataFrame",
+    schema_name: str = "dbo",
+    table_name: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> Iterator[tuple[str, list[Any]]]:
+    """Return batched INSERT statements for the supplied data.
+
+    The columns are inserted in the same order as in the table created
+    by `create_table`. Components of the structure for which the data
+    frame has no column are ignored, as are columns of the data frame
+    not matching any component. Missing values and empty strings are
+    inserted as NULL.
+
+    Each statement inserts several rows at once, while respecting the
+    maximum number of parameters (2,100) and rows (1,000) SQL Server
+    accepts in a single statement.
+
+    Args:
+        structure: The structure describing the data.
+        data: The data to be inserted.
+        schema_name: The name of the schema to which the table belongs.
+        table_name: The name of the table in which data must be inserted.
+            If it is not supplied, the structure ID will be used as table
+            name.
+        batch_size: The maximum number of rows per statement. If it is
+            not supplied, or if it exceeds what SQL Server allows, the
+            largest batch size SQL Server allows will be used.
+
+    Yields:
+        Tuples containing the INSERT statement, as a prepared statement,
+        and the list of values to replace its placeholders.
+    """
+    target = __get_target_table(table_name or structure.id, schema_name)
+    cols = __get_load_columns(structure, data)
+    fields = ", ".join(__get_field(c) for c in cols)
+    # It is safe to ignore S608, as the input is sanitized.
+    stmt = f"INSERT INTO {target} ({fields}) VALUES "  # noqa: S608
+    for rows, values in __batch_rows(data, cols, batch_size):
+        yield f"{stmt}{__get_placeholders(rows, len(cols))};", values
+
+
+def get_merge_statements(
+    structure: Union[DataflowInfo, DataStructureDefinition, Schema],
+    data: "pd.DataFrame",
+    action: ActionType = ActionType.Append,
+    schema_name: str = "dbo",
+    table_name: Optional[str] = None,
+    pk_fields: Optional[Collection[str]] = None,
+    batch_size: Optional[int] = None,
+) -> Iterator[tuple[str, list[Any]]]:
+    """Return batched statements applying the data to an existing table.
+
+    The statements depend on the supplied action:
+
+    - Append: A MERGE statement inserts the new rows and updates the
+      existing ones. Missing values in the data do not overwrite the
+      values already in the table.
+    - Replace: A MERGE statement inserts the new rows and replaces the
+      existing ones. Missing values in the data are stored as NULL.
+    - Delete: A DELETE statement removes the rows matching the primary
+      key values in the data. The primary key fields absent from the
+      data frame match any value, so that, for example, whole series
+      can be deleted.
+    - Information: No statement is returned, as the data must not be
+      stored.
+
+    Rows are matched using the primary key of the table, as created by
+    `create_table`. Each statement processes several rows at once,
+    while respecting the maximum number of parameters (2,100) and rows
+    (1,000) SQL Server accepts in a single statement.
+
+    Args:
+        structure: The structure describing the data.
+        data: The data to be applied to the table.
+        action: The action to perform with the data.
+        schema_name: The name of the schema to which the table belongs.
+        table_name: The name of the table to be modified. If it is not
+            supplied, the structure ID will be used as table name.
+        pk_fields: The field(s) of the (composite) primary key. If it
+            is not supplied, the primary key is a composite key combining
+            the dimension values.
+        batch_size: The maximum number of rows per statement. If it is
+            not supplied, or if it exceeds what SQL Server allows, the
+            largest batch size SQL Server allows will be used.
+
+    Yields:
+        Tuples containing the statement, as a prepared statement, and
+        the list of values to replace its placeholders.
+
+    Raises:
+        Invalid: If the data frame does not contain the primary key
+            fields required by the action.
+    """
+    if action == ActionType.Information:
+        return
+    target = __get_target_table(table_name or structure.id, schema_name)
+    cols = __get_load_columns(structure, data)
+    pk = list(pk_fields or [c.id for c in structure.components.dimensions])
+    keys = [c for c in cols if c in pk]
+    if action == ActionType.Delete:
+        if not keys:
+            raise errors.Invalid(
+                "Missing primary key",
+                "At least one primary key field is required to delete data.",
+                {"primary_key": pk},
+            )
+        cols = keys
+    elif len(keys) != len(pk):
+        raise errors.Invalid(
+            "Missing primary key",
+            "All primary key fields are required to merge data.",
+            {"missing": [c for c in pk if c not in keys]},
+        )
+    fields = ", ".join(__get_field(c) for c in cols)
+    on = " AND ".join(
+        f"tgt.{__get_field(c)} = src.{__get_field(c)}" for c in keys
+    )
+    src = f"(VALUES {{}}) AS src ({fields}) ON {on}"
+    if action == ActionType.Delete:
+        # It is safe to ignore S608, as the input is sanitized.
+        stmt = f"DELETE tgt FROM {target} AS tgt INNER JOIN {src};"  # noqa: S608
+    else:
+        stmt = __get_merge_template(target, src, cols, keys, action)
+    for rows, values in __batch_rows(data, cols, batch_size):
+        yield stmt.format(__get_placeholders(rows, len(cols))), values
+
+
 def get_select_statement(
     table_name: str,
     schema_name: str = "dbo",
@@ -180,12 +328,7 @@ def get_select_statement(
         - A list of values to replace the placeholders in the prepared
             statement.
     """
-    if not __valid_identifier(schema_name) or not __valid_identifier(
-        table_name
-    ):
-        raise errors.Invalid("Invalid table or schema name")
-
-    target = f"{schema_name}.{table_name}"
+    target = __get_target_table(table_name, schema_name)
     where, values = get_where_clause(filters, case_mode)
     cols = get_select_columns(columns)
     sc = get_sort_clause(sort)
@@ -195,6 +338,219 @@ def get_select_statement(
     return f"SELECT {cols} FROM {target}{where}{sc}{pag}", values  # noqa: S608
 
 
+def get_keyset_statement(
+    table_name: str,
+    keys: Sequence[str],
+    schema_name: str = "dbo",
+    filters: Optional[Filter] = None,
+    columns: Optional[Collection[str]] = None,
+    last_key: Optional[Sequence[Any]] = None,
+    limit: int = 10_000,
+    case_mode: CaseMode = "insensitive",
+) -> tuple[str, list[Any]]:
+    """Return a SQL SELECT statement fetching the next page of rows.
+
+    Unlike OFFSET-based pagination, which must skip all the rows before
+    the requested page, keyset (or seek) pagination uses the index on
+    the key columns to start directly after the last row already read.
+    Reading a table page by page therefore takes linear, rather than
+    quadratic, time.
+
+    The rows are sorted by key. To read a table, call this function
+    without `last_key` to get the first page, and then with the key
+    values of the last row of the previous page, until a page contains
+    fewer rows than the limit.
+
+    Args:
+        table_name: The name of the table from which to fetch data.
+        keys: The columns uniquely identifying a row, typically the
+            dimensions of the structure, i.e. the default primary key
+            of the tables created by `create_table`.
+        schema_name: The name of the schema to which the table belongs.
+        filters: The filters to be considered in the SQL WHERE clause.
+        columns: The columns from which to fetch data. The key columns
+            are added, if they are missing.
+        last_key: The values of the key columns for the last row
+            already read, if any.
+        limit: The maximum number of rows to return.
+        case_mode: Controls string matching case sensitivity in WHERE
+            clauses. The allowed values are 'insensitive', 'sensitive',
+            or 'default' (use database/column collation). Defaults to
+            'insensitive'.
+
+    Returns: A tuple containing:
+        - A string representing the SELECT statement corresponding to the
+            supplied input, as a prepared statement.
+        - A list of values to replace the placeholders in the prepared
+            statement.
+    """
+    target = __get_target_table(table_name, schema_name)
+    keyset = get_keyset_clause(keys, last_key) if last_key else ("", [])
+    where, values = __and_where(filters, case_mode, keyset)
+    cols = __with_keys(columns, keys)
+    sc = f" ORDER BY {__get_key_fields(keys)}"
+    pag = get_pagination_clause(0, limit)
+    # It is safe to ignore S608, as the input is sanitized.
+    return f"SELECT {cols} FROM {target}{where}{sc}{pag}", values  # noqa: S608
+
+
+def get_keyset_clause(
+    keys: Sequence[str], last_key: Sequence[Any]
+) -> tuple[str, list[Any]]:
+    """Return a condition selecting the rows after the supplied key.
+
+    SQL Server does not support row value comparisons, so the
+    comparison is expanded. For example, for keys A and B, the
+    condition is: A > ? OR (A = ? AND B > ?).
+
+    Args:
+        keys: The key columns, in sort order.
+        last_key: The values of the key columns for the last row
+            already read.
+
+    Returns:
+        A tuple containing:
+        - A string representing the condition, with placeholders for
+            the key values, to be used in a SQL WHERE clause.
+        - A list of values to replace the placeholders in the condition.
+
+    Raises:
+        Invalid: If the number of key values does not match the number
+            of key columns.
+    """
+    if not keys or len(keys) != len(last_key):
+        raise errors.Invalid(
+            "Invalid key",
+            "There must be one value for each key column.",
+            {"keys": list(keys), "values": list(last_key)},
+        )
+    terms = []
+    values: list[Any] = []
+    for i in range(len(keys)):
+        eqs = [f"{__get_field(k)} = ?" for k in keys[:i]]
+        eqs.append(f"{__get_field(keys[i])} > ?")
+        terms.append(" AND ".join(eqs))
+        values.extend(last_key[: i + 1])
+    if len(terms) == 1:
+        return terms[0], values
+    return " OR ".join(f"({t})" for t in terms), values
+
+
+def get_partition_bounds_statement(
+    table_name: str,
+    keys: Sequence[str],
+    partitions: int,
+    schema_name: str = "dbo",
+    filters: Optional[Filter] = None,
+    case_mode: CaseMode = "insensitive",
+) -> tuple[str, list[Any]]:
+    """Return a SQL SELECT statement computing partition boundaries.
+
+    The statement returns (at most) `partitions - 1` rows, with the key
+    values of the last row of each partition but the last one, so that
+    partitions contain roughly the same number of rows. The result can
+    be passed as `bounds` to `get_partition_statements`.
+
+    Args:
+        table_name: The name of the table from which to fetch data.
+        keys: The columns uniquely identifying a row, in sort order.
+        partitions: The number of partitions.
+        schema_name: The name of the schema to which the table belongs.
+        filters: The filters to be considered in the SQL WHERE clause.
+        case_mode: Controls string matching case sensitivity in WHERE
+            clauses.
+
+    Returns: A tuple containing:
+        - A string representing the SELECT statement, as a prepared
+            statement.
+        - A list of values to replace the placeholders in the prepared
+            statement.
+    """
+    __validate_partitions(partitions)
+    target = __get_target_table(table_name, schema_name)
+    where, values = __and_where(filters, case_mode)
+    kf = __get_key_fields(keys)
+    rn = f"ROW_NUMBER() OVER (ORDER BY {kf}) AS rn"
+    # It is safe to ignore S608, as the input is sanitized.
+    inner = f"SELECT {kf}, {rn}, COUNT(*) OVER () AS cnt FROM {target}{where}"  # noqa: S608
+    # A row closes a partition when rn * partitions / cnt reaches the
+    # next integer (integer division).
+    cond = "k.rn < k.cnt AND k.rn * ? / k.cnt > (k.rn - 1) * ? / k.cnt"
+    return (
+        f"SELECT {kf} FROM ({inner}) AS k WHERE {cond} ORDER BY {kf}",  # noqa: S608
+        values + [partitions, partitions],
+    )
+
+
+def get_partition_statements(
+    table_name: str,
+    keys: Sequence[str],
+    partitions: int,
+    schema_name: str = "dbo",
+    filters: Optional[Filter] = None,
+    columns: Optional[Collection[str]] = None,
+    bounds: Optional[Sequence[Sequence[Any]]] = None,
+    case_mode: CaseMode = "insensitive",
+) -> list[tuple[str, list[Any]]]:
+    """Return SQL SELECT statements reading disjoint partitions of a table.
+
+    Together, the statements return the rows matching the filters, and
+    each row is returned by exactly one statement, so that the
+    statements can be executed in parallel.
+
+    If `bounds` are supplied (for example, as returned by executing the
+    statement created by `get_partition_bounds_statement`), partitions
+    are ranges of keys, which can be read efficiently using the index on
+    the key columns: partition i contains the keys greater than
+    bounds[i - 1] and lower than or equal to bounds[i]. Else, rows are
+    assigned to partitions using a checksum of their key values, which
+    requires reading the whole table (or index) for each partition.
+
+    Args:
+        table_name: The name of the table from which to fetch data.
+        keys: The columns uniquely identifying a row, in sort order.
+        partitions: The number of partitions. If bounds are supplied,
+            there are as many partitions as bounds, plus one.
+        schema_name: The name of the schema to which the table belongs.
+        filters: The filters to be considered in the SQL WHERE clause.
+        columns: The columns from which to fetch data.
+        bounds: The key values of the last row of each partition but the
+            last one, in ascending order.
+        case_mode: Controls string matching case sensitivity in WHERE
+            clauses.
+
+    Returns:
+        A list of tuples, one per partition, containing the SELECT
+        statement, as a prepared statement, and the list of values to
+        replace its placeholders.
+    """
+    __validate_partitions(partitions)
+    target = __get_target_table(table_name, schema_name)
+    cols = get_select_columns(columns)
+    conds: list[tuple[str, list[Any]]] = []
+    if bounds is not None:
+        for i in range(len(bounds) + 1):
+            lower = get_keyset_clause(keys, bounds[i - 1]) if i else ("", [])
+            upper = (
+                get_keyset_clause(keys, bounds[i])
+                if i < len(bounds)
+                else ("", [])
+            )
+            parts = [f"({lower[0]})"] if lower[0] else []
+            if upper[0]:
+                parts.append(f"NOT ({upper[0]})")
+            conds.append((" AND ".join(parts), lower[1] + upper[1]))
+    else:
+        cs = f"ABS(CAST(CHECKSUM({__get_key_fields(keys)}) AS BIGINT)) % ?"
+        conds = [(f"{cs} = ?", [partitions, i]) for i in range(partitions)]
+    out = []
+    for cond in conds:
+        where, values = __and_where(filters, case_mode, cond)
+        # It is safe to ignore S608, as the input is sanitized.
+        out.append((f"SELECT {cols} FROM {target}{where}", values))  # noqa: S608
+    return out
+
+
 def get_select_columns(columns: Optional[Collection[str]]) -> str:
     """Return the columns to be selected from a table.
 
@@ -622,6 +978,127 @@ def __map_col_to_comp(col: Column) -> Component:
     )
 
 
+def __get_load_columns(
+    structure: Union[DataflowInfo, DataStructureDefinition, Schema],
+    data: "pd.DataFrame",
+) -> list[str]:
+    comps = __order_components(structure.components)
+    # With two dimensions, observation-level attributes are also seen as
+    # series-level ones, hence the deduplication.
+    cols = list(dict.fromkeys(c.id for c in comps if c.id in data.columns))
+    if not cols:
+        raise errors.Invalid(
+            "No data to load",
+            "None of the data frame columns matches the structure.",
+            {"structure": structure.id},
+        )
+    return cols
+
+
+def __get_merge_template(
+    target: str,
+    src: str,
+    cols: Sequence[str],
+    keys: Sequence[str],
+    action: ActionType,
+) -> str:
+    updates = []
+    for c in cols:
+        if c not in keys:
+            f = __get_field(c)
+            if action == ActionType.Replace:
+                updates.append(f"{f} = src.{f}")
+            else:
+                updates.append(f"{f} = COALESCE(src.{f}, tgt.{f})")
+    fields = ", ".join(__get_field(c) for c in cols)
+    values = ", ".join(f"src.{__get_field(c)}" for c in cols)
+    stmt = f"MERGE INTO {target} WITH (HOLDLOCK) AS tgt USING {src}"
+    if updates:
+        stmt += f" WHEN MATCHED THEN UPDATE SET {', '.join(updates)}"
+    # It is safe to ignore S608, as the input is sanitized.
+    ins = f"INSERT ({fields}) VALUES ({values})"  # noqa: S608
+    return f"{stmt} WHEN NOT MATCHED THEN {ins};"
+
+
+def __get_batch_size(columns: int, batch_size: Optional[int]) -> int:
+    if columns > MAX_PARAMETERS:
+        raise errors.Invalid(
+            "Too many columns",
+            f"SQL Server accepts at most {MAX_PARAMETERS} parameters.",
+            {"columns": columns},
+        )
+    size = min(MAX_ROWS, MAX_PARAMETERS // columns)
+    return min(batch_size, size) if batch_size and batch_size > 0 else size
+
+
+def __batch_rows(
+    data: "pd.DataFrame", cols: Sequence[str], batch_size: Optional[int]
+) -> Iterator[tuple[int, list[Any]]]:
+    size = __get_batch_size(len(cols), batch_size)
+    frame = data[list(cols)].astype(object)
+    cells = frame.to_numpy()
+    cells[(frame.isna() | (frame == "")).to_numpy()] = None
+    for start in range(0, len(cells), size):
+        chunk = cells[start : start + size]
+        values = []
+        for row in chunk.tolist():
+            values.extend(row)
+        yield len(chunk), values
+
+
+def __get_placeholders(rows: int, columns: int) -> str:
+    row = f"({', '.join('?' * columns)})"
+    return ", ".join([row] * rows)
+
+
+def __get_target_table(table_name: str, schema_name: str) -> str:
+    if not __valid_identifier(schema_name) or not __valid_identifier(
+        table_name
+    ):
+        raise errors.Invalid("Invalid table or schema name")
+    return f"{schema_name}.{table_name}"
+
+
+def __get_key_fields(keys: Sequence[str]) -> str:
+    return ", ".join(__get_field(k) for k in keys)
+
+
+def __with_keys(
+    columns: Optional[Collection[str]], keys: Sequence[str]
+) -> str:
+    if columns:
+        columns = list(columns)
+        columns.extend(k for k in keys if k not in columns)
+    return get_select_columns(columns)
+
+
+def __and_where(
+    filters: Optional[Filter],
+    case_mode: CaseMode,
+    *conditions: tuple[str, list[Any]],
+) -> tuple[str, list[Any]]:
+    __validate_case_mode(case_mode)
+    parts = [__get_filter(filters, case_mode)] if filters else []
+    parts.extend(c for c in conditions if c[0])
+    if not parts:
+        return "", []
+    values = []
+    for _, v in parts:
+        values.extend(v)
+    if len(parts) == 1:
+        return f" WHERE {parts[0][0]}", values
+    return f" WHERE {' AND '.join(f'({c})' for c, _ in parts)}", values
+
+
+def __validate_partitions(partitions: int) -> None:
+    if partitions < 1:
+        raise errors.Invalid(
+            "Invalid number of partitions",
+            "There must be at least one partition.",
+            {"partitions": partitions},
+        )
+
+
 def __valid_identifier(name: str) -> bool:
     """Validate that a string is a valid SQL identifier."""
     return bool(re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", name))
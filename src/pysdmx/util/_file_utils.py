@@ -0,0 +1,35 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+from uuid import uuid4
+
+
+@contextmanager
+def open_replacing(
+    path: Union[str, Path], binary: bool = False, **kwargs: Any
+) -> Iterator[IO[Any]]:
+    """Open a new file that replaces the supplied path once written.
+
+    The content is written to a temporary file in the same directory,
+    which replaces the file at ``path`` only if the block completes.
+    Otherwise, the temporary file is removed and any existing file at
+    ``path`` is left untouched.
+
+    Args:
+        path: The path of the file to be written.
+        binary: Whether to open the file in binary mode.
+        **kwargs: Extra arguments for ``open`` (e.g. the encoding).
+
+    Yields:
+        The temporary file, open for writing.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with open(tmp, "xb" if binary else "x", **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -5,13 +5,13 @@ from pysdmx.model.dataflow import (
     DataStructureDefinition,
     Schema,
 )
-from pysdmx.model.message import Message
+from pysdmx.model.message import StructureMessage
 from pysdmx.util import parse_urn
 
 
 def _resolve_dsd(
     dataflow: Dataflow,
-    message: Message,
+    message: StructureMessage,
     dataset_ref: Reference,
     source: str,
 ) -> DataStructureDefinition:
@@ -57,7 +57,7 @@ def _build_schema(
 
 
 def schema_generator(
-    message: Message,
+    message: StructureMessage,
     dataset_ref: Reference,
 ) -> Schema:
     """Generates a Schema by resolving the short_urn in the message."""
@@ -0,0 +1,97 @@
+import pytest
+from parsy import ParseError  # type: ignore[import-untyped]
+
+from pysdmx.api.dc.query._fast_parser import fast_parse
+from pysdmx.api.dc.query._py_parser import py_parser
+from pysdmx.api.dc.query._sql_parser import sql_parser
+from pysdmx.api.dc.query.util import parse_query
+from pysdmx.errors import Invalid
+
+QUERIES = [
+    "REF_AREA='UY'",
+    "  REF_AREA = 'UY'  ",
+    "REF_AREA='UY' AND FREQ <> 'A' AND OBS_VALUE >= 42",
+    "REF_AREA='UY' and FREQ <> 'A' aNd OBS_VALUE < 4.2",
+    "OBS_VALUE <= .5 AND OBS_VALUE > 1.",
+    "TITLE LIKE '%GDP%' AND TITLE not like 'A_'",
+    "OBS_STATUS IN ('A', 'F','E') AND CONF not in (1,2 , 3)",
+    "OBS_VALUE BETWEEN 1 AND 3 AND YEAR NOT BETWEEN 2000 and 2010",
+    "UPDATED > '2024-01-15T10:42:21+01:00' AND DT = '2024-01-15t10:42'",
+    "UPDATED BETWEEN '2024-01-01T00:00Z' AND '2024-02-01T00:00:00.5Z'",
+    "UPDATED IN ('2024-01-01T00:00', '2024-01-02T00:00')",
+    "REF_AREA == 'UY'",
+    "REF_AREA == 'UY' and FREQ != 'A' and OBS_VALUE <= 42",
+    "OBS_STATUS in ['A', 'F'] and CONF not in (1, 2)",
+    "OBS_STATUS in ('A', 'F'] and X-Y_$@ > 1",
+    "TIME_PERIOD >= '2024-01'",
+    "REF_AREA = ''",
+]
+
+INVALID = [
+    "",
+    "   ",
+    "REF_AREA",
+    "REF_AREA =",
+    "REF_AREA = 'UY' AND",
+    "REF_AREA = 'UY' OR FREQ = 'A'",
+    "REF_AREA == 'UY' AND FREQ == 'A'",
+    "REF_AREA = 'UY' and FREQ == 'A'",
+    "OBS_VALUE BETWEEN 1",
+    "OBS_VALUE BETWEEN 1 AND",
+    "OBS_STATUS IN ()",
+    "OBS_STATUS IN ('A',)",
+    "OBS_STATUS IN ['A']",
+    "OBS_VALUE IS NULL",
+    'REF_AREA = "UY"',
+]
+
+
+def __reference(query: str):  # type: ignore[no-untyped-def]
+    try:
+        return py_parser.parse(query)
+    except ParseError:
+        return sql_parser.parse(query)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_same_output_as_parsers(query):
+    assert fast_parse(query.strip()) == __reference(query.strip())
+
+
+@pytest.mark.parametrize("query", INVALID)
+def test_invalid_queries_not_parsed(query):
+    assert fast_parse(query.strip()) is None
+    with pytest.raises(ParseError):
+        __reference(query.strip())
+
+
+@pytest.mark.parametrize("query", INVALID)
+def test_invalid_queries_reported(query):
+    with pytest.raises(Invalid, match="Unparseable query") as ex:
+        parse_query(query)
+    assert query in ex.value.description
+
+
+def test_invalid_datetime_reported():
+    query = "UPDATED > '2024-13-45T10:42'"
+
+    with pytest.raises(Invalid, match="Invalid input"):
+        fast_parse(query)
+    with pytest.raises(Invalid, match="Invalid input"):
+        parse_query(query)
+
+
+def test_unusual_operator_spacing_handled_by_parsers():
+    query = "OBS_STATUS NOT  IN ('A')"
+
+    with pytest.raises(KeyError):
+        fast_parse(query)
+    with pytest.raises(ValueError, match="not a valid _InOperator"):
+        parse_query(query)
+
+
+def test_parsed_queries_cached():
+    first = parse_query("REF_AREA = 'UY' AND OBS_VALUE > 42")
+    second = parse_query("  REF_AREA = 'UY' AND OBS_VALUE > 42 ")
+
+    assert first is second
@@ -1,5 +1,5 @@
-import pathlib
 import tempfile
+import threading
 
 import httpx
 import pandas as pd
@@ -8,7 +8,16 @@ import pytest
 from pysdmx.api.dc.pd import PandasConnector
 from pysdmx.api.dc.query import Operator, TextFilter
 from pysdmx.errors import InternalError, NotFound
-from pysdmx.model import Dataflow, Reference
+from pysdmx.model import (
+    Agency,
+    Component,
+    Components,
+    Concept,
+    Dataflow,
+    DataflowInfo,
+    Reference,
+    Role,
+)
 
 
 @pytest.fixture
@@ -500,10 +509,10 @@ def test_data_query_no_schema_query(respx_mock, client, query_data, csv_data):
     assert len(data) == 20  # 20 observations
 
 
-def test_data_query_tempfile_creation_error(client, mocker):
+def test_data_query_buffer_creation_error(client, mocker):
     mocker.patch(
-        "tempfile.NamedTemporaryFile",
-        side_effect=OSError("cannot create temporary file"),
+        "tempfile.SpooledTemporaryFile",
+        side_effect=OSError("cannot create buffer"),
     )
     dfref = Reference("Dataflow", "BIS", "BIS_DER", "1.0")
 
@@ -517,16 +526,16 @@ def test_data_query_tempfile_creation_error(client, mocker):
 
 
 @pytest.fixture
-def temp_file_creator(tmp_path):
-    created_paths = []
-    named_temp_file = tempfile.NamedTemporaryFile
+def buffer_creator():
+    created_buffers = []
+    spooled_temp_file = tempfile.SpooledTemporaryFile
 
-    def create_temp_file(*args, **kwargs):
-        handle = named_temp_file(*args, dir=tmp_path, **kwargs)
-        created_paths.append(pathlib.Path(handle.name))
+    def create_buffer(*args, **kwargs):
+        handle = spooled_temp_file(*args, **kwargs)
+        created_buffers.append(handle)
         return handle
 
-    return create_temp_file, created_paths
+    return create_buffer, created_buffers
 
 
 @pytest.mark.parametrize(
@@ -537,7 +546,7 @@ def temp_file_creator(tmp_path):
     ),
     [
         (
-            OSError("cannot write temporary file"),
+            OSError("cannot write buffer"),
             InternalError,
             "Unexpected I/O issue",
         ),
@@ -554,20 +563,20 @@ def temp_file_creator(tmp_path):
         "reraises-keyboard-interrupt",
     ],
 )
-def test_write_temp_csv_error_handling_and_cleanup(
+def test_download_csv_error_handling_and_cleanup(
     client,
     mocker,
-    temp_file_creator,
+    buffer_creator,
     raised_error,
     expected_error,
     error_match,
 ):
-    create_temp_file, created_paths = temp_file_creator
+    create_buffer, created_buffers = buffer_creator
 
     def fail_stream(*args, **kwargs):
         raise raised_error
 
-    mocker.patch("tempfile.NamedTemporaryFile", side_effect=create_temp_file)
+    mocker.patch("tempfile.SpooledTemporaryFile", side_effect=create_buffer)
     mocker.patch.object(
         client._PandasConnector__client,
         "stream_data",
@@ -576,13 +585,75 @@ def test_write_temp_csv_error_handling_and_cleanup(
 
     if error_match:
         with pytest.raises(expected_error, match=error_match) as exc_info:
-            client._PandasConnector__write_temp_csv(object())
+            client._PandasConnector__download_csv(object())
     else:
         with pytest.raises(expected_error) as exc_info:
-            client._PandasConnector__write_temp_csv(object())
+            client._PandasConnector__download_csv(object())
 
     if error_match is None:
         assert exc_info.value is raised_error
 
-    assert len(created_paths) == 1
-    assert not created_paths[0].exists()
+    assert len(created_buffers) == 1
+    assert created_buffers[0].closed
+
+
+def test_download_csv_stays_in_memory(client, mocker, csv_data):
+    mocker.patch.object(
+        client._PandasConnector__client,
+        "stream_data",
+        return_value=iter([csv_data[:100], csv_data[100:]]),
+    )
+
+    with client._PandasConnector__download_csv(object()) as buffer:
+        assert not buffer._rolled
+        assert buffer.read() == csv_data
+
+
+def test_data_query_flow_fetched_concurrently(client, mocker, csv_data):
+    started = threading.Event()
+
+    def slow_dataflow(*args, **kwargs):
+        started.set()
+        raise NotFound("No flow", "The dataflow could not be found.")
+
+    def stream(*args, **kwargs):
+        # The dataflow is requested before the data download starts
+        assert started.wait(5)
+        yield csv_data
+
+    mocker.patch(
+        "pysdmx.api.dc.rest.SdmxConnector.dataflow", side_effect=slow_dataflow
+    )
+    mocker.patch.object(
+        client._PandasConnector__client, "stream_data", side_effect=stream
+    )
+    dfref = Reference("Dataflow", "BIS", "BIS_DER", "1.0")
+
+    with pytest.raises(NotFound):
+        client.data(dfref)
+
+
+def test_data_query_time_period_only_dimension(client, mocker):
+    flow = DataflowInfo(
+        "TP",
+        Components(
+            [
+                Component("TIME_PERIOD", True, Role.DIMENSION, Concept("TP")),
+                Component("OBS_VALUE", False, Role.MEASURE, Concept("OV")),
+            ]
+        ),
+        Agency("BIS"),
+    )
+    mocker.patch(
+        "pysdmx.api.dc.rest.SdmxConnector.dataflow", return_value=flow
+    )
+    mocker.patch.object(
+        client._PandasConnector__client,
+        "stream_data",
+        return_value=iter([b"TIME_PERIOD,OBS_VALUE\n2020,1\n2021,2\n"]),
+    )
+    dfref = Reference("Dataflow", "BIS", "TP", "1.0")
+
+    data = client.data(dfref, apply_schema=False, infer_index=False)
+
+    assert data["SERIES_KEY"].tolist() == ["", ""]
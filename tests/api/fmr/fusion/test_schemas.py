@@ -323,6 +323,20 @@ def test_codes_no_const(
     )
 
 
+def test_shared_final_artefacts(
+    respx_mock, fmr, no_const_query, no_hca_query, no_const_body, no_hca_body
+):
+    """Final codelists and concepts are shared across schemas."""
+    checks.check_shared_final_artefacts(
+        respx_mock,
+        fmr,
+        no_const_query,
+        no_hca_query,
+        no_const_body,
+        no_hca_body,
+    )
+
+
 def test_core_local_repr(
     respx_mock, fmr, no_const_query, no_hca_query, no_const_body, no_hca_body
 ):
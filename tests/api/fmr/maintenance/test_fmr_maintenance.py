@@ -1,4 +1,7 @@
 import base64
+import gzip
+import threading
+import time
 
 import httpx
 import msgspec
@@ -346,6 +349,219 @@ def test_client_error(
     assert end_point_in in e.value.description
 
 
+@pytest.fixture
+def reports():
+    return [
+        MetadataReport(
+            f"REPORT_{i}",
+            agency="TEST",
+            name=f"Report {i}",
+            attributes=(MetadataAttribute("A", f"Value {i}"),),
+        )
+        for i in range(5)
+    ]
+
+
+def __report_ids(request):
+    msg = (
+        msgspec.json.Decoder(JsonMetadataMessage)
+        .decode(request.content)
+        .to_model()
+    )
+    return [r.id for r in msg.reports]
+
+
+def test_report_batches(
+    respx_mock, reports, end_point_in, end_point_out_report, user, pwd
+):
+    respx_mock.post(end_point_out_report).mock(
+        return_value=httpx.Response(201)
+    )
+
+    with RegistryMaintenanceClient(end_point_in, user, pwd) as client:
+        results = client.put_metadata_reports(reports, batch_size=2)
+
+    assert respx_mock.calls.call_count == 3
+    assert [__report_ids(c.request) for c in respx_mock.calls] == [
+        ["REPORT_0", "REPORT_1"],
+        ["REPORT_2", "REPORT_3"],
+        ["REPORT_4"],
+    ]
+    assert [(r.index, r.size, r.status) for r in results] == [
+        (0, 2, 201),
+        (1, 2, 201),
+        (2, 1, 201),
+    ]
+    assert all(r.ok for r in results)
+
+
+def test_structure_batches(
+    respx_mock, structure, end_point_in, end_point_out_structure, user, pwd
+):
+    respx_mock.post(end_point_out_structure).mock(
+        return_value=httpx.Response(200)
+    )
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    results = client.put_structures([structure] * 3, batch_size=2)
+
+    assert respx_mock.calls.call_count == 2
+    assert [r.size for r in results] == [2, 1]
+
+
+def test_compressed_upload(
+    respx_mock, reports, end_point_in, end_point_out_report, user, pwd
+):
+    respx_mock.post(end_point_out_report).mock(
+        return_value=httpx.Response(200)
+    )
+    client = RegistryMaintenanceClient(end_point_in, user, pwd, compress=True)
+
+    client.put_metadata_reports(reports)
+
+    request = respx_mock.calls[0].request
+    assert request.headers["Content-Encoding"] == "gzip"
+    msg = (
+        msgspec.json.Decoder(JsonMetadataMessage)
+        .decode(gzip.decompress(request.content))
+        .to_model()
+    )
+    assert len(msg.reports) == 5
+
+
+def test_client_is_reused(
+    respx_mock, reports, end_point_in, end_point_out_report, user, pwd
+):
+    respx_mock.post(end_point_out_report).mock(
+        return_value=httpx.Response(200)
+    )
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    client.put_metadata_reports(reports[:1])
+    pooled = client._client
+    client.put_metadata_reports(reports[1:])
+
+    assert pooled is not None
+    assert client._client is pooled
+    client.close()
+    assert client._client is None
+    assert pooled.is_closed
+
+
+def test_close_without_client(end_point_in, user, pwd):
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    client.close()
+
+    assert client._client is None
+
+
+def test_client_recreated_for_higher_concurrency(
+    respx_mock, reports, end_point_in, end_point_out_report, user, pwd
+):
+    respx_mock.post(end_point_out_report).mock(
+        return_value=httpx.Response(200)
+    )
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    client.put_metadata_reports(reports, batch_size=1, concurrency=2)
+    pooled = client._client
+    client.put_metadata_reports(reports, batch_size=1, concurrency=10)
+    assert client._client is pooled
+    client.put_metadata_reports(reports, batch_size=1, concurrency=12)
+
+    assert pooled.is_closed
+    assert client._client is not pooled
+    assert not client._client.is_closed
+    client.close()
+
+
+def test_concurrent_batches(
+    respx_mock, reports, end_point_in, end_point_out_report, user, pwd
+):
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def side_effect(request):
+        with lock:
+            running.append(request)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(request)
+        return httpx.Response(200)
+
+    respx_mock.post(end_point_out_report).mock(side_effect=side_effect)
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    results = client.put_metadata_reports(reports, batch_size=1, concurrency=2)
+
+    assert respx_mock.calls.call_count == 5
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert max(max_running) == 2
+
+
+def test_batch_errors_reported(
+    respx_mock, reports, end_point_in, end_point_out_report, user, pwd
+):
+    respx_mock.post(end_point_out_report).mock(
+        side_effect=[
+            httpx.Response(200),
+            httpx.Response(409, text="Conflict"),
+            httpx.Response(200),
+        ]
+    )
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    results = client.put_metadata_reports(
+        reports, batch_size=2, raise_errors=False
+    )
+
+    assert respx_mock.calls.call_count == 3
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].status == 409
+    assert isinstance(results[1].error, errors.Invalid)
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_batch_error_raised(
+    respx_mock,
+    reports,
+    end_point_in,
+    end_point_out_report,
+    user,
+    pwd,
+    concurrency,
+):
+    respx_mock.post(end_point_out_report).mock(
+        return_value=httpx.Response(500)
+    )
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    with pytest.raises(errors.InternalError):
+        client.put_metadata_reports(
+            reports, batch_size=1, concurrency=concurrency
+        )
+
+    if concurrency == 1:
+        assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "concurrency"), [(0, 1), (None, 0), (-1, 2)]
+)
+def test_invalid_batching(
+    reports, end_point_in, user, pwd, batch_size, concurrency
+):
+    client = RegistryMaintenanceClient(end_point_in, user, pwd)
+
+    with pytest.raises(errors.Invalid):
+        client.put_metadata_reports(
+            reports, batch_size=batch_size, concurrency=concurrency
+        )
+
+
 def __compute_pwd(user, pwd):
     encoded = base64.b64encode(f"{user}:{pwd}".encode("ascii")).decode("ascii")
     return f"Basic {encoded}"
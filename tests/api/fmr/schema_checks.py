@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 
 import httpx
@@ -326,6 +327,58 @@ def check_unconstrained_coded_components(
             assert comp.enumeration is None
 
 
+def check_shared_final_artefacts(
+    mock,
+    fmr: RegistryClient,
+    no_const_query,
+    hca_query,
+    no_const_body,
+    hca_body,
+):
+    """Final codelists and concepts are shared across schemas."""
+    final_body = re.sub(
+        rb'("version":\s*")1\.0"', rb'\g<1>1.0.0"', no_const_body
+    ).replace(b"(1.0)", b"(1.0.0)")
+    mock.get(hca_query).mock(
+        return_value=httpx.Response(200, content=hca_body)
+    )
+    mock.get(no_const_query).mock(
+        side_effect=[
+            httpx.Response(200, content=final_body),
+            httpx.Response(200, content=final_body),
+            httpx.Response(200, content=no_const_body),
+            httpx.Response(200, content=no_const_body),
+        ]
+    )
+
+    first = fmr.get_schema("datastructure", "BIS", "BIS_CBS", "1.0")
+    second = fmr.get_schema("datastructure", "BIS", "BIS_CBS", "1.0")
+    draft = fmr.get_schema("datastructure", "BIS", "BIS_CBS", "1.0")
+    other_draft = fmr.get_schema("datastructure", "BIS", "BIS_CBS", "1.0")
+
+    assert first == second
+    assert any(c.enumeration for c in first.components)
+    for c1, c2 in zip(first.components, second.components):
+        assert c1.concept is c2.concept
+        assert c1.enumeration is c2.enumeration
+    for c1, c2 in zip(draft.components, other_draft.components):
+        assert c1.concept == c2.concept
+        assert c1.concept is not c2.concept
+        if c1.enumeration:
+            assert c1.enumeration == c2.enumeration
+            assert c1.enumeration is not c2.enumeration
+
+    fmr.clear_cache()
+    mock.get(no_const_query).mock(
+        return_value=httpx.Response(200, content=final_body)
+    )
+    third = fmr.get_schema("datastructure", "BIS", "BIS_CBS", "1.0")
+
+    assert third == first
+    for c1, c3 in zip(first.components, third.components):
+        assert c1.concept is not c3.concept
+
+
 async def check_core_local_repr_async(
     mock,
     fmr: AsyncRegistryClient,
@@ -385,3 +385,72 @@ def test_writer_nullable_integers_and_optional_nulls():
     # Optional null attr → empty string
     assert df["ATTR_OPT"].iloc[0] == ""
     assert df["ATTR_OPT"].iloc[1] == "world"
+
+
+def test_writer_typed_values():
+    """Typed values are written as in SDMX-ML messages."""
+    from pysdmx.model import (
+        Component,
+        Components,
+        Concept,
+        DataType,
+        Role,
+        Schema,
+    )
+
+    data = pd.DataFrame(
+        data={
+            "DIM1": ["A", "B"],
+            "OBS_VALUE": ["1.0", "2.5"],
+            "ATTR_BOOL": ["true", None],
+            "ATTR_INT": ["1", None],
+        }
+    )
+    schema = Schema(
+        context="datastructure",
+        agency="T",
+        id="T",
+        version="1.0",
+        components=Components(
+            [
+                Component(
+                    id="DIM1",
+                    role=Role.DIMENSION,
+                    concept=Concept(id="DIM1"),
+                    required=True,
+                ),
+                Component(
+                    id="OBS_VALUE",
+                    role=Role.MEASURE,
+                    concept=Concept(id="OBS_VALUE"),
+                    required=True,
+                    local_dtype=DataType.DOUBLE,
+                ),
+                Component(
+                    id="ATTR_BOOL",
+                    role=Role.ATTRIBUTE,
+                    concept=Concept(id="ATTR_BOOL"),
+                    required=False,
+                    attachment_level="O",
+                    local_dtype=DataType.BOOLEAN,
+                ),
+                Component(
+                    id="ATTR_INT",
+                    role=Role.ATTRIBUTE,
+                    concept=Concept(id="ATTR_INT"),
+                    required=False,
+                    attachment_level="O",
+                    local_dtype=DataType.INTEGER,
+                ),
+            ]
+        ),
+    )
+    dataset = PandasDataset(data=data, structure=schema)
+
+    result = write([dataset])
+
+    assert result.splitlines() == [
+        "DATAFLOW,DIM1,OBS_VALUE,ATTR_BOOL,ATTR_INT",
+        "T:T(1.0),A,1,true,1",
+        "T:T(1.0),B,2.5,,",
+    ]
@@ -0,0 +1,97 @@
+from io import StringIO
+
+import pandas as pd
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io.csv.sdmx20.writer.metadata import write
+from pysdmx.model import MetadataAttribute, MetadataReport
+from pysdmx.model.dataset import ActionType
+
+MDF = "urn:sdmx:org.sdmx.infomodel.metadatastructure.Metadataflow=BIS:MDF(1.0)"
+MPA = (
+    "urn:sdmx:org.sdmx.infomodel.metadatastructure."
+    "MetadataProvisionAgreement=BIS:MPA(1.0)"
+)
+DF = "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=BIS:DF(1.0)"
+DSD = "urn:sdmx:org.sdmx.infomodel.datastructure.DataStructure=BIS:DSD(1.0)"
+
+
+@pytest.fixture
+def reports():
+    return [
+        MetadataReport(
+            id="R1",
+            agency="BIS",
+            version="1.0",
+            metadataflow=MDF,
+            targets=(DF,),
+            attributes=(
+                MetadataAttribute(
+                    "CONTACT",
+                    attributes=(
+                        MetadataAttribute("NAME", "Jane"),
+                        MetadataAttribute("EMAIL", ["jane@x.org", "j@x.org"]),
+                    ),
+                ),
+                MetadataAttribute("TITLE", {"en": "Title", "fr": "Titre"}),
+            ),
+        ),
+        MetadataReport(
+            id="R2",
+            agency="BIS",
+            version="1.0",
+            metadataProvisionAgreement=MPA,
+            targets=(DF, DSD),
+            action=ActionType.Replace,
+            attributes=(
+                MetadataAttribute("COUNT", 4),
+                MetadataAttribute("COUNT", 5),
+            ),
+        ),
+    ]
+
+
+def test_write(reports):
+    result = pd.read_csv(StringIO(write(reports)), dtype=str)
+
+    assert list(result.columns) == [
+        "STRUCTURE",
+        "STRUCTURE_ID",
+        "ACTION",
+        "METADATASET_ID",
+        "TARGET",
+        "CONTACT.NAME",
+        "CONTACT.EMAIL",
+        "TITLE",
+        "COUNT",
+    ]
+    assert result["STRUCTURE"].tolist() == [
+        "metadataflow",
+        "metadataprovision",
+    ]
+    assert result["STRUCTURE_ID"].tolist() == ["BIS:MDF(1.0)", "BIS:MPA(1.0)"]
+    assert result["ACTION"].tolist() == ["I", "R"]
+    assert result["METADATASET_ID"].tolist() == ["BIS:R1(1.0)", "BIS:R2(1.0)"]
+    assert result["TARGET"].tolist() == [DF, f"[{DF};{DSD}]"]
+    row = result.iloc[0]
+    assert row["CONTACT.NAME"] == "Jane"
+    assert row["CONTACT.EMAIL"] == "[jane@x.org;j@x.org]"
+    assert row["TITLE"] == "[en:Title;fr:Titre]"
+    assert pd.isna(row["COUNT"])
+    assert result.iloc[1]["COUNT"] == "[4;5]"
+    assert pd.isna(result.iloc[1]["CONTACT.NAME"])
+
+
+def test_write_to_file(reports, tmp_path):
+    output_path = tmp_path / "reports.csv"
+
+    assert write(reports, output_path) is None
+    assert output_path.read_text() == write(reports)
+
+
+def test_write_without_structure():
+    report = MetadataReport(id="R", agency="BIS", version="1.0")
+
+    with pytest.raises(Invalid, match="metadataflow or a metadata provision"):
+        write([report])
@@ -0,0 +1,30 @@
+from io import StringIO
+
+import pandas as pd
+
+from pysdmx.io.csv.sdmx21.writer.metadata import write
+from pysdmx.model import MetadataAttribute, MetadataReport
+from pysdmx.model.dataset import ActionType
+
+MDF = "urn:sdmx:org.sdmx.infomodel.metadatastructure.Metadataflow=BIS:MDF(1.0)"
+
+
+def test_write_actions():
+    reports = [
+        MetadataReport(
+            id=f"R{i}",
+            agency="BIS",
+            version="1.0",
+            metadataflow=MDF,
+            action=action,
+            attributes=(MetadataAttribute("TITLE", "Title"),),
+        )
+        for i, action in enumerate(
+            [None, ActionType.Append, ActionType.Replace, ActionType.Delete]
+        )
+    ]
+
+    result = pd.read_csv(StringIO(write(reports)), dtype=str)
+
+    assert result["ACTION"].tolist() == ["M", "M", "R", "D"]
+    assert result["TITLE"].tolist() == ["Title"] * 4
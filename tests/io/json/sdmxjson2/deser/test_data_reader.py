@@ -0,0 +1,301 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pysdmx import errors
+from pysdmx.api.dc.query import TextFilter
+from pysdmx.io.json.sdmxjson2.reader.data import read
+from pysdmx.model.dataset import ActionType
+
+SCHEMA_21 = "https://json.sdmx.org/2.1/sdmx-json-data-schema.json"
+DF_URN = "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=BIS:DF(1.0)"
+
+
+@pytest.fixture
+def exr_message():
+    file_path = Path(__file__).parents[3] / "samples" / "exr-time-series.json"
+    with open(file_path, "r") as f:
+        return f.read()
+
+
+def __component(cid, values, key_position=None, **kwargs):
+    out = {"id": cid, "name": cid, "values": values, **kwargs}
+    if key_position is not None:
+        out["keyPosition"] = key_position
+    return out
+
+
+@pytest.fixture
+def structure():
+    return {
+        "links": [{"urn": DF_URN, "rel": "dataflow"}],
+        "name": "Test",
+        "dimensions": {
+            "series": [
+                __component(
+                    "FREQ",
+                    [{"id": "A", "name": "Annual"}, {"id": "M", "name": "M"}],
+                    0,
+                ),
+                __component("REF_AREA", [{"value": "CH"}, {"value": "DE"}], 1),
+            ],
+            "observation": [
+                __component(
+                    "TIME_PERIOD", [{"value": "2020"}, {"value": "2021"}], 2
+                ),
+            ],
+        },
+        "measures": {"observation": [{"id": "OBS_VALUE", "name": "Value"}]},
+        "attributes": {
+            "dataSet": [
+                __component(
+                    "UNIT",
+                    [{"value": "EUR"}],
+                    relationship={"dataflow": {}},
+                ),
+            ],
+            "dimensionGroup": [
+                __component(
+                    "TITLE",
+                    [{"value": "Annual"}, {"value": "Swiss"}],
+                    relationship={"dimensions": ["FREQ"]},
+                ),
+            ],
+            "series": [
+                __component(
+                    "DECIMALS",
+                    [{"value": "2"}],
+                    relationship={"dimensions": ["FREQ", "REF_AREA"]},
+                ),
+            ],
+            "observation": [
+                __component(
+                    "OBS_STATUS",
+                    [{"id": "A", "name": "Normal"}, {"id": "E", "name": "E"}],
+                    relationship={"observation": {}},
+                ),
+            ],
+        },
+        "dataSets": [0],
+    }
+
+
+@pytest.fixture
+def series_message(structure):
+    return {
+        "meta": {
+            "id": "test",
+            "prepared": "2025-01-01T00:00:00Z",
+            "sender": {"id": "BIS"},
+            "schema": SCHEMA_21,
+        },
+        "data": {
+            "structures": [structure],
+            "dataSets": [
+                {
+                    "structure": 0,
+                    "action": "Merge",
+                    "attributes": [0],
+                    "dimensionGroupAttributes": {
+                        "0:~": [0],
+                        ":0": [1],
+                    },
+                    "series": {
+                        "0:0": {
+                            "attributes": [0],
+                            "observations": {
+                                "0": [1.5, 0],
+                                "1": [2.5, None],
+                            },
+                        },
+                        "1:1": {
+                            "attributes": [None],
+                            "observations": {"1": [None, 1]},
+                        },
+                        "0:1": {"attributes": [0]},
+                    },
+                }
+            ],
+        },
+    }
+
+
+def test_read_sample(exr_message):
+    message = read(exr_message)
+
+    assert message.header.id == "IT1001"
+    assert len(message.data) == 1
+    dataset = message.data[0]
+    assert dataset.short_urn == "Dataflow=ECB:EXR(1.0)"
+    assert dataset.action == ActionType.Append
+    assert len(dataset.data) == 4
+    assert list(dataset.data.columns[:6]) == [
+        "FREQ",
+        "CURRENCY",
+        "CURRENCY_DENOM",
+        "EXR_TYPE",
+        "EXR_SUFFIX",
+        "TIME_PERIOD",
+    ]
+
+
+def test_read_series(series_message):
+    message = read(json.dumps(series_message))
+
+    dataset = message.data[0]
+    assert dataset.short_urn == "Dataflow=BIS:DF(1.0)"
+    assert dataset.action == ActionType.Append
+    assert dataset.attributes == {"UNIT": "EUR"}
+    df = dataset.data
+    assert list(df.columns) == [
+        "FREQ",
+        "REF_AREA",
+        "TIME_PERIOD",
+        "OBS_VALUE",
+        "OBS_STATUS",
+        "DECIMALS",
+        "TITLE",
+    ]
+    assert len(df) == 4
+    assert df["FREQ"].tolist() == ["A", "A", "M", "A"]
+    assert df["REF_AREA"].tolist() == ["CH", "CH", "DE", "DE"]
+    assert df["TIME_PERIOD"].tolist()[:3] == ["2020", "2021", "2021"]
+    # The series without observations is kept, without time period
+    assert pd.isna(df["TIME_PERIOD"][3])
+    assert df["OBS_VALUE"].tolist()[:2] == ["1.5", "2.5"]
+    assert pd.isna(df["OBS_VALUE"][2])
+    assert df["OBS_STATUS"].tolist()[0] == "A"
+    assert pd.isna(df["OBS_STATUS"][1])
+    assert df["OBS_STATUS"].tolist()[2] == "E"
+    assert df["DECIMALS"].tolist()[:2] == ["2", "2"]
+    assert pd.isna(df["DECIMALS"][2])
+    # Group attributes, the last group overriding the first one
+    assert df["TITLE"].tolist()[:2] == ["Swiss", "Swiss"]
+    assert pd.isna(df["TITLE"][2])
+    assert df["TITLE"][3] == "Annual"
+
+
+def test_read_flat_observations(series_message, structure):
+    dims = structure["dimensions"]
+    dims["observation"] = dims["series"] + dims["observation"]
+    dims["series"] = []
+    structure["attributes"]["series"] = []
+    structure["attributes"]["dimensionGroup"] = []
+    dataset = series_message["data"]["dataSets"][0]
+    del dataset["series"]
+    del dataset["dimensionGroupAttributes"]
+    dataset["observations"] = {
+        "0:0:0": [1.5, 0],
+        "1:1:1": ["2", None],
+    }
+
+    df = read(json.dumps(series_message)).data[0].data
+
+    assert df["FREQ"].tolist() == ["A", "M"]
+    assert df["REF_AREA"].tolist() == ["CH", "DE"]
+    assert df["TIME_PERIOD"].tolist() == ["2020", "2021"]
+    assert df["OBS_VALUE"].tolist() == ["1.5", "2"]
+
+
+def test_read_with_filters(series_message):
+    message = read(
+        json.dumps(series_message),
+        filters=TextFilter("REF_AREA", "=", "DE"),
+    )
+
+    df = message.data[0].data
+    assert df["REF_AREA"].tolist() == ["DE", "DE"]
+    assert df.index.tolist() == [0, 1]
+
+
+def test_read_without_validation(series_message):
+    del series_message["data"]["structures"][0]["name"]
+
+    message = read(json.dumps(series_message), validate=False)
+
+    assert len(message.data[0].data) == 4
+
+
+def test_read_invalid_message():
+    with pytest.raises(errors.Invalid, match="could not be read"):
+        read('{"data": {}}', validate=False)
+
+
+def test_read_missing_structure(series_message):
+    series_message["data"]["dataSets"][0]["structure"] = 1
+
+    with pytest.raises(errors.Invalid, match="structure 1 not found"):
+        read(json.dumps(series_message), validate=False)
+
+
+def test_read_position_out_of_range(series_message):
+    series = series_message["data"]["dataSets"][0]["series"]
+    series["0:0"]["observations"]["0"] = [1.5, 2]
+
+    with pytest.raises(errors.Invalid, match="out of range"):
+        read(json.dumps(series_message), validate=False)
+
+
+def test_read_invalid_key(series_message):
+    series = series_message["data"]["dataSets"][0]["series"]
+    series["0:0:0"] = series.pop("0:0")
+
+    with pytest.raises(errors.Invalid, match="positions of 2 dimension"):
+        read(json.dumps(series_message), validate=False)
+
+
+def test_read_without_structure_link(series_message):
+    series_message["data"]["structures"][0]["links"] = [
+        {"href": "https://example.org", "rel": "self"}
+    ]
+
+    with pytest.raises(errors.Invalid, match="could not be found"):
+        read(json.dumps(series_message), validate=False)
+
+
+def test_read_empty_dataset(series_message):
+    dataset = series_message["data"]["dataSets"][0]
+    dataset["attributes"] = [None]
+    dataset["dimensionGroupAttributes"] = {"0:~": [None]}
+    dataset["series"] = {}
+
+    message = read(json.dumps(series_message))
+
+    result = message.data[0]
+    assert result.attributes == {}
+    assert len(result.data) == 0
+    assert "OBS_VALUE" in result.data.columns
+
+
+def test_read_null_values(series_message, structure):
+    structure["attributes"]["observation"][0]["values"].append(None)
+    series = series_message["data"]["dataSets"][0]["series"]
+    series["0:0"]["observations"]["0"] = [1.5, 2]
+
+    df = read(json.dumps(series_message), validate=False).data[0].data
+
+    assert pd.isna(df["OBS_STATUS"][0])
+    assert df["OBS_STATUS"][2] == "E"
+
+
+def test_read_structure_from_later_link(series_message, structure):
+    series_message["data"]["dataSets"][0]["links"] = [
+        {"href": "https://example.org/dataflow", "rel": "dataflow"}
+    ]
+    structure["links"] = [
+        {
+            "urn": "urn:sdmx:org.sdmx.infomodel.codelist.Codelist=BIS:CL(1.0)",
+            "rel": "dataflow",
+        },
+        {
+            "urn": "urn:sdmx:org.sdmx.infomodel.datastructure."
+            "DataStructure=BIS:DSD(1.0)",
+            "rel": "datastructure",
+        },
+    ]
+
+    message = read(json.dumps(series_message), validate=False)
+
+    assert message.data[0].short_urn == "DataStructure=BIS:DSD(1.0)"
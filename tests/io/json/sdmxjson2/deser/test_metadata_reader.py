@@ -1,17 +1,21 @@
+import io
+from pathlib import Path
+
 import msgspec
 import pytest
 
 from pysdmx import errors
 from pysdmx.io.json.sdmxjson2.messages import JsonMetadataMessage
-from pysdmx.io.json.sdmxjson2.reader.metadata import read
-from pysdmx.model.message import MetadataMessage
+from pysdmx.io.json.sdmxjson2.reader.metadata import iter_read, read
+from pysdmx.model import MetadataAttribute, MetadataReport
+from pysdmx.model.message import Header, MetadataMessage
+
+REPORT = "tests/io/json/sdmxjson2/deser/samples/reports/report.json"
 
 
 @pytest.fixture
 def body():
-    with open(
-        "tests/io/json/sdmxjson2/deser/samples/reports/report.json", "rb"
-    ) as f:
+    with open(REPORT, "rb") as f:
         return f.read()
 
 
@@ -48,3 +52,73 @@ def test_get_json2_invalid_refmeta():
         match="as SDMX-JSON 2.0.0 or 2.1.0 reference metadata message.",
     ):
         read("pyproject.toml", validate=False)
+
+
+@pytest.fixture
+def many_reports():
+    reports = [
+        MetadataReport(
+            f"RPT{i}",
+            agency="BIS",
+            name=f'Report "{i}" {{[with]}} \\ brackets \u00e9',
+            attributes=(
+                MetadataAttribute(
+                    "CONTACT",
+                    attributes=(MetadataAttribute("NAME", f"Name {i}"),),
+                ),
+                MetadataAttribute("NOTE", ["a", "b"]),
+            ),
+        )
+        for i in range(20)
+    ]
+    message = JsonMetadataMessage.from_model(
+        MetadataMessage(Header(), reports)
+    )
+    return reports, msgspec.json.encode(message)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_iter_read(many_reports, chunk_size):
+    reports, body = many_reports
+
+    result = list(iter_read(io.BytesIO(body), chunk_size=chunk_size))
+
+    assert result == list(read(body.decode(), validate=False).reports)
+    assert [r.id for r in result] == [r.id for r in reports]
+    assert result[3].name == 'Report "3" {[with]} \\ brackets \u00e9'
+    assert result[3]["CONTACT.NAME"].value == "Name 3"
+
+
+def test_iter_read_sources(body, empty):
+    expected = read(body.decode(), validate=False).reports
+
+    assert list(iter_read(body)) == list(expected)
+    assert list(iter_read(body.decode())) == list(expected)
+    assert list(iter_read(Path(REPORT))) == list(expected)
+    assert list(iter_read(empty)) == []
+
+
+def test_iter_read_is_lazy(many_reports):
+    _, body = many_reports
+    truncated = body[: body.index(b"RPT3") - 20]
+
+    reports = iter_read(truncated)
+
+    assert next(reports).id == "RPT0"
+    with pytest.raises(errors.Invalid, match="could not be read"):
+        list(reports)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"meta": {"id": "metadataSets"}, "data": {}}',
+        b'{"data": {"metadataSets": [{"id": 1}]}}',
+        b'{"data": {"metadataSets": ["RPT1"]}}',
+        b'{"data": {"metadataSets": [1, true]}}',
+        b"",
+    ],
+)
+def test_iter_read_invalid(body):
+    with pytest.raises(errors.Invalid, match="could not be read"):
+        list(iter_read(body))
@@ -0,0 +1,464 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysdmx import errors
+from pysdmx.io.format import Format
+from pysdmx.io.json.sdmxjson2.reader.data import read
+from pysdmx.io.json.sdmxjson2.writer.v2_0.data import write as write_v20
+from pysdmx.io.json.sdmxjson2.writer.v2_1.data import write as write_v21
+from pysdmx.io.pd import PandasDataset
+from pysdmx.io.writer import write_sdmx
+from pysdmx.model import (
+    Code,
+    Codelist,
+    Component,
+    Components,
+    Concept,
+    DataType,
+    Role,
+    Schema,
+)
+from pysdmx.model.dataset import ActionType
+from pysdmx.model.message import Header
+
+ORDER = ["FREQ", "REF_AREA", "TIME_PERIOD"]
+
+
+@pytest.fixture
+def schema():
+    freq = Codelist(
+        "CL_FREQ",
+        agency="BIS",
+        name="Frequencies",
+        items=[Code("A", name="Annual"), Code("M", name="Monthly")],
+    )
+    return Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [
+                Component(
+                    "FREQ",
+                    True,
+                    Role.DIMENSION,
+                    Concept("FREQ"),
+                    local_codes=freq,
+                ),
+                Component("REF_AREA", True, Role.DIMENSION, Concept("AREA")),
+                Component("TIME_PERIOD", True, Role.DIMENSION, Concept("TP")),
+                Component("OBS_VALUE", False, Role.MEASURE, Concept("OV")),
+                Component(
+                    "TITLE",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("TITLE"),
+                    attachment_level="FREQ,REF_AREA",
+                ),
+                Component(
+                    "OBS_STATUS",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("OBS_STATUS"),
+                    attachment_level="O",
+                ),
+                Component(
+                    "UNIT",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("UNIT"),
+                    attachment_level="D",
+                ),
+                Component(
+                    "COMMENT",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("COMMENT"),
+                    attachment_level="O",
+                ),
+            ]
+        ),
+        "1.0",
+        name="Test dataflow",
+    )
+
+
+@pytest.fixture
+def dataset(schema):
+    data = pd.DataFrame(
+        {
+            "FREQ": ["A", "A", "M", "A"],
+            "REF_AREA": ["CH", "CH", "CH", "DE"],
+            "TIME_PERIOD": ["2020", "2021", "2020-01", "2020"],
+            "OBS_VALUE": ["1.5", "2", "", "4"],
+            "TITLE": ["Swiss", "Swiss", "Monthly", ""],
+            "OBS_STATUS": ["A", "", "A", "E"],
+            "UNIT": ["EUR", "EUR", "EUR", "EUR"],
+            "COMMENT": ["", "", "", ""],
+        }
+    )
+    return PandasDataset(
+        structure=schema, data=data, action=ActionType.Replace
+    )
+
+
+def __sorted(df):
+    return df.sort_values(ORDER).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("writer", [write_v20, write_v21])
+@pytest.mark.parametrize(
+    "dim_at_obs", [None, "AllDimensions", "TIME_PERIOD", "REF_AREA"]
+)
+def test_round_trip(dataset, writer, dim_at_obs):
+    out = writer([dataset], dimension_at_observation=dim_at_obs)
+
+    message = read(out, validate=True)
+
+    result = message.data[0]
+    assert result.short_urn == "Dataflow=BIS:DF(1.0)"
+    assert result.action == ActionType.Replace
+    assert result.attributes == {"UNIT": "EUR"}
+    df = __sorted(result.data)
+    assert df["FREQ"].tolist() == ["A", "A", "A", "M"]
+    assert df["REF_AREA"].tolist() == ["CH", "CH", "DE", "CH"]
+    assert df["TIME_PERIOD"].tolist() == ["2020", "2021", "2020", "2020-01"]
+    assert df["OBS_VALUE"].tolist()[:3] == ["1.5", "2", "4"]
+    assert pd.isna(df["OBS_VALUE"][3])
+    assert df["TITLE"][0] == "Swiss"
+    assert pd.isna(df["TITLE"][2])
+    assert df["TITLE"][3] == "Monthly"
+    assert df["OBS_STATUS"].tolist()[0] == "A"
+    assert pd.isna(df["OBS_STATUS"][1])
+    # Attributes without any value are not written
+    assert "COMMENT" not in df.columns
+
+
+def test_flat_layout(dataset):
+    out = json.loads(write_v20([dataset], prettyprint=False))
+
+    structure = out["data"]["structures"][0]
+    assert structure["name"] == "Test dataflow"
+    assert structure["dataSets"] == [0]
+    dims = structure["dimensions"]
+    assert "series" not in dims
+    assert [d["keyPosition"] for d in dims["observation"]] == [0, 1, 2]
+    assert dims["observation"][0]["values"] == [
+        {"id": "A", "name": "Annual"},
+        {"id": "M", "name": "Monthly"},
+    ]
+    assert dims["observation"][1]["values"] == [
+        {"value": "CH"},
+        {"value": "DE"},
+    ]
+    attributes = structure["attributes"]
+    assert attributes["dataSet"][0]["relationship"] == {"dataflow": {}}
+    assert [a["id"] for a in attributes["observation"]] == [
+        "TITLE",
+        "OBS_STATUS",
+    ]
+    ds = out["data"]["dataSets"][0]
+    assert ds["action"] == "Replace"
+    assert ds["attributes"] == [0]
+    assert ds["observations"] == {
+        "0:0:0": ["1.5", 0, 0],
+        "0:0:1": ["2", 0, None],
+        "1:0:2": [None, 1, 0],
+        "0:1:0": ["4", None, 1],
+    }
+
+
+def test_series_layout(dataset):
+    out = json.loads(
+        write_v21(
+            [dataset],
+            prettyprint=False,
+            dimension_at_observation="TIME_PERIOD",
+        )
+    )
+
+    structure = out["data"]["structures"][0]
+    dims = structure["dimensions"]
+    assert [d["id"] for d in dims["series"]] == ["FREQ", "REF_AREA"]
+    assert [d["id"] for d in dims["observation"]] == ["TIME_PERIOD"]
+    assert dims["observation"][0]["keyPosition"] == 2
+    attributes = structure["attributes"]
+    assert attributes["series"][0]["id"] == "TITLE"
+    assert attributes["series"][0]["relationship"] == {
+        "dimensions": ["FREQ", "REF_AREA"]
+    }
+    assert attributes["observation"][0]["id"] == "OBS_STATUS"
+    assert out["data"]["dataSets"][0]["series"] == {
+        "0:0": {
+            "attributes": [0],
+            "observations": {"0": ["1.5", 0], "1": ["2", None]},
+        },
+        "1:0": {"attributes": [1], "observations": {"2": [None, 0]}},
+        "0:1": {"attributes": [None], "observations": {"0": ["4", 1]}},
+    }
+
+
+def test_dimension_at_observation_by_dataset(dataset):
+    out = json.loads(
+        write_v20(
+            [dataset],
+            dimension_at_observation={"Dataflow=BIS:DF(1.0)": "REF_AREA"},
+        )
+    )
+
+    dims = out["data"]["structures"][0]["dimensions"]
+    assert [d["id"] for d in dims["observation"]] == ["REF_AREA"]
+
+
+@pytest.mark.parametrize("writer", [write_v20, write_v21])
+def test_missing_measure_values(writer):
+    schema = Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [
+                Component("REF_AREA", True, Role.DIMENSION, Concept("AREA")),
+                Component(
+                    "OBS_VALUE",
+                    False,
+                    Role.MEASURE,
+                    Concept("OV"),
+                    DataType.DOUBLE,
+                ),
+                Component("OBS_NOTE", False, Role.MEASURE, Concept("ON")),
+            ]
+        ),
+        "1.0",
+    )
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "REF_AREA": ["CH", "DE", "FR", "IT"],
+                "OBS_VALUE": [1.5, np.nan, None, 4.0],
+                "OBS_NOTE": ["a", None, "", pd.NA],
+            }
+        ),
+    )
+
+    out = json.loads(writer([dataset], prettyprint=False))
+
+    assert out["data"]["dataSets"][0]["observations"] == {
+        "0": [1.5, "a"],
+        "1": [None, None],
+        "2": [None, None],
+        "3": [4.0, None],
+    }
+
+
+def test_invalid_dimension_at_observation(dataset):
+    with pytest.raises(errors.Invalid, match="not found"):
+        write_v20([dataset], dimension_at_observation="OBS_VALUE")
+
+
+def test_no_schema():
+    ds = PandasDataset(
+        structure="Dataflow=BIS:DF(1.0)",
+        data=pd.DataFrame({"FREQ": ["A"]}),
+    )
+
+    with pytest.raises(errors.Invalid):
+        write_v20([ds])
+
+
+def test_header(dataset):
+    header = Header(id="test42", test=True)
+
+    out = json.loads(write_v21([dataset], header=header))
+
+    assert out["meta"]["id"] == "test42"
+    assert out["meta"]["test"] is True
+    assert out["meta"]["schema"] == (
+        "https://json.sdmx.org/2.1/sdmx-json-data-schema.json"
+    )
+
+
+def test_write_to_file(dataset, tmp_path):
+    output_path = tmp_path / "data" / "message.json"
+
+    result = write_v20([dataset], output_path=str(output_path))
+
+    assert result is None
+    message = read(output_path.read_text())
+    assert len(message.data[0].data) == 4
+
+
+@pytest.mark.parametrize(
+    "fmt", [Format.DATA_SDMX_JSON_2_0_0, Format.DATA_SDMX_JSON_2_1_0]
+)
+def test_write_sdmx(dataset, fmt):
+    out = write_sdmx(
+        dataset, fmt, dimension_at_observation="TIME_PERIOD", prettyprint=False
+    )
+
+    assert '"series":' in out
+    assert len(read(out).data[0].data) == 4
+
+
+def test_conflicting_series_attribute(schema):
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "FREQ": ["A", "A", "A"],
+                "REF_AREA": ["CH", "CH", "CH"],
+                "TIME_PERIOD": ["2020", "2021", "2022"],
+                "OBS_VALUE": ["1", "2", "3"],
+                "TITLE": ["S", "", "X"],
+            }
+        ),
+    )
+
+    with pytest.raises(errors.Invalid, match="has conflicting values"):
+        write_v20([dataset], dimension_at_observation="TIME_PERIOD")
+
+
+def test_series_attribute_on_one_row(schema):
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "FREQ": ["A", "A", "M"],
+                "REF_AREA": ["CH", "CH", "CH"],
+                "TIME_PERIOD": ["2020", "2021", "2020-01"],
+                "OBS_VALUE": ["1", "2", "3"],
+                "TITLE": ["", "Swiss", ""],
+            }
+        ),
+    )
+
+    out = json.loads(
+        write_v20([dataset], dimension_at_observation="TIME_PERIOD")
+    )
+
+    series = out["data"]["dataSets"][0]["series"]
+    assert series["0:0"]["attributes"] == [0]
+    assert series["1:0"]["attributes"] == [None]
+
+
+@pytest.mark.parametrize("dim_at_obs", [None, "TIME_PERIOD"])
+def test_duplicated_observations(schema, dim_at_obs):
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "FREQ": ["A", "A", "A"],
+                "REF_AREA": ["CH", "DE", "DE"],
+                "TIME_PERIOD": ["2020", "2020", "2020"],
+                "OBS_VALUE": ["1", "2", "3"],
+            }
+        ),
+    )
+
+    with pytest.raises(errors.Invalid, match="observations with key A.DE"):
+        write_v20([dataset], dimension_at_observation=dim_at_obs)
+
+
+def test_single_dimension_and_measure_attribute(tmp_path):
+    schema = Schema(
+        "datastructure",
+        "BIS",
+        "DSD",
+        Components(
+            [
+                Component(
+                    "YEAR",
+                    True,
+                    Role.DIMENSION,
+                    Concept("YEAR"),
+                    DataType.INTEGER,
+                ),
+                Component(
+                    "OBS_VALUE",
+                    False,
+                    Role.MEASURE,
+                    Concept("OV"),
+                    DataType.DOUBLE,
+                ),
+                Component(
+                    "PRECISION",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("PRECISION"),
+                    DataType.INTEGER,
+                    attachment_level="OBS_VALUE",
+                ),
+                Component(
+                    "UNIT",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("UNIT"),
+                    attachment_level="D",
+                ),
+                Component(
+                    "SOURCE",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("SOURCE"),
+                    attachment_level="O",
+                ),
+            ]
+        ),
+        "1.0",
+    )
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "YEAR": [2020, 2021],
+                "OBS_VALUE": [1.5, 2.5],
+                "PRECISION": [1, 2],
+            }
+        ),
+    )
+    output_path = tmp_path / "message.json"
+
+    write_v21([dataset], output_path, dimension_at_observation="YEAR")
+
+    out = json.loads(output_path.read_text())
+    structure = out["data"]["structures"][0]
+    assert "series" not in structure["dimensions"]
+    attributes = structure["attributes"]
+    assert attributes["dataSet"] == []
+    assert attributes["observation"][0]["relationship"] == {
+        "observation": {},
+        "measures": ["OBS_VALUE"],
+    }
+    assert attributes["observation"][0]["values"] == [
+        {"value": 1},
+        {"value": 2},
+    ]
+    assert out["data"]["dataSets"][0]["observations"] == {
+        "0": [1.5, 0],
+        "1": [2.5, 1],
+    }
+    df = read(output_path.read_text(), validate=True).data[0].data
+    assert df["YEAR"].tolist() == ["2020", "2021"]
+    assert df["PRECISION"].tolist() == ["1", "2"]
+
+
+def test_no_dimensions():
+    schema = Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [Component("OBS_VALUE", False, Role.MEASURE, Concept("OV"))]
+        ),
+        "1.0",
+    )
+    dataset = PandasDataset(
+        structure=schema, data=pd.DataFrame({"OBS_VALUE": ["1"]})
+    )
+
+    with pytest.raises(errors.Invalid, match="no dimensions"):
+        write_v20([dataset])
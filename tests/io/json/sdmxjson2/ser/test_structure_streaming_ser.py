@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from pysdmx import errors
+from pysdmx.io.json.sdmxjson2.messages import JsonStructureMessage
+from pysdmx.io.json.sdmxjson2.writer._helper import write_structure_msg
+from pysdmx.model import (
+    Agency,
+    AgencyScheme,
+    Code,
+    Codelist,
+    Concept,
+    ConceptScheme,
+    encoders,
+)
+from pysdmx.model.message import Header, StructureMessage
+
+
+@pytest.fixture
+def header():
+    return Header(id="test42", test=True)
+
+
+@pytest.fixture
+def structures():
+    return [
+        Codelist(
+            id=f"CL_{i}",
+            name="Codelist & co",
+            agency="BIS",
+            items=[Code("A", name="Code A"), Code("B", name='"B"')],
+        )
+        for i in range(3)
+    ] + [
+        AgencyScheme(agency="SDMX", items=[Agency("BIS", name="BIS")]),
+        ConceptScheme(
+            id="CS",
+            name="Concepts",
+            agency="BIS",
+            items=[Concept("C", name="Concept")],
+        ),
+    ]
+
+
+def __whole(header, structures, prettyprint, msg_version):
+    msg = StructureMessage(header, structures)
+    jm = JsonStructureMessage.from_model(msg, msg_version)
+    out = msgspec.json.Encoder(enc_hook=encoders).encode(jm)
+    if prettyprint:
+        out = msgspec.json.format(out, indent=4)
+    return out.decode("utf-8")
+
+
+@pytest.mark.parametrize("prettyprint", [True, False])
+@pytest.mark.parametrize("msg_version", ["2.0.0", "2.1"])
+def test_same_as_whole_message(header, structures, prettyprint, msg_version):
+    expected = __whole(header, structures, prettyprint, msg_version)
+
+    out = write_structure_msg(
+        structures,
+        header=header,
+        prettyprint=prettyprint,
+        msg_version=msg_version,
+    )
+
+    assert out == expected
+    assert msgspec.json.decode(out)["data"]["codelists"][2]["id"] == "CL_2"
+
+
+@pytest.mark.parametrize("prettyprint", [True, False])
+def test_file_same_as_string(header, structures, prettyprint, tmp_path):
+    path = tmp_path / "sub" / "out.json"
+
+    res = write_structure_msg(
+        structures, path, prettyprint=prettyprint, header=header
+    )
+
+    assert res is None
+    assert path.read_text("utf-8") == write_structure_msg(
+        structures, prettyprint=prettyprint, header=header
+    )
+
+
+def test_no_structures(header, tmp_path):
+    path = tmp_path / "out.json"
+
+    with pytest.raises(errors.Invalid):
+        write_structure_msg([], str(path), header=header)
+
+    assert not Path(path).exists()
+
+
+def test_partial_file_removed(header, structures, tmp_path):
+    path = tmp_path / "out.json"
+    # Concept schemes are serialized after the codelists
+    structures.append(ConceptScheme(id="NO_NAME", agency="BIS"))
+
+    with pytest.raises(errors.Invalid):
+        write_structure_msg(structures, path, header=header)
+
+    assert not path.exists()
+
+
+def test_existing_file_kept_on_error(header, structures, tmp_path):
+    path = tmp_path / "out.json"
+    path.write_bytes(b"previous")
+    structures.append(ConceptScheme(id="NO_NAME", agency="BIS"))
+
+    with pytest.raises(errors.Invalid):
+        write_structure_msg(structures, path, header=header)
+
+    assert path.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_existing_file_replaced(header, structures, tmp_path):
+    path = tmp_path / "out.json"
+    path.write_bytes(b"previous")
+
+    write_structure_msg(structures, path, header=header)
+
+    assert path.read_text("utf-8") == write_structure_msg(
+        structures, header=header
+    )
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,217 @@
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io import arrow, get_datasets
+from pysdmx.io.arrow import read, write
+from pysdmx.io.pd import PandasDataset
+from pysdmx.model import (
+    Code,
+    Codelist,
+    Component,
+    Components,
+    Concept,
+    DataType,
+    Facets,
+    Role,
+    Schema,
+)
+from pysdmx.model.dataset import ActionType
+
+SAMPLES = Path(__file__).parent / "samples"
+
+
+@pytest.fixture
+def schema():
+    freq = Codelist(
+        "CL_FREQ",
+        agency="BIS",
+        name="Frequencies",
+        items=[Code("A", name="Annual"), Code("M", name="Monthly")],
+    )
+    return Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [
+                Component(
+                    "FREQ",
+                    True,
+                    Role.DIMENSION,
+                    Concept("FREQ", dtype=DataType.STRING),
+                    local_codes=freq,
+                ),
+                Component("TIME_PERIOD", True, Role.DIMENSION, Concept("TP")),
+                Component(
+                    "OBS_VALUE",
+                    False,
+                    Role.MEASURE,
+                    Concept("OBS_VALUE", dtype=DataType.DOUBLE),
+                ),
+                Component(
+                    "OBS_STATUS",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("OBS_STATUS"),
+                    attachment_level="O",
+                ),
+            ]
+        ),
+        "1.0",
+        artefacts=["urn:sdmx:org.sdmx.infomodel.codelist.Codelist=BIS:CL"],
+        name="Test",
+    )
+
+
+@pytest.fixture
+def dataset(schema):
+    return PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "FREQ": ["A", "M", "A"],
+                "TIME_PERIOD": ["2020", "2020-01", "2021"],
+                "OBS_VALUE": ["1.5", "", "3"],
+                "OBS_STATUS": ["A", None, "E"],
+            }
+        ),
+        attributes={"UNIT": "EUR"},
+        action=ActionType.Replace,
+        reporting_begin=date(2020, 1, 1),
+        set_id="42",
+    )
+
+
+@pytest.mark.parametrize("file_format", ["ipc", "parquet"])
+def test_round_trip(dataset, tmp_path, file_format):
+    output_path = tmp_path / f"cache.{file_format}"
+
+    write(dataset, output_path, file_format)
+    result = read(output_path)
+
+    assert result.structure == dataset.structure
+    assert result.attributes == {"UNIT": "EUR"}
+    assert result.action == ActionType.Replace
+    assert result.reporting_begin == date(2020, 1, 1)
+    assert result.set_id == "42"
+    pd.testing.assert_frame_equal(result.data, dataset.data)
+    assert result.data["OBS_VALUE"].dtype == pd.ArrowDtype(pa.float64())
+
+
+def test_facets_decoded_to_declared_types(tmp_path):
+    schema = Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [
+                Component(
+                    "FREQ",
+                    True,
+                    Role.DIMENSION,
+                    Concept("FREQ"),
+                    local_facets=Facets(min_length="1", max_length="3"),
+                )
+            ]
+        ),
+        "1.0",
+    )
+    dataset = PandasDataset(
+        structure=schema, data=pd.DataFrame({"FREQ": ["A"]})
+    )
+    output_path = tmp_path / "cache.arrow"
+
+    write(dataset, output_path)
+    result = read(output_path)
+
+    facets = result.structure.components["FREQ"].local_facets
+    assert facets == Facets(min_length=1, max_length=3)
+
+
+def test_decoders_unsupported_type():
+    decoders = getattr(arrow, "__decoders")
+
+    with pytest.raises(NotImplementedError):
+        decoders(Schema, {})
+
+
+def test_round_trip_without_schema(dataset, tmp_path):
+    output_path = tmp_path / "cache.arrow"
+
+    write(dataset, str(output_path), include_schema=False)
+    result = read(str(output_path))
+
+    assert result.structure == "Dataflow=BIS:DF(1.0)"
+    pd.testing.assert_frame_equal(result.data, dataset.data)
+
+
+def test_round_trip_short_urn(tmp_path):
+    dataset = PandasDataset(
+        structure="DataStructure=BIS:BIS_DER(1.0)",
+        data=pd.DataFrame({"FREQ": ["A"], "OBS_VALUE": ["1"]}),
+    )
+    output_path = tmp_path / "nested" / "cache.parquet"
+
+    write(dataset, output_path, "parquet")
+    result = read(output_path)
+
+    assert result.structure == "DataStructure=BIS:BIS_DER(1.0)"
+    assert result.action == ActionType.Information
+    pd.testing.assert_frame_equal(result.data, dataset.data)
+
+
+def test_round_trip_read_dataset(tmp_path):
+    dataset = get_datasets(
+        SAMPLES / "data.xml", SAMPLES / "datastructure.xml"
+    )[0]
+    output_path = tmp_path / "cache.arrow"
+
+    write(dataset, output_path)
+    result = read(output_path)
+
+    assert result.short_urn == dataset.short_urn
+    assert [c.id for c in result.structure.components] == [
+        c.id for c in dataset.structure.components
+    ]
+    assert result.attributes == dataset.attributes
+    pd.testing.assert_frame_equal(result.data, dataset.data)
+
+
+def test_ipc_is_memory_mapped(dataset, tmp_path):
+    output_path = tmp_path / "cache.arrow"
+    write(dataset, output_path)
+
+    allocated = pa.total_allocated_bytes()
+    result = read(output_path)
+
+    # The columns point to the mapped file, not to allocated memory
+    assert pa.total_allocated_bytes() == allocated
+    assert len(result.data) == 3
+
+
+def test_unsupported_format(dataset, tmp_path):
+    with pytest.raises(Invalid, match="not a supported cache format"):
+        write(dataset, tmp_path / "cache.feather", "feather")
+
+
+def test_read_unknown_file(tmp_path):
+    output_path = tmp_path / "cache.csv"
+    output_path.write_text("FREQ,OBS_VALUE\nA,1\n")
+
+    with pytest.raises(Invalid, match="neither an Arrow IPC nor a Parquet"):
+        read(output_path)
+
+
+def test_read_without_metadata(tmp_path):
+    output_path = tmp_path / "cache.arrow"
+    table = pa.table({"FREQ": ["A"]})
+    with pa.ipc.new_file(str(output_path), table.schema) as writer:
+        writer.write_table(table)
+
+    with pytest.raises(Invalid, match="does not contain pysdmx"):
+        read(output_path)
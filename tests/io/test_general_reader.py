@@ -7,7 +7,8 @@ import httpx
 import pytest
 
 import pysdmx.io.input_processor as m
-from pysdmx.errors import Invalid, NotImplemented
+from pysdmx.api.dc.query.util import parse_query
+from pysdmx.errors import Invalid
 from pysdmx.io import read_sdmx
 from pysdmx.io.reader import get_datasets
 from pysdmx.model import (
@@ -511,10 +512,12 @@ def test_get_json21_refmeta(sdmx_json_21_refmeta):
 
 @pytest.mark.json
 def test_get_json2_data(sdmx_json_data):
-    with pytest.raises(
-        NotImplemented, match="This flavour of SDMX-JSON is not supported."
-    ):
-        read_sdmx(sdmx_json_data)
+    result = read_sdmx(sdmx_json_data)
+    assert result.data is not None
+    assert len(result.data) == 1
+    dataset = result.data[0]
+    assert dataset.short_urn == "Dataflow=ECB:EXR(1.0)"
+    assert len(dataset.data) == 4
 
 
 def test_get_datasets_prov_agreement(
@@ -826,3 +829,92 @@ def test_read_multi_datatype_representation_map():
     assert isinstance(m, MultiValueMap)
     assert list(m.source) == ["A", "1"]
     assert list(m.target) == ["X", "9"]
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "tests/io/xml/sdmx21/reader/samples/str_ser.xml",
+        "tests/io/xml/sdmx21/reader/samples/str_ser_group.xml",
+        "tests/io/xml/sdmx21/reader/samples/str_all.xml",
+        "tests/io/xml/sdmx21/reader/samples/gen_ser.xml",
+        "tests/io/xml/sdmx21/reader/samples/gen_all.xml",
+        "tests/io/samples/data_v1.csv",
+        "tests/io/csv/sdmx20/reader/samples/data_v2.csv",
+        "tests/io/csv/sdmx21/reader/samples/data_v21.csv",
+    ],
+)
+def test_read_sdmx_with_filters(file_path):
+    flt = parse_query("TIME_PERIOD >= '2010' AND OBS_STATUS = 'A'")
+
+    full = read_sdmx(file_path, validate=False).data[0].data
+    result = read_sdmx(file_path, validate=False, filters=flt).data[0].data
+
+    expected = full[
+        (full["TIME_PERIOD"] >= "2010") & (full["OBS_STATUS"] == "A")
+    ]
+    assert 0 < len(result) < len(full)
+    assert list(result.index) == list(range(len(result)))
+    assert result.to_dict("records") == expected.to_dict("records")
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "tests/io/xml/sdmx21/reader/samples/str_ser.xml",
+        "tests/io/samples/data_v1.csv",
+        "tests/io/csv/sdmx20/reader/samples/data_v2.csv",
+        "tests/io/csv/sdmx21/reader/samples/data_v21.csv",
+    ],
+)
+def test_read_sdmx_filters_matching_nothing(file_path):
+    flt = parse_query("TIME_PERIOD = '1900'")
+
+    result = read_sdmx(file_path, validate=False, filters=flt).data
+
+    assert len(result) == 1
+    assert result[0].data.empty
+
+
+def test_read_sdmx_filters_applied_per_chunk(monkeypatch):
+    import pysdmx.io.xml.__data_aux as data_aux
+    import pysdmx.io.xml.__ss_aux_reader as ss_aux
+
+    monkeypatch.setattr(data_aux, "READING_CHUNKSIZE", 10)
+    file_path = "tests/io/xml/sdmx21/reader/samples/str_ser.xml"
+    flt = parse_query("TIME_PERIOD = '2010'")
+    concatenated = []
+    original_concat = data_aux.pd.concat
+
+    def spy_concat(frames, **kwargs):
+        concatenated.append(len(frames[1]))
+        return original_concat(frames, **kwargs)
+
+    monkeypatch.setattr(data_aux.pd, "concat", spy_concat)
+
+    compiled = []
+    original_compile = ss_aux.compile_filter
+
+    def spy_compile(filters):
+        compiled.append(filters)
+        return original_compile(filters)
+
+    monkeypatch.setattr(ss_aux, "compile_filter", spy_compile)
+
+    result = read_sdmx(file_path, validate=False, filters=flt).data[0].data
+
+    assert (result["TIME_PERIOD"] == "2010").all()
+    assert max(concatenated) < 10
+    # The filter is compiled once, not once per chunk
+    assert len(concatenated) > 1
+    assert compiled == [flt]
+
+
+def test_get_datasets_with_filters(data_path, structures_path):
+    flt = parse_query("TIME_PERIOD = '2010'")
+
+    result = get_datasets(data_path, structures_path, filters=flt)
+
+    assert len(result) == 1
+    assert 0 < len(result[0].data) < 1000
+    assert (result[0].data["TIME_PERIOD"] == "2010").all()
@@ -13,6 +13,7 @@ from pysdmx.model import (
     Component,
     Components,
     Concept,
+    DataType,
     Role,
     Schema,
 )
@@ -827,6 +828,25 @@ def test_metadata_report_json_to_xml_roundtrip(tmpdir, sample, sdmx_format):
     assert json_reports == from_xml.get_reports()
 
 
+@pytest.mark.parametrize(
+    "sdmx_format",
+    [Format.REFMETA_SDMX_CSV_2_0_0, Format.REFMETA_SDMX_CSV_2_1_0],
+)
+def test_metadata_report_json_to_csv(tmpdir, sdmx_format):
+    reports = read_sdmx(
+        REFMETA_PATH / "mult_reports.json", validate=False
+    ).get_reports()
+
+    out_path = Path(str(tmpdir)) / "reports.csv"
+    write_sdmx(reports, sdmx_format=sdmx_format, output_path=str(out_path))
+
+    result = pd.read_csv(out_path, dtype=str)
+    assert len(result) == len(reports)
+    assert result["METADATASET_ID"].tolist() == [
+        r.short_urn.split("=")[1] for r in reports
+    ]
+
+
 @pytest.mark.parametrize(
     "sdmx_format",
     [
@@ -955,3 +975,58 @@ def test_json_metadata_provider_scheme_roundtrip(sdmx_format):
         jp.get_metadata_provider_schemes()
         == xp.get_metadata_provider_schemes()
     )
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        Format.DATA_SDMX_CSV_1_0_0,
+        Format.DATA_SDMX_CSV_2_0_0,
+        Format.DATA_SDMX_CSV_2_1_0,
+    ],
+)
+def test_csv_float_nan(fmt):
+    schema = Schema(
+        "datastructure",
+        "T",
+        "T",
+        Components(
+            [
+                Component("DIM1", True, Role.DIMENSION, Concept("DIM1")),
+                Component(
+                    "OBS_VALUE",
+                    True,
+                    Role.MEASURE,
+                    Concept("OBS_VALUE"),
+                    local_dtype=DataType.DOUBLE,
+                ),
+                Component(
+                    "ATTR",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("ATTR"),
+                    local_dtype=DataType.DOUBLE,
+                    attachment_level="O",
+                ),
+            ]
+        ),
+        "1.0",
+    )
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "DIM1": ["A", "B"],
+                "OBS_VALUE": ["NaN", "2.5"],
+                "ATTR": ["NaN", "1"],
+            }
+        ),
+    )
+    assert pd.isna(dataset.data["OBS_VALUE"].iloc[0])
+
+    result = pd.read_csv(
+        StringIO(write_sdmx(dataset, fmt)), dtype=str, keep_default_na=False
+    )
+
+    assert result["OBS_VALUE"].tolist() == ["NaN", "2.5"]
+    assert result["ATTR"].tolist() == ["", "1"]
@@ -130,6 +130,17 @@ def test_process_string_to_read_valid_json():
         process_string_to_read('{"key": "value"}')
 
 
+def test_process_string_to_read_json_data_20():
+    message = (
+        '{"meta": {"schema": '
+        '"https://json.sdmx.org/2.0.0/sdmx-json-data-schema.json"}}'
+    )
+
+    _, read_format = process_string_to_read(message)
+
+    assert read_format == Format.DATA_SDMX_JSON_2_0_0
+
+
 def test_process_string_to_read_invalid_json():
     with pytest.raises(Invalid, match="Cannot parse input as SDMX."):
         process_string_to_read('{"key": "value"')
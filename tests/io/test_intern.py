@@ -0,0 +1,113 @@
+from pysdmx.io._intern import InternPool, intern, interning, share
+from pysdmx.model import Code, Codelist
+
+URN = "Codelist=BIS:CL_FREQ(1.0.0)"
+
+
+def _codelist(*codes):
+    return Codelist(
+        "CL_FREQ",
+        agency="BIS",
+        version="1.0.0",
+        items=[Code(c) for c in codes],
+    )
+
+
+def test_intern_final():
+    pool = InternPool()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return _codelist("A", "M")
+
+    with interning(pool):
+        first = intern(URN, factory)
+        second = intern(URN, factory)
+
+    assert first is second
+    assert len(calls) == 1
+    assert len(pool) == 1
+
+
+def test_intern_not_final():
+    pool = InternPool()
+
+    with interning(pool):
+        first = intern("Codelist=BIS:CL_FREQ(1.0)", lambda: _codelist("A"))
+        second = intern("Codelist=BIS:CL_FREQ(1.0)", lambda: _codelist("A"))
+        draft = intern("Codelist=BIS:CL_FREQ(1.0.0-draft)", _codelist)
+
+    assert first == second
+    assert first is not second
+    assert draft is not None
+    assert len(pool) == 0
+
+
+def test_intern_without_pool():
+    first = intern(URN, lambda: _codelist("A"))
+    second = intern(URN, lambda: _codelist("A"))
+
+    assert first is not second
+
+
+def test_share_equal_only():
+    pool = InternPool()
+
+    with interning(pool):
+        first = share(URN, _codelist("A"))
+        same = share(URN, _codelist("A"))
+        other = share(URN, _codelist("M"))
+
+    assert same is first
+    assert other is not first
+    assert [c.id for c in other] == ["M"]
+
+
+def test_shared_kept_apart():
+    pool = InternPool()
+
+    with interning(pool):
+        partial = share(URN, _codelist("A"))
+        complete = intern(URN, lambda: _codelist("A", "M"))
+
+    assert partial is not complete
+    assert len(complete) == 2
+    assert len(pool) == 2
+
+
+def test_clear():
+    pool = InternPool()
+
+    with interning(pool):
+        first = intern(URN, _codelist)
+        pool.clear()
+        second = intern(URN, _codelist)
+
+    assert first is not second
+    assert len(pool) == 1
+
+
+def test_interning_reset():
+    pool = InternPool()
+
+    with interning(pool):
+        with interning(InternPool()):
+            intern(URN, _codelist)
+        intern("Codelist=BIS:CL_AREA(1.0.0)", _codelist)
+    intern("Codelist=BIS:CL_UNIT(1.0.0)", _codelist)
+
+    assert len(pool) == 1
+
+
+def test_invalid_urn_not_shared():
+    pool = InternPool()
+
+    with interning(pool):
+        first = intern("not a urn", _codelist)
+        second = intern("not a urn", _codelist)
+        shared = share("not a urn", first)
+
+    assert first is not second
+    assert shared is first
+    assert len(pool) == 0
@@ -1,9 +1,15 @@
+from datetime import date
+
 import pandas as pd
 import pyarrow as pa
 import pytest
 
 from pysdmx.errors import Invalid
-from pysdmx.io.pd import PandasDataset
+from pysdmx.io.pd import (
+    PandasDataset,
+    stringify_dataframe,
+    stringify_dataset,
+)
 from pysdmx.model import (
     Component,
     Components,
@@ -161,8 +167,9 @@ def test_stringify_dataframe():
     result = stringify_dataframe(ds.data)
     assert result["A"].tolist() == ["1", ""]
     assert result["B"].tolist() == ["x", ""]
-    # All columns should be plain string dtype
-    assert all(result[c].dtype == "object" for c in result.columns)
+    # All columns should be PyArrow string columns
+    str_dtype = pd.ArrowDtype(pa.string())
+    assert all(result[c].dtype == str_dtype for c in result.columns)
 
 
 def test_stringify_dataframe_empty():
@@ -195,3 +202,244 @@ def test_regression_509_all_none_column():
     # Verify no ArrowNotImplementedError on string conversion
     result = ds.data.astype(str)
     assert result["ATTR"].tolist() == ["<NA>", "<NA>"]
+
+
+# --- Incremental and lazy dtype application ---
+
+
+def test_columns_in_target_dtype_are_not_cast():
+    schema = _make_schema(_dim("FREQ"), _msr("OBS_VALUE"))
+    df = pd.DataFrame({"FREQ": ["A"], "OBS_VALUE": ["1.5"]})
+    ds = PandasDataset(structure=schema, data=df)
+    freq = ds.data["FREQ"].array
+    value = ds.data["OBS_VALUE"].array
+
+    ds.structure = schema
+
+    assert ds.data["FREQ"].array is freq
+    assert ds.data["OBS_VALUE"].array is value
+
+
+def test_original_dataframe_not_modified():
+    schema = _make_schema(_dim("FREQ"), _msr("OBS_VALUE"))
+    df = pd.DataFrame({"FREQ": ["A", "M"], "OBS_VALUE": ["1.5", ""]})
+
+    ds = PandasDataset(structure=schema, data=df)
+
+    assert df["OBS_VALUE"].tolist() == ["1.5", ""]
+    assert df["OBS_VALUE"].dtype == object
+    assert ds.data["OBS_VALUE"].tolist()[0] == 1.5
+    assert pd.isna(ds.data["OBS_VALUE"].iloc[1])
+
+
+def test_arrow_string_to_typed_columns():
+    str_dtype = pd.ArrowDtype(pa.string())
+    df = pd.DataFrame(
+        {"ID": ["A", "B", "C"], "VALUE": ["1", "", None]}, dtype=str_dtype
+    )
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df)
+
+    ds.structure = _make_schema(_dim("ID"), _msr("VALUE", DataType.INTEGER))
+
+    assert ds.data["VALUE"].dtype == pd.ArrowDtype(pa.int32())
+    assert ds.data["VALUE"].iloc[0] == 1
+    assert ds.data["VALUE"].isna().tolist() == [False, True, True]
+
+
+def test_mixed_object_column_to_string():
+    df = pd.DataFrame({"A": [1, "x", None, 2.5]})
+
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df)
+
+    assert ds.data["A"].tolist()[:2] == ["1", "x"]
+    assert pd.isna(ds.data["A"].iloc[2])
+    assert ds.data["A"].iloc[3] == "2.5"
+
+
+def test_datetime_column_to_string():
+    df = pd.DataFrame({"A": pd.to_datetime(["2020-01-01", None])})
+
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df)
+
+    assert ds.data["A"].dtype == pd.ArrowDtype(pa.string())
+    assert ds.data["A"].iloc[0] == "2020-01-01"
+    assert pd.isna(ds.data["A"].iloc[1])
+
+
+def test_datetime_strings_to_date():
+    df = pd.DataFrame(
+        {"D": ["2020-01-01T10:00:00", "2020-02-01T00:00:00", ""]}
+    )
+
+    ds = PandasDataset(
+        structure=_make_schema(_dim("D", DataType.DATE)), data=df
+    )
+
+    assert ds.data["D"].dtype == pd.ArrowDtype(pa.date32())
+    assert ds.data["D"].tolist()[:2] == [date(2020, 1, 1), date(2020, 2, 1)]
+    assert pd.isna(ds.data["D"].iloc[2])
+
+
+def test_arrow_strings_to_date():
+    df = pd.DataFrame(
+        {"D": ["2020-01-01T00:00:00", "2020-02-01T10:00:00", ""]},
+        dtype=pd.ArrowDtype(pa.string()),
+    )
+
+    ds = PandasDataset(
+        structure=_make_schema(_dim("D", DataType.DATE)), data=df
+    )
+
+    assert ds.data["D"].dtype == pd.ArrowDtype(pa.date32())
+    assert ds.data["D"].tolist()[:2] == [date(2020, 1, 1), date(2020, 2, 1)]
+    assert pd.isna(ds.data["D"].iloc[2])
+
+
+def test_arrow_strings_to_datetime():
+    df = pd.DataFrame(
+        {"D": ["2020-01-01T10:30:00", ""]},
+        dtype=pd.ArrowDtype(pa.string()),
+    )
+
+    ds = PandasDataset(
+        structure=_make_schema(_dim("D", DataType.DATE_TIME)), data=df
+    )
+
+    assert pa.types.is_timestamp(ds.data["D"].dtype.pyarrow_dtype)
+    assert ds.data["D"].iloc[0] == pd.Timestamp("2020-01-01T10:30:00")
+    assert pd.isna(ds.data["D"].iloc[1])
+
+
+def test_arrow_strings_to_integer():
+    df = pd.DataFrame(
+        {"ID": ["A", "B", "C"], "VALUE": ["1.0", "2", ""]},
+        dtype=pd.ArrowDtype(pa.string()),
+    )
+
+    ds = PandasDataset(
+        structure=_make_schema(_dim("ID"), _msr("VALUE", DataType.INTEGER)),
+        data=df,
+    )
+
+    assert pa.types.is_integer(ds.data["VALUE"].dtype.pyarrow_dtype)
+    assert ds.data["VALUE"].tolist()[:2] == [1, 2]
+    assert pd.isna(ds.data["VALUE"].iloc[2])
+
+
+def test_arrow_integers_to_double():
+    df = pd.DataFrame(
+        {
+            "ID": pd.Series(["A", "B"], dtype=pd.ArrowDtype(pa.string())),
+            "VALUE": pd.Series([1, None], dtype=pd.ArrowDtype(pa.int64())),
+        }
+    )
+
+    ds = PandasDataset(
+        structure=_make_schema(_dim("ID"), _msr("VALUE")), data=df
+    )
+
+    assert ds.data["VALUE"].dtype == pd.ArrowDtype(pa.float64())
+    assert ds.data["VALUE"].iloc[0] == 1.0
+    assert pd.isna(ds.data["VALUE"].iloc[1])
+
+
+def test_categorical_column_to_string():
+    df = pd.DataFrame({"A": pd.Categorical(["x", "y", None])})
+
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df)
+
+    assert ds.data["A"].dtype == pd.ArrowDtype(pa.string())
+    assert ds.data["A"].tolist()[:2] == ["x", "y"]
+
+
+def test_lazy_dtypes_applied_on_first_access():
+    schema = _make_schema(_dim("ID"), _msr("VALUE"))
+    df = pd.DataFrame({"ID": ["A"], "VALUE": ["1.5"]})
+
+    ds = PandasDataset(structure=schema, data=df, lazy=True)
+
+    assert ds.__dict__ == {"_pending_dtypes": True}
+    assert ds.data["VALUE"].dtype == pd.ArrowDtype(pa.float64())
+    assert ds.__dict__ == {}
+
+
+def test_lazy_structure_reassignment():
+    df = pd.DataFrame({"ID": ["A"], "VALUE": ["not_a_number"]})
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df, lazy=True)
+
+    ds.structure = _make_schema(_dim("ID"), _msr("VALUE", DataType.INTEGER))
+
+    with pytest.raises(Invalid, match="Type conversion failed"):
+        ds.data  # noqa: B018
+
+
+def test_stringify_dataframe_formats():
+    schema = _make_schema(
+        _dim("ID"),
+        _msr("VALUE"),
+        _att("FLAG", DataType.BOOLEAN),
+        _att("COUNT", DataType.INTEGER),
+    )
+    df = pd.DataFrame(
+        {
+            "ID": ["A", None],
+            "VALUE": ["1.0", ""],
+            "FLAG": ["true", None],
+            "COUNT": ["1", None],
+        }
+    )
+    ds = PandasDataset(structure=schema, data=df)
+
+    result = stringify_dataframe(ds.data)
+
+    assert result.to_dict(orient="list") == {
+        "ID": ["A", ""],
+        "VALUE": ["1", ""],
+        "FLAG": ["true", ""],
+        "COUNT": ["1", ""],
+    }
+
+
+def test_stringify_dataframe_object_columns():
+    df = pd.DataFrame(
+        {"A": [1, "x", None], "B": pd.Categorical(["y", None, "y"])}
+    )
+
+    result = stringify_dataframe(df)
+
+    assert result["A"].tolist() == ["1", "x", ""]
+    assert result["B"].tolist() == ["y", "", "y"]
+    assert df["A"].tolist() == [1, "x", None]
+
+
+def test_stringify_dataset_is_cached():
+    df = pd.DataFrame({"A": ["x", None]})
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df)
+
+    view = stringify_dataset(ds)
+
+    assert stringify_dataset(ds) is view
+    assert view["A"].tolist() == ["x", ""]
+    # The data of the dataset are left untouched
+    assert pd.isna(ds.data["A"].iloc[1])
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda ds: setattr(ds, "data", ds.data.copy()),
+        lambda ds: ds.data.__setitem__("B", "z"),
+        lambda ds: ds.data.loc.__setitem__((1, "A"), "y"),
+        lambda ds: setattr(ds.data, "columns", ["B"]),
+    ],
+)
+def test_stringify_dataset_cache_invalidation(modify):
+    df = pd.DataFrame({"A": ["x", None]})
+    ds = PandasDataset(structure="Dataflow=BIS:TEST(1.0)", data=df)
+    view = stringify_dataset(ds)
+
+    modify(ds)
+
+    result = stringify_dataset(ds)
+    assert result is not view
+    pd.testing.assert_frame_equal(result, stringify_dataframe(ds.data))
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pysdmx.io._pd_utils import transform_dataframe_for_writing
+from pysdmx.model import Component, Components, Concept, DataType, Role, Schema
+
+COLUMNS = {
+    "OBJECT": pd.Series(["x", "", None, "nan"], dtype=object),
+    "FLOAT": pd.Series([1.0, np.nan, 2.5, None]),
+    "ARROW_FLOAT": pd.Series(
+        [1.0, None, 2.5, 3], dtype=pd.ArrowDtype(pa.float64())
+    ),
+    "ARROW_BOOL": pd.Series(
+        [True, None, False, True], dtype=pd.ArrowDtype(pa.bool_())
+    ),
+    "ARROW_STRING": pd.Series(
+        ["a", "", None, "b"], dtype=pd.ArrowDtype(pa.string())
+    ),
+    "DATETIME": pd.Series(
+        [pd.Timestamp("2020-01-01"), pd.NaT, pd.Timestamp("2021-01-01"), None]
+    ),
+    "MIXED": pd.Series([1, "x", pd.NA, ""], dtype=object),
+}
+
+
+def _schema(required, dtype):
+    return Schema(
+        "dataflow",
+        "BIS",
+        "TEST",
+        Components(
+            [
+                Component(
+                    c,
+                    required,
+                    Role.ATTRIBUTE,
+                    Concept(c),
+                    dtype,
+                    attachment_level="O",
+                )
+                for c in COLUMNS
+            ]
+        ),
+    )
+
+
+# The values written for each column, with N standing for missing values
+EXPECTED = {
+    "OBJECT": ["x", "N", "N", "nan"],
+    "FLOAT": ["1.0", "N", "2.5", "N"],
+    "ARROW_FLOAT": ["1.0", "N", "2.5", "3.0"],
+    "ARROW_BOOL": ["True", "N", "False", "True"],
+    "ARROW_STRING": ["a", "N", "N", "b"],
+    "DATETIME": ["2020-01-01 00:00:00", "N", "2021-01-01 00:00:00", "N"],
+    "MIXED": ["1", "x", "N", "N"],
+}
+
+
+@pytest.mark.parametrize(
+    ("required", "dtype", "null"),
+    [
+        (True, DataType.DOUBLE, "NaN"),
+        (True, DataType.STRING, "#N/A"),
+        (False, DataType.DOUBLE, None),
+        (False, DataType.STRING, None),
+    ],
+)
+def test_transform_values(required, dtype, null):
+    df = pd.DataFrame(COLUMNS)
+
+    result = transform_dataframe_for_writing(df, _schema(required, dtype))
+
+    for col, expected in EXPECTED.items():
+        values = [None if pd.isna(v) else v for v in result[col]]
+        assert values == [null if v == "N" else v for v in expected], col
+
+
+def test_transform_null_representations():
+    df = pd.DataFrame(
+        {
+            "OBJECT": ["", None, "x", "y"],
+            "ARROW_STRING": pd.Series(
+                ["", None, "x", "y"], dtype=pd.ArrowDtype(pa.string())
+            ),
+        }
+    )
+    schema = Schema(
+        "dataflow",
+        "BIS",
+        "TEST",
+        Components(
+            [
+                Component(
+                    "OBJECT", True, Role.MEASURE, Concept("O"), DataType.DOUBLE
+                ),
+                Component("ARROW_STRING", True, Role.DIMENSION, Concept("A")),
+            ]
+        ),
+    )
+
+    result = transform_dataframe_for_writing(df, schema)
+
+    assert result["OBJECT"].tolist() == ["NaN", "NaN", "x", "y"]
+    assert result["ARROW_STRING"].tolist() == ["#N/A", "#N/A", "x", "y"]
+
+
+def test_transform_does_not_modify_input():
+    df = pd.DataFrame({"OBJECT": ["", "x"], "OTHER": [None, 1]})
+
+    result = transform_dataframe_for_writing(
+        df, _schema(True, DataType.STRING)
+    )
+
+    assert result["OBJECT"].tolist() == ["#N/A", "x"]
+    assert df["OBJECT"].tolist() == ["", "x"]
+    assert result["OTHER"].tolist()[1] == 1
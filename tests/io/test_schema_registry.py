@@ -0,0 +1,139 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io import SchemaRegistry, get_datasets, read_sdmx
+from pysdmx.model import Schema
+from pysdmx.util import parse_short_urn
+
+DSD = "DataStructure=BIS:BIS_DER(1.0)"
+
+
+@pytest.fixture
+def data_path():
+    return str(Path(__file__).parent / "samples" / "data.xml")
+
+
+@pytest.fixture
+def structures_path():
+    return str(Path(__file__).parent / "samples" / "datastructure.xml")
+
+
+def test_schema_is_generated_once(structures_path):
+    registry = SchemaRegistry()
+    message = read_sdmx(structures_path, validate=False)
+
+    schema = registry.get_schema(message, DSD)
+
+    assert isinstance(schema, Schema)
+    assert registry.get_schema(message, DSD) is schema
+    assert registry.get_schema(message, parse_short_urn(DSD)) is schema
+
+
+def test_schemas_are_per_message(structures_path):
+    registry = SchemaRegistry()
+    m1 = read_sdmx(structures_path, validate=False)
+    m2 = read_sdmx(structures_path, validate=False)
+
+    s1 = registry.get_schema(m1, DSD)
+    s2 = registry.get_schema(m2, DSD)
+
+    assert s1 is not s2
+    assert s1 == s2
+
+
+def test_errors_are_not_cached(structures_path):
+    registry = SchemaRegistry()
+    message = read_sdmx(structures_path, validate=False)
+    missing = "DataStructure=BIS:MISSING(1.0)"
+
+    for _ in range(2):
+        with pytest.raises(Invalid, match="Missing DataStructure"):
+            registry.get_schema(message, missing)
+
+
+def test_least_recently_used_messages_are_evicted(structures_path):
+    registry = SchemaRegistry(max_messages=1)
+    m1 = read_sdmx(structures_path, validate=False)
+    m2 = read_sdmx(structures_path, validate=False)
+
+    s1 = registry.get_schema(m1, DSD)
+    registry.get_schema(m2, DSD)
+
+    assert registry.get_schema(m1, DSD) is not s1
+
+
+def test_get_datasets_reuses_file_schemas(data_path, structures_path):
+    registry = SchemaRegistry()
+
+    ds1 = get_datasets(data_path, structures_path, registry=registry)
+    ds2 = get_datasets(data_path, structures_path, registry=registry)
+
+    assert ds1[0].structure is ds2[0].structure
+    assert (
+        ds1[0].structure
+        == get_datasets(data_path, structures_path)[0].structure
+    )
+
+
+def test_get_datasets_rereads_modified_files(
+    data_path, structures_path, tmp_path
+):
+    registry = SchemaRegistry()
+    path = tmp_path / "structures.xml"
+    shutil.copy(structures_path, path)
+
+    ds1 = get_datasets(data_path, path, registry=registry)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    ds2 = get_datasets(data_path, path, registry=registry)
+
+    assert ds1[0].structure is not ds2[0].structure
+    assert ds1[0].structure == ds2[0].structure
+
+
+def test_get_datasets_with_structure_message(data_path, structures_path):
+    registry = SchemaRegistry()
+    message = read_sdmx(structures_path)
+
+    ds1 = get_datasets(data_path, message, registry=registry)
+    ds2 = get_datasets(data_path, message, registry=registry)
+    ds3 = get_datasets(data_path, message)
+
+    assert ds1[0].structure is ds2[0].structure
+    assert ds3[0].structure == ds1[0].structure
+    assert len(ds1[0].structure.artefacts) == 26
+
+
+def test_clear(data_path, structures_path):
+    registry = SchemaRegistry()
+
+    ds1 = get_datasets(data_path, structures_path, registry=registry)
+    registry.clear()
+    ds2 = get_datasets(data_path, structures_path, registry=registry)
+
+    assert ds1[0].structure is not ds2[0].structure
+
+
+def test_get_datasets_rereads_strings(data_path, structures_path):
+    registry = SchemaRegistry()
+    with open(structures_path, "r") as f:
+        structures = f.read()
+
+    ds1 = get_datasets(data_path, structures, registry=registry)
+    ds2 = get_datasets(data_path, structures, registry=registry)
+
+    assert ds1[0].structure is not ds2[0].structure
+    assert ds1[0].structure == ds2[0].structure
+
+
+def test_missing_files_are_not_cached(tmp_path):
+    registry = SchemaRegistry()
+    path = tmp_path / "missing.xml"
+
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError):
+            registry.get_structures(path)
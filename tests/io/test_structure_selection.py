@@ -0,0 +1,160 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io import read_sdmx
+from pysdmx.io._structure_selection import Candidate, StructureSelector
+from pysdmx.model import Codelist, ConceptScheme
+
+TESTS = Path(__file__).parent.parent
+SOURCES = {
+    "xml21": (
+        TESTS / "io" / "samples" / "datastructure_descendants.xml",
+        "DataStructure=BIS:BIS_DER(1.0)",
+        "Codelist=BIS:CL_FREQ(1.0)",
+    ),
+    "xml30": (
+        TESTS
+        / "io"
+        / "xml"
+        / "sdmx30"
+        / "reader"
+        / "samples"
+        / "VTL_Sample_1.xml",
+        "DataStructure=SDMX:DS11(1.0)",
+        "Codelist=SDMX:CL_AREA(1.0)",
+    ),
+    "json": (
+        TESTS / "api" / "fmr" / "samples" / "df" / "no_const.json",
+        "DataStructure=BIS:BIS_CBS(1.0)",
+        "Codelist=BIS:CL_FREQ(1.0)",
+    ),
+}
+
+
+@pytest.fixture(params=SOURCES.keys())
+def source(request):
+    return SOURCES[request.param]
+
+
+def __read(path, only=None):
+    return read_sdmx(path, validate=False, only=only)
+
+
+def __urns(message):
+    return sorted(s.short_urn for s in message.structures)
+
+
+def test_select_by_type(source):
+    path, _, _ = source
+    full = __read(path)
+
+    message = __read(path, ["codelist"])
+
+    assert message.structures == full.get_codelists()
+    assert all(isinstance(s, Codelist) for s in message.structures)
+
+
+def test_select_by_short_urn(source):
+    path, _, cl = source
+
+    message = __read(path, [cl])
+
+    assert __urns(message) == [cl]
+    assert message.get_codelist(cl) == __read(path).get_codelist(cl)
+
+
+def test_select_by_item_urn(source):
+    path, _, cl = source
+    urn = f"urn:sdmx:org.sdmx.infomodel.codelist.Code={cl[9:]}.A"
+
+    message = __read(path, [urn, f"{cl}.B"])
+
+    assert __urns(message) == [cl]
+
+
+def test_select_with_dependencies(source):
+    path, dsd, _ = source
+    full = __read(path)
+
+    message = __read(path, [dsd])
+
+    out = message.get_data_structure_definition(dsd)
+    assert out == full.get_data_structure_definition(dsd)
+    assert all(
+        isinstance(s, (Codelist, ConceptScheme)) or s.short_urn == dsd
+        for s in message.structures
+    )
+    for comp in out.components:
+        if comp.local_codes:
+            assert comp.local_codes.short_urn in __urns(message)
+
+
+def test_select_dataflow_with_dependencies():
+    path = SOURCES["xml21"][0]
+
+    message = __read(path, ["Dataflow=BIS:WEBSTATS_DER_DATAFLOW(1.0)"])
+
+    urns = __urns(message)
+    assert "Dataflow=BIS:WEBSTATS_DER_DATAFLOW(1.0)" in urns
+    assert "DataStructure=BIS:BIS_DER(1.0)" in urns
+    assert "ConceptScheme=BIS:BIS_CONCEPT_SCHEME(1.0)" in urns
+    assert "AgencyScheme=SDMX:AGENCIES(1.0)" not in urns
+
+
+def test_select_nothing(source):
+    message = __read(source[0], ["Codelist=BIS:CL_MISSING(1.0)"])
+
+    assert not message.structures
+
+
+def test_select_skips_non_artefacts_xml():
+    content = SOURCES["xml21"][0].read_text()
+    content = content.replace(
+        "<mes:Structures>", '<mes:Structures note="x">', 1
+    )
+    content = content.replace(
+        "<str:Codelists>", '<str:Codelists note="y"><str:Codelist/>', 1
+    )
+
+    message = __read(content, ["Codelist=BIS:CL_FREQ(1.0)"])
+
+    assert __urns(message) == ["Codelist=BIS:CL_FREQ(1.0)"]
+
+
+def test_select_skips_unknown_properties_json():
+    content = json.loads(SOURCES["json"][0].read_text())
+    content["data"]["unknownArtefacts"] = [{"id": "X"}]
+
+    message = __read(json.dumps(content), ["Codelist=BIS:CL_FREQ(1.0)"])
+
+    assert __urns(message) == ["Codelist=BIS:CL_FREQ(1.0)"]
+
+
+def test_invalid_selection():
+    with pytest.raises(Invalid, match="Invalid selection"):
+        StructureSelector.from_query(["Codelist=BIS:CL_FREQ"])
+
+
+def test_select_missing_or_wildcarded_versions():
+    selector = StructureSelector.from_query(["dataflow"])
+    candidates = [
+        Candidate("Dataflow", "A", "DF", "1.0", ["B:CL(2.0)", "B:CS(1.0+)"]),
+        Candidate("Codelist", "B", "CL", "1.0"),
+        Candidate("Codelist", "B", "CL", "2.0", ["B:CL2"]),
+        Candidate("Codelist", "B", "CL2", "3.0"),
+        Candidate("ConceptScheme", "B", "CS", "1.1"),
+        Candidate("ConceptScheme", "C", "CS", "1.1"),
+    ]
+
+    def dependencies(content):
+        for ref in content or ():
+            agency, _, rest = ref.partition(":")
+            aid, _, version = rest.partition("(")
+            yield agency, aid, version[:-1] if version else None
+
+    out = selector.select(candidates, dependencies)
+
+    assert out == [True, False, True, True, True, False]
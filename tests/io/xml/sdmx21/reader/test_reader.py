@@ -10,6 +10,7 @@ from pysdmx.errors import Invalid
 from pysdmx.io import read_sdmx
 from pysdmx.io.format import Format
 from pysdmx.io.input_processor import process_string_to_read
+from pysdmx.io.xml.__data_aux import __merge_groups as merge_groups
 from pysdmx.io.xml.__tokens import OBS_DIM, OBS_VALUE_ID
 from pysdmx.io.xml.sdmx21.reader.error import read as read_error
 from pysdmx.io.xml.sdmx21.reader.generic import read as read_generic
@@ -1550,3 +1551,56 @@ def test_category_scheme_21_enrichment_edge_cases(samples_folder):
         "urn:sdmx:org.sdmx.infomodel.categoryscheme."
         "Category=BIS:CS_ABSENT(1.0).Z"
     )
+
+
+def test_merge_groups_by_group_type():
+    data = pd.DataFrame(
+        {
+            "DIM1": ["A1", "A1", "A2", "A3"],
+            "DIM2": ["B1", "B2", "B1", "B1"],
+            "OBS_VALUE": ["1", "2", "3", "4"],
+        }
+    )
+    groups = pd.DataFrame(
+        [
+            {"DIM1": "A1", "GATTR": "G1"},
+            {"DIM2": "B1", "GATTR": "G2", "OTHER": "O1"},
+            {"DIM1": "A1", "DIM2": "B2", "OTHER": "O2"},
+            {"DIM1": "A1", "GATTR": "IGNORED"},
+            {"DIM1": "A9", "GATTR": "UNMATCHED"},
+        ]
+    )
+
+    result = merge_groups(data, groups)
+
+    assert list(result.columns) == [
+        "DIM1",
+        "DIM2",
+        "OBS_VALUE",
+        "GATTR",
+        "OTHER",
+    ]
+    # The first group providing an attribute for a row wins
+    assert result["GATTR"].tolist() == ["G1", "G1", "G2", "G2"]
+    assert result["OTHER"].tolist() == ["O1", "O2", "O1", "O1"]
+
+
+def test_merge_groups_without_match():
+    data = pd.DataFrame({"DIM1": ["A1", "A2"], "OBS_VALUE": ["1", "2"]})
+    groups = pd.DataFrame([{"DIM1": "A1", "GATTR": "G1"}])
+
+    result = merge_groups(data, groups)
+
+    assert result["GATTR"].tolist()[0] == "G1"
+    assert pd.isna(result["GATTR"][1])
+    pd.testing.assert_frame_equal(merge_groups(data, pd.DataFrame()), data)
+
+
+def test_merge_groups_without_keys():
+    data = pd.DataFrame({"DIM1": ["A1", "A2"], "OBS_VALUE": ["1", "2"]})
+    groups = pd.DataFrame([{"DIM1": None, "GATTR": "G1"}])
+
+    result = merge_groups(data, groups)
+
+    # A group without dimension values matches no rows
+    pd.testing.assert_frame_equal(result, data)
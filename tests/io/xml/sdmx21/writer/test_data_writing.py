@@ -11,6 +11,8 @@ from pysdmx.io import read_sdmx
 from pysdmx.io.format import Format
 from pysdmx.io.input_processor import process_string_to_read
 from pysdmx.io.pd import PandasDataset
+from pysdmx.io.xml.__write_aux import __escape_xml as escape_xml
+from pysdmx.io.xml.__write_data_aux import _group_series
 from pysdmx.io.xml.sdmx21.writer.generic import write as write_gen
 from pysdmx.io.xml.sdmx21.writer.structure_specific import (
     write as write_str_spec,
@@ -1050,3 +1052,73 @@ def test_str_spec_group_attr_mixed_empty_na_emits_single_group():
     )
     assert result.count("<Group ") == 1
     assert 'G_ATT="#N/A"' in result
+
+
+def test_write_does_not_modify_data(content):
+    content = list(content.values())
+    dtypes = content[0].data.dtypes.to_dict()
+
+    result_spe = write_str_spec(content, dimension_at_observation="DIM1")
+    result_gen = write_gen(content, dimension_at_observation="DIM1")
+
+    assert content[0].data.dtypes.to_dict() == dtypes
+    assert read_sdmx(result_spe).data[0].data["ATT2"].tolist() == [
+        "7",
+        "8",
+        "9",
+    ]
+    assert read_sdmx(result_gen).data[0].data["ATT2"].tolist() == [
+        "7",
+        "8",
+        "9",
+    ]
+
+
+def test_group_series():
+    data = pd.DataFrame(
+        {
+            "DIM1": ["B", "A", "B", "A"],
+            "TP": ["2020", "2020", "2021", "2021"],
+            "ATT1": ["", "x", "y", ""],
+        }
+    )
+
+    series, order, bounds = _group_series(data, ["DIM1"], ["ATT1"])
+
+    assert series.to_dict(orient="records") == [
+        {"DIM1": "A", "ATT1": "x"},
+        {"DIM1": "B", "ATT1": "y"},
+    ]
+    assert order.tolist() == [1, 3, 0, 2]
+    assert bounds.tolist() == [0, 2, 4]
+
+
+def test_group_series_conflict():
+    data = pd.DataFrame({"DIM1": ["A", "A"], "ATT1": ["x", "y"]})
+
+    with pytest.raises(Invalid, match=r"'ATT1' has conflicting values"):
+        _group_series(data, ["DIM1"], ["ATT1"])
+
+
+@pytest.mark.parametrize("dim", [None, "DIM2"])
+def test_generic_writer_special_values(header, content, dim):
+    dataset = list(content.values())[0]
+    values = ["<&>", "é ü", "a\\b", "t\tab", 'it\'s "q"']
+    dataset.data = pd.DataFrame(
+        {
+            "DIM1": [1, 1, 1, 1, 1],
+            "DIM2": [1, 2, 3, 4, 5],
+            "ATT1": ["A", "A", "A", "A", "A"],
+            "ATT2": values,
+            "M1": values,
+        }
+    )
+
+    result = write_gen([dataset], header=header, dimension_at_observation=dim)
+
+    # Values are written as repr quotes them (escaped in gen:Value tags)
+    for value in values:
+        escaped = repr(escape_xml(value))[1:-1].replace("'", '"')
+        assert f'<gen:Value id="ATT2" value="{escaped}"/>' in result
+        raw = repr(value)[1:-1].replace("'", '"')
+        assert f'<gen:ObsValue value="{raw}"/>' in result
@@ -10,7 +10,10 @@ from pysdmx.io.input_processor import process_string_to_read
 from pysdmx.io.reader import read_sdmx
 from pysdmx.io.reader import read_sdmx as reader
 from pysdmx.io.writer import write_sdmx
+from pysdmx.io.xml.sdmx30.reader.metadata import iter_read as iter_metadata
+from pysdmx.io.xml.sdmx30.reader.metadata import read as read_metadata
 from pysdmx.io.xml.sdmx30.reader.structure import read as read_structure
+from pysdmx.io.xml.sdmx30.writer.metadata import write as write_metadata
 from pysdmx.model import (
     Agency,
     AgencyScheme,
@@ -38,6 +41,7 @@ from pysdmx.model import (
     Hierarchy,
     ItemReference,
     KeySet,
+    MetadataAttribute,
     Metadataflow,
     MetadataProvider,
     MetadataProviderScheme,
@@ -1506,3 +1510,91 @@ def test_categorisation_30(samples_folder):
         "urn:sdmx:org.sdmx.infomodel.categoryscheme."
         "Category=BIS:CS1(1.0.0).OTHER"
     )
+
+
+@pytest.fixture
+def many_reports():
+    return [
+        MetadataReport(
+            f"RPT{i}",
+            agency="BIS",
+            name=f"Report {i}",
+            metadataflow=(
+                "urn:sdmx:org.sdmx.infomodel.metadatastructure."
+                "Metadataflow=BIS:MDF_TEST(1.0)"
+            ),
+            targets=(
+                "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=BIS:DF(1.0)",
+            ),
+            attributes=(
+                MetadataAttribute(
+                    "CONTACT",
+                    attributes=(
+                        MetadataAttribute("NAME", f"Name <{i}> & co"),
+                    ),
+                ),
+                MetadataAttribute("NOTE", ["a", "b"]),
+            ),
+        )
+        for i in range(50)
+    ]
+
+
+@pytest.mark.xml
+@pytest.mark.parametrize(
+    "sample", ["generic_metadata.xml", "generic_metadata_mpa.xml"]
+)
+def test_iter_generic_metadata_same_as_read(samples_folder, sample):
+    data_path = samples_folder / sample
+    expected = read_metadata(data_path.read_text(), validate=False)
+
+    assert list(iter_metadata(data_path)) == list(expected)
+    assert list(iter_metadata(data_path.read_text())) == list(expected)
+    with open(data_path, "rb") as f:
+        assert list(iter_metadata(f)) == list(expected)
+
+
+@pytest.mark.xml
+def test_iter_generic_metadata_many_reports(many_reports):
+    message = write_metadata(many_reports)
+
+    result = list(iter_metadata(message))
+
+    assert result == list(read_metadata(message, validate=False))
+    assert [r.id for r in result] == [f"RPT{i}" for i in range(50)]
+    assert result[7]["CONTACT.NAME"].value == "Name <7> & co"
+
+
+@pytest.mark.xml
+def test_iter_generic_metadata_is_lazy(many_reports):
+    message = write_metadata(many_reports)
+    truncated = message[: message.index("RPT3") - 50]
+
+    reports = iter_metadata(truncated)
+
+    assert next(reports).id == "RPT0"
+    assert next(reports).id == "RPT1"
+    with pytest.raises(Invalid, match="could not be parsed"):
+        list(reports)
+
+
+@pytest.mark.xml
+def test_iter_generic_metadata_wrong_message(samples_folder):
+    data_path = samples_folder / "metadata_family.xml"
+
+    with pytest.raises(Invalid, match="not SDMX-ML GenericMetadata"):
+        next(iter_metadata(data_path))
+
+
+@pytest.mark.xml
+def test_iter_generic_metadata_21_namespace():
+    message = (
+        '<mes:GenericMetadata xmlns:mes="http://www.sdmx.org/resources/'
+        'sdmxml/schemas/v2_1/message"><mes:Header><mes:ID>ID</mes:ID>'
+        "</mes:Header></mes:GenericMetadata>"
+    )
+
+    assert list(iter_metadata(message)) == []
+    assert list(iter_metadata(message)) == list(
+        read_metadata(message, validate=False)
+    )
@@ -7,6 +7,8 @@ from pysdmx.errors import Invalid
 from pysdmx.io.format import Format
 from pysdmx.io.input_processor import process_string_to_read
 from pysdmx.io.reader import read_sdmx
+from pysdmx.io.xml.sdmx31.reader.metadata import iter_read as iter_metadata
+from pysdmx.io.xml.sdmx31.reader.metadata import read as read_metadata
 from pysdmx.io.xml.sdmx31.reader.structure import read as read_structure
 from pysdmx.model import (
     Categorisation,
@@ -415,6 +417,20 @@ def test_generic_metadata_31(samples_folder):
     assert report["NOTE"].value == "A single note"
 
 
+@pytest.mark.xml
+def test_iter_generic_metadata_31(samples_folder):
+    data_path = samples_folder / "generic_metadata.xml"
+    expected = read_metadata(data_path.read_text(), validate=False)
+
+    reports = list(iter_metadata(data_path))
+
+    assert reports == list(expected)
+    assert reports[0]["CONTACT.EMAIL"].value == [
+        "john@example.org",
+        "doe@example.org",
+    ]
+
+
 @pytest.mark.xml
 def test_category_scheme_31(samples_folder):
     data_path = samples_folder / "category_scheme.xml"
@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pysdmx.io import read_sdmx
+
+SAMPLES = Path(__file__).parent
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        SAMPLES.parent / "samples" / "datastructure_descendants.xml",
+        SAMPLES / "sdmx21" / "reader" / "samples" / "item_scheme.xml",
+        SAMPLES / "sdmx21" / "reader" / "samples" / "category_scheme.xml",
+        SAMPLES / "sdmx21" / "reader" / "samples" / "hierarchy_alias.xml",
+        SAMPLES / "sdmx30" / "reader" / "samples" / "VTL_Sample_1.xml",
+        SAMPLES / "sdmx30" / "reader" / "samples" / "valuelist_enum.xml",
+        SAMPLES / "sdmx31" / "reader" / "samples" / "hierarchy_levels.xml",
+        SAMPLES / "sdmx31" / "reader" / "samples" / "metadata_family.xml",
+    ],
+    ids=lambda p: f"{p.parent.parent.parent.name}-{p.name}",
+)
+def test_concurrent_formatting_matches_sequential(
+    sample, thread_pool, process_pool
+):
+    expected = read_sdmx(sample, validate=False).structures
+
+    threads = read_sdmx(sample, validate=False, executor=thread_pool)
+    processes = read_sdmx(sample, validate=False, executor=process_pool)
+
+    assert threads.structures == expected
+    assert processes.structures == expected
+
+
+def test_concurrent_formatting_with_selection(thread_pool):
+    sample = SAMPLES.parent / "samples" / "datastructure_descendants.xml"
+    only = ["DataStructure=BIS:BIS_DER(1.0)"]
+
+    expected = read_sdmx(sample, validate=False, only=only).structures
+    result = read_sdmx(sample, validate=False, only=only, executor=thread_pool)
+
+    assert result.structures == expected
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io.xml.sdmx21.writer.structure import write as write_21
+from pysdmx.io.xml.sdmx30.writer.structure import write as write_30
+from pysdmx.io.xml.sdmx31.writer.structure import write as write_31
+from pysdmx.model import Annotation, Code, Codelist, Concept, ConceptScheme
+from pysdmx.model.message import Header
+
+HEADER = Header(id="ID", prepared=datetime(2021, 1, 1))
+WRITERS = [write_21, write_30, write_31]
+
+
+@pytest.fixture
+def structures():
+    codelist = Codelist(
+        id="CL_LARGE",
+        agency="BIS",
+        name="Large & long",
+        items=[
+            Code(
+                id=f"C{i}",
+                name=f"Code & {i}",
+                annotations=[Annotation(id="A", text="Text")],
+            )
+            for i in range(2000)
+        ],
+    )
+    concepts = ConceptScheme(
+        id="CS",
+        agency="BIS",
+        name="Concepts",
+        items=[Concept(id="C", name="Concept", codes=codelist)],
+    )
+    return [codelist, concepts]
+
+
+@pytest.mark.parametrize("write", WRITERS)
+def test_file_matches_string(write, structures, tmp_path):
+    path = tmp_path / "structures.xml"
+
+    expected = write(structures, header=HEADER)
+    result = write(structures, output_path=path, header=HEADER)
+
+    assert result is None
+    assert path.read_text(encoding="UTF-8") == expected
+    assert expected.count("<str:Code ") == 2000
+    assert "Code &amp; 1999" in expected
+
+
+@pytest.mark.parametrize("write", WRITERS)
+def test_no_file_left_on_error(write, structures, tmp_path):
+    path = tmp_path / "structures.xml"
+    # Items are streamed, so the error happens after writing started
+    invalid = Codelist(
+        id="CL_INVALID",
+        agency="BIS",
+        name="Invalid",
+        items=[Code(id="A", name="A"), Code(id="B")],
+    )
+
+    with pytest.raises(Invalid, match="Name is required"):
+        write([*structures, invalid], output_path=path, header=HEADER)
+
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("write", WRITERS)
+def test_existing_file_kept_on_error(write, structures, tmp_path):
+    path = tmp_path / "structures.xml"
+    path.write_text("previous", encoding="UTF-8")
+    invalid = Codelist(
+        id="CL_INVALID",
+        agency="BIS",
+        name="Invalid",
+        items=[Code(id="A", name="A"), Code(id="B")],
+    )
+
+    with pytest.raises(Invalid, match="Name is required"):
+        write([*structures, invalid], output_path=path, header=HEADER)
+
+    assert path.read_text(encoding="UTF-8") == "previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("write", WRITERS)
+def test_existing_file_replaced(write, structures, tmp_path):
+    path = tmp_path / "structures.xml"
+    path.write_text("previous", encoding="UTF-8")
+
+    write(structures, output_path=str(path), header=HEADER)
+
+    assert path.read_text(encoding="UTF-8") == write(structures, header=HEADER)
+    assert list(tmp_path.iterdir()) == [path]
@@ -266,3 +266,129 @@ def test_hierarchy_repr(id, name, agency, operator, desc, version, codes):
         "operator='urn:sdmx:org.sdmx.infomodel.transformation.UserDefinedOperator=SDMX:OPS(1.0).SUM')"
     )
     assert r == expected_repr
+
+
+@pytest.fixture
+def shared_codes():
+    grandchild1 = HierarchicalCode("child211", "Child 2.1.1")
+    grandchild2 = HierarchicalCode("child212", "Child 2.1.2")
+    child1 = HierarchicalCode(
+        "child21", "Child 2.1", codes=[grandchild1, grandchild2]
+    )
+    child2 = HierarchicalCode("child22", "Child 2.2", codes=[grandchild1])
+    return [
+        HierarchicalCode("child1", "Child 1"),
+        HierarchicalCode("child2", "Child 2", codes=[child1, child2]),
+    ]
+
+
+def test_paths(id, name, agency, shared_codes):
+    h = Hierarchy(id=id, name=name, agency=agency, codes=shared_codes)
+
+    assert h.paths("child211") == [
+        "child2.child21.child211",
+        "child2.child22.child211",
+    ]
+    assert h.paths("child1") == ["child1"]
+    assert h.paths("unknown") == []
+
+
+def test_parent_and_ancestors(id, name, agency, shared_codes):
+    h = Hierarchy(id=id, name=name, agency=agency, codes=shared_codes)
+
+    assert h.parent("child2.child22.child211") == "child2.child22"
+    assert h.parent("child2") is None
+    assert h.parent("child211") is None
+    assert h.ancestors("child2.child22.child211") == [
+        "child2.child22",
+        "child2",
+    ]
+    assert h.ancestors("child1") == []
+    assert h.ancestors("unknown") == []
+
+
+def test_descendants(id, name, agency, shared_codes):
+    h = Hierarchy(id=id, name=name, agency=agency, codes=shared_codes)
+
+    assert h.descendants("child2") == [
+        "child2.child21",
+        "child2.child21.child211",
+        "child2.child21.child212",
+        "child2.child22",
+        "child2.child22.child211",
+    ]
+    assert h.descendants("child2.child22") == ["child2.child22.child211"]
+    assert h.descendants("child1") == []
+    assert h.descendants("unknown") == []
+
+
+def test_is_ancestor(id, name, agency, shared_codes):
+    h = Hierarchy(id=id, name=name, agency=agency, codes=shared_codes)
+
+    assert h.is_ancestor("child2", "child2.child22.child211")
+    assert h.is_ancestor("child2.child21", "child2.child21.child212")
+    assert not h.is_ancestor("child2.child21", "child2.child22.child211")
+    assert not h.is_ancestor("child2.child22.child211", "child2")
+    assert not h.is_ancestor("child2", "child2")
+    assert not h.is_ancestor("child1", "child2.child21")
+    assert not h.is_ancestor("unknown", "child2")
+
+
+def test_deep_hierarchy(id, name, agency):
+    depth = 5000
+    code = HierarchicalCode(f"c{depth}")
+    for i in reversed(range(depth)):
+        code = HierarchicalCode(f"c{i}", codes=[code])
+    h = Hierarchy(id=id, name=name, agency=agency, codes=[code])
+    leaf = ".".join(f"c{i}" for i in range(depth + 1))
+
+    assert len(h) == depth + 1
+    assert h[leaf].id == f"c{depth}"
+    assert h.paths(f"c{depth}") == [leaf]
+    assert len(h.ancestors(leaf)) == depth
+    assert h.is_ancestor("c0", leaf)
+    assert len(h.all_codes()) == depth + 1
+
+
+def test_index_does_not_affect_equality(id, name, agency, codes):
+    h1 = Hierarchy(id=id, name=name, agency=agency, codes=codes)
+    h2 = Hierarchy(id=id, name=name, agency=agency, codes=codes)
+
+    assert h1["child2.child21"] is not None
+
+    assert h1 == h2
+    assert msgspec.msgpack.Encoder().encode(
+        h1
+    ) == msgspec.msgpack.Encoder().encode(h2)
+
+
+def test_duplicated_code_under_same_parent(id, name, agency):
+    first = HierarchicalCode("1", codes=[HierarchicalCode("11")])
+    second = HierarchicalCode(
+        "1",
+        codes=[HierarchicalCode("12", codes=[HierarchicalCode("121")])],
+    )
+
+    h = Hierarchy(id=id, name=name, agency=agency, codes=[first, second])
+
+    assert len(h) == 5
+    assert [c.id for c in h.all_codes()] == ["1", "11", "1", "12", "121"]
+    # The first code with the ID is the one found by path
+    assert h["1"] is first
+    assert h.paths("12") == []
+
+
+def test_cached(id, name, agency, codes):
+    h1 = Hierarchy(id=id, name=name, agency=agency, codes=codes)
+    h2 = Hierarchy(id=id, name=name, agency=agency, codes=codes)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    value = h1._cached("key", factory)
+
+    assert h1._cached("key", factory) is value
+    assert len(calls) == 1
+    assert h1 == h2
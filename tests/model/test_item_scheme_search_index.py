@@ -0,0 +1,153 @@
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.model import (
+    Code,
+    Codelist,
+    ConceptScheme,
+    HierarchicalCode,
+    Hierarchy,
+)
+from pysdmx.model.concept import Concept
+
+
+@pytest.fixture
+def codelist():
+    return Codelist(
+        "CL_AREA",
+        agency="BIS",
+        items=[
+            Code("XM", name="Euro area"),
+            Code("CI", name="Côte d'Ivoire"),
+            Code("EU", name="European Union", description="Euro users"),
+            Code("EA", name="Euro"),
+            Code("NEU", name="Non-European countries"),
+            Code("NE", name="Neuro"),
+        ],
+    )
+
+
+def __ids(items):
+    return [i.id for i in items]
+
+
+def test_ranked_by_match_quality(codelist):
+    result = codelist.search("euro")
+
+    assert __ids(result) == ["EA", "XM", "EU", "NEU", "NE"]
+
+
+def test_name_before_description(codelist):
+    result = codelist.search("users")
+
+    assert __ids(result) == ["EU"]
+
+    result = codelist.search("eur", fields="description")
+
+    assert __ids(result) == ["EU"]
+
+
+def test_accents_ignored(codelist):
+    assert __ids(codelist.search("cote")) == ["CI"]
+    assert __ids(codelist.search("CÔTE D'IV")) == ["CI"]
+
+
+def test_prefix(codelist):
+    result = codelist.search("euro", prefix=True)
+
+    assert __ids(result) == ["EA", "XM", "EU", "NEU"]
+
+
+def test_prefix_several_words(codelist):
+    assert __ids(codelist.search("euro ar", prefix=True)) == ["XM"]
+    assert __ids(codelist.search("uro ar", prefix=True)) == []
+    assert __ids(codelist.search("uro ar")) == ["XM"]
+
+
+def test_query_across_words(codelist):
+    assert __ids(codelist.search("o are")) == ["XM"]
+    assert __ids(codelist.search("n-eur")) == ["NEU"]
+
+
+def test_no_match(codelist):
+    assert codelist.search("asia") == []
+
+
+def test_regex_on_original_text(codelist):
+    result = codelist.search("^Euro", use_regex=True)
+
+    assert __ids(result) == ["EA", "XM", "EU"]
+    assert codelist.search("^euro", use_regex=True) == []
+
+
+def test_regex_prefix_ignored(codelist):
+    result = codelist.search("Union$", use_regex=True, prefix=True)
+
+    assert __ids(result) == ["EU"]
+
+
+def test_index_built_once(codelist):
+    codelist.search("euro")
+    index = codelist.__dict__["_search"]
+
+    codelist.search("area")
+
+    assert codelist.__dict__["_search"] is index
+
+
+def test_index_not_part_of_equality(codelist):
+    other = Codelist("CL_AREA", agency="BIS", items=codelist.items)
+
+    codelist.search("euro")
+
+    assert codelist == other
+
+
+def test_concept_scheme():
+    cs = ConceptScheme(
+        "CS",
+        agency="BIS",
+        items=[
+            Concept("FREQ", name="Frequency"),
+            Concept("CUR", name="Currency"),
+        ],
+    )
+
+    assert __ids(cs.search("cy")) == ["FREQ", "CUR"]
+
+
+def test_large_codelist():
+    codes = [Code(f"C{i}", name=f"Code number {i}") for i in range(20000)]
+    codelist = Codelist("CL", agency="BIS", items=codes)
+
+    assert __ids(codelist.search("number 19999")) == ["C19999"]
+    assert len(codelist.search("number 1999", prefix=True)) == 11
+
+
+@pytest.fixture
+def hierarchy():
+    de = HierarchicalCode("DE", name="Germany")
+    fr = HierarchicalCode("FR", name="France")
+    return Hierarchy(
+        "H_AREA",
+        agency="BIS",
+        codes=[
+            HierarchicalCode(
+                "EU",
+                name="European Union",
+                codes=[de, fr, HierarchicalCode("XM", name="Euro area")],
+            ),
+            HierarchicalCode("EA", name="Euro area", codes=[de, fr]),
+        ],
+    )
+
+
+def test_hierarchy_search(hierarchy):
+    assert __ids(hierarchy.search("germ")) == ["DE"]
+    assert __ids(hierarchy.search("euro area")) == ["XM", "EA"]
+    assert __ids(hierarchy.search("^F", use_regex=True)) == ["FR"]
+
+
+def test_hierarchy_search_empty(hierarchy):
+    with pytest.raises(Invalid):
+        hierarchy.search("")
@@ -338,3 +338,34 @@ def test_no_metadata_report():
 
     with pytest.raises(NotFound):
         msg.get_reports()
+
+
+def test_structure_lookups_are_indexed():
+    cls = [Codelist(id=f"CL_{i}", agency="BIS") for i in range(100)]
+    cs = ConceptScheme(id="CS", agency="BIS")
+    message = Message(structures=[*cls, cs])
+
+    for cl in cls:
+        assert message.get_codelist(cl.short_urn) is cl
+    assert message.get_concept_scheme(cs.short_urn) is cs
+    assert message.get_codelists() == cls
+    assert message.get_concept_schemes() == [cs]
+
+    # Returned lists are copies, the index cannot be altered
+    message.get_codelists().clear()
+    assert message.get_codelists() == cls
+
+    with pytest.raises(NotFound):
+        message.get_codelist("Codelist=BIS:MISSING(1.0)")
+
+
+def test_indexed_message_equality_and_repr():
+    cl = Codelist(id="CL_FREQ", agency="BIS")
+    message = Message(structures=[cl])
+    other = Message(structures=[cl])
+    before = repr(message)
+
+    message.get_codelist(cl.short_urn)
+
+    assert message == other
+    assert repr(message) == before
@@ -0,0 +1,274 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.io.pd import PandasDataset
+from pysdmx.model import (
+    Component,
+    Components,
+    Concept,
+    HierarchicalCode,
+    Hierarchy,
+    Role,
+    Schema,
+)
+from pysdmx.toolkit.pd import aggregate, check_aggregates
+
+
+@pytest.fixture
+def hierarchy():
+    de = HierarchicalCode("DE")
+    fr = HierarchicalCode("FR")
+    us = HierarchicalCode("US")
+    return Hierarchy(
+        id="H_AREA",
+        agency="BIS",
+        codes=[
+            HierarchicalCode(
+                "W",
+                codes=[
+                    HierarchicalCode("EU", codes=[de, fr]),
+                    HierarchicalCode("NA", codes=[us]),
+                ],
+            ),
+            HierarchicalCode("EA", codes=[de, fr]),
+        ],
+    )
+
+
+@pytest.fixture
+def schema(hierarchy):
+    return Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [
+                Component(
+                    "REF_AREA",
+                    True,
+                    Role.DIMENSION,
+                    Concept("REF_AREA"),
+                    local_codes=hierarchy,
+                ),
+                Component("TIME_PERIOD", True, Role.DIMENSION, Concept("TP")),
+                Component(
+                    "OBS_VALUE",
+                    False,
+                    Role.MEASURE,
+                    Concept("OBS_VALUE"),
+                ),
+                Component(
+                    "OBS_STATUS",
+                    False,
+                    Role.ATTRIBUTE,
+                    Concept("OBS_STATUS"),
+                    attachment_level="O",
+                ),
+            ]
+        ),
+    )
+
+
+@pytest.fixture
+def dataset(schema):
+    return PandasDataset(
+        structure=schema,
+        data=pd.DataFrame(
+            {
+                "REF_AREA": ["DE", "FR", "US", "DE", "W", "EU", "EU", "CH"],
+                "TIME_PERIOD": [
+                    "2020",
+                    "2020",
+                    "2020",
+                    "2021",
+                    "2020",
+                    "2020",
+                    "2021",
+                    "2020",
+                ],
+                "OBS_VALUE": ["1", "2", "4", "8", "7", "3.5", "", "100"],
+                "OBS_STATUS": ["A"] * 8,
+            }
+        ),
+    )
+
+
+def __by_key(df):
+    return {
+        (a, t): v
+        for a, t, v in zip(df["REF_AREA"], df["TIME_PERIOD"], df["OBS_VALUE"])
+    }
+
+
+def test_aggregate(dataset):
+    result = aggregate(dataset, "REF_AREA")
+
+    assert list(result.columns) == ["REF_AREA", "TIME_PERIOD", "OBS_VALUE"]
+    assert __by_key(result) == {
+        ("W", "2020"): 7.0,
+        ("EU", "2020"): 3.0,
+        ("NA", "2020"): 4.0,
+        ("EA", "2020"): 3.0,
+        ("W", "2021"): 8.0,
+        ("EU", "2021"): 8.0,
+        ("EA", "2021"): 8.0,
+    }
+
+
+def test_aggregate_numeric_measure(dataset, hierarchy):
+    dataset.data = dataset.data.astype(
+        {"OBS_VALUE": pd.ArrowDtype(pa.float64())}
+    )
+
+    result = aggregate(dataset, "REF_AREA", hierarchy, "OBS_VALUE")
+
+    assert __by_key(result)[("W", "2020")] == 7.0
+
+
+def test_aggregate_missing_values(dataset):
+    dataset.data.loc[3, "OBS_VALUE"] = ""
+
+    result = __by_key(aggregate(dataset, "REF_AREA"))
+
+    assert pd.isna(result[("W", "2021")])
+    assert result[("W", "2020")] == 7.0
+
+
+def test_aggregate_shared_code_counted_per_path():
+    de = HierarchicalCode("DE")
+    hierarchy = Hierarchy(
+        id="H",
+        agency="BIS",
+        codes=[
+            HierarchicalCode(
+                "W",
+                codes=[
+                    HierarchicalCode("EU", codes=[de]),
+                    HierarchicalCode("EA", codes=[de]),
+                ],
+            )
+        ],
+    )
+    schema = Schema(
+        "dataflow",
+        "BIS",
+        "DF",
+        Components(
+            [
+                Component("REF_AREA", True, Role.DIMENSION, Concept("A")),
+                Component("OBS_VALUE", False, Role.MEASURE, Concept("O")),
+            ]
+        ),
+    )
+    dataset = PandasDataset(
+        structure=schema,
+        data=pd.DataFrame({"REF_AREA": ["DE"], "OBS_VALUE": [2.0]}),
+    )
+
+    result = aggregate(dataset, "REF_AREA", hierarchy)
+
+    assert dict(zip(result["REF_AREA"], result["OBS_VALUE"])) == {
+        "W": 4.0,
+        "EU": 2.0,
+        "EA": 2.0,
+    }
+
+
+def test_check_aggregates(dataset):
+    result = check_aggregates(dataset, "REF_AREA")
+
+    assert list(result.columns) == [
+        "REF_AREA",
+        "TIME_PERIOD",
+        "OBS_VALUE",
+        "EXPECTED",
+        "DIFFERENCE",
+    ]
+    assert result.to_dict("records") == [
+        {
+            "REF_AREA": "EU",
+            "TIME_PERIOD": "2020",
+            "OBS_VALUE": 3.5,
+            "EXPECTED": 3.0,
+            "DIFFERENCE": 0.5,
+        }
+    ]
+
+
+def test_check_aggregates_tolerance(dataset):
+    assert check_aggregates(dataset, "REF_AREA", abs_tol=0.5).empty
+    assert check_aggregates(dataset, "REF_AREA", rel_tol=0.2).empty
+    assert len(check_aggregates(dataset, "REF_AREA", rel_tol=0.1)) == 1
+
+
+def test_rollup_cached(dataset, hierarchy):
+    aggregate(dataset, "REF_AREA", hierarchy)
+    table = hierarchy._cached("rollup", pd.DataFrame)
+
+    aggregate(dataset, "REF_AREA", hierarchy)
+
+    assert hierarchy._cached("rollup", pd.DataFrame) is table
+    assert "_rollup" not in hierarchy.__dict__
+
+
+def test_aggregate_parent_with_several_nodes(schema, dataset):
+    # EU is attached twice, with different children
+    hierarchy = Hierarchy(
+        id="H_AREA",
+        agency="BIS",
+        codes=[
+            HierarchicalCode("W", codes=[HierarchicalCode("EU")]),
+            HierarchicalCode(
+                "X",
+                codes=[
+                    HierarchicalCode(
+                        "EU",
+                        codes=[HierarchicalCode("DE"), HierarchicalCode("FR")],
+                    )
+                ],
+            ),
+        ],
+    )
+
+    result = aggregate(dataset, "REF_AREA", hierarchy)
+
+    assert __by_key(result) == {
+        ("EU", "2020"): 3.0,
+        ("X", "2020"): 3.0,
+        ("EU", "2021"): 8.0,
+        ("X", "2021"): 8.0,
+    }
+
+
+def test_missing_schema():
+    dataset = PandasDataset(
+        structure="Dataflow=BIS:DF(1.0)",
+        data=pd.DataFrame({"REF_AREA": ["DE"], "OBS_VALUE": [1.0]}),
+    )
+
+    with pytest.raises(Invalid, match="Schema is needed"):
+        aggregate(dataset, "REF_AREA")
+
+
+def test_unknown_dimension(dataset):
+    with pytest.raises(Invalid, match="not a dimension"):
+        aggregate(dataset, "OBS_STATUS")
+
+
+def test_unknown_measure(dataset):
+    with pytest.raises(Invalid, match="not a measure"):
+        aggregate(dataset, "REF_AREA", measure="OBS_CONF")
+
+
+def test_missing_hierarchy(dataset):
+    with pytest.raises(Invalid, match="No hierarchy"):
+        aggregate(dataset, "TIME_PERIOD")
+
+
+def test_non_numeric_values(dataset):
+    dataset.data.loc[0, "OBS_VALUE"] = "N/A"
+
+    with pytest.raises(Invalid, match="not numbers"):
+        check_aggregates(dataset, "REF_AREA")
@@ -0,0 +1,219 @@
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pysdmx.api.dc.query import (
+    BooleanFilter,
+    DateTimeFilter,
+    LogicalOperator,
+    MultiFilter,
+    NotFilter,
+    NullFilter,
+    NumberFilter,
+    Operator,
+    TextFilter,
+)
+from pysdmx.api.dc.query.util import parse_query
+from pysdmx.errors import Invalid
+from pysdmx.toolkit.pd import compile_filter, filter_data
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "FREQ": ["A", "M", "Q", None, ""],
+            "OBS_VALUE": ["1", "2.5", "", "7", "3"],
+            "TIME_PERIOD": ["2019", "2020-01", "2021-Q1", "2022", "2020"],
+            "FLAG": ["true", "false", "", "1", None],
+        }
+    )
+
+
+def __rows(df, flt, **kwargs):
+    return list(filter_data(df, flt, **kwargs).index)
+
+
+@pytest.mark.parametrize(
+    ("operator", "value", "expected"),
+    [
+        (Operator.EQUALS, "A", [0]),
+        (Operator.NOT_EQUALS, "A", [1, 2]),
+        (Operator.GREATER_THAN, "M", [2]),
+        (Operator.GREATER_THAN_OR_EQUAL, "M", [1, 2]),
+        (Operator.LESS_THAN, "M", [0]),
+        (Operator.LESS_THAN_OR_EQUAL, "M", [0, 1]),
+        (Operator.IN, ["A", "Q"], [0, 2]),
+        (Operator.NOT_IN, ["A", "Q"], [1]),
+        (Operator.BETWEEN, ["B", "Z"], [1, 2]),
+        (Operator.NOT_BETWEEN, ["B", "Z"], [0]),
+        (Operator.LIKE, "a%", [0]),
+        (Operator.NOT_LIKE, "a*", [1, 2]),
+    ],
+)
+def test_text_filter(df, operator, value, expected):
+    assert __rows(df, TextFilter("FREQ", operator, value)) == expected
+
+
+def test_like_case_sensitive(df):
+    flt = TextFilter("FREQ", Operator.LIKE, "a%")
+
+    assert __rows(df, flt, case_sensitive=True) == []
+
+
+def test_like_single_char(df):
+    flt = TextFilter("TIME_PERIOD", Operator.LIKE, "2020-__")
+
+    assert __rows(df, flt) == [1]
+
+
+@pytest.mark.parametrize(
+    ("operator", "value", "expected"),
+    [
+        (Operator.EQUALS, 7, [3]),
+        (Operator.GREATER_THAN, 2, [1, 3, 4]),
+        (Operator.LESS_THAN_OR_EQUAL, 2.5, [0, 1]),
+        (Operator.IN, [1, 3], [0, 4]),
+        (Operator.BETWEEN, [2, 3], [1, 4]),
+        (Operator.NOT_BETWEEN, [2, 3], [0, 3]),
+    ],
+)
+def test_number_filter_on_strings(df, operator, value, expected):
+    assert __rows(df, NumberFilter("OBS_VALUE", operator, value)) == expected
+
+
+def test_number_filter_on_numbers():
+    df = pd.DataFrame({"OBS_VALUE": pd.array([1, None, 3], dtype="Int64")})
+    flt = NumberFilter("OBS_VALUE", Operator.NOT_EQUALS, 1)
+
+    assert __rows(df, flt) == [2]
+
+
+def test_datetime_filter():
+    df = pd.DataFrame(
+        {"T": pd.to_datetime(["2019-01-01", "2021-01-01", None])}
+    )
+    flt = DateTimeFilter("T", Operator.GREATER_THAN, datetime(2020, 1, 1))
+
+    assert __rows(df, flt) == [1]
+
+
+def test_datetime_filter_on_strings_with_timezone():
+    df = pd.DataFrame({"T": ["2020-01-01T00:00:00", "2020-01-02T00:00:00"]})
+    flt = DateTimeFilter(
+        "T",
+        Operator.BETWEEN,
+        [
+            datetime(2020, 1, 1, 12, tzinfo=timezone.utc),
+            datetime(2020, 1, 3, tzinfo=timezone.utc),
+        ],
+    )
+
+    assert __rows(df, flt) == [1]
+
+
+def test_boolean_filter(df):
+    assert __rows(df, BooleanFilter("FLAG", Operator.EQUALS, True)) == [0, 3]
+    assert __rows(df, BooleanFilter("FLAG", Operator.NOT_EQUALS, True)) == [1]
+
+
+def test_boolean_filter_invalid_operator():
+    with pytest.raises(Invalid, match="Invalid operator"):
+        compile_filter(BooleanFilter("FLAG", Operator.GREATER_THAN, True))
+
+
+def test_null_filter(df):
+    assert __rows(df, NullFilter("FREQ", Operator.NULL)) == [3, 4]
+    assert __rows(df, NullFilter("FREQ", Operator.NOT_NULL)) == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    ("operator", "expected"),
+    [(Operator.NULL, [3, 4]), (Operator.NOT_NULL, [0, 1, 2])],
+)
+def test_text_filter_null_operators(df, operator, expected):
+    assert __rows(df, TextFilter("FREQ", operator, "")) == expected
+
+
+def test_boolean_filter_on_booleans():
+    data = pd.DataFrame({"FLAG": pd.array([True, False, None], "boolean")})
+
+    assert __rows(data, BooleanFilter("FLAG", Operator.EQUALS, False)) == [1]
+
+
+def test_missing_column_is_null(df):
+    assert __rows(df, NullFilter("OTHER", Operator.NULL)) == [0, 1, 2, 3, 4]
+    assert __rows(df, TextFilter("OTHER", Operator.NOT_EQUALS, "A")) == []
+
+
+def test_not_filter_keeps_unknown_out(df):
+    flt = NotFilter(TextFilter("FREQ", Operator.EQUALS, "A"))
+
+    assert __rows(df, flt) == [1, 2]
+
+
+def test_multi_filter_and(df):
+    flt = parse_query("FREQ IN ('A', 'M') AND OBS_VALUE > 2")
+
+    assert __rows(df, flt) == [1]
+
+
+def test_multi_filter_or(df):
+    flt = MultiFilter(
+        [
+            TextFilter("FREQ", Operator.EQUALS, "A"),
+            NumberFilter("OBS_VALUE", Operator.GREATER_THAN, 5),
+        ],
+        LogicalOperator.OR,
+    )
+
+    assert __rows(df, flt) == [0, 3]
+
+
+def test_nested_filters(df):
+    flt = MultiFilter(
+        [
+            NotFilter(
+                MultiFilter(
+                    [
+                        TextFilter("FREQ", Operator.EQUALS, "A"),
+                        TextFilter("FREQ", Operator.EQUALS, "Q"),
+                    ],
+                    LogicalOperator.OR,
+                )
+            ),
+            NullFilter("FREQ", Operator.NOT_NULL),
+        ]
+    )
+
+    assert __rows(df, flt) == [1]
+
+
+def test_empty_multi_filter(df):
+    assert __rows(df, MultiFilter([])) == [0, 1, 2, 3, 4]
+
+
+def test_arrow_and_categorical_columns(df):
+    flt = TextFilter("FREQ", Operator.GREATER_THAN_OR_EQUAL, "M")
+
+    arrow = df.astype(pd.ArrowDtype(pa.string()))
+    categorical = df.astype({"FREQ": "category"})
+
+    assert __rows(arrow, flt) == [1, 2]
+    assert __rows(categorical, flt) == [1, 2]
+
+
+def test_compiled_filter_is_reusable(df):
+    predicate = compile_filter(TextFilter("FREQ", Operator.EQUALS, "M"))
+
+    mask = predicate(df)
+
+    assert mask.dtype == bool
+    assert mask.tolist() == [False, True, False, False, False]
+    assert predicate(df.iloc[:1]).tolist() == [False]
+
+
+def test_no_filter(df):
+    assert filter_data(df, None) is df
@@ -0,0 +1,197 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.model import MetadataAttribute, MetadataReport
+from pysdmx.toolkit.pd import frame_to_reports, reports_to_frame
+
+MDF = "urn:sdmx:org.sdmx.infomodel.metadatastructure.Metadataflow=BIS:MDF(1.0)"
+TARGET = "urn:sdmx:org.sdmx.infomodel.datastructure.Dataflow=BIS:DF(1.0)"
+
+
+@pytest.fixture
+def reports():
+    return [
+        MetadataReport(
+            id="R1",
+            agency="BIS",
+            version="1.0",
+            name="First report",
+            metadataflow=MDF,
+            targets=(TARGET,),
+            attributes=(
+                MetadataAttribute(
+                    "CONTACT",
+                    attributes=(
+                        MetadataAttribute("NAME", "Jane"),
+                        MetadataAttribute("EMAIL", ["jane@x.org", "j@x.org"]),
+                    ),
+                ),
+                MetadataAttribute("TITLE", {"en": "Title", "fr": "Titre"}),
+                MetadataAttribute("COUNT", 3),
+            ),
+        ),
+        MetadataReport(
+            id="R2",
+            agency="BIS",
+            version="1.0",
+            name="Second report",
+            attributes=(
+                MetadataAttribute("COUNT", 4),
+                MetadataAttribute("EMPTY"),
+            ),
+        ),
+    ]
+
+
+def test_reports_to_frame(reports):
+    df = reports_to_frame(reports)
+
+    assert list(df.columns) == [
+        "REPORT",
+        "ATTRIBUTE",
+        "POSITION",
+        "VALUE",
+        "LANG",
+    ]
+    assert (
+        df["REPORT"].tolist()
+        == ["MetadataReport=BIS:R1(1.0)"] * 7
+        + ["MetadataReport=BIS:R2(1.0)"] * 2
+    )
+    assert df["ATTRIBUTE"].tolist() == [
+        "CONTACT",
+        "CONTACT.NAME",
+        "CONTACT.EMAIL",
+        "CONTACT.EMAIL",
+        "TITLE",
+        "TITLE",
+        "COUNT",
+        "COUNT",
+        "EMPTY",
+    ]
+    assert df["POSITION"].tolist() == [0, 1, 2, 2, 3, 3, 4, 0, 1]
+    assert df["VALUE"].tolist() == [
+        None,
+        "Jane",
+        "jane@x.org",
+        "j@x.org",
+        "Title",
+        "Titre",
+        3,
+        4,
+        None,
+    ]
+    assert df["LANG"].isna().tolist() == [
+        True,
+        True,
+        True,
+        True,
+        False,
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert df["LANG"].iloc[4:6].tolist() == ["en", "fr"]
+
+
+def test_reports_to_frame_analysis(reports):
+    df = reports_to_frame(reports)
+
+    counts = df[df["VALUE"].notna()].groupby("REPORT")["ATTRIBUTE"].nunique()
+
+    assert counts.to_dict() == {
+        "MetadataReport=BIS:R1(1.0)": 4,
+        "MetadataReport=BIS:R2(1.0)": 1,
+    }
+
+
+def test_reports_to_frame_empty():
+    df = reports_to_frame([])
+
+    assert df.empty
+    assert len(df.columns) == 5
+
+
+def test_round_trip(reports):
+    result = frame_to_reports(reports_to_frame(reports), reports)
+
+    assert result == reports
+
+
+def test_round_trip_without_reports(reports):
+    result = frame_to_reports(reports_to_frame(reports))
+
+    assert [r.short_urn for r in result] == [r.short_urn for r in reports]
+    assert result[0].attributes == reports[0].attributes
+    assert result[0].name is None
+
+
+def test_round_trip_filtered(reports):
+    df = reports_to_frame(reports)
+    df = df[df["ATTRIBUTE"] != "CONTACT.EMAIL"]
+    df.loc[df["ATTRIBUTE"] == "COUNT", "VALUE"] = 5
+
+    result = frame_to_reports(df, reports)
+
+    assert result[0]["CONTACT"].attributes == (
+        MetadataAttribute("NAME", "Jane"),
+    )
+    assert result[0]["COUNT"].value == 5
+    assert result[1]["COUNT"].value == 5
+
+
+def test_repeated_localised_values():
+    report = MetadataReport(
+        id="R",
+        agency="BIS",
+        attributes=(
+            MetadataAttribute(
+                "NOTE", [{"en": "One", "fr": "Un"}, {"en": "Two"}, "Three"]
+            ),
+        ),
+    )
+
+    result = frame_to_reports(reports_to_frame([report]), [report])
+
+    assert result == [report]
+
+
+def test_deep_report():
+    attr = MetadataAttribute("LEAF", "x")
+    for _ in range(5000):
+        attr = MetadataAttribute("NODE", attributes=(attr,))
+    report = MetadataReport(id="R", agency="BIS", attributes=(attr,))
+
+    df = reports_to_frame([report])
+    result = frame_to_reports(df, [report])
+
+    assert len(df) == 5001
+    attr, depth = result[0].attributes[0], 0
+    while attr.attributes:
+        attr, depth = attr.attributes[0], depth + 1
+    assert (attr.id, attr.value, depth) == ("LEAF", "x", 5000)
+
+
+def test_missing_columns(reports):
+    df = reports_to_frame(reports).drop(columns="LANG")
+
+    with pytest.raises(Invalid, match="not a flattened collection"):
+        frame_to_reports(df)
+
+
+def test_unknown_report(reports):
+    df = reports_to_frame(reports)
+
+    with pytest.raises(Invalid, match="not one of the supplied reports"):
+        frame_to_reports(df, reports[:1])
+
+
+def test_frame_dtypes(reports):
+    df = reports_to_frame(reports)
+
+    assert df["REPORT"].dtype == pd.ArrowDtype(pa.string())
+    assert df["POSITION"].dtype == pd.ArrowDtype(pa.int32())
+    assert df["VALUE"].dtype == object
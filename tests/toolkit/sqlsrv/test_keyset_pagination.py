@@ -0,0 +1,175 @@
+import sqlite3
+
+import pytest
+
+from pysdmx.api.dc.query import NumberFilter, Operator, TextFilter
+from pysdmx.errors import Invalid
+from pysdmx.toolkit.sqlsrv import (
+    get_keyset_clause,
+    get_keyset_statement,
+    get_partition_bounds_statement,
+    get_partition_statements,
+)
+
+KEYS = ["FREQ", "REF_AREA"]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("ATTACH DATABASE ':memory:' AS dbo")
+    conn.execute(
+        'CREATE TABLE dbo.T ("FREQ" TEXT, "REF_AREA" TEXT, "VAL" INT)'
+    )
+    rows = [
+        (f, a, i)
+        for i, (f, a) in enumerate(
+            (f, a) for f in ("A", "M", "Q") for a in ("CH", "DE", "UY", "ZA")
+        )
+    ]
+    conn.executemany("INSERT INTO dbo.T VALUES (?, ?, ?)", rows)
+    yield conn
+    conn.close()
+
+
+def test_keyset_clause_single_key():
+    assert get_keyset_clause(["A"], [1]) == ('"A" > ?', [1])
+
+
+def test_keyset_clause_composite_key():
+    out = get_keyset_clause(["A", "B", "C"], ["x", "y", 3])
+
+    assert out == (
+        '("A" > ?) OR ("A" = ? AND "B" > ?) '
+        'OR ("A" = ? AND "B" = ? AND "C" > ?)',
+        ["x", "x", "y", "x", "y", 3],
+    )
+
+
+def test_keyset_clause_invalid_key():
+    with pytest.raises(Invalid, match="Invalid key"):
+        get_keyset_clause(["A", "B"], ["x"])
+
+
+def test_keyset_clause_selects_following_rows(conn):
+    cond, values = get_keyset_clause(KEYS, ["M", "DE"])
+
+    rows = conn.execute(
+        f"SELECT FREQ, REF_AREA FROM dbo.T WHERE {cond} ORDER BY 1, 2",  # noqa: S608
+        values,
+    ).fetchall()
+
+    assert rows[0] == ("M", "UY")
+    assert len(rows) == 6
+
+
+def test_first_page():
+    stmt, values = get_keyset_statement("T", KEYS, limit=100)
+
+    assert stmt == (
+        'SELECT * FROM dbo.T ORDER BY "FREQ", "REF_AREA" '
+        "OFFSET 0 ROWS FETCH NEXT 100 ROWS ONLY"
+    )
+    assert values == []
+
+
+def test_next_page_with_filters_and_columns():
+    flt = TextFilter("CONF", Operator.EQUALS, "F")
+
+    stmt, values = get_keyset_statement(
+        "T",
+        KEYS,
+        "stg",
+        filters=flt,
+        columns=["VAL", "FREQ"],
+        last_key=["A", "CH"],
+        limit=10,
+    )
+
+    assert stmt == (
+        'SELECT "VAL", "FREQ", "REF_AREA" FROM stg.T '
+        'WHERE ("CONF" = ?) AND (("FREQ" > ?) '
+        'OR ("FREQ" = ? AND "REF_AREA" > ?)) '
+        'ORDER BY "FREQ", "REF_AREA" OFFSET 0 ROWS FETCH NEXT 10 ROWS ONLY'
+    )
+    assert values == ["F", "A", "A", "CH"]
+
+
+def test_keyset_invalid_table():
+    with pytest.raises(Invalid, match="Invalid table or schema name"):
+        get_keyset_statement("T;", KEYS)
+
+
+def test_partition_bounds_statement():
+    flt = NumberFilter("VAL", Operator.GREATER_THAN, 1)
+
+    stmt, values = get_partition_bounds_statement("T", KEYS, 4, filters=flt)
+
+    assert stmt.startswith(
+        'SELECT "FREQ", "REF_AREA" FROM (SELECT "FREQ", "REF_AREA", '
+        'ROW_NUMBER() OVER (ORDER BY "FREQ", "REF_AREA") AS rn, '
+        'COUNT(*) OVER () AS cnt FROM dbo.T WHERE "VAL" > ?) AS k WHERE '
+    )
+    assert values == [1, 4, 4]
+
+
+@pytest.mark.parametrize("partitions", [1, 2, 3, 5, 12, 20])
+def test_range_partitions_are_disjoint(conn, partitions):
+    stmt, values = get_partition_bounds_statement("T", KEYS, partitions)
+    bounds = conn.execute(stmt, values).fetchall()
+
+    stmts = get_partition_statements(
+        "T", KEYS, partitions, columns=["VAL"], bounds=bounds
+    )
+
+    assert len(bounds) == min(partitions, 12) - 1
+    assert len(stmts) == len(bounds) + 1
+    seen = []
+    sizes = []
+    for stmt, values in stmts:
+        rows = conn.execute(stmt, values).fetchall()
+        sizes.append(len(rows))
+        seen.extend(r[0] for r in rows)
+    assert sorted(seen) == list(range(12))
+    assert max(sizes) - min(sizes) <= 1
+
+
+def test_range_partitions_with_filters(conn):
+    flt = TextFilter("REF_AREA", Operator.NOT_EQUALS, "CH")
+    stmt, values = get_partition_bounds_statement("T", KEYS, 3, filters=flt)
+    bounds = conn.execute(stmt, values).fetchall()
+
+    stmts = get_partition_statements(
+        "T", KEYS, 3, filters=flt, columns=["VAL"], bounds=bounds
+    )
+
+    seen = []
+    for stmt, values in stmts:
+        seen.extend(r[0] for r in conn.execute(stmt, values).fetchall())
+    assert sorted(seen) == [1, 2, 3, 5, 6, 7, 9, 10, 11]
+
+
+def test_range_partitions_statements():
+    out = get_partition_statements("T", ["A"], 2, bounds=[[5]])
+
+    assert out == [
+        ('SELECT * FROM dbo.T WHERE NOT ("A" > ?)', [5]),
+        ('SELECT * FROM dbo.T WHERE ("A" > ?)', [5]),
+    ]
+
+
+def test_checksum_partitions():
+    flt = TextFilter("FREQ", Operator.EQUALS, "A")
+
+    out = get_partition_statements("T", KEYS, 3, filters=flt)
+
+    cs = 'ABS(CAST(CHECKSUM("FREQ", "REF_AREA") AS BIGINT)) % ? = ?'
+    assert out == [
+        (f'SELECT * FROM dbo.T WHERE ("FREQ" = ?) AND ({cs})', ["A", 3, i])  # noqa: S608
+        for i in range(3)
+    ]
+
+
+def test_invalid_partitions():
+    with pytest.raises(Invalid, match="Invalid number of partitions"):
+        get_partition_statements("T", KEYS, 0)
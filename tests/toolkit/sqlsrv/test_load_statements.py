@@ -0,0 +1,210 @@
+import pandas as pd
+import pytest
+
+from pysdmx.errors import Invalid
+from pysdmx.model import (
+    Component,
+    Components,
+    Concept,
+    DataflowInfo,
+    DataType,
+    Role,
+)
+from pysdmx.model.dataset import ActionType
+from pysdmx.toolkit.sqlsrv import (
+    MAX_PARAMETERS,
+    get_insert_statements,
+    get_merge_statements,
+)
+
+
+@pytest.fixture
+def dsi():
+    comps = [
+        Component("FREQ", True, Role.DIMENSION, Concept("FREQ")),
+        Component("REF_AREA", True, Role.DIMENSION, Concept("REF_AREA")),
+        Component(
+            "OBS_VALUE",
+            False,
+            Role.MEASURE,
+            Concept("OBS_VALUE"),
+            DataType.INTEGER,
+        ),
+        Component(
+            "CONF",
+            False,
+            Role.ATTRIBUTE,
+            Concept("CONF"),
+            attachment_level="O",
+        ),
+    ]
+    return DataflowInfo("TEST", Components(comps), "SDMX")
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "CONF": ["F", ""],
+            "OBS_VALUE": [42, None],
+            "REF_AREA": ["CH", "UY"],
+            "FREQ": ["A", "A"],
+            "OTHER": ["x", "y"],
+        }
+    )
+
+
+def test_insert(dsi, data):
+    out = list(get_insert_statements(dsi, data))
+
+    assert out == [
+        (
+            'INSERT INTO dbo.TEST ("FREQ", "REF_AREA", "OBS_VALUE", "CONF") '
+            "VALUES (?, ?, ?, ?), (?, ?, ?, ?);",
+            ["A", "CH", 42, "F", "A", "UY", None, None],
+        )
+    ]
+
+
+def test_insert_custom_table(dsi, data):
+    out = list(
+        get_insert_statements(
+            dsi, data[["FREQ", "REF_AREA"]], "stg", "T1", batch_size=1
+        )
+    )
+
+    assert out == [
+        (
+            'INSERT INTO stg.T1 ("FREQ", "REF_AREA") VALUES (?, ?);',
+            ["A", "CH"],
+        ),
+        (
+            'INSERT INTO stg.T1 ("FREQ", "REF_AREA") VALUES (?, ?);',
+            ["A", "UY"],
+        ),
+    ]
+
+
+def test_insert_respects_parameters_limit(dsi):
+    data = pd.DataFrame({"FREQ": ["A"] * 1500, "REF_AREA": ["CH"] * 1500})
+    df3 = data.assign(OBS_VALUE=1)
+
+    two = list(get_insert_statements(dsi, data))
+    three = list(get_insert_statements(dsi, df3, batch_size=5000))
+
+    assert [len(v) for _, v in two] == [2000, 1000]
+    assert [len(v) // 3 for _, v in three] == [700, 700, 100]
+    assert all(len(v) <= MAX_PARAMETERS for _, v in three)
+    assert three[0][0].count("?") == 2100
+    assert three[2][0].count("?") == 300
+
+
+def test_insert_too_many_columns():
+    comps = [
+        Component(f"D{i}", True, Role.DIMENSION, Concept(f"D{i}"))
+        for i in range(MAX_PARAMETERS + 1)
+    ]
+    dsi = DataflowInfo("WIDE", Components(comps), "SDMX")
+    data = pd.DataFrame({c.id: ["A"] for c in comps})
+
+    with pytest.raises(Invalid, match="Too many columns"):
+        list(get_insert_statements(dsi, data))
+
+
+def test_insert_no_matching_columns(dsi):
+    with pytest.raises(Invalid, match="No data to load"):
+        list(get_insert_statements(dsi, pd.DataFrame({"X": [1]})))
+
+
+def test_insert_invalid_table(dsi, data):
+    with pytest.raises(Invalid, match="Invalid table or schema name"):
+        list(get_insert_statements(dsi, data, table_name="T; DROP"))
+
+
+def test_insert_empty_data(dsi, data):
+    assert list(get_insert_statements(dsi, data.iloc[0:0])) == []
+
+
+def test_merge_append(dsi, data):
+    out = list(get_merge_statements(dsi, data))
+
+    assert out == [
+        (
+            "MERGE INTO dbo.TEST WITH (HOLDLOCK) AS tgt USING "
+            "(VALUES (?, ?, ?, ?), (?, ?, ?, ?)) "
+            'AS src ("FREQ", "REF_AREA", "OBS_VALUE", "CONF") '
+            'ON tgt."FREQ" = src."FREQ" AND tgt."REF_AREA" = src."REF_AREA" '
+            'WHEN MATCHED THEN UPDATE SET "OBS_VALUE" = '
+            'COALESCE(src."OBS_VALUE", tgt."OBS_VALUE"), '
+            '"CONF" = COALESCE(src."CONF", tgt."CONF") '
+            'WHEN NOT MATCHED THEN INSERT ("FREQ", "REF_AREA", "OBS_VALUE", '
+            '"CONF") VALUES (src."FREQ", src."REF_AREA", src."OBS_VALUE", '
+            'src."CONF");',
+            ["A", "CH", 42, "F", "A", "UY", None, None],
+        )
+    ]
+
+
+def test_merge_replace(dsi, data):
+    out = list(get_merge_statements(dsi, data, ActionType.Replace))
+
+    assert len(out) == 1
+    assert (
+        'WHEN MATCHED THEN UPDATE SET "OBS_VALUE" = src."OBS_VALUE", '
+        '"CONF" = src."CONF" WHEN NOT MATCHED'
+    ) in out[0][0]
+
+
+def test_merge_keys_only(dsi, data):
+    out = list(get_merge_statements(dsi, data[["FREQ", "REF_AREA"]]))
+
+    assert "WHEN MATCHED" not in out[0][0]
+    assert "WHEN NOT MATCHED THEN INSERT" in out[0][0]
+
+
+def test_merge_custom_pk(dsi, data):
+    out = list(get_merge_statements(dsi, data, pk_fields=["REF_AREA"]))
+
+    assert 'ON tgt."REF_AREA" = src."REF_AREA" WHEN' in out[0][0]
+    assert '"FREQ" = COALESCE(src."FREQ", tgt."FREQ")' in out[0][0]
+
+
+def test_merge_missing_pk(dsi, data):
+    with pytest.raises(Invalid, match="Missing primary key") as ex:
+        list(get_merge_statements(dsi, data.drop(columns="REF_AREA")))
+
+    assert ex.value.csi == {"missing": ["REF_AREA"]}
+
+
+def test_delete(dsi, data):
+    out = list(get_merge_statements(dsi, data, ActionType.Delete))
+
+    assert out == [
+        (
+            "DELETE tgt FROM dbo.TEST AS tgt INNER JOIN "
+            '(VALUES (?, ?), (?, ?)) AS src ("FREQ", "REF_AREA") '
+            'ON tgt."FREQ" = src."FREQ" '
+            'AND tgt."REF_AREA" = src."REF_AREA";',
+            ["A", "CH", "A", "UY"],
+        )
+    ]
+
+
+def test_delete_partial_key(dsi, data):
+    out = list(
+        get_merge_statements(dsi, data[["REF_AREA"]], ActionType.Delete)
+    )
+
+    assert out[0][1] == ["CH", "UY"]
+    assert out[0][0].endswith('ON tgt."REF_AREA" = src."REF_AREA";')
+
+
+def test_delete_without_key(dsi, data):
+    with pytest.raises(Invalid, match="Missing primary key"):
+        list(get_merge_statements(dsi, data[["CONF"]], ActionType.Delete))
+
+
+def test_information(dsi, data):
+    out = get_merge_statements(dsi, data, ActionType.Information)
+
+    assert list(out) == []